@@ -0,0 +1,56 @@
+"""Add rate_counters table for the shared rate limit backend.
+
+Revision ID: 20261019_0004
+Revises: 20260228_0003
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0004'
+down_revision = '20260228_0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if 'rate_counters' not in tables:
+        op.create_table(
+            'rate_counters',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('bucket_key', sa.String(length=200), nullable=False),
+            sa.Column('window_start', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint(
+                'bucket_key',
+                'window_start',
+                name='uq_rate_counters_bucket_window',
+            ),
+        )
+        op.create_index(
+            'ix_rate_counters_window_start',
+            'rate_counters',
+            ['window_start'],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if 'rate_counters' in tables:
+        indexes = {idx['name'] for idx in inspector.get_indexes('rate_counters')}
+        if 'ix_rate_counters_window_start' in indexes:
+            op.drop_index('ix_rate_counters_window_start', table_name='rate_counters')
+        op.drop_table('rate_counters')
@@ -0,0 +1,45 @@
+"""Add composite audit indexes for keyset pagination and filtered export.
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0005'
+down_revision = '20261019_0004'
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    'ix_audit_log_entries_action_chain_index': ['action', 'chain_index'],
+    'ix_audit_log_entries_resource_chain_index': ['resource', 'chain_index'],
+    'ix_audit_log_entries_status_chain_index': ['status', 'chain_index'],
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'audit_log_entries' not in set(inspector.get_table_names()):
+        return
+    existing = {idx['name'] for idx in inspector.get_indexes('audit_log_entries')}
+    for name, columns in _INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'audit_log_entries', columns, unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'audit_log_entries' not in set(inspector.get_table_names()):
+        return
+    existing = {idx['name'] for idx in inspector.get_indexes('audit_log_entries')}
+    for name in _INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name='audit_log_entries')
@@ -0,0 +1,231 @@
+"""Range-partition audit_log_entries by month and add audit archive manifests.
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 11:00:00.000000
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import Connection
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0006'
+down_revision = '20261019_0005'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    'id, chain_index, prev_hash, entry_hash, event_id, action, resource, resource_id, '
+    'actor_key_id, actor_role, status, reason, created_at'
+)
+_COLUMN_DDL = """
+    chain_index INTEGER NOT NULL,
+    prev_hash VARCHAR(128),
+    entry_hash VARCHAR(128) NOT NULL,
+    event_id VARCHAR(64) NOT NULL,
+    action VARCHAR(100) NOT NULL,
+    resource VARCHAR(200) NOT NULL,
+    resource_id VARCHAR(64),
+    actor_key_id VARCHAR(64),
+    actor_role VARCHAR(32),
+    status VARCHAR(32),
+    reason VARCHAR(255),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+"""
+_INDEXES = {
+    'ix_audit_log_entries_chain_index': ['chain_index'],
+    'ix_audit_log_entries_entry_hash': ['entry_hash'],
+    'ix_audit_log_entries_event_id': ['event_id'],
+    'ix_audit_log_entries_action': ['action'],
+    'ix_audit_log_entries_resource': ['resource'],
+    'ix_audit_log_entries_action_chain_index': ['action', 'chain_index'],
+    'ix_audit_log_entries_resource_chain_index': ['resource', 'chain_index'],
+    'ix_audit_log_entries_status_chain_index': ['status', 'chain_index'],
+}
+_UNIQUE_CONSTRAINTS = ('uq_audit_log_entries_chain_index', 'uq_audit_log_entries_entry_hash')
+_MONTHS_AHEAD = 3
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(value: datetime) -> datetime:
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def _partition_name(month_start: datetime) -> str:
+    return f'audit_log_entries_y{month_start.year:04d}m{month_start.month:02d}'
+
+
+def _is_partitioned(connection: Connection) -> bool:
+    relkind = connection.execute(
+        sa.text(
+            "SELECT relkind FROM pg_class "
+            "WHERE relname = 'audit_log_entries' AND pg_table_is_visible(oid)",
+        ),
+    ).scalar_one_or_none()
+    return relkind == 'p'
+
+
+def _create_indexes() -> None:
+    for name, columns in _INDEXES.items():
+        op.create_index(name, 'audit_log_entries', columns, unique=False)
+
+
+def _create_manifests_table(connection: Connection) -> None:
+    if 'audit_archive_manifests' in sa.inspect(connection).get_table_names():
+        return
+    op.create_table(
+        'audit_archive_manifests',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('partition_name', sa.String(length=63), nullable=False),
+        sa.Column('range_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('range_end', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('object_name', sa.String(length=255), nullable=True),
+        sa.Column('entry_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('first_chain_index', sa.Integer(), nullable=True),
+        sa.Column('last_chain_index', sa.Integer(), nullable=True),
+        sa.Column('first_prev_hash', sa.String(length=128), nullable=True),
+        sa.Column('last_entry_hash', sa.String(length=128), nullable=True),
+        sa.Column('archive_sha512', sa.String(length=128), nullable=True),
+        sa.Column('prev_manifest_hash', sa.String(length=128), nullable=True),
+        sa.Column('manifest_hash', sa.String(length=128), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('manifest_hash', name='uq_audit_archive_manifests_manifest_hash'),
+    )
+    op.create_index(
+        'ix_audit_archive_manifests_partition_name',
+        'audit_archive_manifests',
+        ['partition_name'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_audit_archive_manifests_last_chain_index',
+        'audit_archive_manifests',
+        ['last_chain_index'],
+        unique=False,
+    )
+
+
+def _move_aside(connection: Connection, suffix: str) -> None:
+    # Constraint indexes keep their names across RENAME TO, so they are renamed as well to
+    # free the names for the replacement table.
+    renamed = f'audit_log_entries_{suffix}'
+    op.execute(f'ALTER TABLE audit_log_entries RENAME TO {renamed}')
+    for name in _UNIQUE_CONSTRAINTS:
+        exists = connection.execute(
+            sa.text(
+                'SELECT 1 FROM pg_constraint '
+                'WHERE conrelid = CAST(:table AS regclass) AND conname = :name',
+            ),
+            {'table': renamed, 'name': name},
+        ).first()
+        if exists is not None:
+            op.execute(f'ALTER TABLE {renamed} RENAME CONSTRAINT {name} TO {name}_{suffix}')
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name != 'postgresql':
+        return
+    _create_manifests_table(connection)
+    if 'audit_log_entries' not in sa.inspect(connection).get_table_names():
+        return
+    if _is_partitioned(connection):
+        return
+
+    _move_aside(connection, 'unpartitioned')
+    op.execute(
+        f"""
+        CREATE TABLE audit_log_entries (
+            id INTEGER GENERATED BY DEFAULT AS IDENTITY,
+            {_COLUMN_DDL},
+            CONSTRAINT pk_audit_log_entries PRIMARY KEY (id, created_at),
+            CONSTRAINT uq_audit_log_entries_chain_index UNIQUE (chain_index, created_at),
+            CONSTRAINT uq_audit_log_entries_entry_hash UNIQUE (entry_hash, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """,
+    )
+
+    oldest = connection.execute(
+        sa.text('SELECT min(created_at) FROM audit_log_entries_unpartitioned'),
+    ).scalar_one_or_none()
+    now = datetime.now(UTC)
+    month = _month_start(oldest or now)
+    last = _month_start(now)
+    for _ in range(_MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        upper = _next_month(month)
+        op.execute(
+            f'CREATE TABLE {_partition_name(month)} PARTITION OF audit_log_entries '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')",
+        )
+        month = upper
+    op.execute('CREATE TABLE audit_log_entries_default PARTITION OF audit_log_entries DEFAULT')
+
+    op.execute(
+        f'INSERT INTO audit_log_entries ({_COLUMNS}) '
+        f'SELECT {_COLUMNS} FROM audit_log_entries_unpartitioned',
+    )
+    op.execute('DROP TABLE audit_log_entries_unpartitioned')
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('audit_log_entries', 'id'), "
+        'COALESCE((SELECT max(id) FROM audit_log_entries), 0) + 1, false)',
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name != 'postgresql':
+        return
+    if 'audit_log_entries' in sa.inspect(connection).get_table_names() and _is_partitioned(
+        connection,
+    ):
+        _move_aside(connection, 'partitioned')
+        op.execute(
+            f"""
+            CREATE TABLE audit_log_entries (
+                id SERIAL PRIMARY KEY,
+                {_COLUMN_DDL},
+                CONSTRAINT uq_audit_log_entries_chain_index UNIQUE (chain_index),
+                CONSTRAINT uq_audit_log_entries_entry_hash UNIQUE (entry_hash)
+            )
+            """,
+        )
+        op.execute(
+            f'INSERT INTO audit_log_entries ({_COLUMNS}) '
+            f'SELECT {_COLUMNS} FROM audit_log_entries_partitioned',
+        )
+        op.execute('DROP TABLE audit_log_entries_partitioned CASCADE')
+        op.execute(
+            "SELECT setval(pg_get_serial_sequence('audit_log_entries', 'id'), "
+            'COALESCE((SELECT max(id) FROM audit_log_entries), 0) + 1, false)',
+        )
+        _create_indexes()
+
+    if 'audit_archive_manifests' in sa.inspect(connection).get_table_names():
+        op.drop_index(
+            'ix_audit_archive_manifests_last_chain_index',
+            table_name='audit_archive_manifests',
+        )
+        op.drop_index(
+            'ix_audit_archive_manifests_partition_name',
+            table_name='audit_archive_manifests',
+        )
+        op.drop_table('audit_archive_manifests')
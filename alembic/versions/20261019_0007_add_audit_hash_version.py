@@ -0,0 +1,40 @@
+"""Add hash_version to audit_log_entries; existing rows keep verifying under v1.
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0007'
+down_revision = '20261019_0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'audit_log_entries' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('audit_log_entries')}
+    if 'hash_version' not in columns:
+        op.add_column(
+            'audit_log_entries',
+            sa.Column('hash_version', sa.SmallInteger(), nullable=False, server_default='1'),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'audit_log_entries' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('audit_log_entries')}
+    if 'hash_version' in columns:
+        op.drop_column('audit_log_entries', 'hash_version')
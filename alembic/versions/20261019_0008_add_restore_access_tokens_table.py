@@ -0,0 +1,55 @@
+"""Add restore_access_tokens table for the shared restore token store.
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 13:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0008'
+down_revision = '20261019_0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if 'restore_access_tokens' not in tables:
+        op.create_table(
+            'restore_access_tokens',
+            sa.Column('token_digest', sa.String(length=64), nullable=False),
+            sa.Column('backup_id', sa.String(length=64), nullable=False),
+            sa.Column('actor_key_id', sa.String(length=64), nullable=True),
+            sa.Column('issued_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint('token_digest'),
+        )
+        op.create_index(
+            'ix_restore_access_tokens_expires_at',
+            'restore_access_tokens',
+            ['expires_at'],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if 'restore_access_tokens' in tables:
+        indexes = {idx['name'] for idx in inspector.get_indexes('restore_access_tokens')}
+        if 'ix_restore_access_tokens_expires_at' in indexes:
+            op.drop_index(
+                'ix_restore_access_tokens_expires_at',
+                table_name='restore_access_tokens',
+            )
+        op.drop_table('restore_access_tokens')
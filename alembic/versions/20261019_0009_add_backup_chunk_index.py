@@ -0,0 +1,41 @@
+"""Add chunk_size and chunk_offsets to backup_metadata for chunked GCM backups.
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0009'
+down_revision = '20261019_0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'chunk_size' not in columns:
+        op.add_column('backup_metadata', sa.Column('chunk_size', sa.Integer(), nullable=True))
+    if 'chunk_offsets' not in columns:
+        op.add_column('backup_metadata', sa.Column('chunk_offsets', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'chunk_offsets' in columns:
+        op.drop_column('backup_metadata', 'chunk_offsets')
+    if 'chunk_size' in columns:
+        op.drop_column('backup_metadata', 'chunk_size')
@@ -0,0 +1,47 @@
+"""Add compression and compression_level to backup_metadata.
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0010'
+down_revision = '20261019_0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'compression' not in columns:
+        op.add_column(
+            'backup_metadata',
+            sa.Column('compression', sa.String(length=16), nullable=True),
+        )
+    if 'compression_level' not in columns:
+        op.add_column(
+            'backup_metadata',
+            sa.Column('compression_level', sa.Integer(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'compression_level' in columns:
+        op.drop_column('backup_metadata', 'compression_level')
+    if 'compression' in columns:
+        op.drop_column('backup_metadata', 'compression')
@@ -0,0 +1,37 @@
+"""Add dedup_manifest to backup_metadata for deduplicated chunk storage.
+
+Revision ID: 20261019_0011
+Revises: 20261019_0010
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0011'
+down_revision = '20261019_0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'dedup_manifest' not in columns:
+        op.add_column('backup_metadata', sa.Column('dedup_manifest', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'dedup_manifest' in columns:
+        op.drop_column('backup_metadata', 'dedup_manifest')
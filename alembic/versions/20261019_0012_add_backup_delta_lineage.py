@@ -0,0 +1,58 @@
+"""Add delta lineage columns to backup_metadata for incremental backups.
+
+Revision ID: 20261019_0012
+Revises: 20261019_0011
+Create Date: 2026-10-19 17:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0012'
+down_revision = '20261019_0011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'base_backup_id' not in columns:
+        op.add_column(
+            'backup_metadata',
+            sa.Column('base_backup_id', sa.String(length=64), nullable=True),
+        )
+        op.create_index(
+            'ix_backup_metadata_base_backup_id',
+            'backup_metadata',
+            ['base_backup_id'],
+            unique=False,
+        )
+    if 'delta_depth' not in columns:
+        op.add_column(
+            'backup_metadata',
+            sa.Column('delta_depth', sa.Integer(), nullable=False, server_default=sa.text('0')),
+        )
+    if 'delta_size' not in columns:
+        op.add_column('backup_metadata', sa.Column('delta_size', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('backup_metadata')}
+    if 'delta_size' in columns:
+        op.drop_column('backup_metadata', 'delta_size')
+    if 'delta_depth' in columns:
+        op.drop_column('backup_metadata', 'delta_depth')
+    if 'base_backup_id' in columns:
+        op.drop_index('ix_backup_metadata_base_backup_id', table_name='backup_metadata')
+        op.drop_column('backup_metadata', 'base_backup_id')
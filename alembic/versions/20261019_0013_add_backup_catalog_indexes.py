@@ -0,0 +1,46 @@
+"""Add composite indexes for keyset-paginated backup catalog queries.
+
+Revision ID: 20261019_0013
+Revises: 20261019_0012
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0013'
+down_revision = '20261019_0012'
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    'ix_backup_metadata_created_at_id': ['created_at', 'id'],
+    'ix_backup_metadata_source_system_created_at': ['source_system', 'created_at', 'id'],
+    'ix_backup_metadata_classification_created_at': ['classification', 'created_at', 'id'],
+    'ix_backup_metadata_status_created_at': ['status', 'created_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    existing = {index['name'] for index in inspector.get_indexes('backup_metadata')}
+    for name, columns in _INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'backup_metadata', columns, unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'backup_metadata' not in set(inspector.get_table_names()):
+        return
+    existing = {index['name'] for index in inspector.get_indexes('backup_metadata')}
+    for name in _INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name='backup_metadata')
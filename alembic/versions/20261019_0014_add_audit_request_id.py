@@ -0,0 +1,40 @@
+"""Add the correlation request_id to audit_log_entries.
+
+Revision ID: 20261019_0014
+Revises: 20261019_0013
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0014'
+down_revision = '20261019_0013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'audit_log_entries' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('audit_log_entries')}
+    if 'request_id' not in columns:
+        op.add_column(
+            'audit_log_entries',
+            sa.Column('request_id', sa.String(length=128), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'audit_log_entries' not in set(inspector.get_table_names()):
+        return
+    columns = {column['name'] for column in inspector.get_columns('audit_log_entries')}
+    if 'request_id' in columns:
+        op.drop_column('audit_log_entries', 'request_id')
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable
 from functools import lru_cache
 
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
+from app.core.profiling import StackSampler
+from app.core.request_context import generate_request_id, request_id_var
+from app.core.tracing import TraceStore
 from app.infrastructure.crypto.key_store_fs import FileSystemKeyStore
 from app.infrastructure.db.session import get_db_session
+from app.infrastructure.db.unit_of_work import UnitOfWork
 from app.infrastructure.storage.minio_client import InMemoryObjectStorage
+from app.infrastructure.storage.restore_spool import RestoreSpool, default_spool_directory
 from app.repositories.alerts_repository import AlertsRepository
 from app.repositories.api_keys_repository import ApiKeysRepository
 from app.repositories.audit_repository import AuditRepository
@@ -18,15 +22,21 @@ from app.repositories.backups_repository import BackupsRepository
 from app.repositories.incident_repository import IncidentRepository
 from app.repositories.key_versions_repository import KeyVersionsRepository
 from app.repositories.policies_repository import PoliciesRepository
-from app.schemas.auth import ApiKeyPrincipal
+from app.services.audit_aggregation import AUTH_SUCCESS_MODES, AuthSuccessAggregator
 from app.services.audit_service import AuditService
-from app.services.auth_service import AuthFailure, AuthService
+from app.services.auth_service import AuthService
 from app.services.backup_service import BackupService
 from app.services.incident_service import IncidentService
 from app.services.key_management_service import KeyManagementService
 from app.services.monitoring_service import MonitoringService
 from app.services.policy_service import PolicyService
 from app.services.restore_access_token_service import RestoreAccessTokenService
+from app.services.restore_access_token_store import (
+    InMemoryRestoreAccessTokenStore,
+    PostgresRestoreAccessTokenStore,
+    RestoreAccessTokenStore,
+    SignedRestoreAccessTokenStore,
+)
 from app.services.restore_service import RestoreService
 
 logger = logging.getLogger(__name__)
@@ -37,15 +47,10 @@ def get_app_settings() -> Settings:
 
 
 def get_request_id(request: Request) -> str:
-    return request.headers.get('x-request-id', 'generated-placeholder-id')
-
-
-def _auth_error_payload(code: str, message: str, request_id: str) -> dict[str, object]:
-    return {
-        'error': {'code': code, 'message': message},
-        'data': None,
-        'meta': {'request_id': request_id},
-    }
+    request_id = request_id_var.get()
+    if request_id is None:
+        request_id = request.headers.get('x-request-id') or generate_request_id()
+    return request_id
 
 
 def get_api_keys_repository(db: AsyncSession = Depends(get_db_session)) -> ApiKeysRepository:
@@ -56,6 +61,10 @@ def get_policies_repository(db: AsyncSession = Depends(get_db_session)) -> Polic
     return PoliciesRepository(db)
 
 
+def get_unit_of_work(db: AsyncSession = Depends(get_db_session)) -> UnitOfWork:
+    return UnitOfWork(db)
+
+
 def get_backups_repository(db: AsyncSession = Depends(get_db_session)) -> BackupsRepository:
     return BackupsRepository(db)
 
@@ -78,10 +87,21 @@ def get_incident_repository(db: AsyncSession = Depends(get_db_session)) -> Incid
     return IncidentRepository(db)
 
 
+@lru_cache(maxsize=1)
+def get_auth_success_aggregator() -> AuthSuccessAggregator | None:
+    settings = get_settings()
+    mode = settings.audit_auth_success_mode
+    if mode not in AUTH_SUCCESS_MODES:
+        raise ValueError(f'Unknown audit auth success mode: {mode}')
+    if mode == 'full':
+        return None
+    return AuthSuccessAggregator(window_seconds=settings.audit_auth_success_window_seconds)
+
+
 def get_audit_service(
     repository: AuditRepository = Depends(get_audit_repository),
 ) -> AuditService:
-    return AuditService(repository)
+    return AuditService(repository, auth_success_aggregator=get_auth_success_aggregator())
 
 
 def get_key_store(settings: Settings = Depends(get_app_settings)) -> FileSystemKeyStore:
@@ -100,13 +120,46 @@ def get_auth_service(
     return AuthService(repository, audit_service)
 
 
+@lru_cache(maxsize=1)
 def get_policy_service() -> PolicyService:
     return PolicyService()
 
 
 @lru_cache(maxsize=1)
 def get_restore_access_token_service() -> RestoreAccessTokenService:
-    return RestoreAccessTokenService()
+    settings = get_settings()
+    backend = settings.restore_access_token_backend
+    store: RestoreAccessTokenStore
+    if backend == 'memory':
+        store = InMemoryRestoreAccessTokenStore()
+    elif backend == 'postgres':
+        store = PostgresRestoreAccessTokenStore()
+    elif backend == 'signed':
+        store = SignedRestoreAccessTokenStore(
+            settings.restore_access_token_signing_key.encode(),
+        )
+    else:
+        raise ValueError(f'Unknown restore access token backend: {backend}')
+    return RestoreAccessTokenService(store=store)
+
+
+@lru_cache(maxsize=1)
+def get_trace_store() -> TraceStore:
+    return TraceStore(capacity=get_settings().trace_store_size)
+
+
+@lru_cache(maxsize=1)
+def get_stack_sampler() -> StackSampler:
+    return StackSampler(interval_seconds=get_settings().profiling_interval_ms / 1000)
+
+
+@lru_cache(maxsize=1)
+def get_restore_spool() -> RestoreSpool:
+    settings = get_settings()
+    return RestoreSpool(
+        settings.restore_spool_dir or default_spool_directory(),
+        encrypt=settings.restore_spool_encrypt,
+    )
 
 
 def get_incident_service(
@@ -141,26 +194,6 @@ def get_monitoring_service(
     return MonitoringService(alerts_repository=alerts_repository, audit_service=audit_service)
 
 
-def get_backup_service(
-    repository: BackupsRepository = Depends(get_backups_repository),
-    settings: Settings = Depends(get_app_settings),
-    policy_service: PolicyService = Depends(get_policy_service),
-    audit_service: AuditService = Depends(get_audit_service),
-    key_store: FileSystemKeyStore = Depends(get_key_store),
-    storage: InMemoryObjectStorage = Depends(get_storage_client),
-    key_management_service: KeyManagementService = Depends(get_key_management_service),
-) -> BackupService:
-    return BackupService(
-        repository,
-        settings,
-        policy_service,
-        audit_service,
-        key_store,
-        storage,
-        key_management_service,
-    )
-
-
 def get_restore_service(
     backups_repository: BackupsRepository = Depends(get_backups_repository),
     auth_service: AuthService = Depends(get_auth_service),
@@ -174,6 +207,7 @@ def get_restore_service(
         get_restore_access_token_service,
     ),
     monitoring_service: MonitoringService = Depends(get_monitoring_service),
+    restore_spool: RestoreSpool = Depends(get_restore_spool),
 ) -> RestoreService:
     return RestoreService(
         backups_repository,
@@ -186,73 +220,33 @@ def get_restore_service(
         storage,
         restore_access_token_service,
         monitoring_service,
+        restore_spool,
     )
 
 
-async def require_api_key(
-    request: Request,
-    request_id: str = Depends(get_request_id),
+def get_backup_service(
+    repository: BackupsRepository = Depends(get_backups_repository),
     settings: Settings = Depends(get_app_settings),
-    auth_service: AuthService = Depends(get_auth_service),
+    policy_service: PolicyService = Depends(get_policy_service),
     audit_service: AuditService = Depends(get_audit_service),
-) -> ApiKeyPrincipal:
-    api_key = request.headers.get(settings.api_key_header)
-    try:
-        client_ip = request.client.host if request.client else None
-        principal = await auth_service.authenticate(api_key or '', client_ip)
-    except AuthFailure as exc:
-        raise HTTPException(
-            status_code=401,
-            detail=_auth_error_payload(code=exc.code, message=exc.message, request_id=request_id),
-        ) from exc
-    except Exception as exc:
-        logger.exception('Authentication dependency failure', exc_info=exc)
-        try:
-            await audit_service.record_auth_failure(
-                key_prefix=(api_key or '')[:8],
-                reason='auth_dependency_failure',
-                client_ip=request.client.host if request.client else None,
-            )
-        except Exception:
-            logger.exception('Failed to record auth dependency failure audit event')
-        raise HTTPException(
-            status_code=401,
-            detail=_auth_error_payload(
-                code='AUTH_UNAVAILABLE',
-                message='Authentication service unavailable',
-                request_id=request_id,
-            ),
-        ) from exc
-    request.state.principal = principal
-    return principal
-
-
-def require_permission(permission: str) -> Callable[..., Awaitable[ApiKeyPrincipal]]:
-    async def _require_permission(
-        request: Request,
-        request_id: str = Depends(get_request_id),
-        principal: ApiKeyPrincipal = Depends(require_api_key),
-        policy_service: PolicyService = Depends(get_policy_service),
-        audit_service: AuditService = Depends(get_audit_service),
-    ) -> ApiKeyPrincipal:
-        decision = policy_service.authorize(principal, permission)
-        if not decision.allowed:
-            client_ip = request.client.host if request.client else None
-            await audit_service.record_authorization_denied(
-                key_id=principal.key_id if principal else None,
-                role=decision.role,
-                permission=decision.required_permission,
-                reason=decision.reason,
-                client_ip=client_ip,
-            )
-            raise HTTPException(
-                status_code=403,
-                detail=_auth_error_payload(
-                    code='POLICY_DENIED',
-                    message='Not authorized for this operation',
-                    request_id=request_id,
-                ),
-            )
-        return principal
-
-    return _require_permission
+    key_store: FileSystemKeyStore = Depends(get_key_store),
+    storage: InMemoryObjectStorage = Depends(get_storage_client),
+    key_management_service: KeyManagementService = Depends(get_key_management_service),
+    restore_service: RestoreService = Depends(get_restore_service),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    incident_service: IncidentService = Depends(get_incident_service),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> BackupService:
+    return BackupService(
+        repository,
+        settings,
+        policy_service,
+        audit_service,
+        key_store,
+        storage,
+        key_management_service,
+        restore_service,
+        unit_of_work,
+        incident_service,
+        auth_service,
+    )
@@ -6,6 +6,8 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from app.core.request_context import generate_request_id, request_id_var
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +25,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         request: Request,
         exc: RequestValidationError,
     ) -> JSONResponse:
-        request_id = request.headers.get('x-request-id', 'generated-placeholder-id')
+        request_id = request_id_var.get() or generate_request_id()
         return JSONResponse(
             status_code=422,
             content={
@@ -36,10 +38,15 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(HTTPException)
     async def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse:
         if isinstance(exc.detail, dict):
-            return JSONResponse(status_code=exc.status_code, content=exc.detail)
+            return JSONResponse(
+                status_code=exc.status_code,
+                content=exc.detail,
+                headers=exc.headers,
+            )
         return JSONResponse(
             status_code=exc.status_code,
             content=_error_payload(code='http_error', message=str(exc.detail)),
+            headers=exc.headers,
         )
 
     @app.exception_handler(Exception)
@@ -1 +1,228 @@
-"""Authentication middleware placeholder."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.api import dependencies
+from app.core.config import Settings
+from app.core.request_context import generate_request_id, key_id_var, request_id_var
+from app.core.tracing import trace_span
+from app.schemas.auth import ApiKeyPrincipal
+from app.services.auth_service import AuthFailure
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProtectedRoute:
+    """Permission for every path under `prefix`; None makes the prefix public."""
+
+    prefix: str
+    permission: str | None
+
+    def matches(self, path: str) -> bool:
+        return path == self.prefix or path.startswith(f'{self.prefix}/')
+
+
+def _auth_error_payload(code: str, message: str, request_id: str) -> dict[str, object]:
+    return {
+        'error': {'code': code, 'message': message},
+        'data': None,
+        'meta': {'request_id': request_id},
+    }
+
+
+class _RequestServices:
+    """Auth collaborators for one request; the DB session is opened only if needed."""
+
+    def __init__(self, scope: Scope) -> None:
+        app = scope.get('app')
+        self._overrides: dict[Callable[..., Any], Callable[..., Any]] = getattr(
+            app,
+            'dependency_overrides',
+            {},
+        )
+        self._session: Any = None
+        self._audit_service: Any = None
+
+    def _override(self, provider: Callable[..., Any]) -> Callable[..., Any] | None:
+        return self._overrides.get(provider)
+
+    def _db_session(self) -> Any:
+        if self._session is None:
+            from app.infrastructure.db.session import get_session_factory
+
+            self._session = get_session_factory()()
+        return self._session
+
+    def audit_service(self) -> Any:
+        if self._audit_service is None:
+            override = self._override(dependencies.get_audit_service)
+            if override is not None:
+                self._audit_service = override()
+            else:
+                from app.repositories.audit_repository import AuditRepository
+
+                self._audit_service = dependencies.get_audit_service(
+                    AuditRepository(self._db_session()),
+                )
+        return self._audit_service
+
+    def auth_service(self) -> Any:
+        override = self._override(dependencies.get_auth_service)
+        if override is not None:
+            return override()
+        from app.repositories.api_keys_repository import ApiKeysRepository
+
+        return dependencies.get_auth_service(
+            ApiKeysRepository(self._db_session()),
+            self.audit_service(),
+        )
+
+    def policy_service(self) -> Any:
+        override = self._override(dependencies.get_policy_service)
+        if override is not None:
+            return override()
+        return dependencies.get_policy_service()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AuthenticationMiddleware:
+    """Authenticates and authorizes protected API routes once, ahead of the router.
+
+    On success the principal is attached to `scope['state']['principal']` (read by routes
+    through `request.state.principal`); failures short-circuit with 401/403 envelopes
+    without resolving any route dependencies. Paths under the API prefix that match no
+    entry in `protected_routes` are refused with 404.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Settings,
+        protected_routes: tuple[ProtectedRoute, ...],
+    ) -> None:
+        self.app = app
+        self._api_prefix = settings.api_v1_prefix.rstrip('/')
+        self._api_key_header = settings.api_key_header.lower().encode('latin-1')
+        self._protected_routes = protected_routes
+
+    def _route(self, path: str) -> ProtectedRoute | None:
+        relative = path[len(self._api_prefix):]
+        for route in self._protected_routes:
+            if route.matches(relative):
+                return route
+        return None
+
+    def _api_key(self, scope: Scope) -> str:
+        headers: list[tuple[bytes, bytes]] = scope.get('headers', [])
+        for key, value in headers:
+            if key == self._api_key_header:
+                return value.decode('latin-1')
+        return ''
+
+    async def _reject(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        status_code: int,
+        code: str,
+        message: str,
+    ) -> None:
+        request_id = request_id_var.get() or generate_request_id()
+        response = JSONResponse(
+            status_code=status_code,
+            content=_auth_error_payload(code=code, message=message, request_id=request_id),
+        )
+        await response(scope, receive, send)
+
+    async def _authenticate(
+        self,
+        services: _RequestServices,
+        api_key: str,
+        client_ip: str | None,
+    ) -> ApiKeyPrincipal | AuthFailure:
+        try:
+            principal: ApiKeyPrincipal = await services.auth_service().authenticate(
+                api_key,
+                client_ip,
+            )
+        except AuthFailure as exc:
+            return exc
+        except Exception as exc:
+            logger.exception('Authentication middleware failure', exc_info=exc)
+            try:
+                await services.audit_service().record_auth_failure(
+                    key_prefix=api_key[:8],
+                    reason='auth_dependency_failure',
+                    client_ip=client_ip,
+                )
+            except Exception:
+                logger.exception('Failed to record auth dependency failure audit event')
+            return AuthFailure('AUTH_UNAVAILABLE', 'Authentication service unavailable')
+        return principal
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        path: str = scope['path']
+        if not path.startswith(self._api_prefix):
+            await self.app(scope, receive, send)
+            return
+        route = self._route(path)
+        if route is None:
+            await self._reject(scope, receive, send, 404, 'NOT_FOUND', 'Route not found')
+            return
+        if route.permission is None:
+            await self.app(scope, receive, send)
+            return
+        permission = route.permission
+
+        client = scope.get('client')
+        client_ip = client[0] if client else None
+        services = _RequestServices(scope)
+        try:
+            with trace_span('auth.authenticate'):
+                outcome = await self._authenticate(services, self._api_key(scope), client_ip)
+            if isinstance(outcome, AuthFailure):
+                await self._reject(scope, receive, send, 401, outcome.code, outcome.message)
+                return
+            principal = outcome
+            decision = services.policy_service().authorize(principal, permission)
+            if not decision.allowed:
+                await services.audit_service().record_authorization_denied(
+                    key_id=principal.key_id,
+                    role=decision.role,
+                    permission=decision.required_permission,
+                    reason=decision.reason,
+                    client_ip=client_ip,
+                )
+                await self._reject(
+                    scope,
+                    receive,
+                    send,
+                    403,
+                    'POLICY_DENIED',
+                    'Not authorized for this operation',
+                )
+                return
+        finally:
+            await services.close()
+
+        scope.setdefault('state', {})['principal'] = principal
+        token = key_id_var.set(principal.key_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            key_id_var.reset(token)
@@ -1 +1,72 @@
-"""Correlation ID middleware placeholder."""
+from __future__ import annotations
+
+import logging
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.constants import REQUEST_ID_HEADER
+from app.core.request_context import generate_request_id, is_valid_request_id, request_id_var
+
+access_logger = logging.getLogger('app.access')
+
+
+class CorrelationIdMiddleware:
+    """Assigns every request an ID, exposes it via `request_id_var` and echoes it back."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = REQUEST_ID_HEADER,
+        access_log: bool = True,
+    ) -> None:
+        self.app = app
+        self._header_name = header_name.lower().encode('latin-1')
+        self._access_log = access_log
+
+    def _incoming_request_id(self, scope: Scope) -> str | None:
+        headers: list[tuple[bytes, bytes]] = scope.get('headers', [])
+        for key, value in headers:
+            if key == self._header_name:
+                candidate = value.decode('latin-1')
+                return candidate if is_valid_request_id(candidate) else None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        started = perf_counter()
+        request_id = self._incoming_request_id(scope) or generate_request_id()
+        state = scope.setdefault('state', {})
+        state['request_id'] = request_id
+        header = (self._header_name, request_id.encode('latin-1'))
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                headers = [item for item in message.get('headers', []) if item[0] != header[0]]
+                headers.append(header)
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            if self._access_log and access_logger.isEnabledFor(logging.INFO):
+                principal = state.get('principal')
+                access_logger.info(
+                    'Request completed',
+                    extra={
+                        'request_id': request_id,
+                        'key_id': getattr(principal, 'key_id', None),
+                        'method': scope['method'],
+                        'route': getattr(scope.get('route'), 'path', scope['path']),
+                        'status_code': status_code,
+                        'latency_ms': round((perf_counter() - started) * 1000, 3),
+                    },
+                )
+            request_id_var.reset(token)
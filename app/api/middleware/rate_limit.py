@@ -1 +1,323 @@
-"""Rate limit middleware placeholder."""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal, Protocol
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import Settings
+from app.core.request_context import generate_request_id, request_id_var
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitConfigError(ValueError):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+    @classmethod
+    def parse(cls, spec: str) -> RateLimit:
+        try:
+            capacity_raw, period_raw = spec.split('/', 1)
+            capacity = int(capacity_raw)
+            period_seconds = float(period_raw)
+        except ValueError as exc:
+            raise RateLimitConfigError(f'Invalid rate limit: {spec!r}') from exc
+        if capacity <= 0 or period_seconds <= 0:
+            raise RateLimitConfigError(f'Invalid rate limit: {spec!r}')
+        return cls(capacity=capacity, period_seconds=period_seconds)
+
+
+@dataclass(frozen=True)
+class RouteGroup:
+    name: str
+    prefix: str
+    methods: frozenset[str] | None = None
+    exact: bool = False
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        if self.exact:
+            return path == self.prefix or path == f'{self.prefix}/'
+        return path == self.prefix or path.startswith(f'{self.prefix}/')
+
+
+DEFAULT_ROUTE_GROUPS: tuple[RouteGroup, ...] = (
+    RouteGroup(name='health', prefix='/health'),
+    RouteGroup(name='restore_submit', prefix='/restores', methods=frozenset({'POST'}), exact=True),
+    RouteGroup(name='restores', prefix='/restores'),
+    RouteGroup(name='backups', prefix='/backups'),
+    RouteGroup(name='audit', prefix='/audit'),
+    RouteGroup(name='admin', prefix='/admin'),
+)
+EXEMPT_ROUTE_GROUPS = frozenset({'health'})
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    per_ip: RateLimit | None
+    per_key: dict[str, RateLimit]
+    global_limits: dict[str, RateLimit]
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RateLimitPolicy:
+        per_ip = settings.rate_limit_per_ip
+        return cls(
+            per_ip=RateLimit.parse(per_ip) if per_ip else None,
+            per_key={
+                group: RateLimit.parse(spec) for group, spec in settings.rate_limit_per_key.items()
+            },
+            global_limits={
+                group: RateLimit.parse(spec) for group, spec in settings.rate_limit_global.items()
+            },
+        )
+
+    def key_limit(self, group: str) -> RateLimit | None:
+        return self.per_key.get(group) or self.per_key.get('default')
+
+
+class _TokenBucket:
+    __slots__ = ('tokens', 'updated_at', 'capacity', 'refill_per_second')
+
+    def __init__(self, limit: RateLimit, now: float) -> None:
+        self.tokens = float(limit.capacity)
+        self.updated_at = now
+        self.capacity = float(limit.capacity)
+        self.refill_per_second = limit.refill_per_second
+
+    def is_full(self, now: float) -> bool:
+        return self.tokens + (now - self.updated_at) * self.refill_per_second >= self.capacity
+
+
+class InMemoryRateLimiter:
+    def __init__(
+        self,
+        shard_count: int = 64,
+        max_buckets_per_shard: int = 4096,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if shard_count <= 0 or shard_count & (shard_count - 1):
+            raise RateLimitConfigError('shard_count must be a power of two')
+        self._mask = shard_count - 1
+        self._max_buckets_per_shard = max_buckets_per_shard
+        self._shards: list[dict[str, _TokenBucket]] = [{} for _ in range(shard_count)]
+        self._clock = clock or time.monotonic
+
+    def bucket_count(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        """Take one token; return 0.0 when allowed, else seconds until a token is available."""
+        shard = self._shards[hash(key) & self._mask]
+        now = self._clock()
+        bucket = shard.get(key)
+        if bucket is None:
+            if len(shard) >= self._max_buckets_per_shard:
+                self._evict(shard, now)
+            bucket = _TokenBucket(limit, now)
+            shard[key] = bucket
+        else:
+            elapsed = now - bucket.updated_at
+            if elapsed > 0:
+                bucket.tokens = min(
+                    bucket.capacity,
+                    bucket.tokens + elapsed * bucket.refill_per_second,
+                )
+                bucket.updated_at = now
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            return 0.0
+        return (1.0 - bucket.tokens) / bucket.refill_per_second
+
+    @staticmethod
+    def _evict(shard: dict[str, _TokenBucket], now: float) -> None:
+        # A full bucket carries no state worth keeping; fall back to the oldest entry.
+        idle = [key for key, bucket in shard.items() if bucket.is_full(now)]
+        if not idle:
+            idle = [next(iter(shard))]
+        for key in idle:
+            del shard[key]
+
+
+class SharedRateLimitStore(Protocol):
+    async def hit(self, bucket_key: str, limit: RateLimit) -> float:
+        ...
+
+
+class PostgresRateLimitStore:
+    """Fixed-window counters in `rate_counters`, shared by every gateway node."""
+
+    _UPSERT_SQL = (
+        'INSERT INTO rate_counters (bucket_key, window_start, count) '
+        'VALUES (:bucket_key, :window_start, 1) '
+        'ON CONFLICT (bucket_key, window_start) '
+        'DO UPDATE SET count = rate_counters.count + 1 '
+        'RETURNING count'
+    )
+
+    def __init__(
+        self,
+        session_factory: Callable[[], object] | None = None,
+        now_provider: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._now_provider = now_provider or (lambda: datetime.now(UTC))
+
+    def _get_session_factory(self) -> Callable[[], object]:
+        if self._session_factory is None:
+            from app.infrastructure.db.session import get_session_factory
+
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    async def hit(self, bucket_key: str, limit: RateLimit) -> float:
+        from sqlalchemy import text
+
+        now = self._now_provider()
+        window_index = math.floor(now.timestamp() / limit.period_seconds)
+        window_start = datetime.fromtimestamp(window_index * limit.period_seconds, UTC)
+        session_factory = self._get_session_factory()
+        async with session_factory() as session:  # type: ignore[attr-defined]
+            result = await session.execute(
+                text(self._UPSERT_SQL),
+                {'bucket_key': bucket_key, 'window_start': window_start},
+            )
+            count = int(result.scalar_one())
+            await session.commit()
+        if count <= limit.capacity:
+            return 0.0
+        return max(
+            (window_start.timestamp() + limit.period_seconds) - now.timestamp(),
+            0.0,
+        )
+
+
+def _rate_limited_payload(request_id: str) -> dict[str, object]:
+    return {
+        'error': {'code': 'RATE_LIMITED', 'message': 'Rate limit exceeded'},
+        'data': None,
+        'meta': {'request_id': request_id},
+    }
+
+
+class RateLimitMiddleware:
+    """Applies one stage of the rate limits.
+
+    The 'client' stage runs ahead of authentication and charges only the per-IP bucket.
+    The 'principal' stage runs after AuthenticationMiddleware and charges the per-key and
+    system-wide quotas, so requests that fail authentication never spend them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Settings,
+        stage: Literal['client', 'principal'] = 'client',
+        limiter: InMemoryRateLimiter | None = None,
+        shared_store: SharedRateLimitStore | None = None,
+        route_groups: Sequence[RouteGroup] = DEFAULT_ROUTE_GROUPS,
+    ) -> None:
+        if stage not in {'client', 'principal'}:
+            raise RateLimitConfigError(f'Unknown rate limit stage: {stage}')
+        self.app = app
+        self._stage = stage
+        self._enabled = settings.rate_limit_enabled
+        self._policy = RateLimitPolicy.from_settings(settings)
+        self._limiter = limiter or InMemoryRateLimiter()
+        if shared_store is None and settings.rate_limit_backend == 'postgres':
+            shared_store = PostgresRateLimitStore()
+        elif settings.rate_limit_backend not in {'memory', 'postgres'}:
+            raise RateLimitConfigError(
+                f'Unknown rate limit backend: {settings.rate_limit_backend}',
+            )
+        self._shared_store = shared_store
+        self._api_prefix = settings.api_v1_prefix.rstrip('/')
+        self._route_groups = tuple(route_groups)
+
+    def _route_group(self, method: str, path: str) -> str | None:
+        if not path.startswith(self._api_prefix):
+            return None
+        relative = path[len(self._api_prefix):]
+        for group in self._route_groups:
+            if group.matches(method, relative):
+                return group.name
+        return 'default'
+
+    def _check_client(self, scope: Scope) -> float:
+        if self._policy.per_ip is None:
+            return 0.0
+        client = scope.get('client')
+        client_ip = client[0] if client else 'unknown'
+        return self._limiter.acquire(f'ip:{client_ip}', self._policy.per_ip)
+
+    async def _check_principal(self, scope: Scope, group: str) -> float:
+        shared_checks: list[tuple[str, RateLimit]] = []
+        principal = scope.get('state', {}).get('principal')
+        key_limit = self._policy.key_limit(group)
+        if principal is not None and key_limit is not None:
+            bucket_key = f'key:{group}:{principal.key_id}'
+            retry_after = self._limiter.acquire(bucket_key, key_limit)
+            if retry_after:
+                return retry_after
+            shared_checks.append((bucket_key, key_limit))
+
+        global_limit = self._policy.global_limits.get(group)
+        if global_limit is not None:
+            bucket_key = f'global:{group}'
+            retry_after = self._limiter.acquire(bucket_key, global_limit)
+            if retry_after:
+                return retry_after
+            shared_checks.append((bucket_key, global_limit))
+
+        if self._shared_store is not None:
+            for bucket_key, limit in shared_checks:
+                try:
+                    retry_after = await self._shared_store.hit(bucket_key, limit)
+                except Exception:
+                    # Local buckets already enforced per-node limits; keep serving.
+                    logger.exception('Shared rate limit store unavailable')
+                    return 0.0
+                if retry_after:
+                    return retry_after
+        return 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not self._enabled:
+            await self.app(scope, receive, send)
+            return
+        group = self._route_group(scope['method'], scope['path'])
+        if group is None or group in EXEMPT_ROUTE_GROUPS:
+            await self.app(scope, receive, send)
+            return
+        if self._stage == 'client':
+            retry_after = self._check_client(scope)
+        else:
+            retry_after = await self._check_principal(scope, group)
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+        request_id = request_id_var.get() or generate_request_id()
+        response = JSONResponse(
+            status_code=429,
+            content=_rate_limited_payload(request_id),
+            headers={'Retry-After': str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
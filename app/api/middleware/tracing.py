@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api import dependencies
+from app.core.config import Settings
+from app.core.request_context import generate_request_id, request_id_var
+from app.core.tracing import RequestTrace, TraceStore, span_backend, start_trace
+
+_TRACE_PERMISSION = 'admin'
+_STATUS_KEY = 'trace_status_code'
+
+
+def _capture_status(state: dict[str, Any], send: Send) -> Send:
+    async def send_with_status(message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            state[_STATUS_KEY] = message['status']
+        await send(message)
+
+    return send_with_status
+
+
+class TracingMiddleware:
+    """Records per-request spans when asked to by header or by the sampling rate.
+
+    A header-triggered trace is only kept when the caller turns out to hold the admin
+    permission, so other callers cannot fill the trace store; sampled traces are kept
+    regardless. With a telemetry backend installed every request also gets a server span
+    carrying the request ID, parented to any incoming `traceparent`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Settings,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self._header_name = settings.trace_header.lower().encode('latin-1')
+        self._sample_rate = settings.trace_sample_rate
+        self._sample = sample
+
+    def _requested(self, scope: Scope) -> bool:
+        headers: list[tuple[bytes, bytes]] = scope.get('headers', [])
+        for key, value in headers:
+            if key == self._header_name:
+                return value.strip().lower() in {b'1', b'true', b'on'}
+        return False
+
+    def _provider(self, scope: Scope, provider: Callable[..., Any]) -> Any:
+        overrides = getattr(scope.get('app'), 'dependency_overrides', {})
+        return overrides.get(provider, provider)()
+
+    def _may_view_traces(self, scope: Scope) -> bool:
+        principal = scope.get('state', {}).get('principal')
+        if principal is None:
+            return False
+        policy_service = self._provider(scope, dependencies.get_policy_service)
+        return bool(policy_service.authorize(principal, _TRACE_PERMISSION).allowed)
+
+    async def _record(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._requested(scope):
+            trigger = 'header'
+        elif self._sample_rate > 0 and self._sample() < self._sample_rate:
+            trigger = 'sampled'
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        trace = RequestTrace(
+            request_id=request_id_var.get() or generate_request_id(),
+            method=scope['method'],
+            path=scope['path'],
+            trigger=trigger,
+        )
+        state = scope.setdefault('state', {})
+        try:
+            with start_trace(trace):
+                await self.app(scope, receive, _capture_status(state, send))
+        finally:
+            trace.finish(state.get(_STATUS_KEY))
+            if trigger == 'sampled' or self._may_view_traces(scope):
+                store: TraceStore = self._provider(scope, dependencies.get_trace_store)
+                store.add(trace)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        backend = span_backend()
+        if backend is None:
+            await self._record(scope, receive, send)
+            return
+        state = scope.setdefault('state', {})
+        headers: list[tuple[bytes, bytes]] = scope.get('headers', [])
+        carrier = {key.decode('latin-1'): value.decode('latin-1') for key, value in headers}
+        with backend.start_span(
+            f"{scope['method']} {scope['path']}",
+            {
+                'http.request.method': scope['method'],
+                'url.path': scope['path'],
+                'ssbg.request_id': request_id_var.get() or '',
+            },
+            carrier=carrier,
+        ):
+            try:
+                await self._record(scope, receive, _capture_status(state, send))
+            finally:
+                status_code = state.get(_STATUS_KEY)
+                if status_code is not None:
+                    backend.annotate({'http.response.status_code': status_code})
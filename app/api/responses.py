@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class EnvelopeResponse(JSONResponse):
+    """JSON response encoded in a single pass by pydantic-core.
+
+    Pydantic models, enums and datetimes inside the content are serialized natively, so
+    routes hand models over as they are instead of dumping each one to a dict first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def success_response(data: object, request_id: str, status_code: int = 200) -> EnvelopeResponse:
+    # Returning a Response skips FastAPI's jsonable_encoder pass over the payload.
+    return EnvelopeResponse(
+        {'data': data, 'meta': {'request_id': request_id}},
+        status_code=status_code,
+    )
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.api.dependencies import get_alerts_repository, get_audit_service, get_request_id
+from app.api.responses import EnvelopeResponse, success_response
 from app.core.enums import AlertStatus
 from app.infrastructure.db.models.alert import AlertModel
 from app.repositories.alerts_repository import AlertsRepository
@@ -14,10 +13,6 @@ from app.services.audit_service import AuditService
 router = APIRouter()
 
 
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
-
-
 def _error_payload(
     code: str,
     message: str,
@@ -53,7 +48,7 @@ async def list_alerts(
     request_id: str = Depends(get_request_id),
     repository: AlertsRepository = Depends(get_alerts_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     records = await repository.list_alerts()
     principal = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -63,8 +58,8 @@ async def list_alerts(
         resource_id=None,
         client_ip=request.client.host if request.client else None,
     )
-    return _success_payload(
-        data={'alerts': [_to_alert_response(record).model_dump(mode='json') for record in records]},
+    return success_response(
+        data={'alerts': [_to_alert_response(record) for record in records]},
         request_id=request_id,
     )
 
@@ -77,7 +72,7 @@ async def update_alert_status(
     request_id: str = Depends(get_request_id),
     repository: AlertsRepository = Depends(get_alerts_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     try:
         new_status = AlertStatus(payload.status)
     except ValueError as exc:
@@ -108,7 +103,7 @@ async def update_alert_status(
         resource_id=updated.alert_id,
         client_ip=request.client.host if request.client else None,
     )
-    return _success_payload(
-        data={'alert': _to_alert_response(updated).model_dump(mode='json')},
+    return success_response(
+        data={'alert': _to_alert_response(updated)},
         request_id=request_id,
     )
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.api.dependencies import get_audit_service, get_incident_service, get_request_id
+from app.api.responses import EnvelopeResponse, success_response
 from app.core.enums import IncidentLevel
 from app.schemas.admin import IncidentStateResponse, IncidentTransitionRequest
 from app.services.audit_service import AuditService
@@ -13,10 +12,6 @@ from app.services.incident_service import IncidentService, InvalidIncidentTransi
 router = APIRouter()
 
 
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
-
-
 def _error_payload(
     code: str,
     message: str,
@@ -36,7 +31,7 @@ async def get_incident_state(
     request_id: str = Depends(get_request_id),
     incident_service: IncidentService = Depends(get_incident_service),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     state = await incident_service.get_state()
     principal = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -52,7 +47,7 @@ async def get_incident_state(
         reason=state.reason,
         changed_at=state.changed_at,
     )
-    return _success_payload(data=response.model_dump(mode='json'), request_id=request_id)
+    return success_response(data=response, request_id=request_id)
 
 
 @router.put('')
@@ -62,7 +57,7 @@ async def update_incident_state(
     request_id: str = Depends(get_request_id),
     incident_service: IncidentService = Depends(get_incident_service),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     principal = getattr(request.state, 'principal', None)
     try:
         new_level = IncidentLevel(payload.level)
@@ -105,4 +100,4 @@ async def update_incident_state(
         reason=updated.reason,
         changed_at=updated.changed_at,
     )
-    return _success_payload(data=response.model_dump(mode='json'), request_id=request_id)
+    return success_response(data=response, request_id=request_id)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import secrets
-from collections.abc import Mapping
 from datetime import datetime
 from hashlib import sha512
 from uuid import uuid4
@@ -15,6 +14,7 @@ from app.api.dependencies import (
     get_key_management_service,
     get_request_id,
 )
+from app.api.responses import EnvelopeResponse, success_response
 from app.core.config import Settings
 from app.infrastructure.db.models.api_key import ApiKeyModel
 from app.repositories.api_keys_repository import ApiKeysRepository
@@ -40,10 +40,6 @@ from app.services.key_management_service import (
 router = APIRouter()
 
 
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
-
-
 def _error_payload(code: str, message: str, request_id: str) -> dict[str, object]:
     return {
         'error': {'code': code, 'message': message},
@@ -91,7 +87,7 @@ async def create_key(
     request_id: str = Depends(get_request_id),
     repository: ApiKeysRepository = Depends(get_api_keys_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     raw_key = secrets.token_urlsafe(32)
     key_id = uuid4().hex
     key_prefix = raw_key[:8]
@@ -117,7 +113,7 @@ async def create_key(
         client_ip=request.client.host if request.client else None,
     )
     data = ApiKeyCreateResponse(api_key=raw_key, key=_key_to_response(record))
-    return _success_payload(data=data.model_dump(), request_id=request_id)
+    return success_response(data=data, request_id=request_id)
 
 
 @router.get('')
@@ -126,7 +122,7 @@ async def list_keys(
     request_id: str = Depends(get_request_id),
     repository: ApiKeysRepository = Depends(get_api_keys_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     records = await repository.list_keys()
     actor_key_id = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -136,8 +132,8 @@ async def list_keys(
         resource_id=None,
         client_ip=request.client.host if request.client else None,
     )
-    data = {'keys': [_key_to_response(record).model_dump() for record in records]}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'keys': [_key_to_response(record) for record in records]}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.post('/{key_id}/revoke')
@@ -147,7 +143,7 @@ async def revoke_key(
     request_id: str = Depends(get_request_id),
     repository: ApiKeysRepository = Depends(get_api_keys_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     record = await repository.revoke_key(key_id)
     if record is None:
         raise HTTPException(
@@ -166,8 +162,8 @@ async def revoke_key(
         resource_id=record.key_id,
         client_ip=request.client.host if request.client else None,
     )
-    data = {'key': _key_to_response(record).model_dump()}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'key': _key_to_response(record)}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.get('/versions')
@@ -176,7 +172,7 @@ async def list_key_versions(
     request_id: str = Depends(get_request_id),
     key_management_service: KeyManagementService = Depends(get_key_management_service),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     versions = await key_management_service.list_versions()
     actor_key_id = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -186,12 +182,8 @@ async def list_key_versions(
         resource_id=None,
         client_ip=request.client.host if request.client else None,
     )
-    data = {
-        'versions': [
-            _version_to_response(version).model_dump(mode='json') for version in versions
-        ],
-    }
-    return _success_payload(data=data, request_id=request_id)
+    data = {'versions': [_version_to_response(version) for version in versions]}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.post('/versions/rotate')
@@ -200,7 +192,7 @@ async def rotate_key_version(
     request: Request,
     request_id: str = Depends(get_request_id),
     key_management_service: KeyManagementService = Depends(get_key_management_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     actor = getattr(request.state, 'principal', None)
     try:
         rotated = await key_management_service.rotate_active_version(
@@ -218,8 +210,8 @@ async def rotate_key_version(
                 'meta': {'request_id': request_id},
             },
         ) from exc
-    data = {'version': _version_to_response(rotated).model_dump(mode='json')}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'version': _version_to_response(rotated)}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.post('/versions/{version_id}/crypto-shred')
@@ -230,7 +222,7 @@ async def crypto_shred_key_version(
     request_id: str = Depends(get_request_id),
     settings: Settings = Depends(get_app_settings),
     key_management_service: KeyManagementService = Depends(get_key_management_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     principal = getattr(request.state, 'principal', None)
     mfa_token = request.headers.get(settings.mfa_header)
     try:
@@ -259,7 +251,7 @@ async def crypto_shred_key_version(
         affected_backups=affected_backups,
         incident_effect=str(result['incident_effect']),
     )
-    return _success_payload(data=response.model_dump(mode='json'), request_id=request_id)
+    return success_response(data=response, request_id=request_id)
 
 
 @router.get('/versions/{version_id}')
@@ -269,7 +261,7 @@ async def get_key_version(
     request_id: str = Depends(get_request_id),
     key_management_service: KeyManagementService = Depends(get_key_management_service),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     try:
         version = await key_management_service.get_version(version_id)
     except KeyVersionNotFoundError as exc:
@@ -289,8 +281,8 @@ async def get_key_version(
         resource_id=version_id,
         client_ip=request.client.host if request.client else None,
     )
-    data = {'version': _version_to_response(version).model_dump(mode='json')}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'version': _version_to_response(version)}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.get('/versions/{version_id}/crypto-shred-outcome')
@@ -300,7 +292,7 @@ async def get_crypto_shred_outcome(
     request_id: str = Depends(get_request_id),
     key_management_service: KeyManagementService = Depends(get_key_management_service),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     try:
         outcome = await key_management_service.get_crypto_shred_outcome(version_id)
     except KeyVersionNotFoundError as exc:
@@ -340,4 +332,4 @@ async def get_crypto_shred_outcome(
             else None
         ),
     )
-    return _success_payload(data=response.model_dump(mode='json'), request_id=request_id)
+    return success_response(data=response, request_id=request_id)
@@ -1,23 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 
-from app.api.dependencies import get_audit_service, get_policies_repository, get_request_id
+from app.api.dependencies import (
+    get_audit_service,
+    get_policies_repository,
+    get_policy_service,
+    get_request_id,
+)
+from app.api.responses import EnvelopeResponse, success_response
 from app.infrastructure.db.models.policy_record import PolicyRecordModel
 from app.repositories.policies_repository import PoliciesRepository
 from app.schemas.admin import PolicyCreateRequest, PolicyResponse, PolicyUpdateRequest
 from app.services.audit_service import AuditService
+from app.services.policy_compiler import PolicyCompileError, validate_rule
+from app.services.policy_service import PolicyService
 
 router = APIRouter()
 
 
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
-
-
 def _error_payload(code: str, message: str, request_id: str) -> dict[str, object]:
     return {
         'error': {'code': code, 'message': message},
@@ -26,6 +29,20 @@ def _error_payload(code: str, message: str, request_id: str) -> dict[str, object
     }
 
 
+def _validate_rule_json(rule_json: dict[str, object], request_id: str) -> None:
+    try:
+        validate_rule(rule_json)
+    except PolicyCompileError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail=_error_payload(
+                code='POLICY_INVALID',
+                message=exc.message,
+                request_id=request_id,
+            ),
+        ) from exc
+
+
 def _policy_to_response(record: PolicyRecordModel) -> PolicyResponse:
     return PolicyResponse(
         policy_id=record.policy_id,
@@ -45,7 +62,9 @@ async def create_policy(
     request_id: str = Depends(get_request_id),
     repository: PoliciesRepository = Depends(get_policies_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+    policy_service: PolicyService = Depends(get_policy_service),
+) -> EnvelopeResponse:
+    _validate_rule_json(payload.rule_json, request_id)
     record = PolicyRecordModel(
         policy_id=uuid4().hex,
         name=payload.name,
@@ -54,6 +73,10 @@ async def create_policy(
         is_active=payload.is_active,
     )
     record = await repository.create_policy(record)
+    policy_service.reload(
+        await repository.list_policies(),
+        watermark=await repository.get_watermark(),
+    )
     actor_key_id = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
         actor_key_id=actor_key_id.key_id if actor_key_id else None,
@@ -62,8 +85,8 @@ async def create_policy(
         resource_id=record.policy_id,
         client_ip=request.client.host if request.client else None,
     )
-    data = {'policy': _policy_to_response(record).model_dump()}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'policy': _policy_to_response(record)}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.get('')
@@ -72,7 +95,7 @@ async def list_policies(
     request_id: str = Depends(get_request_id),
     repository: PoliciesRepository = Depends(get_policies_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     records = await repository.list_policies()
     actor_key_id = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -82,8 +105,8 @@ async def list_policies(
         resource_id=None,
         client_ip=request.client.host if request.client else None,
     )
-    data = {'policies': [_policy_to_response(record).model_dump() for record in records]}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'policies': [_policy_to_response(record) for record in records]}
+    return success_response(data=data, request_id=request_id)
 
 
 @router.put('/{policy_id}')
@@ -94,7 +117,10 @@ async def update_policy(
     request_id: str = Depends(get_request_id),
     repository: PoliciesRepository = Depends(get_policies_repository),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+    policy_service: PolicyService = Depends(get_policy_service),
+) -> EnvelopeResponse:
+    if payload.rule_json is not None:
+        _validate_rule_json(payload.rule_json, request_id)
     record = await repository.update_policy(
         policy_id=policy_id,
         name=payload.name,
@@ -111,6 +137,10 @@ async def update_policy(
                 request_id=request_id,
             ),
         )
+    policy_service.reload(
+        await repository.list_policies(),
+        watermark=await repository.get_watermark(),
+    )
     actor_key_id = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
         actor_key_id=actor_key_id.key_id if actor_key_id else None,
@@ -119,5 +149,5 @@ async def update_policy(
         resource_id=record.policy_id,
         client_ip=request.client.host if request.client else None,
     )
-    data = {'policy': _policy_to_response(record).model_dump()}
-    return _success_payload(data=data, request_id=request_id)
+    data = {'policy': _policy_to_response(record)}
+    return success_response(data=data, request_id=request_id)
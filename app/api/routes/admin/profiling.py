@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from app.api.dependencies import (
+    get_audit_service,
+    get_request_id,
+    get_stack_sampler,
+    get_trace_store,
+)
+from app.api.responses import EnvelopeResponse, success_response
+from app.core.profiling import StackSampler
+from app.core.tracing import TraceStore, collapsed_stacks, speedscope_profile
+from app.services.audit_service import AuditService
+
+router = APIRouter()
+
+ProfileFormat = Literal['json', 'speedscope', 'collapsed']
+
+
+def _error_payload(
+    code: str,
+    message: str,
+    request_id: str,
+    details: list[dict[str, object]] | None = None,
+) -> dict[str, object]:
+    return {
+        'error': {'code': code, 'message': message},
+        'data': {'details': details or []},
+        'meta': {'request_id': request_id},
+    }
+
+
+def _render_stacks(
+    name: str,
+    stacks: Counter[tuple[str, ...]],
+    unit: str,
+    fmt: ProfileFormat,
+) -> Response | None:
+    # Exports are returned bare so they can be opened directly in speedscope/flamegraph.pl.
+    if fmt == 'speedscope':
+        return JSONResponse(content=speedscope_profile(name, stacks, unit))
+    if fmt == 'collapsed':
+        return PlainTextResponse(content=collapsed_stacks(stacks))
+    return None
+
+
+async def _record_view(
+    request: Request,
+    audit_service: AuditService,
+    action: str,
+    resource_id: str | None,
+) -> None:
+    principal = getattr(request.state, 'principal', None)
+    await audit_service.record_admin_action(
+        actor_key_id=principal.key_id if principal else None,
+        action=action,
+        resource='profiling',
+        resource_id=resource_id,
+        client_ip=request.client.host if request.client else None,
+    )
+
+
+@router.get('/traces')
+async def list_traces(
+    request: Request,
+    request_id: str = Depends(get_request_id),
+    store: TraceStore = Depends(get_trace_store),
+    audit_service: AuditService = Depends(get_audit_service),
+    limit: int = Query(default=50, ge=1, le=500),
+) -> EnvelopeResponse:
+    traces = store.recent(limit)
+    await _record_view(request, audit_service, 'profiling_traces_viewed', None)
+    return success_response(
+        data={'traces': [trace.summary() for trace in traces]},
+        request_id=request_id,
+    )
+
+
+@router.get('/traces/{trace_id}')
+async def get_trace(
+    trace_id: str,
+    request: Request,
+    request_id: str = Depends(get_request_id),
+    store: TraceStore = Depends(get_trace_store),
+    audit_service: AuditService = Depends(get_audit_service),
+    format: ProfileFormat = Query(default='json'),
+) -> Response:
+    trace = store.get(trace_id)
+    if trace is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_error_payload(
+                code='TRACE_NOT_FOUND',
+                message='Trace not found',
+                request_id=request_id,
+                details=[{'trace_id': trace_id}],
+            ),
+        )
+    await _record_view(request, audit_service, 'profiling_trace_viewed', trace_id)
+    rendered = _render_stacks(
+        f'{trace.method} {trace.path} ({trace.request_id})',
+        trace.self_times(),
+        'microseconds',
+        format,
+    )
+    if rendered is not None:
+        return rendered
+    return success_response(data=trace.to_dict(), request_id=request_id)
+
+
+@router.get('/sampler')
+async def get_sampler_profile(
+    request: Request,
+    request_id: str = Depends(get_request_id),
+    sampler: StackSampler = Depends(get_stack_sampler),
+    audit_service: AuditService = Depends(get_audit_service),
+    format: ProfileFormat = Query(default='json'),
+    reset: bool = Query(default=False),
+) -> Response:
+    if not sampler.running:
+        raise HTTPException(
+            status_code=409,
+            detail=_error_payload(
+                code='PROFILING_DISABLED',
+                message='Sampling profiler is not running',
+                request_id=request_id,
+            ),
+        )
+    samples = sampler.samples
+    stacks = sampler.snapshot(reset=reset)
+    await _record_view(request, audit_service, 'profiling_sampler_viewed', None)
+    rendered = _render_stacks('ssbg sampled profile', stacks, 'none', format)
+    if rendered is not None:
+        return rendered
+    top = stacks.most_common(50)
+    return success_response(
+        data={
+            'interval_ms': sampler.interval_seconds * 1000,
+            'samples': samples,
+            'top_stacks': [{'stack': list(stack), 'samples': count} for stack, count in top],
+        },
+        request_id=request_id,
+    )
@@ -1,24 +1,29 @@
-from collections.abc import Mapping
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import get_audit_service, get_request_id
+from app.api.responses import EnvelopeResponse, success_response
+from app.schemas.audit import AuditEntryExport
 from app.services.audit_service import AuditService
 
 router = APIRouter()
 
-
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
+_EXPORT_FIELDS = tuple(AuditEntryExport.model_fields)
+_EXPORT_MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
 
 
 @router.get('/chain/validate')
 async def validate_audit_chain(
     request_id: str = Depends(get_request_id),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     result = await audit_service.validate_chain()
-    return _success_payload(data=result.model_dump(mode='json'), request_id=request_id)
+    return success_response(data=result, request_id=request_id)
 
 
 @router.get('/entries')
@@ -31,13 +36,16 @@ async def list_audit_entries(
     action: str | None = Query(default=None),
     resource: str | None = Query(default=None),
     status: str | None = Query(default=None),
-) -> dict[str, object]:
+    cursor: int | None = Query(default=None, ge=0),
+) -> EnvelopeResponse:
+    # `cursor` is the last chain_index already seen; when present it supersedes `offset`.
     entries = await audit_service.list_audit_entries(
-        offset=offset,
+        offset=0 if cursor is not None else offset,
         limit=limit,
         action=action,
         resource=resource,
         status=status,
+        after_chain_index=cursor,
     )
     principal = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -47,22 +55,77 @@ async def list_audit_entries(
         resource_id=None,
         client_ip=request.client.host if request.client else None,
     )
-    return _success_payload(
+    return success_response(
         data={
-            'entries': [entry.model_dump(mode='json') for entry in entries],
-            'paging': {'offset': offset, 'limit': limit},
+            'entries': entries,
+            'paging': {'offset': None if cursor is not None else offset, 'limit': limit},
             'filters': {'action': action, 'resource': resource, 'status': status},
+            'next_cursor': entries[-1].chain_index if len(entries) == limit else None,
         },
         request_id=request_id,
     )
 
 
+async def _ndjson_rows(entries: AsyncIterator[AuditEntryExport]) -> AsyncIterator[str]:
+    async for entry in entries:
+        yield entry.model_dump_json() + '\n'
+
+
+async def _csv_rows(entries: AsyncIterator[AuditEntryExport]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_EXPORT_FIELDS)
+    async for entry in entries:
+        row = entry.model_dump(mode='json')
+        writer.writerow([row[field] for field in _EXPORT_FIELDS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header-only exports still emit the column row.
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get('/export')
+async def export_audit_entries(
+    request: Request,
+    audit_service: AuditService = Depends(get_audit_service),
+    export_format: Literal['ndjson', 'csv'] = Query(default='ndjson', alias='format'),
+    action: str | None = Query(default=None),
+    resource: str | None = Query(default=None),
+    status: str | None = Query(default=None),
+    cursor: int | None = Query(default=None, ge=0),
+) -> StreamingResponse:
+    principal = getattr(request.state, 'principal', None)
+    await audit_service.record_admin_action(
+        actor_key_id=principal.key_id if principal else None,
+        action='audit_export_accessed',
+        resource='audit',
+        resource_id=export_format,
+        client_ip=request.client.host if request.client else None,
+    )
+    entries = audit_service.stream_audit_entries(
+        action=action,
+        resource=resource,
+        status=status,
+        after_chain_index=cursor,
+    )
+    rows = _ndjson_rows(entries) if export_format == 'ndjson' else _csv_rows(entries)
+    return StreamingResponse(
+        rows,
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': f'attachment; filename="audit-entries.{export_format}"',
+        },
+    )
+
+
 @router.get('/summary')
 async def get_audit_validation_summary(
     request: Request,
     request_id: str = Depends(get_request_id),
     audit_service: AuditService = Depends(get_audit_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     result = await audit_service.validate_chain()
     principal = getattr(request.state, 'principal', None)
     await audit_service.record_admin_action(
@@ -72,7 +135,7 @@ async def get_audit_validation_summary(
         resource_id=None,
         client_ip=request.client.host if request.client else None,
     )
-    return _success_payload(
-        data={'validation': result.model_dump(mode='json')},
+    return success_response(
+        data={'validation': result},
         request_id=request_id,
     )
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import base64
+import binascii
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from app.api.dependencies import get_backup_service, get_request_id
-from app.schemas.backups import BackupRequest
+from app.api.dependencies import (
+    get_app_settings,
+    get_audit_service,
+    get_backup_service,
+    get_backups_repository,
+    get_request_id,
+)
+from app.api.responses import EnvelopeResponse, success_response
+from app.core.config import Settings
+from app.core.enums import BackupStatus, ClassificationLevel
+from app.repositories.backups_repository import BackupCatalogFilters, BackupsRepository
+from app.schemas.backups import BackupCatalogEntry, BackupRequest
+from app.services.audit_service import AuditService
+from app.services.auth_service import MfaFailure
 from app.services.backup_service import (
     BackupPolicyDenied,
     BackupProcessingError,
@@ -16,10 +31,6 @@ from app.services.backup_service import (
 router = APIRouter()
 
 
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
-
-
 def _error_payload(
     code: str,
     message: str,
@@ -33,17 +44,108 @@ def _error_payload(
     }
 
 
+def _encode_cursor(created_at: datetime, record_id: int) -> str:
+    raw = f'{created_at.isoformat()}|{record_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, _, record_id = raw.rpartition('|')
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError('Invalid catalog cursor') from exc
+
+
+@router.get('')
+async def list_backup_catalog(
+    request: Request,
+    request_id: str = Depends(get_request_id),
+    repository: BackupsRepository = Depends(get_backups_repository),
+    audit_service: AuditService = Depends(get_audit_service),
+    source_system: str | None = Query(default=None, max_length=200),
+    classification: ClassificationLevel | None = Query(default=None),
+    status: BackupStatus | None = Query(default=None),
+    date_from: datetime | None = Query(default=None),
+    date_to: datetime | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = Query(default=None, max_length=200),
+    count: Literal['none', 'exact', 'estimate'] = Query(default='none'),
+) -> EnvelopeResponse:
+    try:
+        after = _decode_cursor(cursor) if cursor is not None else None
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=_error_payload(
+                code='BACKUP_CURSOR_INVALID',
+                message='Invalid catalog cursor',
+                request_id=request_id,
+                details=[],
+            ),
+        ) from exc
+    filters = BackupCatalogFilters(
+        source_system=source_system,
+        classification=classification.value if classification else None,
+        status=status.value if status else None,
+        created_from=date_from,
+        created_to=date_to,
+    )
+    records = await repository.list_catalog(filters, limit=limit, after=after)
+    total: int | None = None
+    if count == 'exact':
+        total = await repository.count_catalog(filters)
+    elif count == 'estimate':
+        total = await repository.estimate_catalog_count(filters)
+    principal = getattr(request.state, 'principal', None)
+    await audit_service.record_admin_action(
+        actor_key_id=principal.key_id if principal else None,
+        action='backup_catalog_accessed',
+        resource='backup',
+        resource_id=None,
+        client_ip=request.client.host if request.client else None,
+    )
+    return success_response(
+        data={
+            'backups': [
+                BackupCatalogEntry.model_validate(record, from_attributes=True)
+                for record in records
+            ],
+            'paging': {'limit': limit, 'count_mode': count, 'total': total},
+            'next_cursor': (
+                _encode_cursor(records[-1].created_at, records[-1].id)
+                if len(records) == limit
+                else None
+            ),
+        },
+        request_id=request_id,
+    )
+
+
 @router.post('')
 async def submit_backup(
     payload: BackupRequest,
     request: Request,
     request_id: str = Depends(get_request_id),
+    settings: Settings = Depends(get_app_settings),
     backup_service: BackupService = Depends(get_backup_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     try:
         principal = getattr(request.state, 'principal', None)
         client_ip = request.client.host if request.client else None
-        data = await backup_service.submit_backup(payload, principal, client_ip)
+        mfa_token = request.headers.get(settings.mfa_header)
+        data = await backup_service.submit_backup(payload, principal, client_ip, mfa_token)
+    except MfaFailure as exc:
+        raise HTTPException(
+            status_code=401,
+            detail=_error_payload(
+                code=exc.code,
+                message=exc.message,
+                request_id=request_id,
+                details=[],
+            ),
+        ) from exc
     except BackupValidationError as exc:
         raise HTTPException(
             status_code=422,
@@ -74,4 +176,4 @@ async def submit_backup(
                 details=[],
             ),
         ) from exc
-    return _success_payload(data=data, request_id=request_id)
+    return success_response(data=data, request_id=request_id)
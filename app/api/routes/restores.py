@@ -1,41 +1,45 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 
 from app.api.dependencies import (
     get_app_settings,
     get_request_id,
     get_restore_access_token_service,
     get_restore_service,
+    get_restore_spool,
 )
+from app.api.responses import EnvelopeResponse, success_response
 from app.core.config import Settings
+from app.infrastructure.storage.restore_spool import RestoreSpool
 from app.schemas.restores import RestoreRequest
 from app.services.auth_service import MfaFailure
 from app.services.restore_access_token_service import (
     RestoreAccessTokenExpired,
     RestoreAccessTokenForbidden,
     RestoreAccessTokenInvalid,
+    RestoreAccessTokenRecord,
     RestoreAccessTokenService,
 )
 from app.services.restore_service import (
+    RestoredRange,
     RestoreExecutionUnavailable,
     RestoreIncidentRestricted,
     RestoreIntegrityFailed,
     RestoreIrreversible,
     RestoreMetadataNotFound,
     RestorePolicyDenied,
+    RestoreRangeNotSatisfiable,
     RestoreService,
 )
 
 router = APIRouter()
 
 
-def _success_payload(data: Mapping[str, object], request_id: str) -> dict[str, object]:
-    return {'data': data, 'meta': {'request_id': request_id}}
-
-
 def _error_payload(
     code: str,
     message: str,
@@ -56,7 +60,7 @@ async def submit_restore(
     request_id: str = Depends(get_request_id),
     settings: Settings = Depends(get_app_settings),
     restore_service: RestoreService = Depends(get_restore_service),
-) -> dict[str, object]:
+) -> EnvelopeResponse:
     try:
         principal = getattr(request.state, 'principal', None)
         client_ip = request.client.host if request.client else None
@@ -132,20 +136,19 @@ async def submit_restore(
                 details=[],
             ),
         ) from exc
-    return _success_payload(data=data, request_id=request_id)
+    return success_response(data=data, request_id=request_id)
 
 
-@router.get('/access/{restore_token}')
-async def use_restore_access_token(
+async def _validate_restore_token(
+    token_service: RestoreAccessTokenService,
     restore_token: str,
     request: Request,
-    request_id: str = Depends(get_request_id),
-    token_service: RestoreAccessTokenService = Depends(get_restore_access_token_service),
-) -> dict[str, object]:
+    request_id: str,
+) -> RestoreAccessTokenRecord:
     try:
         principal = getattr(request.state, 'principal', None)
         actor_key_id = principal.key_id if principal is not None else None
-        record = token_service.validate_token(restore_token, actor_key_id=actor_key_id)
+        return await token_service.validate_token(restore_token, actor_key_id=actor_key_id)
     except RestoreAccessTokenExpired as exc:
         raise HTTPException(
             status_code=401,
@@ -176,7 +179,17 @@ async def use_restore_access_token(
                 details=[],
             ),
         ) from exc
-    return _success_payload(
+
+
+@router.get('/access/{restore_token}')
+async def use_restore_access_token(
+    restore_token: str,
+    request: Request,
+    request_id: str = Depends(get_request_id),
+    token_service: RestoreAccessTokenService = Depends(get_restore_access_token_service),
+) -> EnvelopeResponse:
+    record = await _validate_restore_token(token_service, restore_token, request, request_id)
+    return success_response(
         data={
             'status': 'restore_access_granted',
             'backup_id': record.backup_id,
@@ -184,3 +197,139 @@ async def use_restore_access_token(
         },
         request_id=request_id,
     )
+
+
+def _parse_byte_range(header: str | None) -> tuple[int | None, int | None] | None:
+    # Only a single `bytes=` range is honoured; anything else gets the whole body (RFC 9110).
+    if header is None:
+        return None
+    unit, _, spec = header.strip().partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, separator, last = spec.strip().partition('-')
+    if not separator:
+        return None
+    first, last = first.strip(), last.strip()
+    if not first:
+        return (None, int(last)) if last.isdigit() and int(last) > 0 else None
+    if not first.isdigit() or (last and not last.isdigit()):
+        return None
+    if last and int(last) < int(first):
+        return None
+    return int(first), int(last) if last else None
+
+
+@router.get('/access/{restore_token}/content', response_model=None)
+async def download_restored_content(
+    restore_token: str,
+    request: Request,
+    request_id: str = Depends(get_request_id),
+    token_service: RestoreAccessTokenService = Depends(get_restore_access_token_service),
+    restore_service: RestoreService = Depends(get_restore_service),
+    spool: RestoreSpool = Depends(get_restore_spool),
+) -> Response:
+    record = await _validate_restore_token(token_service, restore_token, request, request_id)
+    byte_range = _parse_byte_range(request.headers.get('range'))
+    restored_range: RestoredRange | None = None
+    try:
+        principal = getattr(request.state, 'principal', None)
+        if byte_range is not None:
+            restored_range = await restore_service.read_restored_range(
+                record,
+                principal,
+                *byte_range,
+            )
+        if restored_range is None:
+            entry = await restore_service.open_restored_content(record, principal)
+    except RestoreRangeNotSatisfiable as exc:
+        raise HTTPException(
+            status_code=416,
+            detail=_error_payload(
+                code='RESTORE_RANGE_NOT_SATISFIABLE',
+                message=exc.message,
+                request_id=request_id,
+                details=[{'size': exc.size}],
+            ),
+            headers={'Content-Range': f'bytes */{exc.size}'},
+        ) from exc
+    except RestoreMetadataNotFound as exc:
+        raise HTTPException(
+            status_code=404,
+            detail=_error_payload(
+                code='RESTORE_BACKUP_NOT_FOUND',
+                message='Backup metadata not found',
+                request_id=request_id,
+                details=[{'backup_id': exc.backup_id}],
+            ),
+        ) from exc
+    except RestoreIrreversible as exc:
+        raise HTTPException(
+            status_code=410,
+            detail=_error_payload(
+                code='RESTORE_IRREVERSIBLE',
+                message=exc.message,
+                request_id=request_id,
+                details=[{'reason_category': exc.reason_category}],
+            ),
+        ) from exc
+    except RestoreIntegrityFailed as exc:
+        raise HTTPException(
+            status_code=409,
+            detail=_error_payload(
+                code='RESTORE_INTEGRITY_FAILED',
+                message=exc.message,
+                request_id=request_id,
+                details=[],
+            ),
+        ) from exc
+    except RestoreExecutionUnavailable as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=_error_payload(
+                code='RESTORE_UNAVAILABLE',
+                message=exc.message,
+                request_id=request_id,
+                details=[],
+            ),
+        ) from exc
+
+    if restored_range is not None:
+        return Response(
+            restored_range.content,
+            status_code=206,
+            media_type='application/octet-stream',
+            headers={
+                'Accept-Ranges': 'bytes',
+                'Content-Range': (
+                    f'bytes {restored_range.first_byte}-{restored_range.last_byte}'
+                    f'/{restored_range.total_size}'
+                ),
+                'Content-Disposition': (
+                    f'attachment; filename="{restored_range.backup_id}.bin"'
+                ),
+            },
+        )
+
+    headers = {
+        'Accept-Ranges': 'bytes',
+        'Content-Length': str(entry.size),
+        'Content-Disposition': f'attachment; filename="{entry.backup_id}.bin"',
+    }
+    # The service acquired the entry; hold it until the body is sent so an expiry purge
+    # cannot wipe it mid-download.
+    if not entry.encrypted:
+        return FileResponse(
+            entry.path,
+            media_type='application/octet-stream',
+            headers=headers,
+            background=BackgroundTask(spool.release, entry),
+        )
+
+    async def _body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in spool.iter_plaintext(entry):
+                yield chunk
+        finally:
+            await spool.release(entry)
+
+    return StreamingResponse(_body(), media_type='application/octet-stream', headers=headers)
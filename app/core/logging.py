@@ -1,5 +1,118 @@
+from __future__ import annotations
+
+import atexit
+import json
 import logging
+import queue
+import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.request_context import key_id_var, request_id_var
+
+_STANDARD_RECORD_ATTRS = frozenset(
+    logging.LogRecord('', 0, '', 0, '', None, None).__dict__.keys()
+    | {'message', 'asctime', 'request_id', 'key_id', 'taskName'},
+)
+
+_listener: QueueListener | None = None
+_queue_handler: DroppingQueueHandler | None = None
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'request_id'):
+            record.request_id = request_id_var.get() or '-'
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, object] = {
+            'timestamp': datetime.fromtimestamp(record.created, UTC).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+            'key_id': getattr(record, 'key_id', None),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exception'] = record.exc_text
+        if record.stack_info:
+            payload['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str, separators=(',', ':'))
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hands records to a background listener; never blocks the event loop on a full queue."""
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is deferred to the listener thread; only capture what depends on
+        # the caller's context (contextvars, lazily-interpolated args).
+        if not hasattr(record, 'request_id'):
+            record.request_id = request_id_var.get()
+        if not hasattr(record, 'key_id'):
+            record.key_id = key_id_var.get()
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def get_dropped_log_count() -> int:
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def configure_logging(
+    level: str = 'INFO',
+    log_format: str = 'json',
+    queue_size: int = 10000,
+) -> None:
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if log_format == 'json':
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.addFilter(RequestIdFilter())
+        stream_handler.setFormatter(
+            logging.Formatter('%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s'),
+        )
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level.upper())
+    _listener.start()
+    atexit.register(shutdown_logging)
 
 
-def configure_logging() -> None:
-    logging.basicConfig(level=logging.INFO)
+def shutdown_logging() -> None:
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    _listener.stop()
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+    _listener = None
+    _queue_handler = None
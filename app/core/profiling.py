@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+
+_MAX_DEPTH = 64
+
+
+def _frame_stack(frame: FrameType | None) -> tuple[str, ...]:
+    names: list[str] = []
+    while frame is not None and len(names) < _MAX_DEPTH:
+        code = frame.f_code
+        names.append(f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})')
+        frame = frame.f_back
+    return tuple(reversed(names))
+
+
+class StackSampler:
+    """Low-overhead wall-clock sampler of one thread's Python stack.
+
+    A daemon thread reads the target thread's current frame every `interval_seconds` and
+    counts identical stacks, so the cost is bounded by the sampling rate rather than by
+    the number of calls the gateway makes.
+    """
+
+    def __init__(self, interval_seconds: float = 0.01) -> None:
+        self._interval_seconds = interval_seconds
+        self._stacks: Counter[tuple[str, ...]] = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target_thread_id: int | None = None
+        self.samples = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def interval_seconds(self) -> float:
+        return self._interval_seconds
+
+    def start(self, target_thread_id: int | None = None) -> None:
+        if self.running:
+            return
+        self._target_thread_id = target_thread_id or threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ssbg-stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample_once(self) -> None:
+        frame = sys._current_frames().get(self._target_thread_id or threading.get_ident())
+        if frame is None:
+            return
+        stack = _frame_stack(frame)
+        with self._lock:
+            self._stacks[stack] += 1
+            self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            self.sample_once()
+
+    def snapshot(self, reset: bool = False) -> Counter[tuple[str, ...]]:
+        with self._lock:
+            stacks = Counter(self._stacks)
+            if reset:
+                self._stacks.clear()
+                self.samples = 0
+        return stacks
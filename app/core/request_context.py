@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import itertools
+import secrets
+from contextvars import ContextVar
+from time import time_ns
+
+request_id_var: ContextVar[str | None] = ContextVar('request_id', default=None)
+key_id_var: ContextVar[str | None] = ContextVar('key_id', default=None)
+
+_NODE_ID = secrets.token_hex(4)
+_SEQUENCE = itertools.count()
+_last_millis = -1
+_last_prefix = ''
+_MAX_REQUEST_ID_LENGTH = 128
+_ALLOWED_REQUEST_ID_CHARS = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.:',
+)
+
+
+def generate_request_id() -> str:
+    # ULID-style: 48-bit millisecond timestamp, per-process node id, rolling sequence.
+    # Lexicographically sortable by time and unique without touching os.urandom per call;
+    # the timestamp prefix is formatted at most once per millisecond.
+    global _last_millis, _last_prefix
+    millis = time_ns() // 1_000_000
+    if millis != _last_millis:
+        _last_millis = millis
+        _last_prefix = '%012x%s' % (millis, _NODE_ID)
+    return _last_prefix + '%06x' % (next(_SEQUENCE) & 0xFFFFFF)
+
+
+def is_valid_request_id(value: str) -> bool:
+    return (
+        0 < len(value) <= _MAX_REQUEST_ID_LENGTH
+        and _ALLOWED_REQUEST_ID_CHARS.issuperset(value)
+    )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any
+
+from app.core.config import Settings
+from app.core.tracing import set_span_backend
+
+TELEMETRY_EXPORTERS = ('otlp', 'file')
+_ATTRIBUTE_TYPES = (str, bool, int, float)
+
+_provider: Any = None
+
+
+def _opentelemetry() -> dict[str, Any]:
+    try:
+        from opentelemetry import propagate, trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            SimpleSpanProcessor,
+            SpanExporter,
+            SpanExportResult,
+        )
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError as exc:  # pragma: no cover - depends on the optional extra
+        raise ValueError('Telemetry requires the OpenTelemetry packages (ssbg[otel])') from exc
+    return {
+        'propagate': propagate,
+        'trace': trace,
+        'Resource': Resource,
+        'TracerProvider': TracerProvider,
+        'BatchSpanProcessor': BatchSpanProcessor,
+        'SimpleSpanProcessor': SimpleSpanProcessor,
+        'SpanExporter': SpanExporter,
+        'SpanExportResult': SpanExportResult,
+        'ParentBased': ParentBased,
+        'TraceIdRatioBased': TraceIdRatioBased,
+    }
+
+
+def _exportable(attributes: Mapping[str, object]) -> dict[str, Any]:
+    # OpenTelemetry only accepts primitive attribute values.
+    return {key: value for key, value in attributes.items() if isinstance(value, _ATTRIBUTE_TYPES)}
+
+
+class OpenTelemetrySpanBackend:
+    def __init__(self, tracer: Any, trace_api: Any, propagate: Any) -> None:
+        self._tracer = tracer
+        self._trace_api = trace_api
+        self._propagate = propagate
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, object],
+        carrier: Mapping[str, str] | None = None,
+    ) -> AbstractContextManager[object]:
+        # An incoming W3C traceparent makes the gateway span a child of the caller's.
+        context = self._propagate.extract(carrier) if carrier is not None else None
+        span: AbstractContextManager[object] = self._tracer.start_as_current_span(
+            name,
+            context=context,
+            attributes=_exportable(attributes),
+        )
+        return span
+
+    def annotate(self, attributes: Mapping[str, object]) -> None:
+        self._trace_api.get_current_span().set_attributes(_exportable(attributes))
+
+
+def _file_exporter(otel: Mapping[str, Any], path: Path) -> Any:
+    base: type = otel['SpanExporter']
+    result = otel['SpanExportResult']
+
+    class FileSpanExporter(base):  # type: ignore[misc, valid-type]
+        """One JSON object per line; lets tests and offline runs read spans back."""
+
+        def export(self, spans: Sequence[Any]) -> Any:
+            with path.open('a', encoding='utf-8') as handle:
+                for span in spans:
+                    handle.write(span.to_json(indent=None) + '\n')
+            return result.SUCCESS
+
+    return FileSpanExporter()
+
+
+def configure_telemetry(settings: Settings) -> bool:
+    """Install the OpenTelemetry span backend when TELEMETRY_ENABLED is set."""
+    global _provider
+    if not settings.telemetry_enabled:
+        return False
+    if settings.telemetry_exporter not in TELEMETRY_EXPORTERS:
+        raise ValueError(f'Unknown telemetry exporter: {settings.telemetry_exporter}')
+    otel = _opentelemetry()
+    provider = otel['TracerProvider'](
+        resource=otel['Resource'].create({'service.name': settings.telemetry_service_name}),
+        sampler=otel['ParentBased'](otel['TraceIdRatioBased'](settings.telemetry_sample_rate)),
+    )
+    if settings.telemetry_exporter == 'file':
+        exporter = _file_exporter(otel, Path(settings.telemetry_file_path))
+        provider.add_span_processor(otel['SimpleSpanProcessor'](exporter))
+    else:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as exc:  # pragma: no cover - depends on the optional extra
+            raise ValueError('OTLP export requires the ssbg[otel] extra') from exc
+        exporter = OTLPSpanExporter(endpoint=settings.telemetry_otlp_endpoint)
+        provider.add_span_processor(otel['BatchSpanProcessor'](exporter))
+    _provider = provider
+    set_span_backend(
+        OpenTelemetrySpanBackend(
+            provider.get_tracer('ssbg'),
+            otel['trace'],
+            otel['propagate'],
+        ),
+    )
+    return True
+
+
+def shutdown_telemetry() -> None:
+    global _provider
+    set_span_backend(None)
+    if _provider is not None:
+        # Flushes spans still queued in the batch processor.
+        _provider.shutdown()
+        _provider = None
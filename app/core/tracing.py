@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import functools
+import inspect
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from time import perf_counter_ns
+from typing import ParamSpec, Protocol, TypeVar
+
+P = ParamSpec('P')
+R = TypeVar('R')
+T = TypeVar('T', bound=type)
+
+_ROOT_FRAME = 'request'
+
+_active_trace: ContextVar[RequestTrace | None] = ContextVar('active_trace', default=None)
+# Index of the innermost open span; per task, so spans opened under asyncio.gather nest
+# under the span that spawned them rather than under each other.
+_parent_span: ContextVar[int | None] = ContextVar('parent_span', default=None)
+
+
+class SpanBackend(Protocol):
+    """Exports every span to an external tracer such as OpenTelemetry."""
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, object],
+        carrier: Mapping[str, str] | None = None,
+    ) -> AbstractContextManager[object]: ...
+
+    def annotate(self, attributes: Mapping[str, object]) -> None: ...
+
+
+_span_backend: SpanBackend | None = None
+
+
+def set_span_backend(backend: SpanBackend | None) -> None:
+    global _span_backend
+    _span_backend = backend
+
+
+def span_backend() -> SpanBackend | None:
+    return _span_backend
+
+
+@dataclass
+class TraceSpan:
+    name: str
+    parent: int | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def duration_ns(self) -> int:
+        return 0 if self.end_ns is None else self.end_ns - self.start_ns
+
+
+class RequestTrace:
+    """Timed spans recorded for one request while it is being traced."""
+
+    def __init__(self, request_id: str, method: str, path: str, trigger: str) -> None:
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.trigger = trigger
+        self.started_at = datetime.now(UTC)
+        self.status_code: int | None = None
+        self.spans: list[TraceSpan] = []
+        self._origin_ns = perf_counter_ns()
+        self._duration_ns: int | None = None
+
+    @property
+    def duration_ns(self) -> int:
+        if self._duration_ns is None:
+            return perf_counter_ns() - self._origin_ns
+        return self._duration_ns
+
+    def open_span(self, name: str, parent: int | None, attributes: dict[str, object]) -> int:
+        start_ns = perf_counter_ns() - self._origin_ns
+        self.spans.append(TraceSpan(name, parent, start_ns, attributes=attributes))
+        return len(self.spans) - 1
+
+    def close_span(self, index: int) -> None:
+        self.spans[index].end_ns = perf_counter_ns() - self._origin_ns
+
+    def finish(self, status_code: int | None) -> None:
+        self.status_code = status_code
+        self._duration_ns = perf_counter_ns() - self._origin_ns
+
+    def summary(self) -> dict[str, object]:
+        return {
+            'request_id': self.request_id,
+            'method': self.method,
+            'path': self.path,
+            'trigger': self.trigger,
+            'status_code': self.status_code,
+            'started_at': self.started_at.isoformat(),
+            'duration_ms': round(self.duration_ns / 1_000_000, 3),
+            'span_count': len(self.spans),
+        }
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            **self.summary(),
+            'spans': [
+                {
+                    'name': span.name,
+                    'parent': span.parent,
+                    'start_ms': round(span.start_ns / 1_000_000, 3),
+                    'duration_ms': round(span.duration_ns / 1_000_000, 3),
+                    'attributes': span.attributes,
+                }
+                for span in self.spans
+            ],
+        }
+
+    def _stack(self, index: int) -> tuple[str, ...]:
+        names: list[str] = []
+        current: int | None = index
+        while current is not None:
+            names.append(self.spans[current].name)
+            current = self.spans[current].parent
+        return (_ROOT_FRAME, *reversed(names))
+
+    def self_times(self) -> Counter[tuple[str, ...]]:
+        """Microseconds spent directly in each stack, excluding child spans."""
+        child_time = [0] * len(self.spans)
+        top_level_time = 0
+        for span in self.spans:
+            if span.parent is None:
+                top_level_time += span.duration_ns
+            else:
+                child_time[span.parent] += span.duration_ns
+        # Concurrent children can add up to more than their parent; clamp at zero.
+        stacks: Counter[tuple[str, ...]] = Counter()
+        stacks[(_ROOT_FRAME,)] = max(self.duration_ns - top_level_time, 0) // 1000
+        for index, span in enumerate(self.spans):
+            stacks[self._stack(index)] += max(span.duration_ns - child_time[index], 0) // 1000
+        return stacks
+
+
+def collapsed_stacks(stacks: Mapping[tuple[str, ...], int]) -> str:
+    """Brendan Gregg's folded format, as read by flamegraph.pl and speedscope."""
+    return ''.join(f'{";".join(stack)} {weight}\n' for stack, weight in stacks.items() if weight)
+
+
+def speedscope_profile(
+    name: str,
+    stacks: Mapping[tuple[str, ...], int],
+    unit: str,
+) -> dict[str, object]:
+    frames: dict[str, int] = {}
+    samples: list[list[int]] = []
+    weights: list[int] = []
+    for stack, weight in stacks.items():
+        if not weight:
+            continue
+        samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+        weights.append(weight)
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'shared': {'frames': [{'name': frame} for frame in frames]},
+        'profiles': [
+            {
+                'type': 'sampled',
+                'name': name,
+                'unit': unit,
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            },
+        ],
+    }
+
+
+class TraceStore:
+    """Keeps the most recent request traces for the admin profiling endpoint."""
+
+    def __init__(self, capacity: int = 200) -> None:
+        self._capacity = max(capacity, 1)
+        self._traces: OrderedDict[str, RequestTrace] = OrderedDict()
+
+    def add(self, trace: RequestTrace) -> None:
+        self._traces[trace.request_id] = trace
+        self._traces.move_to_end(trace.request_id)
+        while len(self._traces) > self._capacity:
+            self._traces.popitem(last=False)
+
+    def get(self, request_id: str) -> RequestTrace | None:
+        return self._traces.get(request_id)
+
+    def recent(self, limit: int) -> list[RequestTrace]:
+        return list(reversed(self._traces.values()))[:limit]
+
+
+@contextmanager
+def start_trace(trace: RequestTrace) -> Iterator[RequestTrace]:
+    trace_token = _active_trace.set(trace)
+    parent_token = _parent_span.set(None)
+    try:
+        yield trace
+    finally:
+        _parent_span.reset(parent_token)
+        _active_trace.reset(trace_token)
+
+
+def current_trace() -> RequestTrace | None:
+    return _active_trace.get()
+
+
+def tracing_active() -> bool:
+    return _active_trace.get() is not None or _span_backend is not None
+
+
+@contextmanager
+def trace_span(name: str, **attributes: object) -> Iterator[None]:
+    # Untraced requests pay for one ContextVar lookup and a global read, nothing else.
+    trace = _active_trace.get()
+    backend = _span_backend
+    if trace is None and backend is None:
+        yield
+        return
+    with backend.start_span(name, attributes) if backend is not None else nullcontext():
+        if trace is None:
+            yield
+            return
+        index = trace.open_span(name, _parent_span.get(), attributes)
+        token = _parent_span.set(index)
+        try:
+            yield
+        finally:
+            _parent_span.reset(token)
+            trace.close_span(index)
+
+
+def annotate_span(**attributes: object) -> None:
+    """Add attributes, such as a retry attempt, to the innermost open span."""
+    trace = _active_trace.get()
+    if trace is not None:
+        index = _parent_span.get()
+        if index is not None:
+            trace.spans[index].attributes.update(attributes)
+    if _span_backend is not None:
+        _span_backend.annotate(attributes)
+
+
+def traced(name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    def decorate(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _active_trace.get() is None and _span_backend is None:
+                return await func(*args, **kwargs)
+            with trace_span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def traced_methods(prefix: str) -> Callable[[T], T]:
+    """Wrap every public coroutine method of a class in a `<prefix>.<method>` span."""
+
+    def decorate(cls: T) -> T:
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith('_') or not inspect.iscoroutinefunction(value):
+                continue
+            setattr(cls, attribute, traced(f'{prefix}.{attribute}')(value))
+        return cls
+
+    return decorate
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import secrets
+from collections.abc import Callable
 from dataclasses import dataclass
+from struct import Struct
+from typing import TYPE_CHECKING
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
 @dataclass(frozen=True)
@@ -22,10 +26,17 @@ def _normalize_aes_key(key: bytes) -> bytes:
     return sha256(key).digest()
 
 
+def _cipher(key: bytes) -> AESGCM:
+    # Loaded on first use so importing the app does not pull in the OpenSSL bindings.
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM(key)
+
+
 def encrypt(plaintext: bytes, key: bytes) -> EncryptionResult:
     aes_key = _normalize_aes_key(key)
     nonce = secrets.token_bytes(12)
-    aesgcm = AESGCM(aes_key)
+    aesgcm = _cipher(aes_key)
     encrypted = aesgcm.encrypt(nonce, plaintext, None)
     ciphertext = encrypted[:-16]
     tag = encrypted[-16:]
@@ -34,5 +45,96 @@ def encrypt(plaintext: bytes, key: bytes) -> EncryptionResult:
 
 def decrypt(ciphertext: bytes, key: bytes, nonce: bytes, tag: bytes) -> bytes:
     aes_key = _normalize_aes_key(key)
-    aesgcm = AESGCM(aes_key)
+    aesgcm = _cipher(aes_key)
     return aesgcm.decrypt(nonce, ciphertext + tag, None)
+
+
+GCM_TAG_SIZE = 16
+_CHUNK_NONCE = Struct('>8sI')
+_CHUNK_AAD = Struct('>I?')
+
+
+@dataclass(frozen=True)
+class ChunkedEncryptionResult:
+    nonce_prefix: bytes
+    blob: bytes
+    chunk_size: int
+    # Ciphertext offset of every chunk followed by the blob length, so chunk i is
+    # blob[offsets[i]:offsets[i + 1]].
+    offsets: list[int]
+
+
+def _chunk_nonce(nonce_prefix: bytes, index: int) -> bytes:
+    return _CHUNK_NONCE.pack(nonce_prefix, index)
+
+
+def encrypt_chunked(
+    plaintext: bytes,
+    key: bytes,
+    chunk_size: int,
+    compress: Callable[[bytes], bytes] | None = None,
+) -> ChunkedEncryptionResult:
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    aesgcm = _cipher(_normalize_aes_key(key))
+    nonce_prefix = secrets.token_bytes(8)
+    view = memoryview(plaintext)
+    starts = range(0, len(plaintext), chunk_size) if plaintext else range(1)
+    last_index = len(starts) - 1
+    frames: list[bytes] = []
+    offsets = [0]
+    for index, start in enumerate(starts):
+        # The AAD binds each chunk to its position and marks the last one, so chunks
+        # cannot be reordered and the blob cannot be truncated on a chunk boundary.
+        chunk = bytes(view[start : start + chunk_size])
+        frame = aesgcm.encrypt(
+            _chunk_nonce(nonce_prefix, index),
+            compress(chunk) if compress is not None else chunk,
+            _CHUNK_AAD.pack(index, index == last_index),
+        )
+        frames.append(frame)
+        offsets.append(offsets[-1] + len(frame))
+    return ChunkedEncryptionResult(
+        nonce_prefix=nonce_prefix,
+        blob=b''.join(frames),
+        chunk_size=chunk_size,
+        offsets=offsets,
+    )
+
+
+def decrypt_chunk(frame: bytes, key: bytes, nonce_prefix: bytes, index: int, final: bool) -> bytes:
+    aesgcm = _cipher(_normalize_aes_key(key))
+    return aesgcm.decrypt(
+        _chunk_nonce(nonce_prefix, index),
+        frame,
+        _CHUNK_AAD.pack(index, final),
+    )
+
+
+def decrypt_chunks(
+    blob: bytes,
+    key: bytes,
+    nonce_prefix: bytes,
+    offsets: list[int],
+    first_index: int = 0,
+    decompress: Callable[[bytes], bytes] | None = None,
+) -> bytes:
+    aesgcm = _cipher(_normalize_aes_key(key))
+    last_index = len(offsets) - 2
+    base = offsets[first_index]
+    view = memoryview(blob)
+    parts: list[bytes] = []
+    index = first_index
+    while index <= last_index and offsets[index] - base < len(blob):
+        chunk = aesgcm.decrypt(
+            _chunk_nonce(nonce_prefix, index),
+            bytes(view[offsets[index] - base : offsets[index + 1] - base]),
+            _CHUNK_AAD.pack(index, index == last_index),
+        )
+        parts.append(decompress(chunk) if decompress is not None else chunk)
+        index += 1
+    return b''.join(parts)
+
+
+def chunk_span(first_byte: int, last_byte: int, chunk_size: int) -> tuple[int, int]:
+    return first_byte // chunk_size, last_byte // chunk_size
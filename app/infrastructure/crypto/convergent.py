@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+from dataclasses import dataclass
+
+# Every chunk is sealed under its own derived key, so a fixed nonce is never reused.
+_CHUNK_NONCE = b'\x00' * 12
+
+
+@dataclass(frozen=True)
+class ConvergentKeys:
+    id_key: bytes
+    seal_key: bytes
+
+
+def _derive(key_bytes: bytes, label: bytes, scope: str) -> bytes:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=label + b'\x00' + scope.encode(),
+    ).derive(key_bytes)
+
+
+def derive_convergent_keys(key_bytes: bytes, scope: str) -> ConvergentKeys:
+    """Keys for deduplicated chunks of one data-key version within one scope.
+
+    Identical plaintext chunks seal to identical objects only under the same data key
+    and scope, so equality is never observable across tenants, and destroying the data
+    key version still crypto-shreds every chunk derived from it.
+    """
+    return ConvergentKeys(
+        id_key=_derive(key_bytes, b'ssbg-dedup-id', scope),
+        seal_key=_derive(key_bytes, b'ssbg-dedup-seal', scope),
+    )
+
+
+def chunk_id(keys: ConvergentKeys, plaintext: bytes) -> str:
+    return hmac.new(keys.id_key, plaintext, hashlib.sha256).hexdigest()
+
+
+def _chunk_key(keys: ConvergentKeys, identifier: str) -> bytes:
+    return hmac.new(keys.seal_key, bytes.fromhex(identifier), hashlib.sha256).digest()
+
+
+def seal_chunk(keys: ConvergentKeys, identifier: str, data: bytes) -> bytes:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM(_chunk_key(keys, identifier)).encrypt(
+        _CHUNK_NONCE,
+        data,
+        bytes.fromhex(identifier),
+    )
+
+
+def open_chunk(keys: ConvergentKeys, identifier: str, sealed: bytes) -> bytes:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM(_chunk_key(keys, identifier)).decrypt(
+        _CHUNK_NONCE,
+        sealed,
+        bytes.fromhex(identifier),
+    )
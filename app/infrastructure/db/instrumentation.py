@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from contextlib import ExitStack
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.tracing import trace_span, tracing_active
+
+_SPAN_KEY = 'ssbg_statement_span'
+_STATEMENT_LIMIT = 500
+
+
+def _close_span(context: Any, error: BaseException | None = None) -> None:
+    if context is None:
+        return
+    stack: ExitStack | None = getattr(context, _SPAN_KEY, None)
+    if stack is None:
+        return
+    setattr(context, _SPAN_KEY, None)
+    if error is None:
+        stack.close()
+    else:
+        stack.__exit__(type(error), error, error.__traceback__)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Open a `db.statement` span around every cursor execution on the engine."""
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if context is None or not tracing_active():
+            return
+        words = statement.split(None, 1)
+        stack = ExitStack()
+        stack.enter_context(
+            trace_span(
+                'db.statement',
+                **{
+                    'db.system': 'postgresql',
+                    'db.operation': words[0].upper() if words else '',
+                    'db.statement': statement[:_STATEMENT_LIMIT],
+                    'db.executemany': executemany,
+                },
+            ),
+        )
+        setattr(context, _SPAN_KEY, stack)
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        _close_span(context)
+
+    @event.listens_for(engine, 'handle_error')
+    def _error(exception_context: Any) -> None:
+        _close_span(exception_context.execution_context, exception_context.original_exception)
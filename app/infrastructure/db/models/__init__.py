@@ -1,20 +1,26 @@
 from app.infrastructure.db.base import Base
 from app.infrastructure.db.models.alert import AlertModel
 from app.infrastructure.db.models.api_key import ApiKeyModel
+from app.infrastructure.db.models.audit_archive_manifest import AuditArchiveManifestModel
 from app.infrastructure.db.models.audit_log_entry import AuditLogEntryModel
 from app.infrastructure.db.models.backup_metadata import BackupMetadataModel
 from app.infrastructure.db.models.incident_state import IncidentStateModel
 from app.infrastructure.db.models.key_version import KeyVersionModel
 from app.infrastructure.db.models.policy_record import PolicyRecordModel
+from app.infrastructure.db.models.rate_counter import RateCounterModel
+from app.infrastructure.db.models.restore_access_token import RestoreAccessTokenModel
 
 # Import model modules here as they are added so Alembic can discover metadata.
 __all__ = [
     'AlertModel',
     'ApiKeyModel',
+    'AuditArchiveManifestModel',
     'AuditLogEntryModel',
     'BackupMetadataModel',
     'Base',
     'IncidentStateModel',
     'KeyVersionModel',
     'PolicyRecordModel',
+    'RateCounterModel',
+    'RestoreAccessTokenModel',
 ]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.base import Base
+
+
+class AuditArchiveManifestModel(Base):
+    __tablename__ = 'audit_archive_manifests'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    partition_name: Mapped[str] = mapped_column(String(63), unique=True, index=True)
+    range_start: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    range_end: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    object_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    entry_count: Mapped[int] = mapped_column(Integer, default=0)
+    first_chain_index: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_chain_index: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    first_prev_hash: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    last_entry_hash: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    archive_sha512: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    prev_manifest_hash: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    manifest_hash: Mapped[str] = mapped_column(String(128), unique=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy import (
+    DateTime,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base
@@ -10,16 +19,23 @@ from app.infrastructure.db.base import Base
 
 class AuditLogEntryModel(Base):
     __tablename__ = 'audit_log_entries'
+    # Monthly range partitions on created_at; unique constraints must include the
+    # partition key, so chain uniqueness is serialized by an advisory lock on append.
     __table_args__ = (
-        UniqueConstraint('chain_index', name='uq_audit_log_entries_chain_index'),
-        UniqueConstraint('entry_hash', name='uq_audit_log_entries_entry_hash'),
+        UniqueConstraint('chain_index', 'created_at', name='uq_audit_log_entries_chain_index'),
+        UniqueConstraint('entry_hash', 'created_at', name='uq_audit_log_entries_entry_hash'),
+        Index('ix_audit_log_entries_action_chain_index', 'action', 'chain_index'),
+        Index('ix_audit_log_entries_resource_chain_index', 'resource', 'chain_index'),
+        Index('ix_audit_log_entries_status_chain_index', 'status', 'chain_index'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     chain_index: Mapped[int] = mapped_column(Integer, index=True)
     prev_hash: Mapped[str | None] = mapped_column(String(128), nullable=True)
     entry_hash: Mapped[str] = mapped_column(String(128), index=True)
-    event_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    hash_version: Mapped[int] = mapped_column(SmallInteger, server_default=text('1'))
+    event_id: Mapped[str] = mapped_column(String(64), index=True)
     action: Mapped[str] = mapped_column(String(100), index=True)
     resource: Mapped[str] = mapped_column(String(200), index=True)
     resource_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
@@ -27,4 +43,10 @@ class AuditLogEntryModel(Base):
     actor_role: Mapped[str | None] = mapped_column(String(32), nullable=True)
     status: Mapped[str | None] = mapped_column(String(32), nullable=True)
     reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Correlation ID of the request that wrote the entry; not covered by entry_hash.
+    request_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+    )
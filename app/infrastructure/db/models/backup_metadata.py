@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import JSON, DateTime, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base
@@ -10,6 +10,13 @@ from app.infrastructure.db.base import Base
 
 class BackupMetadataModel(Base):
     __tablename__ = 'backup_metadata'
+    # Catalog pages are keyset-ordered by (created_at, id), alone or after one filter.
+    __table_args__ = (
+        Index('ix_backup_metadata_created_at_id', 'created_at', 'id'),
+        Index('ix_backup_metadata_source_system_created_at', 'source_system', 'created_at', 'id'),
+        Index('ix_backup_metadata_classification_created_at', 'classification', 'created_at', 'id'),
+        Index('ix_backup_metadata_status_created_at', 'status', 'created_at', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     backup_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)
@@ -24,6 +31,16 @@ class BackupMetadataModel(Base):
     nonce: Mapped[str | None] = mapped_column(String(64), nullable=True)
     original_size: Mapped[int | None] = mapped_column(nullable=True)
     encrypted_size: Mapped[int | None] = mapped_column(nullable=True)
+    chunk_size: Mapped[int | None] = mapped_column(nullable=True)
+    chunk_offsets: Mapped[list[int] | None] = mapped_column(JSON, nullable=True)
+    compression: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    compression_level: Mapped[int | None] = mapped_column(nullable=True)
+    # [[chunk_id, plaintext_size], ...] in order; chunks live under storage_path.
+    dedup_manifest: Mapped[list[list[object]] | None] = mapped_column(JSON, nullable=True)
+    # Set when the stored object is a delta against this earlier backup.
+    base_backup_id: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    delta_depth: Mapped[int] = mapped_column(default=0, server_default=text('0'))
+    delta_size: Mapped[int | None] = mapped_column(nullable=True)
     irreversible_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
     shredded_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DEFERRED_KEY = 'ssbg_unit_of_work'
+
+
+def commits_deferred(session: AsyncSession) -> bool:
+    return bool(session.info.get(_DEFERRED_KEY))
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """Repository write boundary: flush inside an open unit of work, commit otherwise."""
+    if commits_deferred(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+class UnitOfWork:
+    """Groups the repository writes of one request into explicit transactions.
+
+    Inside `transaction()` repositories only flush, and the block commits once on exit
+    (one fsync) or rolls back on error. Nested blocks join the outer transaction.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self.commits = 0
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        if commits_deferred(self._session):
+            yield
+            return
+        self._session.info[_DEFERRED_KEY] = True
+        try:
+            yield
+        except BaseException:
+            self._session.info.pop(_DEFERRED_KEY, None)
+            await self._session.rollback()
+            raise
+        self._session.info.pop(_DEFERRED_KEY, None)
+        await self._session.commit()
+        self.commits += 1
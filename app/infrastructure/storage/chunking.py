@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from hashlib import sha256
+
+_MASK64 = (1 << 64) - 1
+# Fixed pseudo-random byte table for the gear rolling hash; boundaries depend on it,
+# so changing it would stop new chunks from deduplicating against stored ones.
+_GEAR = tuple(int.from_bytes(sha256(bytes([value])).digest()[:8], 'big') for value in range(256))
+
+
+def _boundary_mask(bits: int) -> int:
+    # Gear hash bit k only depends on the last k + 1 bytes, so test the high bits.
+    return ((1 << bits) - 1) << (64 - bits)
+
+
+def cdc_boundaries(
+    data: bytes,
+    min_size: int,
+    avg_size: int,
+    max_size: int,
+) -> list[int]:
+    """End offsets of content-defined chunks (FastCDC-style normalized gear chunking).
+
+    A boundary depends only on the bytes just before it, so an insert or delete early
+    in the data shifts the following chunks without changing them.
+    """
+    if not 0 < min_size <= avg_size <= max_size:
+        raise ValueError('Chunk sizes must satisfy 0 < min <= avg <= max')
+    bits = max(avg_size.bit_length() - 1, 1)
+    # Stricter before the average size and looser after it keeps sizes near avg_size.
+    mask_small = _boundary_mask(bits + 1)
+    mask_large = _boundary_mask(max(bits - 1, 1))
+    gear = _GEAR
+    boundaries: list[int] = []
+    length = len(data)
+    start = 0
+    while start < length:
+        end = min(start + max_size, length)
+        if end - start <= min_size:
+            boundaries.append(end)
+            break
+        normal = min(start + avg_size, end)
+        position = start + min_size
+        fingerprint = 0
+        cut = end
+        while position < normal:
+            fingerprint = ((fingerprint << 1) + gear[data[position]]) & _MASK64
+            position += 1
+            if not fingerprint & mask_small:
+                cut = position
+                break
+        else:
+            while position < end:
+                fingerprint = ((fingerprint << 1) + gear[data[position]]) & _MASK64
+                position += 1
+                if not fingerprint & mask_large:
+                    cut = position
+                    break
+        boundaries.append(cut)
+        start = cut
+    return boundaries
+
+
+def slice_chunks(data: bytes, boundaries: list[int]) -> list[bytes]:
+    view = memoryview(data)
+    chunks: list[bytes] = []
+    start = 0
+    for end in boundaries:
+        chunks.append(bytes(view[start:end]))
+        start = end
+    return chunks
+
+
+def split_chunks(data: bytes, min_size: int, avg_size: int, max_size: int) -> list[bytes]:
+    return slice_chunks(data, cdc_boundaries(data, min_size, avg_size, max_size))
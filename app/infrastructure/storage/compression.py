@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable
+
+COMPRESSION_NONE = 'none'
+COMPRESSION_ZLIB = 'zlib'
+COMPRESSION_ZSTD = 'zstd'
+COMPRESSION_ALGORITHMS = frozenset({COMPRESSION_NONE, COMPRESSION_ZLIB, COMPRESSION_ZSTD})
+
+# Compressing must save at least this fraction of the sample to be worth the CPU.
+MIN_COMPRESSION_SAVING = 0.1
+
+Compressor = Callable[[bytes], bytes]
+Decompressor = Callable[[bytes, int], bytes]
+
+
+class CompressionError(Exception):
+    def __init__(self, message: str = 'Compressed data is invalid') -> None:
+        super().__init__(message)
+        self.message = message
+
+
+def _zstandard() -> object:
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on the optional extra
+        raise ValueError('zstd compression requires the zstandard package (ssbg[zstd])') from exc
+    return zstandard
+
+
+def get_compressor(algorithm: str, level: int) -> Compressor | None:
+    if algorithm == COMPRESSION_NONE:
+        return None
+    if algorithm == COMPRESSION_ZLIB:
+        return lambda data: zlib.compress(data, level)
+    if algorithm == COMPRESSION_ZSTD:
+        compressor = _zstandard().ZstdCompressor(level=level)  # type: ignore[attr-defined]
+        compress: Compressor = compressor.compress
+        return compress
+    raise ValueError(f'Unsupported backup compression algorithm: {algorithm}')
+
+
+def _zlib_decompress(data: bytes, max_size: int) -> bytes:
+    decompressor = zlib.decompressobj()
+    try:
+        # One byte of headroom tells an exact fit apart from an oversized stream.
+        output = decompressor.decompress(data, max_size + 1)
+    except zlib.error as exc:
+        raise CompressionError() from exc
+    if len(output) > max_size or not decompressor.eof or decompressor.unconsumed_tail:
+        raise CompressionError()
+    return output
+
+
+def get_decompressor(algorithm: str | None) -> Decompressor | None:
+    if algorithm in (None, COMPRESSION_NONE):
+        return None
+    if algorithm == COMPRESSION_ZLIB:
+        return _zlib_decompress
+    if algorithm == COMPRESSION_ZSTD:
+        decompressor = _zstandard().ZstdDecompressor()  # type: ignore[attr-defined]
+
+        def _zstd_decompress(data: bytes, max_size: int) -> bytes:
+            try:
+                output: bytes = decompressor.decompress(data, max_output_size=max_size)
+            except Exception as exc:
+                raise CompressionError() from exc
+            if len(output) > max_size:
+                raise CompressionError()
+            return output
+
+        return _zstd_decompress
+    raise ValueError(f'Unsupported backup compression algorithm: {algorithm}')
+
+
+def worth_compressing(sample: bytes, compress: Compressor) -> bool:
+    if not sample:
+        return False
+    return len(compress(sample)) <= len(sample) * (1 - MIN_COMPRESSION_SAVING)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from struct import Struct
+
+from app.infrastructure.storage.chunking import cdc_boundaries
+
+DELTA_MAGIC = b'SSBGD1'
+_OP_COPY = 1
+_OP_LITERAL = 2
+_COPY = Struct('>BQI')
+_LITERAL = Struct('>BI')
+
+
+class DeltaError(Exception):
+    def __init__(self, message: str = 'Backup delta is malformed') -> None:
+        super().__init__(message)
+        self.message = message
+
+
+def _chunk_digest(data: memoryview) -> bytes:
+    return blake2b(data, digest_size=16).digest()
+
+
+def compute_delta(
+    base: bytes,
+    target: bytes,
+    min_size: int,
+    avg_size: int,
+    max_size: int,
+) -> bytes:
+    """Encode `target` as copies from `base` plus literal bytes.
+
+    Both sides are split with the same content-defined chunker, so a region shared by
+    base and target yields identical chunks even when an edit has shifted it.
+    """
+    base_view = memoryview(base)
+    known: dict[bytes, int] = {}
+    start = 0
+    for end in cdc_boundaries(base, min_size, avg_size, max_size):
+        known.setdefault(_chunk_digest(base_view[start:end]), start)
+        start = end
+
+    target_view = memoryview(target)
+    ops: list[list[int]] = []
+    start = 0
+    for end in cdc_boundaries(target, min_size, avg_size, max_size):
+        base_offset = known.get(_chunk_digest(target_view[start:end]))
+        length = end - start
+        previous = ops[-1] if ops else None
+        if base_offset is None:
+            if previous is not None and previous[0] == _OP_LITERAL:
+                previous[2] += length
+            else:
+                ops.append([_OP_LITERAL, start, length])
+        elif (
+            previous is not None
+            and previous[0] == _OP_COPY
+            and previous[1] + previous[2] == base_offset
+        ):
+            previous[2] += length
+        else:
+            ops.append([_OP_COPY, base_offset, length])
+        start = end
+
+    parts = [DELTA_MAGIC]
+    for op, offset, length in ops:
+        if op == _OP_COPY:
+            parts.append(_COPY.pack(_OP_COPY, offset, length))
+        else:
+            parts.append(_LITERAL.pack(_OP_LITERAL, length))
+            parts.append(bytes(target_view[offset : offset + length]))
+    return b''.join(parts)
+
+
+def apply_delta(base: bytes, delta: bytes, max_size: int) -> bytes:
+    if not delta.startswith(DELTA_MAGIC):
+        raise DeltaError()
+    view = memoryview(delta)
+    position = len(DELTA_MAGIC)
+    parts: list[bytes | memoryview] = []
+    produced = 0
+    base_view = memoryview(base)
+    while position < len(delta):
+        op = delta[position]
+        if op == _OP_COPY and position + _COPY.size <= len(delta):
+            _, offset, length = _COPY.unpack_from(delta, position)
+            position += _COPY.size
+            if offset + length > len(base):
+                raise DeltaError()
+            parts.append(base_view[offset : offset + length])
+        elif op == _OP_LITERAL and position + _LITERAL.size <= len(delta):
+            _, length = _LITERAL.unpack_from(delta, position)
+            position += _LITERAL.size
+            if position + length > len(delta):
+                raise DeltaError()
+            parts.append(view[position : position + length])
+            position += length
+        else:
+            raise DeltaError()
+        produced += length
+        if produced > max_size:
+            raise DeltaError()
+    return b''.join(parts)
@@ -5,6 +5,8 @@ from http.client import HTTPResponse
 from typing import cast
 from urllib.request import Request, urlopen
 
+from app.core.tracing import traced_methods
+
 
 async def check_minio_ready(endpoint: str, timeout_seconds: float = 2.0) -> bool:
     url = f"{endpoint.rstrip('/')}/minio/health/ready"
@@ -27,6 +29,7 @@ class ObjectStorageError(Exception):
         self.message = message
 
 
+@traced_methods('storage')
 class InMemoryObjectStorage:
     def __init__(self) -> None:
         self._objects: dict[tuple[str, str], bytes] = {}
@@ -38,3 +41,19 @@ class InMemoryObjectStorage:
 
     async def get_object(self, bucket: str, object_name: str) -> bytes | None:
         return self._objects.get((bucket, object_name))
+
+    async def has_object(self, bucket: str, object_name: str) -> bool:
+        return (bucket, object_name) in self._objects
+
+    async def get_object_range(
+        self,
+        bucket: str,
+        object_name: str,
+        first_byte: int,
+        last_byte: int,
+    ) -> bytes | None:
+        # Inclusive bounds, matching an HTTP `Range: bytes=first-last` GET.
+        data = self._objects.get((bucket, object_name))
+        if data is None:
+            return None
+        return data[first_byte : last_byte + 1]
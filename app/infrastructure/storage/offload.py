@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+_T = TypeVar('_T')
+
+# The content-defined chunker and the delta encoder scan byte by byte in pure Python at a
+# few MB/s and hold the GIL throughout, so a worker thread still starves the event loop.
+# Inputs of at least this many bytes run in a worker process instead.
+PROCESS_OFFLOAD_MIN_SIZE = 256 * 1024
+_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn rather than fork: forking a process with running threads is unsafe.
+        _executor = ProcessPoolExecutor(
+            max_workers=_MAX_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _executor
+
+
+async def run_cpu_bound(size: int, func: Callable[..., _T], *args: Any) -> _T:
+    """Run `func(*args)` off the event loop, in a worker process once `size` is large.
+
+    `func` must be a module-level function and its arguments picklable.
+    """
+    if size < PROCESS_OFFLOAD_MIN_SIZE:
+        return await asyncio.to_thread(func, *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+def shutdown_process_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from hashlib import sha256
+from pathlib import Path
+from struct import Struct
+
+logger = logging.getLogger(__name__)
+
+SPOOL_FRAME_SIZE = 1024 * 1024
+_FRAME_LENGTH = Struct('>I')
+_FRAME_NONCE = Struct('>4xQ')
+# Every frame but the last holds SPOOL_FRAME_SIZE plaintext bytes plus a 16-byte GCM tag.
+_STORED_FRAME_SIZE = _FRAME_LENGTH.size + SPOOL_FRAME_SIZE + 16
+_SPOOL_SUFFIX = '.spool'
+_WIPE_CHUNK = b'\x00' * SPOOL_FRAME_SIZE
+
+
+def default_spool_directory() -> str:
+    # Prefer RAM-backed tmpfs so verified plaintext never reaches a physical disk.
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(base, 'ssbg-restore-spool')
+
+
+class RestoreSpoolError(Exception):
+    def __init__(self, message: str = 'Restore spool entry is unreadable') -> None:
+        super().__init__(message)
+        self.message = message
+
+
+@dataclass(eq=False)
+class SpoolEntry:
+    entry_id: str
+    path: Path
+    backup_id: str
+    size: int
+    expires_at: datetime
+    key: bytes | None = field(default=None, repr=False)
+    readers: int = 0
+
+    @property
+    def encrypted(self) -> bool:
+        return self.key is not None
+
+
+def _generate_key() -> bytes:
+    # cryptography is imported on first spool use rather than at app startup.
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM.generate_key(bit_length=256)
+
+
+def _write_entry(path: Path, plaintext: bytes, key: bytes | None) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as handle:
+        if key is None:
+            handle.write(plaintext)
+            return
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        aesgcm = AESGCM(key)
+        view = memoryview(plaintext)
+        for index, offset in enumerate(range(0, len(plaintext), SPOOL_FRAME_SIZE)):
+            frame = aesgcm.encrypt(
+                _FRAME_NONCE.pack(index),
+                bytes(view[offset : offset + SPOOL_FRAME_SIZE]),
+                None,
+            )
+            handle.write(_FRAME_LENGTH.pack(len(frame)))
+            handle.write(frame)
+
+
+def _read_entry_range(path: Path, key: bytes | None, first_byte: int, last_byte: int) -> bytes:
+    length = last_byte - first_byte + 1
+    with open(path, 'rb') as handle:
+        if key is None:
+            handle.seek(first_byte)
+            content = handle.read(length)
+        else:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+            aesgcm = AESGCM(key)
+            first_frame = first_byte // SPOOL_FRAME_SIZE
+            handle.seek(first_frame * _STORED_FRAME_SIZE)
+            frames: list[bytes] = []
+            for index in range(first_frame, last_byte // SPOOL_FRAME_SIZE + 1):
+                header = handle.read(_FRAME_LENGTH.size)
+                if len(header) != _FRAME_LENGTH.size:
+                    raise RestoreSpoolError()
+                (frame_length,) = _FRAME_LENGTH.unpack(header)
+                try:
+                    frames.append(
+                        aesgcm.decrypt(_FRAME_NONCE.pack(index), handle.read(frame_length), None),
+                    )
+                except Exception as exc:
+                    raise RestoreSpoolError() from exc
+            offset = first_byte - first_frame * SPOOL_FRAME_SIZE
+            content = b''.join(frames)[offset : offset + length]
+    if len(content) != length:
+        raise RestoreSpoolError()
+    return content
+
+
+def _wipe_file(path: Path) -> None:
+    try:
+        with open(path, 'r+b') as handle:
+            remaining = os.fstat(handle.fileno()).st_size
+            while remaining > 0:
+                chunk = _WIPE_CHUNK[: min(remaining, len(_WIPE_CHUNK))]
+                handle.write(chunk)
+                remaining -= len(chunk)
+            handle.flush()
+            os.fsync(handle.fileno())
+    except FileNotFoundError:
+        return
+    path.unlink(missing_ok=True)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _wipe_directory(directory: Path) -> None:
+    for stale in directory.glob(f'*{_SPOOL_SUFFIX}'):
+        _wipe_file(stale)
+
+
+def _wipe_stale_directories(base: Path) -> None:
+    for child in base.glob('pid-*'):
+        pid = child.name.removeprefix('pid-')
+        if not pid.isdigit() or _process_alive(int(pid)):
+            continue
+        _wipe_directory(child)
+        try:
+            child.rmdir()
+        except OSError:
+            continue
+
+
+class RestoreSpool:
+    """Verified restore plaintext kept for the lifetime of its restore access token.
+
+    Entries are keyed by a digest of the token. With `encrypt` enabled every entry is
+    AES-GCM framed under its own key held only in this process, so files left behind by
+    a crash are unreadable; otherwise the file is plaintext and can be served zero-copy.
+    Expired entries are overwritten with zeros before they are unlinked.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        encrypt: bool = True,
+        now_provider: Callable[[], datetime] | None = None,
+    ) -> None:
+        base = Path(directory)
+        base.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # One directory per process: workers share the base but never each other's files.
+        self._directory = base / f'pid-{os.getpid()}'
+        self._directory.mkdir(mode=0o700, exist_ok=True)
+        self._encrypt = encrypt
+        self._now_provider = now_provider or (lambda: datetime.now(UTC))
+        self._entries: dict[str, SpoolEntry] = {}
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._write_lock = asyncio.Lock()
+        # Keys for leftovers from earlier processes are gone; nothing can read them.
+        _wipe_directory(self._directory)
+        _wipe_stale_directories(base)
+
+    @staticmethod
+    def _entry_id(token: str) -> str:
+        return sha256(token.encode()).hexdigest()
+
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    async def put(
+        self,
+        token: str,
+        backup_id: str,
+        plaintext: bytes,
+        expires_at: datetime,
+    ) -> SpoolEntry:
+        await self.purge_expired()
+        entry_id = self._entry_id(token)
+        async with self._write_lock:
+            existing = self._entries.get(entry_id)
+            if existing is not None:
+                return existing
+            entry = SpoolEntry(
+                entry_id=entry_id,
+                path=self._directory / f'{entry_id}{_SPOOL_SUFFIX}',
+                backup_id=backup_id,
+                size=len(plaintext),
+                expires_at=expires_at,
+                key=_generate_key() if self._encrypt else None,
+            )
+            await asyncio.to_thread(_write_entry, entry.path, plaintext, entry.key)
+            self._entries[entry_id] = entry
+            heapq.heappush(self._expiry_heap, (expires_at, entry_id))
+        return entry
+
+    async def get(self, token: str) -> SpoolEntry | None:
+        await self.purge_expired()
+        return self._entries.get(self._entry_id(token))
+
+    def acquire(self, entry: SpoolEntry) -> None:
+        entry.readers += 1
+
+    async def release(self, entry: SpoolEntry) -> None:
+        entry.readers -= 1
+        await self.purge_expired()
+
+    async def purge_expired(self) -> int:
+        now = self._now_provider()
+        heap = self._expiry_heap
+        busy: list[tuple[datetime, str]] = []
+        wiped = 0
+        while heap and heap[0][0] <= now:
+            expires_at, entry_id = heapq.heappop(heap)
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+            if entry.readers:
+                # A download that started before expiry finishes before the wipe.
+                busy.append((expires_at, entry_id))
+                continue
+            del self._entries[entry_id]
+            await self._wipe(entry)
+            wiped += 1
+        for item in busy:
+            heapq.heappush(heap, item)
+        return wiped
+
+    async def wipe_all(self) -> None:
+        entries = list(self._entries.values())
+        self._entries.clear()
+        self._expiry_heap.clear()
+        for entry in entries:
+            await self._wipe(entry)
+
+    async def _wipe(self, entry: SpoolEntry) -> None:
+        try:
+            await asyncio.to_thread(_wipe_file, entry.path)
+        except OSError:
+            logger.warning('Failed to wipe restore spool entry', extra={'path': str(entry.path)})
+
+    async def read_range(self, entry: SpoolEntry, first_byte: int, last_byte: int) -> bytes:
+        """Read one inclusive byte range, decrypting only the frames that cover it."""
+        return await asyncio.to_thread(
+            _read_entry_range,
+            entry.path,
+            entry.key,
+            first_byte,
+            last_byte,
+        )
+
+    async def iter_plaintext(self, entry: SpoolEntry) -> AsyncIterator[bytes]:
+        handle = await asyncio.to_thread(open, entry.path, 'rb')
+        try:
+            if entry.key is None:
+                while chunk := await asyncio.to_thread(handle.read, SPOOL_FRAME_SIZE):
+                    yield chunk
+                return
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+            aesgcm = AESGCM(entry.key)
+            index = 0
+            produced = 0
+            while header := await asyncio.to_thread(handle.read, _FRAME_LENGTH.size):
+                (frame_length,) = _FRAME_LENGTH.unpack(header)
+                frame = await asyncio.to_thread(handle.read, frame_length)
+                try:
+                    chunk = aesgcm.decrypt(_FRAME_NONCE.pack(index), frame, None)
+                except Exception as exc:
+                    raise RestoreSpoolError() from exc
+                index += 1
+                produced += len(chunk)
+                yield chunk
+            if produced != entry.size:
+                raise RestoreSpoolError()
+        finally:
+            await asyncio.to_thread(handle.close)
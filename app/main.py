@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -7,27 +9,169 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.api.error_handlers import register_exception_handlers
-from app.api.routes import router as api_router
+from app.api.middleware.auth import AuthenticationMiddleware
+from app.api.middleware.correlation_id import CorrelationIdMiddleware
+from app.api.middleware.rate_limit import RateLimitMiddleware
+from app.api.middleware.tracing import TracingMiddleware
+from app.api.routes import include_routers, protected_routes
 from app.core.config import get_settings
+from app.core.logging import configure_logging, shutdown_logging
+from app.core.telemetry import configure_telemetry, shutdown_telemetry
 
 logger = logging.getLogger(__name__)
 
 
+async def _load_policy_table() -> None:
+    from app.api.dependencies import get_policy_service
+    from app.infrastructure.db.session import get_session_factory
+    from app.repositories.policies_repository import PoliciesRepository
+
+    policy_service = get_policy_service()
+    async with get_session_factory()() as session:
+        repository = PoliciesRepository(session)
+        watermark = await repository.get_watermark()
+        if policy_service.watermark == watermark:
+            return
+        records = await repository.list_policies()
+    policy_service.reload(records, watermark=watermark)
+
+
+async def _refresh_policy_table_periodically(interval_seconds: float) -> None:
+    # Admin edits reload only the worker that served them; the others catch up here.
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await _load_policy_table()
+        except Exception:
+            logger.warning('Failed to refresh policy table', exc_info=True)
+
+
+async def _flush_auth_summaries(force: bool = False) -> int:
+    from app.api.dependencies import get_auth_success_aggregator
+    from app.infrastructure.db.session import get_session_factory
+    from app.repositories.audit_repository import AuditRepository
+    from app.services.audit_service import AuditService
+
+    aggregator = get_auth_success_aggregator()
+    if aggregator is None or not (force or aggregator.has_closed_windows()):
+        return 0
+    async with get_session_factory()() as session:
+        audit_service = AuditService(AuditRepository(session), auth_success_aggregator=aggregator)
+        return await audit_service.flush_auth_summaries(force=force)
+
+
+async def _flush_auth_summaries_periodically(interval_seconds: float) -> None:
+    # Quiet periods leave closed windows behind with no request to flush them.
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await _flush_auth_summaries()
+        except Exception:
+            logger.warning('Failed to flush auth success summaries', exc_info=True)
+
+
+async def _purge_restore_spool(wipe_all: bool = False) -> None:
+    from app.api.dependencies import get_restore_spool
+
+    # The spool is created on the first restore; nothing to purge before that.
+    if get_restore_spool.cache_info().currsize == 0:
+        return
+    spool = get_restore_spool()
+    if wipe_all:
+        await spool.wipe_all()
+    else:
+        await spool.purge_expired()
+
+
+async def _purge_restore_spool_periodically(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await _purge_restore_spool()
+        except Exception:
+            logger.warning('Failed to purge expired restore spool entries', exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
+    configure_logging(settings.log_level, settings.log_format, settings.log_queue_size)
     logger.info('Starting %s in %s', settings.app_name, settings.app_env)
     app.state.settings = settings
+    configure_telemetry(settings)
+    try:
+        await _load_policy_table()
+    except Exception:
+        logger.warning('Policy records unavailable; serving default policy table', exc_info=True)
+    policy_task = asyncio.create_task(
+        _refresh_policy_table_periodically(settings.policy_refresh_seconds),
+    )
+    flush_task: asyncio.Task[None] | None = None
+    if settings.audit_auth_success_mode == 'aggregate':
+        flush_task = asyncio.create_task(
+            _flush_auth_summaries_periodically(settings.audit_auth_success_window_seconds),
+        )
+    spool_task = asyncio.create_task(
+        _purge_restore_spool_periodically(min(settings.restore_access_token_ttl_seconds, 60)),
+    )
+    if settings.profiling_enabled:
+        from app.api.dependencies import get_stack_sampler
+
+        # Sample the event loop thread, where request handling runs.
+        get_stack_sampler().start()
     yield
     logger.info('Shutting down %s', settings.app_name)
+    if settings.profiling_enabled:
+        from app.api.dependencies import get_stack_sampler
+
+        get_stack_sampler().stop()
+    policy_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await policy_task
+    spool_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await spool_task
+    try:
+        await _purge_restore_spool(wipe_all=True)
+    except Exception:
+        logger.warning('Failed to wipe restore spool on shutdown', exc_info=True)
+    if flush_task is not None:
+        flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flush_task
+        try:
+            await _flush_auth_summaries(force=True)
+        except Exception:
+            logger.warning('Failed to flush auth success summaries on shutdown', exc_info=True)
+    from app.infrastructure.storage.offload import shutdown_process_pool
+
+    shutdown_process_pool()
+    shutdown_telemetry()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
     app = FastAPI(title=settings.app_name, debug=settings.app_debug, lifespan=lifespan)
     register_exception_handlers(app)
-    app.include_router(api_router, prefix=settings.api_v1_prefix)
+    app.add_middleware(RateLimitMiddleware, settings=settings, stage='principal')
+    app.add_middleware(
+        AuthenticationMiddleware,
+        settings=settings,
+        protected_routes=protected_routes(),
+    )
+    app.add_middleware(RateLimitMiddleware, settings=settings, stage='client')
+    app.add_middleware(TracingMiddleware, settings=settings)
+    app.add_middleware(CorrelationIdMiddleware)
+    include_routers(app, settings.api_v1_prefix)
     return app
 
 
-app = create_app()
+def __getattr__(name: str) -> FastAPI:
+    # `uvicorn app.main:app` builds the application on first access, so importing
+    # create_app or lifespan (tests, scripts) no longer builds a throwaway one.
+    if name == 'app':
+        application = create_app()
+        globals()['app'] = application
+        return application
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
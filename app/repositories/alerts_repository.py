@@ -3,16 +3,19 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced_methods
 from app.infrastructure.db.models.alert import AlertModel
+from app.infrastructure.db.unit_of_work import commit_or_flush
 
 
+@traced_methods('repository.alerts')
 class AlertsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def create_alert(self, record: AlertModel) -> AlertModel:
         self._session.add(record)
-        await self._session.commit()
+        await commit_or_flush(self._session)
         await self._session.refresh(record)
         return record
 
@@ -53,6 +56,6 @@ class AlertsRepository:
         if record is None:
             return None
         record.status = status
-        await self._session.commit()
+        await commit_or_flush(self._session)
         await self._session.refresh(record)
         return record
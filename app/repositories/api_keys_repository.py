@@ -5,9 +5,12 @@ from datetime import datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced_methods
 from app.infrastructure.db.models.api_key import ApiKeyModel
+from app.infrastructure.db.unit_of_work import commit_or_flush
 
 
+@traced_methods('repository.api_keys')
 class ApiKeysRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -22,11 +25,11 @@ class ApiKeysRepository:
         api_key.last_used_at = datetime.now(timezone.utc)
         api_key.last_used_ip = ip_address
         self._session.add(api_key)
-        await self._session.commit()
+        await commit_or_flush(self._session)
 
     async def create_key(self, api_key: ApiKeyModel) -> ApiKeyModel:
         self._session.add(api_key)
-        await self._session.commit()
+        await commit_or_flush(self._session)
         await self._session.refresh(api_key)
         return api_key
 
@@ -45,6 +48,6 @@ class ApiKeysRepository:
             return None
         record.is_active = False
         self._session.add(record)
-        await self._session.commit()
+        await commit_or_flush(self._session)
         await self._session.refresh(record)
         return record
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tracing import traced_methods
+from app.infrastructure.db.models.audit_archive_manifest import AuditArchiveManifestModel
+from app.infrastructure.db.models.audit_log_entry import AuditLogEntryModel
+
+_PARTITION_NAME = re.compile(r'^audit_log_entries_y(\d{4})m(\d{2})$')
+
+
+def month_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(value: datetime) -> datetime:
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def previous_month(value: datetime) -> datetime:
+    if value.month == 1:
+        return value.replace(year=value.year - 1, month=12)
+    return value.replace(month=value.month - 1)
+
+
+@dataclass(frozen=True)
+class AuditPartition:
+    name: str
+    range_start: datetime
+    range_end: datetime
+
+    @classmethod
+    def for_month(cls, value: datetime) -> AuditPartition:
+        start = month_start(value)
+        return cls(
+            name=f'audit_log_entries_y{start.year:04d}m{start.month:02d}',
+            range_start=start,
+            range_end=next_month(start),
+        )
+
+    @classmethod
+    def from_name(cls, name: str) -> AuditPartition | None:
+        match = _PARTITION_NAME.match(name)
+        if match is None:
+            return None
+        return cls.for_month(datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC))
+
+
+@traced_methods('repository.audit_partitions')
+class AuditPartitionsRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_partitions(self) -> list[AuditPartition]:
+        result = await self._session.execute(
+            text(
+                'SELECT child.relname FROM pg_inherits '
+                'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+                'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+                "WHERE parent.relname = 'audit_log_entries'",
+            ),
+        )
+        partitions = [AuditPartition.from_name(str(name)) for name in result.scalars()]
+        return sorted(
+            (partition for partition in partitions if partition is not None),
+            key=lambda partition: partition.range_start,
+        )
+
+    async def create_partition(self, partition: AuditPartition) -> None:
+        # DDL cannot take bind parameters; names and bounds come from AuditPartition only.
+        await self._session.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF audit_log_entries '
+                f"FOR VALUES FROM ('{partition.range_start.isoformat()}') "
+                f"TO ('{partition.range_end.isoformat()}')",
+            ),
+        )
+        await self._session.commit()
+
+    async def stream_partition_entries(
+        self,
+        partition: AuditPartition,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[AuditLogEntryModel]:
+        query = (
+            select(AuditLogEntryModel)
+            .where(
+                AuditLogEntryModel.created_at >= partition.range_start,
+                AuditLogEntryModel.created_at < partition.range_end,
+            )
+            .order_by(AuditLogEntryModel.chain_index.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(query)
+        try:
+            async for record in result:
+                yield record
+                self._session.expunge(record)
+        finally:
+            await result.close()
+
+    async def drop_partition(self, partition: AuditPartition) -> None:
+        await self._session.execute(
+            text(f'ALTER TABLE audit_log_entries DETACH PARTITION {partition.name}'),
+        )
+        await self._session.execute(text(f'DROP TABLE {partition.name}'))
+        await self._session.commit()
+
+    async def list_manifests(self) -> list[AuditArchiveManifestModel]:
+        result = await self._session.execute(
+            select(AuditArchiveManifestModel).order_by(AuditArchiveManifestModel.range_start.asc()),
+        )
+        return list(result.scalars())
+
+    async def create_manifest(
+        self,
+        manifest: AuditArchiveManifestModel,
+    ) -> AuditArchiveManifestModel:
+        self._session.add(manifest)
+        await self._session.commit()
+        await self._session.refresh(manifest)
+        return manifest
@@ -1,18 +1,50 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced_methods
+from app.infrastructure.db.models.audit_archive_manifest import AuditArchiveManifestModel
 from app.infrastructure.db.models.audit_log_entry import AuditLogEntryModel
+from app.infrastructure.db.unit_of_work import commits_deferred
 
+# Hash inputs in hasher argument order, then the stored hash; see AuditService.validate_chain.
+_CHAIN_COLUMNS = (
+    AuditLogEntryModel.chain_index,
+    AuditLogEntryModel.prev_hash,
+    AuditLogEntryModel.created_at,
+    AuditLogEntryModel.event_id,
+    AuditLogEntryModel.action,
+    AuditLogEntryModel.resource,
+    AuditLogEntryModel.resource_id,
+    AuditLogEntryModel.actor_key_id,
+    AuditLogEntryModel.actor_role,
+    AuditLogEntryModel.status,
+    AuditLogEntryModel.reason,
+    AuditLogEntryModel.hash_version,
+    AuditLogEntryModel.entry_hash,
+)
 
+# Arbitrary application-wide key for pg_advisory_xact_lock; serializes chain appends.
+AUDIT_CHAIN_LOCK_KEY = 0x5353424741554454
+
+
+@traced_methods('repository.audit')
 class AuditRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def create_entry(self, record: AuditLogEntryModel) -> AuditLogEntryModel:
+        if commits_deferred(self._session):
+            # A savepoint lets a chain conflict be retried without losing the unit of work.
+            async with self._session.begin_nested():
+                self._session.add(record)
+            await self._session.refresh(record)
+            return record
         self._session.add(record)
         try:
             await self._session.commit()
@@ -23,16 +55,56 @@ class AuditRepository:
         return record
 
     async def get_latest_chain_cursor(self) -> tuple[int, str] | None:
+        # Partitioned tables cannot enforce a global UNIQUE(chain_index); the lock is held
+        # until the appending transaction commits, so concurrent appenders see each other.
+        if self._session.get_bind().dialect.name == 'postgresql':
+            await self._session.execute(
+                text('SELECT pg_advisory_xact_lock(:key)'),
+                {'key': AUDIT_CHAIN_LOCK_KEY},
+            )
         result = await self._session.execute(
-            select(AuditLogEntryModel.chain_index, AuditLogEntryModel.entry_hash).order_by(
-                AuditLogEntryModel.chain_index.desc(),
-            ),
+            select(AuditLogEntryModel.chain_index, AuditLogEntryModel.entry_hash)
+            .order_by(AuditLogEntryModel.chain_index.desc())
+            .limit(1),
         )
         latest = result.first()
         if latest is None:
-            return None
+            return await self.get_archive_anchor()
         return int(latest[0]), str(latest[1])
 
+    async def get_archive_anchor(self) -> tuple[int, str] | None:
+        result = await self._session.execute(
+            select(
+                AuditArchiveManifestModel.last_chain_index,
+                AuditArchiveManifestModel.last_entry_hash,
+            )
+            .where(AuditArchiveManifestModel.last_chain_index.is_not(None))
+            .order_by(AuditArchiveManifestModel.last_chain_index.desc())
+            .limit(1),
+        )
+        anchor = result.first()
+        if anchor is None:
+            return None
+        return int(anchor[0]), str(anchor[1])
+
+    @staticmethod
+    def _filtered_entries(
+        action: str | None,
+        resource: str | None,
+        status: str | None,
+        after_chain_index: int | None,
+    ) -> Select[tuple[AuditLogEntryModel]]:
+        query = select(AuditLogEntryModel)
+        if action:
+            query = query.where(AuditLogEntryModel.action == action)
+        if resource:
+            query = query.where(AuditLogEntryModel.resource == resource)
+        if status:
+            query = query.where(AuditLogEntryModel.status == status)
+        if after_chain_index is not None:
+            query = query.where(AuditLogEntryModel.chain_index > after_chain_index)
+        return query.order_by(AuditLogEntryModel.chain_index.asc())
+
     async def list_entries(
         self,
         offset: int = 0,
@@ -40,18 +112,48 @@ class AuditRepository:
         action: str | None = None,
         resource: str | None = None,
         status: str | None = None,
+        after_chain_index: int | None = None,
     ) -> list[AuditLogEntryModel]:
-        query = select(AuditLogEntryModel)
-        if action:
-            query = query.where(AuditLogEntryModel.action == action)
-        if resource:
-            query = query.where(AuditLogEntryModel.resource == resource)
-        if status:
-            query = query.where(AuditLogEntryModel.status == status)
+        query = self._filtered_entries(action, resource, status, after_chain_index)
+        if offset:
+            query = query.offset(offset)
+        result = await self._session.execute(query.limit(limit))
+        return list(result.scalars())
+
+    async def list_chain_rows(
+        self,
+        after_chain_index: int,
+        limit: int = 1000,
+    ) -> list[tuple[Any, ...]]:
+        # Plain column tuples: validation reads every field of every row, and skipping
+        # ORM hydration and instrumented attribute access dominates its per-entry cost.
         result = await self._session.execute(
-            query.order_by(AuditLogEntryModel.chain_index.asc()).offset(offset).limit(limit),
+            select(*_CHAIN_COLUMNS)
+            .where(AuditLogEntryModel.chain_index > after_chain_index)
+            .order_by(AuditLogEntryModel.chain_index.asc())
+            .limit(limit),
         )
-        return list(result.scalars())
+        return list(result.tuples())
+
+    async def stream_entries(
+        self,
+        action: str | None = None,
+        resource: str | None = None,
+        status: str | None = None,
+        after_chain_index: int | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[AuditLogEntryModel]:
+        query = self._filtered_entries(action, resource, status, after_chain_index)
+        result = await self._session.stream_scalars(
+            query.execution_options(yield_per=batch_size),
+        )
+        try:
+            async for record in result:
+                yield record
+                # Keep the identity map from accumulating every exported row.
+                self._session.expunge(record)
+        finally:
+            await result.close()
 
     async def count_entries(
         self,
@@ -1,13 +1,60 @@
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.core.tracing import traced_methods
 from app.infrastructure.db.models.backup_metadata import BackupMetadataModel
+from app.infrastructure.db.unit_of_work import commit_or_flush
 
+# What the catalog renders plus the keyset cursor; leaves out the per-chunk JSON columns.
+_CATALOG_COLUMNS = (
+    BackupMetadataModel.id,
+    BackupMetadataModel.backup_id,
+    BackupMetadataModel.classification,
+    BackupMetadataModel.source_system,
+    BackupMetadataModel.description,
+    BackupMetadataModel.status,
+    BackupMetadataModel.key_version,
+    BackupMetadataModel.original_size,
+    BackupMetadataModel.encrypted_size,
+    BackupMetadataModel.compression,
+    BackupMetadataModel.base_backup_id,
+    BackupMetadataModel.delta_depth,
+    BackupMetadataModel.created_by,
+    BackupMetadataModel.created_at,
+)
 
+
+@dataclass(frozen=True)
+class BackupCatalogFilters:
+    source_system: str | None = None
+    classification: str | None = None
+    status: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    def clauses(self) -> list[ColumnElement[bool]]:
+        clauses: list[ColumnElement[bool]] = []
+        if self.source_system:
+            clauses.append(BackupMetadataModel.source_system == self.source_system)
+        if self.classification:
+            clauses.append(BackupMetadataModel.classification == self.classification)
+        if self.status:
+            clauses.append(BackupMetadataModel.status == self.status)
+        if self.created_from is not None:
+            clauses.append(BackupMetadataModel.created_at >= self.created_from)
+        if self.created_to is not None:
+            clauses.append(BackupMetadataModel.created_at < self.created_to)
+        return clauses
+
+
+@traced_methods('repository.backups')
 class BackupsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -18,7 +65,7 @@ class BackupsRepository:
 
     async def create_metadata(self, record: BackupMetadataModel) -> BackupMetadataModel:
         self._session.add(record)
-        await self._session.commit()
+        await commit_or_flush(self._session)
         await self._session.refresh(record)
         return record
 
@@ -28,18 +75,66 @@ class BackupsRepository:
         )
         return result.scalar_one_or_none()
 
+    async def list_catalog(
+        self,
+        filters: BackupCatalogFilters,
+        limit: int = 50,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[BackupMetadataModel]:
+        # Keyset pagination: newest first, resuming strictly after the last (created_at, id).
+        query = (
+            select(BackupMetadataModel)
+            .options(load_only(*_CATALOG_COLUMNS))
+            .where(*filters.clauses())
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(BackupMetadataModel.created_at, BackupMetadataModel.id) < after,
+            )
+        result = await self._session.execute(
+            query.order_by(
+                BackupMetadataModel.created_at.desc(),
+                BackupMetadataModel.id.desc(),
+            ).limit(limit),
+        )
+        return list(result.scalars())
+
+    async def count_catalog(self, filters: BackupCatalogFilters) -> int:
+        result = await self._session.execute(
+            select(func.count()).select_from(BackupMetadataModel).where(*filters.clauses()),
+        )
+        return int(result.scalar_one())
+
+    async def estimate_catalog_count(self, filters: BackupCatalogFilters) -> int:
+        """Planner row estimate for the filtered catalog; exact count off PostgreSQL."""
+        dialect = self._session.get_bind().dialect
+        if dialect.name != 'postgresql':
+            return await self.count_catalog(filters)
+        query = select(BackupMetadataModel.id).where(*filters.clauses())
+        # Filter values are rendered by the dialect's literal processors, which quote them.
+        statement = query.compile(dialect=dialect, compile_kwargs={'literal_binds': True})
+        connection = await self._session.connection()
+        result = await connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}')
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
     async def update_metadata(
         self,
         backup_id: str,
         **fields: object,
     ) -> BackupMetadataModel | None:
-        record = await self.get_by_backup_id(backup_id)
-        if record is None:
-            return None
-        for key, value in fields.items():
-            setattr(record, key, value)
-        await self._session.commit()
-        await self._session.refresh(record)
+        # One UPDATE ... RETURNING round trip instead of SELECT, UPDATE and refresh.
+        result = await self._session.execute(
+            update(BackupMetadataModel)
+            .where(BackupMetadataModel.backup_id == backup_id)
+            .values(**fields)
+            .returning(BackupMetadataModel)
+            .execution_options(populate_existing=True),
+        )
+        record = result.scalar_one_or_none()
+        await commit_or_flush(self._session)
         return record
 
     async def mark_irreversible_by_key_version(
@@ -59,6 +154,24 @@ class BackupsRepository:
             record.status = 'IRREVERSIBLE'
             record.irreversible_reason = reason
             record.shredded_at = event_time
+        # Deltas cannot be rebuilt without their base, so the loss cascades down the lineage.
+        seen = {record.backup_id for record in records}
+        frontier = set(seen)
+        while frontier:
+            result = await self._session.execute(
+                select(BackupMetadataModel).where(
+                    BackupMetadataModel.base_backup_id.in_(sorted(frontier)),
+                ),
+            )
+            children = [record for record in result.scalars() if record.backup_id not in seen]
+            for child in children:
+                if child.status != 'IRREVERSIBLE':
+                    child.status = 'IRREVERSIBLE'
+                    child.irreversible_reason = 'base_irreversible'
+                    child.shredded_at = event_time
+                    records.append(child)
+            frontier = {child.backup_id for child in children}
+            seen |= frontier
         if commit:
             await self._session.commit()
         else:
@@ -3,9 +3,11 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced_methods
 from app.infrastructure.db.models.incident_state import IncidentStateModel
 
 
+@traced_methods('repository.incident')
 class IncidentRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -5,9 +5,11 @@ from datetime import datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced_methods
 from app.infrastructure.db.models.key_version import KeyVersionModel
 
 
+@traced_methods('repository.key_versions')
 class KeyVersionsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced_methods
 from app.infrastructure.db.models.policy_record import PolicyRecordModel
 
 
+@traced_methods('repository.policies')
 class PoliciesRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -22,6 +26,14 @@ class PoliciesRepository:
         )
         return list(result.scalars().all())
 
+    async def get_watermark(self) -> tuple[int, datetime | None]:
+        """Row count and latest update time; changes whenever a policy is added or edited."""
+        result = await self._session.execute(
+            select(func.count(PolicyRecordModel.id), func.max(PolicyRecordModel.updated_at)),
+        )
+        count, updated_at = result.one()
+        return int(count), updated_at
+
     async def update_policy(
         self,
         policy_id: str,
@@ -28,3 +28,11 @@ class AuditEntrySummary(BaseModel):
     status: str | None = None
     reason: str | None = None
     created_at: datetime | None = None
+    request_id: str | None = None
+
+
+class AuditEntryExport(AuditEntrySummary):
+    prev_hash: str | None = None
+    entry_hash: str
+    # Archives written before hash versioning carry no field and were hashed with v1.
+    hash_version: int = 1
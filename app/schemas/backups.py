@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 from app.core.enums import ClassificationLevel
@@ -10,3 +12,20 @@ class BackupRequest(BaseModel):
     source_system: str = Field(min_length=2, max_length=200)
     description: str | None = Field(default=None, max_length=255)
     payload: str | None = Field(default=None, max_length=1000000)
+    base_backup_id: str | None = Field(default=None, min_length=1, max_length=64)
+
+
+class BackupCatalogEntry(BaseModel):
+    backup_id: str
+    classification: str
+    source_system: str
+    description: str | None = None
+    status: str
+    key_version: str | None = None
+    original_size: int | None = None
+    encrypted_size: int | None = None
+    compression: str | None = None
+    base_backup_id: str | None = None
+    delta_depth: int | None = None
+    created_by: str | None = None
+    created_at: datetime
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+AUTH_SUCCESS_MODES = frozenset({'full', 'aggregate'})
+
+_SummaryKey = tuple[str, str, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class AuditSummary:
+    action: str
+    resource: str
+    key_id: str | None
+    client_ip: str | None
+    window_start: datetime
+    window_seconds: float
+    count: int
+
+    @property
+    def reason(self) -> str:
+        window_start = self.window_start.isoformat()
+        return (
+            f'count={self.count};ip={self.client_ip or "unknown"};'
+            f'window={window_start}/{self.window_seconds:g}s'
+        )
+
+
+class AuthSuccessAggregator:
+    """Counts routine successes per (action, key, IP, window) until the window closes.
+
+    Methods never await, so concurrent requests on one event loop cannot interleave inside
+    them; `drain` hands each closed window out exactly once, and `restore` takes back the
+    summaries a failed flush could not write.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError('window_seconds must be positive')
+        self._window_seconds = window_seconds
+        self._clock = clock or time.time
+        self._windows: dict[int, Counter[_SummaryKey]] = {}
+
+    @property
+    def window_seconds(self) -> float:
+        return self._window_seconds
+
+    def _window_index(self) -> int:
+        return math.floor(self._clock() / self._window_seconds)
+
+    def pending_count(self) -> int:
+        return sum(sum(window.values()) for window in self._windows.values())
+
+    def add(self, action: str, resource: str, key_id: str | None, client_ip: str | None) -> None:
+        window_index = self._window_index()
+        window = self._windows.get(window_index)
+        if window is None:
+            window = self._windows[window_index] = Counter()
+        window[(action, resource, key_id, client_ip)] += 1
+
+    def has_closed_windows(self) -> bool:
+        current = self._window_index()
+        return any(window_index < current for window_index in self._windows)
+
+    def drain(self, force: bool = False) -> list[AuditSummary]:
+        current = self._window_index()
+        closed = sorted(
+            window_index
+            for window_index in self._windows
+            if force or window_index < current
+        )
+        summaries: list[AuditSummary] = []
+        for window_index in closed:
+            window_start = datetime.fromtimestamp(window_index * self._window_seconds, UTC)
+            for (action, resource, key_id, client_ip), count in self._windows.pop(
+                window_index,
+            ).items():
+                summaries.append(
+                    AuditSummary(
+                        action=action,
+                        resource=resource,
+                        key_id=key_id,
+                        client_ip=client_ip,
+                        window_start=window_start,
+                        window_seconds=self._window_seconds,
+                        count=count,
+                    ),
+                )
+        return summaries
+
+    def restore(self, summaries: list[AuditSummary]) -> None:
+        for summary in summaries:
+            window_index = round(summary.window_start.timestamp() / self._window_seconds)
+            window = self._windows.get(window_index)
+            if window is None:
+                window = self._windows[window_index] = Counter()
+            window[(summary.action, summary.resource, summary.key_id, summary.client_ip)] += (
+                summary.count
+            )
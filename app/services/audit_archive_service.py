@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime
+from hashlib import sha512
+from typing import Any, Protocol
+
+from app.infrastructure.db.models.audit_archive_manifest import AuditArchiveManifestModel
+from app.repositories.audit_partitions_repository import (
+    AuditPartition,
+    month_start,
+    next_month,
+    previous_month,
+)
+from app.schemas.audit import AuditChainFailure, AuditChainValidationResult, AuditEntryExport
+from app.services.audit_service import AuditService
+
+logger = logging.getLogger(__name__)
+
+
+class AuditArchiveError(Exception):
+    def __init__(self, message: str, partition_name: str | None = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.partition_name = partition_name
+
+
+class AuditPartitionsRepositoryLike(Protocol):
+    async def list_partitions(self) -> list[AuditPartition]:
+        ...
+
+    async def create_partition(self, partition: AuditPartition) -> None:
+        ...
+
+    def stream_partition_entries(self, partition: AuditPartition) -> AsyncIterator[Any]:
+        ...
+
+    async def drop_partition(self, partition: AuditPartition) -> None:
+        ...
+
+    async def list_manifests(self) -> list[AuditArchiveManifestModel]:
+        ...
+
+    async def create_manifest(
+        self,
+        manifest: AuditArchiveManifestModel,
+    ) -> AuditArchiveManifestModel:
+        ...
+
+
+class ArchiveStorage(Protocol):
+    async def put_object(self, bucket: str, object_name: str, data: bytes) -> None:
+        ...
+
+    async def get_object(self, bucket: str, object_name: str) -> bytes | None:
+        ...
+
+
+def _entry_hash(entry: Any) -> str:
+    return AuditService._build_entry_hash(
+        chain_index=entry.chain_index,
+        prev_hash=entry.prev_hash,
+        created_at=entry.created_at,
+        event_id=entry.event_id,
+        action=entry.action,
+        resource=entry.resource,
+        resource_id=entry.resource_id,
+        actor_key_id=entry.actor_key_id,
+        actor_role=entry.actor_role,
+        status=entry.status,
+        reason=entry.reason,
+        hash_version=entry.hash_version,
+    )
+
+
+def build_manifest_hash(manifest: AuditArchiveManifestModel) -> str:
+    payload = {
+        'partition_name': manifest.partition_name,
+        'range_start': manifest.range_start.astimezone(UTC).isoformat(),
+        'range_end': manifest.range_end.astimezone(UTC).isoformat(),
+        'object_name': manifest.object_name,
+        'entry_count': manifest.entry_count,
+        'first_chain_index': manifest.first_chain_index,
+        'last_chain_index': manifest.last_chain_index,
+        'first_prev_hash': manifest.first_prev_hash,
+        'last_entry_hash': manifest.last_entry_hash,
+        'archive_sha512': manifest.archive_sha512,
+        'prev_manifest_hash': manifest.prev_manifest_hash,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return sha512(canonical.encode()).hexdigest()
+
+
+def _chain_anchor(manifests: list[AuditArchiveManifestModel]) -> tuple[int, str | None]:
+    for manifest in reversed(manifests):
+        if manifest.last_chain_index is not None:
+            return manifest.last_chain_index + 1, manifest.last_entry_hash
+    return 1, None
+
+
+def _failure(checked: int, reason: str, entry: Any | None = None) -> AuditChainValidationResult:
+    return AuditChainValidationResult(
+        valid=False,
+        checked_entries=checked,
+        failure=AuditChainFailure(
+            chain_index=getattr(entry, 'chain_index', None),
+            event_id=getattr(entry, 'event_id', None),
+            reason=reason,
+        ),
+    )
+
+
+class AuditArchiveService:
+    """Keeps monthly audit partitions ahead of time and archives sealed ones.
+
+    Archives are gzip NDJSON in chain order; each hash-linked manifest records the chain
+    boundaries and archive digest, which lets live validation resume from the newest anchor.
+    """
+
+    def __init__(
+        self,
+        repository: AuditPartitionsRepositoryLike,
+        storage: ArchiveStorage,
+        bucket: str,
+        audit_service: AuditService | None = None,
+        archive_prefix: str = 'audit-archive',
+        now_provider: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._repository = repository
+        self._storage = storage
+        self._bucket = bucket
+        self._audit_service = audit_service
+        self._archive_prefix = archive_prefix.strip('/')
+        self._now_provider = now_provider or (lambda: datetime.now(UTC))
+
+    async def ensure_partitions(self, months_ahead: int = 2) -> list[str]:
+        existing = {partition.name for partition in await self._repository.list_partitions()}
+        created: list[str] = []
+        month = month_start(self._now_provider())
+        for _ in range(months_ahead + 1):
+            partition = AuditPartition.for_month(month)
+            if partition.name not in existing:
+                await self._repository.create_partition(partition)
+                created.append(partition.name)
+            month = next_month(month)
+        return created
+
+    async def archive_sealed_partitions(
+        self,
+        retain_months: int = 3,
+        drop: bool = False,
+    ) -> list[AuditArchiveManifestModel]:
+        """Archive partitions older than `retain_months`; drop them only when asked to.
+
+        A partition is dropped only after its archive has been read back from storage and
+        matched against the manifest digest.
+        """
+        cutoff = month_start(self._now_provider())
+        for _ in range(retain_months):
+            cutoff = previous_month(cutoff)
+        manifests = await self._repository.list_manifests()
+        archived = {manifest.partition_name for manifest in manifests}
+        created: list[AuditArchiveManifestModel] = []
+        for partition in await self._repository.list_partitions():
+            if partition.range_end > cutoff:
+                continue
+            if partition.name not in archived:
+                manifest = await self._archive_partition(partition, manifests)
+                manifests.append(manifest)
+                created.append(manifest)
+            if not drop:
+                continue
+            # A manifest without a drop means an earlier run stopped half-way; finish it.
+            by_name = {manifest.partition_name: manifest for manifest in manifests}
+            await self._confirm_stored(by_name[partition.name])
+            await self._repository.drop_partition(partition)
+        return created
+
+    async def _confirm_stored(self, manifest: AuditArchiveManifestModel) -> None:
+        if not manifest.entry_count:
+            return
+        data = (
+            await self._storage.get_object(self._bucket, manifest.object_name)
+            if manifest.object_name
+            else None
+        )
+        if data is None or sha512(data).hexdigest() != manifest.archive_sha512:
+            raise AuditArchiveError(
+                'Archived partition could not be read back intact; not dropping it',
+                manifest.partition_name,
+            )
+
+    async def _archive_partition(
+        self,
+        partition: AuditPartition,
+        manifests: list[AuditArchiveManifestModel],
+    ) -> AuditArchiveManifestModel:
+        expected_index, expected_prev_hash = _chain_anchor(manifests)
+        buffer = io.BytesIO()
+        first_chain_index: int | None = None
+        first_prev_hash: str | None = None
+        entry_count = 0
+        with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as archive:
+            async for entry in self._repository.stream_partition_entries(partition):
+                if entry.chain_index != expected_index or entry.prev_hash != expected_prev_hash:
+                    raise AuditArchiveError('Audit chain is not continuous', partition.name)
+                if _entry_hash(entry) != entry.entry_hash:
+                    raise AuditArchiveError('Audit entry hash mismatch', partition.name)
+                if first_chain_index is None:
+                    first_chain_index = entry.chain_index
+                    first_prev_hash = entry.prev_hash
+                line = AuditEntryExport.model_validate(entry, from_attributes=True)
+                archive.write(line.model_dump_json().encode() + b'\n')
+                expected_index += 1
+                expected_prev_hash = entry.entry_hash
+                entry_count += 1
+
+        object_name: str | None = None
+        archive_sha512: str | None = None
+        if entry_count:
+            data = buffer.getvalue()
+            archive_sha512 = sha512(data).hexdigest()
+            object_name = f'{self._archive_prefix}/{partition.name}.ndjson.gz'
+            await self._storage.put_object(self._bucket, object_name, data)
+
+        manifest = AuditArchiveManifestModel(
+            partition_name=partition.name,
+            range_start=partition.range_start,
+            range_end=partition.range_end,
+            object_name=object_name,
+            entry_count=entry_count,
+            first_chain_index=first_chain_index,
+            last_chain_index=expected_index - 1 if entry_count else None,
+            first_prev_hash=first_prev_hash,
+            last_entry_hash=expected_prev_hash if entry_count else None,
+            archive_sha512=archive_sha512,
+            prev_manifest_hash=manifests[-1].manifest_hash if manifests else None,
+        )
+        manifest.manifest_hash = build_manifest_hash(manifest)
+        manifest = await self._repository.create_manifest(manifest)
+        if self._audit_service is not None:
+            await self._audit_service.record_audit_archive(
+                partition_name=partition.name,
+                entry_count=entry_count,
+                archive_sha512=archive_sha512,
+            )
+        logger.info(
+            'Archived audit partition',
+            extra={'partition_name': partition.name, 'entry_count': entry_count},
+        )
+        return manifest
+
+    async def verify_archives(self) -> AuditChainValidationResult:
+        expected_index = 1
+        expected_prev_hash: str | None = None
+        prev_manifest_hash: str | None = None
+        checked = 0
+        for manifest in await self._repository.list_manifests():
+            if manifest.prev_manifest_hash != prev_manifest_hash:
+                return _failure(checked, 'manifest_link_broken')
+            if build_manifest_hash(manifest) != manifest.manifest_hash:
+                return _failure(checked, 'manifest_hash_mismatch')
+            prev_manifest_hash = manifest.manifest_hash
+            if not manifest.entry_count:
+                continue
+            data = (
+                await self._storage.get_object(self._bucket, manifest.object_name)
+                if manifest.object_name
+                else None
+            )
+            if data is None:
+                return _failure(checked, 'archive_missing')
+            if sha512(data).hexdigest() != manifest.archive_sha512:
+                return _failure(checked, 'archive_digest_mismatch')
+            if manifest.first_chain_index != expected_index or (
+                manifest.first_prev_hash != expected_prev_hash
+            ):
+                return _failure(checked, 'manifest_bounds_mismatch')
+            for raw_line in gzip.decompress(data).splitlines():
+                entry = AuditEntryExport.model_validate_json(raw_line)
+                if entry.chain_index != expected_index:
+                    return _failure(checked, 'chain_index_out_of_sequence', entry)
+                if entry.prev_hash != expected_prev_hash:
+                    return _failure(checked, 'prev_hash_mismatch', entry)
+                if _entry_hash(entry) != entry.entry_hash:
+                    return _failure(checked, 'entry_hash_mismatch', entry)
+                expected_prev_hash = entry.entry_hash
+                expected_index += 1
+                checked += 1
+            if (
+                manifest.last_chain_index != expected_index - 1
+                or manifest.last_entry_hash != expected_prev_hash
+            ):
+                return _failure(checked, 'manifest_bounds_mismatch')
+        return AuditChainValidationResult(valid=True, checked_entries=checked, failure=None)
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
-import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from hashlib import sha512
 from uuid import uuid4
 
 from sqlalchemy.exc import IntegrityError
 
+from app.core.request_context import request_id_var
+from app.core.tracing import annotate_span, traced
+from app.infrastructure.crypto.hashing import (
+    AUDIT_HASH_V1,
+    CURRENT_AUDIT_HASH_VERSION,
+    audit_entry_hasher,
+)
 from app.infrastructure.db.models.audit_log_entry import AuditLogEntryModel
 from app.repositories.audit_repository import AuditRepository
-from app.schemas.audit import AuditChainFailure, AuditChainValidationResult, AuditEntrySummary
+from app.schemas.audit import (
+    AuditChainFailure,
+    AuditChainValidationResult,
+    AuditEntryExport,
+    AuditEntrySummary,
+)
+from app.services.audit_aggregation import AuthSuccessAggregator
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +34,13 @@ class AuditWriteError(Exception):
 
 
 class AuditService:
-    def __init__(self, repository: AuditRepository | None = None) -> None:
+    def __init__(
+        self,
+        repository: AuditRepository | None = None,
+        auth_success_aggregator: AuthSuccessAggregator | None = None,
+    ) -> None:
         self._repository = repository
+        self._auth_success_aggregator = auth_success_aggregator
 
     @staticmethod
     def _build_entry_hash(
@@ -38,27 +55,23 @@ class AuditService:
         actor_role: str | None,
         status: str | None,
         reason: str | None,
+        hash_version: int | None = AUDIT_HASH_V1,
     ) -> str:
-        payload = {
-            'chain_index': chain_index,
-            'prev_hash': prev_hash,
-            'created_at': (
-                created_at.astimezone(UTC).isoformat()
-                if created_at is not None
-                else None
-            ),
-            'event_id': event_id,
-            'action': action,
-            'resource': resource,
-            'resource_id': resource_id,
-            'actor_key_id': actor_key_id,
-            'actor_role': actor_role,
-            'status': status,
-            'reason': reason,
-        }
-        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
-        return sha512(canonical.encode()).hexdigest()
+        return audit_entry_hasher(hash_version or AUDIT_HASH_V1)(
+            chain_index,
+            prev_hash,
+            created_at,
+            event_id,
+            action,
+            resource,
+            resource_id,
+            actor_key_id,
+            actor_role,
+            status,
+            reason,
+        )
 
+    @traced('audit.append')
     async def _persist_entry(
         self,
         action: str,
@@ -74,6 +87,7 @@ class AuditService:
             return
         max_attempts = 10
         for attempt in range(max_attempts):
+            annotate_span(attempts=attempt + 1)
             try:
                 cursor = await self._repository.get_latest_chain_cursor()
                 if cursor is None:
@@ -96,11 +110,13 @@ class AuditService:
                     actor_role=actor_role,
                     status=status,
                     reason=reason,
+                    hash_version=CURRENT_AUDIT_HASH_VERSION,
                 )
                 record = AuditLogEntryModel(
                     chain_index=chain_index,
                     prev_hash=prev_hash,
                     entry_hash=entry_hash,
+                    hash_version=CURRENT_AUDIT_HASH_VERSION,
                     created_at=created_at,
                     event_id=event_id,
                     action=action,
@@ -110,6 +126,7 @@ class AuditService:
                     actor_role=actor_role,
                     status=status,
                     reason=reason,
+                    request_id=request_id_var.get(),
                 )
                 await self._repository.create_entry(record)
                 return
@@ -152,6 +169,10 @@ class AuditService:
         client_ip: str | None,
     ) -> None:
         logger.info('Auth success', extra={'key_id': key_id, 'client_ip': client_ip})
+        if self._auth_success_aggregator is not None:
+            self._auth_success_aggregator.add('auth_success', 'api_key', key_id, client_ip)
+            await self.flush_auth_summaries()
+            return
         await self._persist_entry(
             action='auth_success',
             resource='api_key',
@@ -163,6 +184,29 @@ class AuditService:
             fail_secure=False,
         )
 
+    async def flush_auth_summaries(self, force: bool = False) -> int:
+        aggregator = self._auth_success_aggregator
+        if aggregator is None or not (force or aggregator.has_closed_windows()):
+            return 0
+        summaries = aggregator.drain(force=force)
+        for written, summary in enumerate(summaries):
+            try:
+                await self._persist_entry(
+                    action=f'{summary.action}_summary',
+                    resource=summary.resource,
+                    resource_id=summary.key_id,
+                    actor_key_id=summary.key_id,
+                    actor_role=None,
+                    status='success' if summary.action == 'auth_success' else 'allowed',
+                    reason=summary.reason,
+                )
+            except AuditWriteError:
+                # Still best-effort for the caller, but the counts wait for the next flush.
+                aggregator.restore(summaries[written:])
+                logger.exception('Audit summary write failed; counts kept for the next flush')
+                return written
+        return len(summaries)
+
     async def record_mfa_outcome(
         self,
         key_id: str | None,
@@ -179,6 +223,10 @@ class AuditService:
                 'client_ip': client_ip,
             },
         )
+        if outcome == 'allowed' and self._auth_success_aggregator is not None:
+            self._auth_success_aggregator.add('mfa_outcome', 'restore', key_id, client_ip)
+            await self.flush_auth_summaries()
+            return
         await self._persist_entry(
             action='mfa_outcome',
             resource='restore',
@@ -370,71 +418,77 @@ class AuditService:
             fail_secure=True,
         )
 
+    async def record_audit_archive(
+        self,
+        partition_name: str,
+        entry_count: int,
+        archive_sha512: str | None,
+    ) -> None:
+        logger.info(
+            'Audit partition archived',
+            extra={
+                'partition_name': partition_name,
+                'entry_count': entry_count,
+                'archive_sha512': archive_sha512,
+            },
+        )
+        await self._persist_entry(
+            action='audit_partition_archived',
+            resource='audit_partition',
+            resource_id=partition_name,
+            actor_key_id=None,
+            actor_role=None,
+            status='archived',
+            reason=f'sha512:{archive_sha512}' if archive_sha512 else 'empty',
+            fail_secure=True,
+        )
+
     async def validate_chain(self) -> AuditChainValidationResult:
         if self._repository is None:
             return AuditChainValidationResult(valid=True, checked_entries=0, failure=None)
-        offset = 0
         limit = 1000
-        expected_chain_index = 1
-        expected_prev_hash: str | None = None
+        # Archived partitions are summarized by manifests; resume from the newest anchor.
+        anchor = await self._repository.get_archive_anchor()
+        expected_chain_index = 1 if anchor is None else anchor[0] + 1
+        expected_prev_hash: str | None = None if anchor is None else anchor[1]
+        first_chain_index = expected_chain_index
+        last_chain_index = expected_chain_index - 1
 
         while True:
-            entries = await self._repository.list_entries(offset=offset, limit=limit)
-            if not entries:
+            rows = await self._repository.list_chain_rows(
+                after_chain_index=last_chain_index,
+                limit=limit,
+            )
+            if not rows:
                 break
-            for entry in entries:
-                if entry.chain_index != expected_chain_index:
+            for row in rows:
+                *fields, hash_version, entry_hash = row
+                chain_index, prev_hash, _, event_id = fields[:4]
+                failure_reason: str | None = None
+                if chain_index != expected_chain_index:
+                    failure_reason = 'chain_index_out_of_sequence'
+                elif prev_hash != expected_prev_hash:
+                    failure_reason = 'prev_hash_mismatch'
+                elif audit_entry_hasher(hash_version or AUDIT_HASH_V1)(*fields) != entry_hash:
+                    failure_reason = 'entry_hash_mismatch'
+                if failure_reason is not None:
                     return AuditChainValidationResult(
                         valid=False,
-                        checked_entries=expected_chain_index - 1,
+                        checked_entries=expected_chain_index - first_chain_index,
                         failure=AuditChainFailure(
-                            chain_index=entry.chain_index,
-                            event_id=entry.event_id,
-                            reason='chain_index_out_of_sequence',
-                        ),
-                    )
-                if entry.prev_hash != expected_prev_hash:
-                    return AuditChainValidationResult(
-                        valid=False,
-                        checked_entries=expected_chain_index - 1,
-                        failure=AuditChainFailure(
-                            chain_index=entry.chain_index,
-                            event_id=entry.event_id,
-                            reason='prev_hash_mismatch',
+                            chain_index=chain_index,
+                            event_id=event_id,
+                            reason=failure_reason,
                         ),
                     )
 
-                computed_hash = self._build_entry_hash(
-                    chain_index=entry.chain_index,
-                    prev_hash=entry.prev_hash,
-                    created_at=entry.created_at,
-                    event_id=entry.event_id,
-                    action=entry.action,
-                    resource=entry.resource,
-                    resource_id=entry.resource_id,
-                    actor_key_id=entry.actor_key_id,
-                    actor_role=entry.actor_role,
-                    status=entry.status,
-                    reason=entry.reason,
-                )
-                if computed_hash != entry.entry_hash:
-                    return AuditChainValidationResult(
-                        valid=False,
-                        checked_entries=expected_chain_index - 1,
-                        failure=AuditChainFailure(
-                            chain_index=entry.chain_index,
-                            event_id=entry.event_id,
-                            reason='entry_hash_mismatch',
-                        ),
-                    )
-
-                expected_prev_hash = entry.entry_hash
+                expected_prev_hash = entry_hash
                 expected_chain_index += 1
-            offset += len(entries)
+            last_chain_index = rows[-1][0]
 
         return AuditChainValidationResult(
             valid=True,
-            checked_entries=expected_chain_index - 1,
+            checked_entries=expected_chain_index - first_chain_index,
             failure=None,
         )
 
@@ -445,6 +499,7 @@ class AuditService:
         action: str | None = None,
         resource: str | None = None,
         status: str | None = None,
+        after_chain_index: int | None = None,
     ) -> list[AuditEntrySummary]:
         if self._repository is None:
             return []
@@ -454,6 +509,7 @@ class AuditService:
             action=action,
             resource=resource,
             status=status,
+            after_chain_index=after_chain_index,
         )
         return [
             AuditEntrySummary(
@@ -467,10 +523,43 @@ class AuditService:
                 status=record.status,
                 reason=record.reason,
                 created_at=record.created_at,
+                request_id=record.request_id,
             )
             for record in records
         ]
 
+    async def stream_audit_entries(
+        self,
+        action: str | None = None,
+        resource: str | None = None,
+        status: str | None = None,
+        after_chain_index: int | None = None,
+    ) -> AsyncIterator[AuditEntryExport]:
+        if self._repository is None:
+            return
+        async for record in self._repository.stream_entries(
+            action=action,
+            resource=resource,
+            status=status,
+            after_chain_index=after_chain_index,
+        ):
+            yield AuditEntryExport(
+                chain_index=record.chain_index,
+                event_id=record.event_id,
+                action=record.action,
+                resource=record.resource,
+                resource_id=record.resource_id,
+                actor_key_id=record.actor_key_id,
+                actor_role=record.actor_role,
+                status=record.status,
+                reason=record.reason,
+                created_at=record.created_at,
+                request_id=record.request_id,
+                prev_hash=record.prev_hash,
+                entry_hash=record.entry_hash,
+                hash_version=record.hash_version or AUDIT_HASH_V1,
+            )
+
     async def count_security_events(
         self,
         action: str,
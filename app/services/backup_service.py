@@ -1,17 +1,83 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from hashlib import sha512
-from typing import Any, Protocol
+from typing import Any, Protocol, TypeVar
 from uuid import uuid4
 
-from app.core.enums import BackupStatus, ClassificationLevel
-from app.infrastructure.crypto.aes_gcm import encrypt
+from app.core.enums import BackupStatus, ClassificationLevel, IncidentLevel
+from app.core.tracing import trace_span, traced_methods
+from app.infrastructure.crypto.aes_gcm import EncryptionResult, encrypt, encrypt_chunked
+from app.infrastructure.crypto.convergent import chunk_id, derive_convergent_keys, seal_chunk
 from app.infrastructure.crypto.key_store_fs import KeyMaterial
 from app.infrastructure.db.models.backup_metadata import BackupMetadataModel
+from app.infrastructure.storage.chunking import cdc_boundaries, slice_chunks
+from app.infrastructure.storage.compression import (
+    COMPRESSION_NONE,
+    Compressor,
+    get_compressor,
+    worth_compressing,
+)
+from app.infrastructure.storage.delta import compute_delta
 from app.infrastructure.storage.minio_client import ObjectStorageError
+from app.infrastructure.storage.offload import run_cpu_bound
 from app.schemas.auth import ApiKeyPrincipal
 from app.schemas.backups import BackupRequest
 
+_COMPRESSION_SAMPLE_SIZE = 64 * 1024
+_DEDUP_UPLOAD_CONCURRENCY = 8
+_DELTA_AVG_CHUNK_SIZE = 4096
+# A delta has to save at least this fraction of the payload to be stored instead of it.
+_MIN_DELTA_SAVING = 0.1
+# Below this size compressing and sealing a payload takes less time than handing it to a
+# worker thread.
+_OFFLOAD_MIN_SIZE = 64 * 1024
+_T = TypeVar('_T')
+
+
+async def _off_event_loop(size: int, func: Callable[..., _T], *args: Any) -> _T:
+    if size < _OFFLOAD_MIN_SIZE:
+        return func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
+def dedup_prefix(key_version: str) -> str:
+    return f'dedup/{key_version}'
+
+
+def dedup_scope(source_system: str, compression: str) -> str:
+    # Chunks only deduplicate within one source system and one compression format.
+    return f'{source_system}\x00{compression}'
+
+
+def _compress_and_encrypt(
+    plaintext: bytes,
+    key_bytes: bytes,
+    compress: Compressor | None,
+) -> EncryptionResult:
+    return encrypt(compress(plaintext) if compress is not None else plaintext, key_bytes)
+
+
+def _seal_dedup_chunks(
+    plaintext: bytes,
+    boundaries: list[int],
+    key_bytes: bytes,
+    scope: str,
+    compress: Compressor | None,
+) -> tuple[dict[str, bytes], list[tuple[str, int]]]:
+    keys = derive_convergent_keys(key_bytes, scope)
+    sealed_chunks: dict[str, bytes] = {}
+    manifest: list[tuple[str, int]] = []
+    for chunk in slice_chunks(plaintext, boundaries):
+        identifier = chunk_id(keys, chunk)
+        manifest.append((identifier, len(chunk)))
+        if identifier not in sealed_chunks:
+            data = compress(chunk) if compress is not None else chunk
+            sealed_chunks[identifier] = seal_chunk(keys, identifier, data)
+    return sealed_chunks, manifest
+
 
 class BackupValidationError(Exception):
     def __init__(self, message: str, details: list[dict[str, object]]) -> None:
@@ -43,8 +109,14 @@ class ObjectStorage(Protocol):
     async def put_object(self, bucket: str, object_name: str, data: bytes) -> None:
         ...
 
+    async def has_object(self, bucket: str, object_name: str) -> bool:
+        ...
+
 
 class BackupRepositoryLike(Protocol):
+    async def get_by_backup_id(self, backup_id: str) -> Any | None:
+        ...
+
     async def create_metadata(self, record: BackupMetadataModel) -> Any:
         ...
 
@@ -57,9 +129,38 @@ class BackupPolicyServiceLike(Protocol):
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: IncidentLevel = IncidentLevel.NORMAL,
+        mfa_verified: bool = False,
     ) -> Any:
         ...
 
+    def authorize(self, principal: ApiKeyPrincipal | None, permission: str) -> Any:
+        ...
+
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: ClassificationLevel,
+        incident_level: IncidentLevel = IncidentLevel.NORMAL,
+        mfa_verified: bool = False,
+    ) -> Any:
+        ...
+
+
+class IncidentLevelSourceLike(Protocol):
+    async def get_current_level(self) -> IncidentLevel:
+        ...
+
+
+class MfaValidatorLike(Protocol):
+    async def validate_mfa_token(
+        self,
+        principal: ApiKeyPrincipal | None,
+        mfa_token: str | None,
+        client_ip: str | None,
+    ) -> None:
+        ...
+
 
 class BackupAuditServiceLike(Protocol):
     async def record_policy_decision(
@@ -86,12 +187,23 @@ class BackupAuditServiceLike(Protocol):
         ...
 
 
+class BackupBaseReaderLike(Protocol):
+    async def restore_backup_plaintext(self, metadata: Any) -> bytes:
+        ...
+
+
+class UnitOfWorkLike(Protocol):
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        ...
+
+
 class BackupSettingsLike(Protocol):
     classification_required: bool
     default_classification: str
     minio_bucket: str
 
 
+@traced_methods('service.backup')
 class BackupService:
     def __init__(
         self,
@@ -102,6 +214,10 @@ class BackupService:
         key_store: KeyStore,
         storage: ObjectStorage,
         key_management_service: object | None = None,
+        base_reader: BackupBaseReaderLike | None = None,
+        unit_of_work: UnitOfWorkLike | None = None,
+        incident_service: IncidentLevelSourceLike | None = None,
+        mfa_validator: MfaValidatorLike | None = None,
     ) -> None:
         self._repository = repository
         self._settings = settings
@@ -110,6 +226,15 @@ class BackupService:
         self._key_store = key_store
         self._storage = storage
         self._key_management_service = key_management_service
+        self._base_reader = base_reader
+        self._unit_of_work = unit_of_work
+        self._incident_service = incident_service
+        self._mfa_validator = mfa_validator
+
+    def _transaction(self) -> AbstractAsyncContextManager[None]:
+        if self._unit_of_work is None:
+            return nullcontext()
+        return self._unit_of_work.transaction()
 
     async def _mark_failed(
         self,
@@ -117,18 +242,40 @@ class BackupService:
         principal: ApiKeyPrincipal | None,
         reason: str,
     ) -> None:
-        await self._repository.update_metadata(
-            backup_id,
-            status=BackupStatus.FAILED.value,
-        )
-        await self._audit_service.record_backup_event(
-            action='backup_processing_failed',
-            backup_id=backup_id,
-            actor_key_id=principal.key_id if principal else None,
-            actor_role=principal.role if principal else None,
-            status=BackupStatus.FAILED.value,
-            reason=reason,
-        )
+        async with self._transaction():
+            await self._repository.update_metadata(
+                backup_id,
+                status=BackupStatus.FAILED.value,
+            )
+            await self._audit_service.record_backup_event(
+                action='backup_processing_failed',
+                backup_id=backup_id,
+                actor_key_id=principal.key_id if principal else None,
+                actor_role=principal.role if principal else None,
+                status=BackupStatus.FAILED.value,
+                reason=reason,
+            )
+
+    async def _incident_level(self) -> IncidentLevel:
+        if self._incident_service is None:
+            return IncidentLevel.NORMAL
+        try:
+            return IncidentLevel(await self._incident_service.get_current_level())
+        except Exception:
+            # Unknown incident state is evaluated as the strictest level.
+            return IncidentLevel.LOCKDOWN
+
+    async def _mfa_verified(
+        self,
+        principal: ApiKeyPrincipal | None,
+        mfa_token: str | None,
+        client_ip: str | None,
+    ) -> bool:
+        # MFA is optional for backups; a token that is sent must be valid.
+        if not mfa_token or self._mfa_validator is None:
+            return False
+        await self._mfa_validator.validate_mfa_token(principal, mfa_token, client_ip)
+        return True
 
     def _normalize_classification(self, request: BackupRequest) -> ClassificationLevel:
         if request.classification is None:
@@ -159,109 +306,357 @@ class BackupService:
                 ) from exc
         return request.classification
 
-    async def submit_backup(
+    def _invalid_base(self, message: str) -> BackupValidationError:
+        return BackupValidationError(
+            message='Request validation failed',
+            details=[
+                {
+                    'loc': ['body', 'base_backup_id'],
+                    'msg': message,
+                    'type': 'value_error',
+                },
+            ],
+        )
+
+    async def _load_delta_base(
         self,
         request: BackupRequest,
         principal: ApiKeyPrincipal | None,
-        client_ip: str | None,
-    ) -> dict[str, object]:
-        classification = self._normalize_classification(request)
-        backup_id = uuid4().hex
-        decision = self._policy_service.evaluate_backup(principal, classification)
-        await self._audit_service.record_policy_decision(
-            key_id=principal.key_id if principal else None,
-            operation='backup_submit',
-            allowed=decision.allowed,
-            reason=decision.reason,
-            reason_category=decision.reason_category,
-            classification=classification.value,
-            client_ip=client_ip,
-        )
-        if not decision.allowed:
-            await self._audit_service.record_backup_event(
-                action='backup_processing_denied',
-                backup_id=backup_id,
-                actor_key_id=principal.key_id if principal else None,
-                actor_role=principal.role if principal else None,
-                status='DENIED',
-                reason=decision.reason_category,
-            )
-            raise BackupPolicyDenied(decision.reason, decision.reason_category)
-        plaintext = (request.payload or '').encode()
-        checksum_plaintext = sha512(plaintext).hexdigest()
-        record = BackupMetadataModel(
-            backup_id=backup_id,
-            key_version=None,
-            classification=classification.value,
-            source_system=request.source_system,
-            description=request.description,
-            status=BackupStatus.PROCESSING.value,
-            checksum_plaintext=checksum_plaintext,
-            original_size=len(plaintext),
-            created_by=principal.key_id if principal else None,
-        )
-        await self._repository.create_metadata(record)
-        await self._audit_service.record_backup_event(
-            action='backup_processing_started',
-            backup_id=backup_id,
-            actor_key_id=principal.key_id if principal else None,
-            actor_role=principal.role if principal else None,
-            status=BackupStatus.PROCESSING.value,
-            reason=None,
-        )
+        classification: ClassificationLevel,
+        incident_level: IncidentLevel,
+        mfa_verified: bool,
+    ) -> tuple[Any, bytes] | None:
+        base = await self._repository.get_by_backup_id(str(request.base_backup_id))
+        if base is None:
+            raise self._invalid_base('Base backup not found')
+        if base.source_system != request.source_system:
+            raise self._invalid_base('Base backup belongs to a different source system')
+        if base.status != BackupStatus.ACTIVE.value:
+            raise self._invalid_base('Base backup is not active')
+        # Reading the base is a restore of it; without the same classification and the
+        # caller's right to restore it, store this backup in full instead.
+        if base.classification != classification.value:
+            return None
+        if not self._policy_service.authorize(principal, 'restores').allowed:
+            return None
+        if not self._policy_service.evaluate_restore(
+            principal,
+            classification,
+            incident_level=incident_level,
+            mfa_verified=mfa_verified,
+        ).allowed:
+            return None
+        max_depth = getattr(self._settings, 'backup_max_delta_depth', 0)
+        if self._base_reader is None or (getattr(base, 'delta_depth', 0) or 0) >= max_depth:
+            # Synthetic full: the chain is deep enough, so this backup starts a new one.
+            return None
         try:
-            if self._key_management_service is not None and hasattr(
-                self._key_management_service,
-                'get_active_key_material',
-            ):
-                key_material = await self._key_management_service.get_active_key_material()
-            else:
-                key_material = self._key_store.get_active_key()
+            base_plaintext = await self._base_reader.restore_backup_plaintext(base)
         except Exception as exc:
-            await self._mark_failed(backup_id, principal, 'key_unavailable')
-            raise BackupProcessingError('UPLOAD_FAILED', 'Backup encryption failed') from exc
-        await self._repository.update_metadata(
-            backup_id,
-            key_version=key_material.version_id,
+            raise BackupProcessingError('UPLOAD_FAILED', 'Base backup could not be read') from exc
+        return base, base_plaintext
+
+    def _select_compressor(self, sample: bytes) -> Compressor | None:
+        compress = get_compressor(
+            getattr(self._settings, 'backup_compression', COMPRESSION_NONE),
+            getattr(self._settings, 'backup_compression_level', 6),
         )
+        if compress is None:
+            return None
+        if getattr(self._settings, 'backup_compression_adaptive', True) and not worth_compressing(
+            sample,
+            compress,
+        ):
+            # Already-compressed or encrypted payloads would only grow by the framing.
+            return None
+        return compress
+
+    async def _store_object(
+        self,
+        backup_id: str,
+        principal: ApiKeyPrincipal | None,
+        plaintext: bytes,
+        key_material: KeyMaterial,
+        compress: Compressor | None,
+    ) -> dict[str, object]:
+        # Settings objects without a chunk size keep writing single-frame backups.
+        chunk_size = getattr(self._settings, 'backup_chunk_size', 0)
+        fields: dict[str, object] = {}
         try:
-            encryption = encrypt(plaintext, key_material.key_bytes)
+            with trace_span('crypto.encrypt', size=len(plaintext), chunked=chunk_size > 0):
+                if chunk_size > 0:
+                    # Chunks are compressed independently so ranged restores stay chunk-local.
+                    chunked = await _off_event_loop(
+                        len(plaintext),
+                        encrypt_chunked,
+                        plaintext,
+                        key_material.key_bytes,
+                        chunk_size,
+                        compress,
+                    )
+                    ciphertext_blob = chunked.blob
+                    fields['nonce'] = chunked.nonce_prefix.hex()
+                    fields['chunk_size'] = chunked.chunk_size
+                    fields['chunk_offsets'] = chunked.offsets
+                else:
+                    encryption = await _off_event_loop(
+                        len(plaintext),
+                        _compress_and_encrypt,
+                        plaintext,
+                        key_material.key_bytes,
+                        compress,
+                    )
+                    ciphertext_blob = encryption.nonce + encryption.tag + encryption.ciphertext
+                    fields['nonce'] = encryption.nonce.hex()
         except Exception as exc:
             await self._mark_failed(backup_id, principal, 'encryption_failed')
             raise BackupProcessingError('UPLOAD_FAILED', 'Backup encryption failed') from exc
         object_name = f'{backup_id}.bin'
-        ciphertext_blob = encryption.nonce + encryption.tag + encryption.ciphertext
         try:
-            await self._storage.put_object(
-                self._settings.minio_bucket,
-                object_name,
-                ciphertext_blob,
-            )
+            with trace_span('storage.upload', size=len(ciphertext_blob)):
+                await self._storage.put_object(
+                    self._settings.minio_bucket,
+                    object_name,
+                    ciphertext_blob,
+                )
+        except ObjectStorageError as exc:
+            await self._mark_failed(backup_id, principal, 'storage_failed')
+            raise BackupProcessingError('UPLOAD_FAILED', exc.message) from exc
+        except Exception as exc:
+            await self._mark_failed(backup_id, principal, 'storage_failed')
+            raise BackupProcessingError('UPLOAD_FAILED', 'Backup upload failed') from exc
+        fields['storage_path'] = object_name
+        fields['checksum_ciphertext'] = sha512(ciphertext_blob).hexdigest()
+        fields['encrypted_size'] = len(ciphertext_blob)
+        return fields
+
+    async def _store_deduplicated(
+        self,
+        backup_id: str,
+        principal: ApiKeyPrincipal | None,
+        plaintext: bytes,
+        key_material: KeyMaterial,
+        scope: str,
+        compress: Compressor | None,
+    ) -> dict[str, object]:
+        avg_size = getattr(self._settings, 'backup_dedup_avg_chunk_size', 8192)
+        try:
+            with trace_span('dedup.chunk', size=len(plaintext)):
+                # The chunker is pure Python; large inputs run in a worker process.
+                boundaries = await run_cpu_bound(
+                    len(plaintext),
+                    cdc_boundaries,
+                    plaintext,
+                    avg_size // 4,
+                    avg_size,
+                    avg_size * 8,
+                )
+            with trace_span('crypto.encrypt', size=len(plaintext), deduplicated=True):
+                sealed_chunks, manifest = await asyncio.to_thread(
+                    _seal_dedup_chunks,
+                    plaintext,
+                    boundaries,
+                    key_material.key_bytes,
+                    scope,
+                    compress,
+                )
+        except Exception as exc:
+            await self._mark_failed(backup_id, principal, 'encryption_failed')
+            raise BackupProcessingError('UPLOAD_FAILED', 'Backup encryption failed') from exc
+        prefix = dedup_prefix(key_material.version_id)
+        semaphore = asyncio.Semaphore(_DEDUP_UPLOAD_CONCURRENCY)
+
+        async def _upload(identifier: str, sealed: bytes) -> None:
+            object_name = f'{prefix}/{identifier}'
+            async with semaphore:
+                # Sealing is deterministic, so a chunk already stored is byte-identical.
+                if await self._storage.has_object(self._settings.minio_bucket, object_name):
+                    return
+                await self._storage.put_object(self._settings.minio_bucket, object_name, sealed)
+
+        try:
+            with trace_span('storage.upload', chunks=len(sealed_chunks)):
+                await asyncio.gather(
+                    *(_upload(identifier, sealed) for identifier, sealed in sealed_chunks.items()),
+                )
         except ObjectStorageError as exc:
             await self._mark_failed(backup_id, principal, 'storage_failed')
             raise BackupProcessingError('UPLOAD_FAILED', exc.message) from exc
         except Exception as exc:
             await self._mark_failed(backup_id, principal, 'storage_failed')
             raise BackupProcessingError('UPLOAD_FAILED', 'Backup upload failed') from exc
-        checksum_ciphertext = sha512(ciphertext_blob).hexdigest()
-        updated_record = await self._repository.update_metadata(
-            backup_id,
-            status=BackupStatus.ACTIVE.value,
-            storage_path=object_name,
-            checksum_ciphertext=checksum_ciphertext,
-            nonce=encryption.nonce.hex(),
-            encrypted_size=len(ciphertext_blob),
-            key_version=key_material.version_id,
-        )
-        await self._audit_service.record_backup_event(
-            action='backup_processing_succeeded',
-            backup_id=backup_id,
-            actor_key_id=principal.key_id if principal else None,
-            actor_role=principal.role if principal else None,
-            status=BackupStatus.ACTIVE.value,
-            reason=None,
-        )
         return {
+            'storage_path': prefix,
+            'dedup_manifest': [[identifier, size] for identifier, size in manifest],
+            'encrypted_size': sum(len(sealed_chunks[identifier]) for identifier, _ in manifest),
+            'checksum_ciphertext': None,
+            'nonce': None,
+        }
+
+    async def submit_backup(
+        self,
+        request: BackupRequest,
+        principal: ApiKeyPrincipal | None,
+        client_ip: str | None,
+        mfa_token: str | None = None,
+    ) -> dict[str, object]:
+        classification = self._normalize_classification(request)
+        backup_id = uuid4().hex
+        mfa_verified = await self._mfa_verified(principal, mfa_token, client_ip)
+        incident_level = await self._incident_level()
+        with trace_span('policy.evaluate'):
+            decision = self._policy_service.evaluate_backup(
+                principal,
+                classification,
+                incident_level=incident_level,
+                mfa_verified=mfa_verified,
+            )
+        plaintext = (request.payload or '').encode()
+        checksum_plaintext = sha512(plaintext).hexdigest()
+        delta_base: tuple[Any, bytes] | None = None
+        base_error: BackupValidationError | BackupProcessingError | None = None
+        if decision.allowed and request.base_backup_id is not None:
+            # Read the base before the transaction so the audit chain lock is held briefly.
+            try:
+                delta_base = await self._load_delta_base(
+                    request,
+                    principal,
+                    classification,
+                    incident_level,
+                    mfa_verified,
+                )
+            except (BackupValidationError, BackupProcessingError) as exc:
+                base_error = exc
+        # Durability point before the upload: the decision, PROCESSING row and start event.
+        async with self._transaction():
+            await self._audit_service.record_policy_decision(
+                key_id=principal.key_id if principal else None,
+                operation='backup_submit',
+                allowed=decision.allowed,
+                reason=decision.reason,
+                reason_category=decision.reason_category,
+                classification=classification.value,
+                client_ip=client_ip,
+            )
+            if not decision.allowed:
+                await self._audit_service.record_backup_event(
+                    action='backup_processing_denied',
+                    backup_id=backup_id,
+                    actor_key_id=principal.key_id if principal else None,
+                    actor_role=principal.role if principal else None,
+                    status='DENIED',
+                    reason=decision.reason_category,
+                )
+            elif base_error is None:
+                record = BackupMetadataModel(
+                    backup_id=backup_id,
+                    key_version=None,
+                    classification=classification.value,
+                    source_system=request.source_system,
+                    description=request.description,
+                    status=BackupStatus.PROCESSING.value,
+                    checksum_plaintext=checksum_plaintext,
+                    original_size=len(plaintext),
+                    created_by=principal.key_id if principal else None,
+                )
+                await self._repository.create_metadata(record)
+                await self._audit_service.record_backup_event(
+                    action='backup_processing_started',
+                    backup_id=backup_id,
+                    actor_key_id=principal.key_id if principal else None,
+                    actor_role=principal.role if principal else None,
+                    status=BackupStatus.PROCESSING.value,
+                    reason=None,
+                )
+        if not decision.allowed:
+            raise BackupPolicyDenied(decision.reason, decision.reason_category)
+        if base_error is not None:
+            raise base_error
+        try:
+            with trace_span('key.fetch'):
+                if self._key_management_service is not None and hasattr(
+                    self._key_management_service,
+                    'get_active_key_material',
+                ):
+                    key_material = await self._key_management_service.get_active_key_material()
+                else:
+                    key_material = self._key_store.get_active_key()
+        except Exception as exc:
+            await self._mark_failed(backup_id, principal, 'key_unavailable')
+            raise BackupProcessingError('UPLOAD_FAILED', 'Backup encryption failed') from exc
+        payload = plaintext
+        delta_fields: dict[str, object] = {}
+        if delta_base is not None:
+            base, base_plaintext = delta_base
+            with trace_span('delta.compute', size=len(plaintext)):
+                # Pure-Python chunking on both sides; large inputs run in a worker process.
+                delta = await run_cpu_bound(
+                    len(base_plaintext) + len(plaintext),
+                    compute_delta,
+                    base_plaintext,
+                    plaintext,
+                    _DELTA_AVG_CHUNK_SIZE // 4,
+                    _DELTA_AVG_CHUNK_SIZE,
+                    _DELTA_AVG_CHUNK_SIZE * 8,
+                )
+            if len(delta) <= len(plaintext) * (1 - _MIN_DELTA_SAVING):
+                payload = delta
+                delta_fields = {
+                    'base_backup_id': base.backup_id,
+                    'delta_depth': (getattr(base, 'delta_depth', 0) or 0) + 1,
+                    'delta_size': len(delta),
+                }
+        sample_size = getattr(self._settings, 'backup_chunk_size', 0) or _COMPRESSION_SAMPLE_SIZE
+        try:
+            compress = self._select_compressor(payload[:sample_size])
+        except Exception as exc:
+            await self._mark_failed(backup_id, principal, 'compression_failed')
+            raise BackupProcessingError('UPLOAD_FAILED', 'Backup compression failed') from exc
+        storage_fields: dict[str, object] = {
+            'compression': (
+                getattr(self._settings, 'backup_compression', COMPRESSION_NONE)
+                if compress is not None
+                else COMPRESSION_NONE
+            ),
+            'compression_level': (
+                getattr(self._settings, 'backup_compression_level', None)
+                if compress is not None
+                else None
+            ),
+            **delta_fields,
+        }
+        if getattr(self._settings, 'backup_dedup_enabled', False):
+            storage_fields.update(
+                await self._store_deduplicated(
+                    backup_id,
+                    principal,
+                    payload,
+                    key_material,
+                    dedup_scope(request.source_system, str(storage_fields['compression'])),
+                    compress,
+                ),
+            )
+        else:
+            storage_fields.update(
+                await self._store_object(backup_id, principal, payload, key_material, compress),
+            )
+        # Durability point after the upload: the object is stored, publish it as ACTIVE.
+        async with self._transaction():
+            updated_record = await self._repository.update_metadata(
+                backup_id,
+                status=BackupStatus.ACTIVE.value,
+                key_version=key_material.version_id,
+                **storage_fields,
+            )
+            await self._audit_service.record_backup_event(
+                action='backup_processing_succeeded',
+                backup_id=backup_id,
+                actor_key_id=principal.key_id if principal else None,
+                actor_role=principal.role if principal else None,
+                status=BackupStatus.ACTIVE.value,
+                reason=None,
+            )
+        response: dict[str, object] = {
             'status': 'accepted',
             'backup_id': updated_record.backup_id if updated_record else backup_id,
             'classification': (
@@ -271,3 +666,8 @@ class BackupService:
                 updated_record.source_system if updated_record else request.source_system
             ),
         }
+        if request.base_backup_id is not None:
+            # None means the backup was stored in full to keep the delta chain short.
+            response['base_backup_id'] = delta_fields.get('base_backup_id')
+            response['delta_depth'] = delta_fields.get('delta_depth', 0)
+        return response
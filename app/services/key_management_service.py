@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import Protocol
 
 from app.core.enums import IncidentLevel
+from app.core.tracing import traced_methods
 from app.infrastructure.crypto.key_store_fs import KeyMaterial
 from app.infrastructure.db.models.key_version import KeyVersionModel
 from app.schemas.auth import ApiKeyPrincipal
@@ -122,6 +123,7 @@ class IncidentServiceLike(Protocol):
         ...
 
 
+@traced_methods('service.key_management')
 class KeyManagementService:
     def __init__(
         self,
@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import logging
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Protocol, TypeVar
+
+from app.core.enums import ClassificationLevel, IncidentLevel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROLE_PERMISSIONS: dict[str, set[str]] = {
+    'operator': {'backups'},
+    'admin': {'backups', 'restores', 'audit', 'admin'},
+    'super_admin': {'backups', 'restores', 'audit', 'admin'},
+}
+DEFAULT_BACKUP_CLASSIFICATION_ROLES: dict[ClassificationLevel, set[str]] = {
+    level: {'operator', 'admin', 'super_admin'} for level in ClassificationLevel
+}
+DEFAULT_RESTORE_ROLES: set[str] = {'admin', 'super_admin'}
+
+_OPERATIONS = ('backup', 'restore')
+
+
+@dataclass(frozen=True)
+class AuthorizationDecision:
+    allowed: bool
+    reason: str
+    required_permission: str
+    role: str
+
+
+@dataclass(frozen=True)
+class BackupPolicyDecision:
+    allowed: bool
+    reason: str
+    reason_category: str
+    role: str
+    classification: ClassificationLevel
+
+
+@dataclass(frozen=True)
+class RestorePolicyDecision:
+    allowed: bool
+    reason: str
+    reason_category: str
+    role: str
+    classification: ClassificationLevel
+
+
+class PolicyCompileError(ValueError):
+    def __init__(self, message: str, policy_id: str | None = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.policy_id = policy_id
+
+
+class PolicyRecordLike(Protocol):
+    policy_id: str
+    rule_json: dict[str, object]
+    is_active: bool
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class IncidentRestriction:
+    operation: str
+    incident_level: IncidentLevel
+    roles: frozenset[str] | None
+    require_mfa: bool
+
+
+@dataclass
+class PolicyRules:
+    role_permissions: dict[str, set[str]]
+    backup_classification_roles: dict[ClassificationLevel, set[str]]
+    restore_classification_roles: dict[ClassificationLevel, set[str]]
+    incident_restrictions: list[IncidentRestriction] = field(default_factory=list)
+
+    @classmethod
+    def from_defaults(
+        cls,
+        role_permissions: Mapping[str, set[str]] | None = None,
+        backup_classification_roles: Mapping[ClassificationLevel, set[str]] | None = None,
+        restore_roles: set[str] | None = None,
+    ) -> PolicyRules:
+        restore = restore_roles if restore_roles is not None else DEFAULT_RESTORE_ROLES
+        return cls(
+            role_permissions={
+                role: set(permissions)
+                for role, permissions in (role_permissions or DEFAULT_ROLE_PERMISSIONS).items()
+            },
+            backup_classification_roles={
+                level: set(roles)
+                for level, roles in (
+                    backup_classification_roles or DEFAULT_BACKUP_CLASSIFICATION_ROLES
+                ).items()
+            },
+            restore_classification_roles={level: set(restore) for level in ClassificationLevel},
+        )
+
+    def copy(self) -> PolicyRules:
+        return PolicyRules(
+            role_permissions={role: set(p) for role, p in self.role_permissions.items()},
+            backup_classification_roles={
+                level: set(roles) for level, roles in self.backup_classification_roles.items()
+            },
+            restore_classification_roles={
+                level: set(roles) for level, roles in self.restore_classification_roles.items()
+            },
+            incident_restrictions=list(self.incident_restrictions),
+        )
+
+
+def _string_list(rule: Mapping[str, object], key: str, policy_id: str | None) -> set[str]:
+    value = rule.get(key)
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise PolicyCompileError(f'Policy rule field {key!r} must be a list of strings', policy_id)
+    return set(value)
+
+
+def _classifications(
+    rule: Mapping[str, object],
+    policy_id: str | None,
+) -> tuple[ClassificationLevel, ...]:
+    raw = rule.get('classification')
+    if raw is None:
+        return tuple(ClassificationLevel)
+    try:
+        return (ClassificationLevel(str(raw)),)
+    except ValueError as exc:
+        raise PolicyCompileError(f'Unknown classification: {raw!r}', policy_id) from exc
+
+
+def apply_rule(
+    rules: PolicyRules,
+    rule_json: Mapping[str, object],
+    policy_id: str | None = None,
+) -> None:
+    """Apply one `policy_records.rule_json` document; documents without a `type` are ignored."""
+    rule_type = rule_json.get('type')
+    if rule_type is None:
+        return
+    if rule_type == 'role_permissions':
+        role = rule_json.get('role')
+        if not isinstance(role, str) or not role:
+            raise PolicyCompileError('Policy rule field role is required', policy_id)
+        rules.role_permissions[role] = _string_list(rule_json, 'permissions', policy_id)
+    elif rule_type == 'backup_classification':
+        roles = _string_list(rule_json, 'roles', policy_id)
+        for level in _classifications(rule_json, policy_id):
+            rules.backup_classification_roles[level] = set(roles)
+    elif rule_type == 'restore_roles':
+        roles = _string_list(rule_json, 'roles', policy_id)
+        for level in _classifications(rule_json, policy_id):
+            rules.restore_classification_roles[level] = set(roles)
+    elif rule_type == 'incident_restriction':
+        operation = rule_json.get('operation')
+        if operation not in _OPERATIONS:
+            raise PolicyCompileError(f'Unknown policy operation: {operation!r}', policy_id)
+        try:
+            incident_level = IncidentLevel(str(rule_json.get('incident_level')))
+        except ValueError as exc:
+            raise PolicyCompileError('Unknown incident level', policy_id) from exc
+        require_mfa = rule_json.get('require_mfa', False)
+        if not isinstance(require_mfa, bool):
+            raise PolicyCompileError('Policy rule field require_mfa must be a boolean', policy_id)
+        rules.incident_restrictions.append(
+            IncidentRestriction(
+                operation=str(operation),
+                incident_level=incident_level,
+                roles=(
+                    frozenset(_string_list(rule_json, 'roles', policy_id))
+                    if 'roles' in rule_json
+                    else None
+                ),
+                require_mfa=require_mfa,
+            ),
+        )
+    else:
+        raise PolicyCompileError(f'Unknown policy rule type: {rule_type!r}', policy_id)
+
+
+def validate_rule(rule_json: Mapping[str, object]) -> None:
+    apply_rule(PolicyRules.from_defaults(), rule_json)
+
+
+_DecisionT = TypeVar('_DecisionT')
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self._decisions: dict[object, object] = {}
+
+    def __call__(self, decision: _DecisionT) -> _DecisionT:
+        return self._decisions.setdefault(decision, decision)  # type: ignore[return-value]
+
+
+DecisionKey = tuple[str, ClassificationLevel, IncidentLevel, bool]
+
+
+@dataclass(frozen=True)
+class PolicyTable:
+    """Immutable decision table; lookups never allocate for known roles and permissions."""
+
+    version: int
+    authorizations: Mapping[tuple[str, str], AuthorizationDecision]
+    backups: Mapping[DecisionKey, BackupPolicyDecision]
+    restores: Mapping[DecisionKey, RestorePolicyDecision]
+    missing_authorizations: Mapping[str, AuthorizationDecision]
+    missing_backups: Mapping[ClassificationLevel, BackupPolicyDecision]
+    missing_restores: Mapping[ClassificationLevel, RestorePolicyDecision]
+
+
+def _incident_outcome(
+    rules: PolicyRules,
+    operation: str,
+    role: str,
+    incident_level: IncidentLevel,
+    mfa_verified: bool,
+) -> tuple[str, str] | None:
+    for restriction in rules.incident_restrictions:
+        if restriction.operation != operation or restriction.incident_level != incident_level:
+            continue
+        if restriction.roles is not None and role not in restriction.roles:
+            continue
+        if not restriction.require_mfa:
+            return 'incident_restricted', f'{operation.capitalize()} restricted during incident'
+        if not mfa_verified:
+            return 'mfa_required', f'MFA required for {operation} during incident'
+    return None
+
+
+def compile_policy_table(rules: PolicyRules, version: int = 0) -> PolicyTable:
+    intern = _Interner()
+    roles = {
+        *rules.role_permissions,
+        *(role for roles in rules.backup_classification_roles.values() for role in roles),
+        *(role for roles in rules.restore_classification_roles.values() for role in roles),
+    }
+    roles = {sys.intern(role) for role in roles}
+    permissions = {
+        sys.intern(permission)
+        for granted in rules.role_permissions.values()
+        for permission in granted
+    }
+
+    authorizations: dict[tuple[str, str], AuthorizationDecision] = {}
+    for role in roles:
+        granted = rules.role_permissions.get(role, set())
+        for permission in permissions:
+            allowed = permission in granted
+            authorizations[(role, permission)] = intern(
+                AuthorizationDecision(
+                    allowed=allowed,
+                    reason='allowed' if allowed else 'permission_denied',
+                    required_permission=permission,
+                    role=role,
+                ),
+            )
+
+    backups: dict[DecisionKey, BackupPolicyDecision] = {}
+    restores: dict[DecisionKey, RestorePolicyDecision] = {}
+    for role in roles:
+        for level in ClassificationLevel:
+            for incident_level in IncidentLevel:
+                for mfa_verified in (False, True):
+                    key = (role, level, incident_level, mfa_verified)
+                    backups[key] = intern(
+                        _backup_decision(rules, role, level, incident_level, mfa_verified),
+                    )
+                    restores[key] = intern(
+                        _restore_decision(rules, role, level, incident_level, mfa_verified),
+                    )
+
+    return PolicyTable(
+        version=version,
+        authorizations=MappingProxyType(authorizations),
+        backups=MappingProxyType(backups),
+        restores=MappingProxyType(restores),
+        missing_authorizations=MappingProxyType(
+            {
+                permission: intern(missing_principal_authorization(permission))
+                for permission in permissions
+            },
+        ),
+        missing_backups=MappingProxyType(
+            {level: intern(missing_principal_backup(level)) for level in ClassificationLevel},
+        ),
+        missing_restores=MappingProxyType(
+            {level: intern(missing_principal_restore(level)) for level in ClassificationLevel},
+        ),
+    )
+
+
+def _backup_decision(
+    rules: PolicyRules,
+    role: str,
+    classification: ClassificationLevel,
+    incident_level: IncidentLevel,
+    mfa_verified: bool,
+) -> BackupPolicyDecision:
+    if role not in rules.backup_classification_roles.get(classification, set()):
+        return BackupPolicyDecision(
+            allowed=False,
+            reason='Role not permitted for classification',
+            reason_category='role_restricted',
+            role=role,
+            classification=classification,
+        )
+    restricted = _incident_outcome(rules, 'backup', role, incident_level, mfa_verified)
+    if restricted is not None:
+        category, reason = restricted
+        return BackupPolicyDecision(
+            allowed=False,
+            reason=reason,
+            reason_category=category,
+            role=role,
+            classification=classification,
+        )
+    return BackupPolicyDecision(
+        allowed=True,
+        reason='Backup allowed',
+        reason_category='allowed',
+        role=role,
+        classification=classification,
+    )
+
+
+def _restore_decision(
+    rules: PolicyRules,
+    role: str,
+    classification: ClassificationLevel,
+    incident_level: IncidentLevel,
+    mfa_verified: bool,
+) -> RestorePolicyDecision:
+    if role not in rules.restore_classification_roles.get(classification, set()):
+        return RestorePolicyDecision(
+            allowed=False,
+            reason='Role not permitted for restore',
+            reason_category='role_restricted',
+            role=role,
+            classification=classification,
+        )
+    restricted = _incident_outcome(rules, 'restore', role, incident_level, mfa_verified)
+    if restricted is not None:
+        category, reason = restricted
+        return RestorePolicyDecision(
+            allowed=False,
+            reason=reason,
+            reason_category=category,
+            role=role,
+            classification=classification,
+        )
+    return RestorePolicyDecision(
+        allowed=True,
+        reason='Restore allowed',
+        reason_category='allowed',
+        role=role,
+        classification=classification,
+    )
+
+
+def missing_principal_authorization(permission: str) -> AuthorizationDecision:
+    return AuthorizationDecision(
+        allowed=False,
+        reason='missing_principal',
+        required_permission=permission,
+        role='unknown',
+    )
+
+
+def missing_principal_backup(classification: ClassificationLevel) -> BackupPolicyDecision:
+    return BackupPolicyDecision(
+        allowed=False,
+        reason='Missing principal',
+        reason_category='missing_principal',
+        role='unknown',
+        classification=classification,
+    )
+
+
+def missing_principal_restore(classification: ClassificationLevel) -> RestorePolicyDecision:
+    return RestorePolicyDecision(
+        allowed=False,
+        reason='Missing principal',
+        reason_category='missing_principal',
+        role='unknown',
+        classification=classification,
+    )
+
+
+def compile_policy_records(
+    base: PolicyRules,
+    records: Iterable[PolicyRecordLike],
+    version: int = 0,
+) -> PolicyTable:
+    """Layer active records over `base` oldest-first and compile the result."""
+    rules = base.copy()
+    active = sorted(
+        (record for record in records if record.is_active),
+        key=lambda record: (record.created_at is None, record.created_at, record.policy_id),
+    )
+    for record in active:
+        try:
+            apply_rule(rules, record.rule_json, record.policy_id)
+        except PolicyCompileError as exc:
+            logger.warning('Skipping invalid policy %s: %s', record.policy_id, exc.message)
+    return compile_policy_table(rules, version=version)
@@ -1,35 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable
 
-from app.core.enums import ClassificationLevel
+from app.core.enums import ClassificationLevel, IncidentLevel
 from app.schemas.auth import ApiKeyPrincipal
+from app.services.policy_compiler import (
+    AuthorizationDecision,
+    BackupPolicyDecision,
+    PolicyRecordLike,
+    PolicyRules,
+    PolicyTable,
+    RestorePolicyDecision,
+    compile_policy_records,
+    compile_policy_table,
+    missing_principal_authorization,
+    missing_principal_backup,
+    missing_principal_restore,
+)
 
-
-@dataclass(frozen=True)
-class AuthorizationDecision:
-    allowed: bool
-    reason: str
-    required_permission: str
-    role: str
-
-
-@dataclass(frozen=True)
-class BackupPolicyDecision:
-    allowed: bool
-    reason: str
-    reason_category: str
-    role: str
-    classification: ClassificationLevel
-
-
-@dataclass(frozen=True)
-class RestorePolicyDecision:
-    allowed: bool
-    reason: str
-    reason_category: str
-    role: str
-    classification: ClassificationLevel
+__all__ = [
+    'AuthorizationDecision',
+    'BackupPolicyDecision',
+    'PolicyService',
+    'RestorePolicyDecision',
+]
 
 
 class PolicyService:
@@ -37,105 +31,103 @@ class PolicyService:
         self,
         role_permissions: dict[str, set[str]] | None = None,
         backup_classification_roles: dict[ClassificationLevel, set[str]] | None = None,
+        restore_roles: set[str] | None = None,
     ) -> None:
-        self._role_permissions = role_permissions or {
-            'operator': {'backups'},
-            'admin': {'backups', 'restores', 'audit', 'admin'},
-            'super_admin': {'backups', 'restores', 'audit', 'admin'},
-        }
-        self._backup_classification_roles = backup_classification_roles or {
-            ClassificationLevel.PUBLIC: {'operator', 'admin', 'super_admin'},
-            ClassificationLevel.INTERNAL: {'operator', 'admin', 'super_admin'},
-            ClassificationLevel.CONFIDENTIAL: {'operator', 'admin', 'super_admin'},
-            ClassificationLevel.SECRET: {'operator', 'admin', 'super_admin'},
-        }
+        self._base_rules = PolicyRules.from_defaults(
+            role_permissions=role_permissions,
+            backup_classification_roles=backup_classification_roles,
+            restore_roles=restore_roles,
+        )
+        self._table = compile_policy_table(self._base_rules)
+        self._watermark: object | None = None
+
+    @property
+    def table(self) -> PolicyTable:
+        return self._table
+
+    @property
+    def watermark(self) -> object | None:
+        """Marker of the policy records the table was compiled from, if known."""
+        return self._watermark
+
+    def reload(
+        self,
+        records: Iterable[PolicyRecordLike],
+        watermark: object | None = None,
+    ) -> PolicyTable:
+        # Evaluators read `self._table` once, so the swap is atomic for in-flight calls.
+        table = compile_policy_records(self._base_rules, records, version=self._table.version + 1)
+        self._table = table
+        self._watermark = watermark
+        return table
 
     def authorize(
         self,
         principal: ApiKeyPrincipal | None,
         permission: str,
     ) -> AuthorizationDecision:
+        table = self._table
         if principal is None:
-            return AuthorizationDecision(
-                allowed=False,
-                reason='missing_principal',
-                required_permission=permission,
-                role='unknown',
+            return table.missing_authorizations.get(permission) or (
+                missing_principal_authorization(permission)
             )
-
-        role = principal.role
-        allowed_permissions = self._role_permissions.get(role, set())
-        if permission in allowed_permissions:
+        decision = table.authorizations.get((principal.role, permission))
+        if decision is None:
             return AuthorizationDecision(
-                allowed=True,
-                reason='allowed',
+                allowed=False,
+                reason='permission_denied',
                 required_permission=permission,
-                role=role,
+                role=principal.role,
             )
-
-        return AuthorizationDecision(
-            allowed=False,
-            reason='permission_denied',
-            required_permission=permission,
-            role=role,
-        )
+        return decision
 
     def evaluate_backup(
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: IncidentLevel = IncidentLevel.NORMAL,
+        mfa_verified: bool = False,
     ) -> BackupPolicyDecision:
+        table = self._table
         if principal is None:
-            return BackupPolicyDecision(
-                allowed=False,
-                reason='Missing principal',
-                reason_category='missing_principal',
-                role='unknown',
-                classification=classification,
+            return table.missing_backups.get(classification) or (
+                missing_principal_backup(classification)
             )
-        allowed_roles = self._backup_classification_roles.get(classification, set())
-        if principal.role in allowed_roles:
+        decision = table.backups.get(
+            (principal.role, classification, incident_level, mfa_verified),
+        )
+        if decision is None:
             return BackupPolicyDecision(
-                allowed=True,
-                reason='Backup allowed',
-                reason_category='allowed',
+                allowed=False,
+                reason='Role not permitted for classification',
+                reason_category='role_restricted',
                 role=principal.role,
                 classification=classification,
             )
-        return BackupPolicyDecision(
-            allowed=False,
-            reason='Role not permitted for classification',
-            reason_category='role_restricted',
-            role=principal.role,
-            classification=classification,
-        )
+        return decision
 
     def evaluate_restore(
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: IncidentLevel = IncidentLevel.NORMAL,
+        mfa_verified: bool = False,
     ) -> RestorePolicyDecision:
+        table = self._table
         if principal is None:
-            return RestorePolicyDecision(
-                allowed=False,
-                reason='Missing principal',
-                reason_category='missing_principal',
-                role='unknown',
-                classification=classification,
+            return table.missing_restores.get(classification) or (
+                missing_principal_restore(classification)
             )
         # Restore remains more restrictive than backup; RBAC already gates `restores`.
-        if principal.role in {'admin', 'super_admin'}:
+        decision = table.restores.get(
+            (principal.role, classification, incident_level, mfa_verified),
+        )
+        if decision is None:
             return RestorePolicyDecision(
-                allowed=True,
-                reason='Restore allowed',
-                reason_category='allowed',
+                allowed=False,
+                reason='Role not permitted for restore',
+                reason_category='role_restricted',
                 role=principal.role,
                 classification=classification,
             )
-        return RestorePolicyDecision(
-            allowed=False,
-            reason='Role not permitted for restore',
-            reason_category='role_restricted',
-            role=principal.role,
-            classification=classification,
-        )
+        return decision
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-import secrets
-from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Callable
 
+from app.services.restore_access_token_store import (
+    InMemoryRestoreAccessTokenStore,
+    RestoreAccessTokenRecord,
+    RestoreAccessTokenStore,
+)
 
-@dataclass(frozen=True)
-class RestoreAccessTokenRecord:
-    token: str
-    backup_id: str
-    actor_key_id: str | None
-    issued_at: datetime
-    expires_at: datetime
+__all__ = [
+    'RestoreAccessTokenExpired',
+    'RestoreAccessTokenForbidden',
+    'RestoreAccessTokenInvalid',
+    'RestoreAccessTokenRecord',
+    'RestoreAccessTokenService',
+]
 
 
 class RestoreAccessTokenInvalid(Exception):
@@ -40,53 +43,41 @@ class RestoreAccessTokenService:
     def __init__(
         self,
         now_provider: Callable[[], datetime] | None = None,
+        store: RestoreAccessTokenStore | None = None,
     ) -> None:
-        self._records: dict[str, RestoreAccessTokenRecord] = {}
+        self._store = store or InMemoryRestoreAccessTokenStore()
         self._now_provider = now_provider or (lambda: datetime.now(UTC))
 
-    def _purge_expired(self, now: datetime) -> None:
-        expired = [token for token, record in self._records.items() if record.expires_at <= now]
-        for token in expired:
-            del self._records[token]
+    async def active_record_count(self) -> int:
+        return await self._store.active_count(self._now_provider())
 
-    def active_record_count(self) -> int:
-        self._purge_expired(self._now_provider())
-        return len(self._records)
-
-    def issue_token(
+    async def issue_token(
         self,
         backup_id: str,
         actor_key_id: str | None,
         ttl_seconds: int,
     ) -> RestoreAccessTokenRecord:
-        now = self._now_provider()
-        self._purge_expired(now)
         if ttl_seconds <= 0:
             ttl_seconds = 1
-        issued_at = now
-        expires_at = issued_at + timedelta(seconds=ttl_seconds)
-        token = secrets.token_urlsafe(24)
-        record = RestoreAccessTokenRecord(
-            token=token,
+        issued_at = self._now_provider()
+        return await self._store.issue(
             backup_id=backup_id,
             actor_key_id=actor_key_id,
             issued_at=issued_at,
-            expires_at=expires_at,
+            expires_at=issued_at + timedelta(seconds=ttl_seconds),
         )
-        self._records[token] = record
-        return record
 
-    def validate_token(
+    async def validate_token(
         self,
         token: str,
         actor_key_id: str | None = None,
     ) -> RestoreAccessTokenRecord:
-        record = self._records.get(token)
+        record = await self._store.lookup(token)
         if record is None:
             raise RestoreAccessTokenInvalid()
         now = self._now_provider()
         if record.expires_at <= now:
-            del self._records[token]
+            await self._store.discard(token)
             raise RestoreAccessTokenExpired()
         if record.actor_key_id is not None and actor_key_id != record.actor_key_id:
             raise RestoreAccessTokenForbidden()
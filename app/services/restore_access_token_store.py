@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import base64
+import heapq
+import hmac
+import json
+import secrets
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from hashlib import sha256
+from typing import Any, Protocol
+
+from sqlalchemy import delete, func, select
+
+from app.infrastructure.db.models.restore_access_token import RestoreAccessTokenModel
+
+
+@dataclass(frozen=True)
+class RestoreAccessTokenRecord:
+    token: str
+    backup_id: str
+    actor_key_id: str | None
+    issued_at: datetime
+    expires_at: datetime
+
+
+class RestoreAccessTokenStore(Protocol):
+    async def issue(
+        self,
+        backup_id: str,
+        actor_key_id: str | None,
+        issued_at: datetime,
+        expires_at: datetime,
+    ) -> RestoreAccessTokenRecord:
+        ...
+
+    async def lookup(self, token: str) -> RestoreAccessTokenRecord | None:
+        ...
+
+    async def discard(self, token: str) -> None:
+        ...
+
+    async def active_count(self, now: datetime) -> int:
+        ...
+
+
+class InMemoryRestoreAccessTokenStore:
+    """Per-process tokens; a min-heap on expiry makes each purge O(expired * log n)."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, RestoreAccessTokenRecord] = {}
+        self._expiry_heap: list[tuple[datetime, str]] = []
+
+    def _purge_expired(self, now: datetime) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, token = heapq.heappop(heap)
+            # Tokens discarded on validation leave a stale heap entry behind.
+            self._records.pop(token, None)
+
+    async def issue(
+        self,
+        backup_id: str,
+        actor_key_id: str | None,
+        issued_at: datetime,
+        expires_at: datetime,
+    ) -> RestoreAccessTokenRecord:
+        self._purge_expired(issued_at)
+        record = RestoreAccessTokenRecord(
+            token=secrets.token_urlsafe(24),
+            backup_id=backup_id,
+            actor_key_id=actor_key_id,
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+        self._records[record.token] = record
+        heapq.heappush(self._expiry_heap, (expires_at, record.token))
+        return record
+
+    async def lookup(self, token: str) -> RestoreAccessTokenRecord | None:
+        return self._records.get(token)
+
+    async def discard(self, token: str) -> None:
+        self._records.pop(token, None)
+
+    async def active_count(self, now: datetime) -> int:
+        self._purge_expired(now)
+        return len(self._records)
+
+
+def _token_digest(token: str) -> str:
+    return sha256(token.encode()).hexdigest()
+
+
+class PostgresRestoreAccessTokenStore:
+    """Tokens in `restore_access_tokens`, valid on every worker and node."""
+
+    def __init__(self, session_factory: Callable[[], Any] | None = None) -> None:
+        self._session_factory = session_factory
+
+    def _get_session_factory(self) -> Callable[[], Any]:
+        if self._session_factory is None:
+            from app.infrastructure.db.session import get_session_factory
+
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    async def issue(
+        self,
+        backup_id: str,
+        actor_key_id: str | None,
+        issued_at: datetime,
+        expires_at: datetime,
+    ) -> RestoreAccessTokenRecord:
+        token = secrets.token_urlsafe(24)
+        async with self._get_session_factory()() as session:
+            # The expires_at index bounds the purge to rows that have actually expired.
+            await session.execute(
+                delete(RestoreAccessTokenModel).where(
+                    RestoreAccessTokenModel.expires_at <= issued_at,
+                ),
+            )
+            session.add(
+                RestoreAccessTokenModel(
+                    token_digest=_token_digest(token),
+                    backup_id=backup_id,
+                    actor_key_id=actor_key_id,
+                    issued_at=issued_at,
+                    expires_at=expires_at,
+                ),
+            )
+            await session.commit()
+        return RestoreAccessTokenRecord(
+            token=token,
+            backup_id=backup_id,
+            actor_key_id=actor_key_id,
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+
+    async def lookup(self, token: str) -> RestoreAccessTokenRecord | None:
+        async with self._get_session_factory()() as session:
+            model = await session.get(RestoreAccessTokenModel, _token_digest(token))
+        if model is None:
+            return None
+        return RestoreAccessTokenRecord(
+            token=token,
+            backup_id=model.backup_id,
+            actor_key_id=model.actor_key_id,
+            issued_at=model.issued_at,
+            expires_at=model.expires_at,
+        )
+
+    async def discard(self, token: str) -> None:
+        async with self._get_session_factory()() as session:
+            await session.execute(
+                delete(RestoreAccessTokenModel).where(
+                    RestoreAccessTokenModel.token_digest == _token_digest(token),
+                ),
+            )
+            await session.commit()
+
+    async def active_count(self, now: datetime) -> int:
+        async with self._get_session_factory()() as session:
+            result = await session.execute(
+                select(func.count()).where(RestoreAccessTokenModel.expires_at > now),
+            )
+            return int(result.scalar_one())
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+class SignedRestoreAccessTokenStore:
+    """Stateless HMAC-SHA256 tokens: validation needs the signing key and nothing else.
+
+    Signed tokens cannot be revoked before they expire and are not counted.
+    """
+
+    def __init__(self, signing_key: bytes) -> None:
+        if not signing_key:
+            raise ValueError('A signing key is required for signed restore access tokens')
+        self._signing_key = signing_key
+
+    def _sign(self, payload: str) -> str:
+        mac = hmac.new(self._signing_key, payload.encode('ascii'), sha256).digest()
+        return _b64encode(mac)
+
+    async def issue(
+        self,
+        backup_id: str,
+        actor_key_id: str | None,
+        issued_at: datetime,
+        expires_at: datetime,
+    ) -> RestoreAccessTokenRecord:
+        claims = {
+            'b': backup_id,
+            'k': actor_key_id,
+            'i': (issued_at - _EPOCH) // _MICROSECOND,
+            'e': (expires_at - _EPOCH) // _MICROSECOND,
+            'n': secrets.token_hex(8),
+        }
+        payload = _b64encode(json.dumps(claims, separators=(',', ':')).encode())
+        return RestoreAccessTokenRecord(
+            token=f'{payload}.{self._sign(payload)}',
+            backup_id=backup_id,
+            actor_key_id=actor_key_id,
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+
+    async def lookup(self, token: str) -> RestoreAccessTokenRecord | None:
+        payload, _, signature = token.partition('.')
+        try:
+            if not hmac.compare_digest(signature, self._sign(payload)):
+                return None
+            claims = json.loads(_b64decode(payload))
+            return RestoreAccessTokenRecord(
+                token=token,
+                backup_id=claims['b'],
+                actor_key_id=claims['k'],
+                issued_at=_EPOCH + timedelta(microseconds=claims['i']),
+                expires_at=_EPOCH + timedelta(microseconds=claims['e']),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    async def discard(self, token: str) -> None:
+        return None
+
+    async def active_count(self, now: datetime) -> int:
+        return 0
@@ -1,19 +1,43 @@
 from __future__ import annotations
 
+import asyncio
+import hmac
+import logging
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass
 from hashlib import sha512
 from inspect import isawaitable
+from itertools import accumulate
 from typing import Any, Protocol
 
 from app.core.enums import ClassificationLevel, IncidentLevel
-from app.infrastructure.crypto.aes_gcm import decrypt
+from app.core.tracing import annotate_span, trace_span, traced_methods
+from app.infrastructure.crypto.aes_gcm import (
+    GCM_TAG_SIZE,
+    chunk_span,
+    decrypt,
+    decrypt_chunks,
+)
+from app.infrastructure.crypto.convergent import chunk_id, derive_convergent_keys, open_chunk
+from app.infrastructure.storage.compression import CompressionError, get_decompressor
+from app.infrastructure.storage.delta import DeltaError, apply_delta
 from app.infrastructure.storage.minio_client import ObjectStorageError
+from app.infrastructure.storage.restore_spool import RestoreSpoolError
 from app.schemas.auth import ApiKeyPrincipal
 from app.schemas.restores import RestoreMetadataSummary, RestoreRequest
 from app.services.audit_service import AuditService
 from app.services.auth_service import AuthService
+from app.services.backup_service import dedup_scope
 from app.services.incident_service import IncidentService
 from app.services.policy_service import PolicyService
 
+logger = logging.getLogger(__name__)
+
+_DEDUP_FETCH_CONCURRENCY = 8
+# Compaction keeps real chains far shorter; this only stops a corrupted lineage.
+_MAX_DELTA_CHAIN = 64
+
 
 class RestoreMetadataNotFound(Exception):
     def __init__(self, backup_id: str) -> None:
@@ -54,6 +78,37 @@ class RestoreIrreversible(Exception):
         self.reason_category = reason_category
 
 
+class RestoreRangeNotSatisfiable(Exception):
+    def __init__(self, size: int) -> None:
+        super().__init__('Requested range is not satisfiable')
+        self.message = 'Requested range is not satisfiable'
+        self.size = size
+
+
+@dataclass(frozen=True)
+class RestoredRange:
+    backup_id: str
+    first_byte: int
+    last_byte: int
+    total_size: int
+    content: bytes
+
+
+def _resolve_range(
+    total_size: int,
+    first_byte: int | None,
+    last_byte: int | None,
+) -> tuple[int, int]:
+    if first_byte is None:
+        first_byte = max(total_size - (last_byte or 0), 0)
+        last_byte = total_size - 1
+    elif last_byte is None or last_byte >= total_size:
+        last_byte = total_size - 1
+    if first_byte > last_byte or first_byte >= total_size:
+        raise RestoreRangeNotSatisfiable(total_size)
+    return first_byte, last_byte
+
+
 class BackupsRepositoryLike(Protocol):
     async def get_by_backup_id(self, backup_id: str) -> Any | None:
         ...
@@ -68,6 +123,15 @@ class ObjectStorageLike(Protocol):
     async def get_object(self, bucket: str, object_name: str) -> bytes | None:
         ...
 
+    async def get_object_range(
+        self,
+        bucket: str,
+        object_name: str,
+        first_byte: int,
+        last_byte: int,
+    ) -> bytes | None:
+        ...
+
 
 class RestoreSettingsLike(Protocol):
     minio_bucket: str
@@ -75,7 +139,7 @@ class RestoreSettingsLike(Protocol):
 
 
 class RestoreAccessTokenServiceLike(Protocol):
-    def issue_token(
+    async def issue_token(
         self,
         backup_id: str,
         actor_key_id: str | None,
@@ -95,6 +159,30 @@ class MonitoringServiceLike(Protocol):
         ...
 
 
+class RestoreSpoolLike(Protocol):
+    async def put(
+        self,
+        token: str,
+        backup_id: str,
+        plaintext: bytes,
+        expires_at: Any,
+    ) -> Any:
+        ...
+
+    async def get(self, token: str) -> Any | None:
+        ...
+
+    def acquire(self, entry: Any) -> None:
+        ...
+
+    async def release(self, entry: Any) -> None:
+        ...
+
+    async def read_range(self, entry: Any, first_byte: int, last_byte: int) -> bytes:
+        ...
+
+
+@traced_methods('service.restore')
 class RestoreService:
     def __init__(
         self,
@@ -108,6 +196,7 @@ class RestoreService:
         storage: ObjectStorageLike | None = None,
         restore_access_token_service: RestoreAccessTokenServiceLike | None = None,
         monitoring_service: MonitoringServiceLike | None = None,
+        restore_spool: RestoreSpoolLike | None = None,
     ) -> None:
         self._backups_repository = backups_repository
         self._auth_service = auth_service
@@ -119,6 +208,7 @@ class RestoreService:
         self._storage = storage
         self._restore_access_token_service = restore_access_token_service
         self._monitoring_service = monitoring_service
+        self._restore_spool = restore_spool
 
     async def _record_restore_failure(
         self,
@@ -142,6 +232,28 @@ class RestoreService:
                 metadata={'reason': reason},
             )
 
+    async def _record_restore_blocked(
+        self,
+        metadata: Any,
+        principal: ApiKeyPrincipal | None,
+        reason: str,
+    ) -> None:
+        await self._audit_service.record_restore_event(
+            action='restore_restricted_blocked',
+            backup_id=metadata.backup_id,
+            actor_key_id=principal.key_id if principal else None,
+            actor_role=principal.role if principal else None,
+            status='BLOCKED',
+            reason=reason,
+        )
+        if self._monitoring_service is not None:
+            await self._monitoring_service.process_security_event(
+                source_event='restore_restricted_blocked',
+                actor=principal,
+                backup_id=metadata.backup_id,
+                metadata={'restriction_reason': reason},
+            )
+
     async def _resolve_incident_level(self) -> IncidentLevel:
         current = self._incident_service.get_current_level()
         if isawaitable(current):
@@ -155,24 +267,75 @@ class RestoreService:
             raise RestoreExecutionUnavailable()
         return value
 
+    async def _delta_chain(self, metadata: Any) -> list[Any]:
+        chain = [metadata]
+        seen = {metadata.backup_id}
+        while base_backup_id := getattr(chain[-1], 'base_backup_id', None):
+            if base_backup_id in seen or len(chain) > _MAX_DELTA_CHAIN:
+                raise RestoreIntegrityFailed()
+            base = await self._backups_repository.get_by_backup_id(base_backup_id)
+            if base is None:
+                raise RestoreIntegrityFailed()
+            if getattr(base, 'status', None) == 'IRREVERSIBLE':
+                raise RestoreIrreversible(
+                    'Restore blocked: base backup is irreversible after crypto-shredding',
+                    'base_irreversible',
+                )
+            seen.add(base_backup_id)
+            chain.append(base)
+        return chain
+
     async def _restore_and_verify(self, metadata: Any) -> bytes:
         if self._settings is None or self._key_store is None or self._storage is None:
             raise RestoreExecutionUnavailable()
+        # Rebuild from the full backup at the root, verifying every level on the way up.
+        root, *deltas = reversed(await self._delta_chain(metadata))
+        plaintext = self._verify_plaintext(root, await self._load_stored_payload(root))
+        for level in deltas:
+            original_size = getattr(level, 'original_size', None)
+            if not isinstance(original_size, int):
+                raise RestoreExecutionUnavailable()
+            delta = await self._load_stored_payload(level)
+            try:
+                rebuilt = apply_delta(plaintext, delta, original_size)
+            except DeltaError as exc:
+                raise RestoreIntegrityFailed() from exc
+            plaintext = self._verify_plaintext(level, rebuilt)
+        return plaintext
+
+    def _verify_plaintext(self, metadata: Any, plaintext: bytes) -> bytes:
+        checksum_plaintext = self._require_restore_field(metadata, 'checksum_plaintext')
+        if sha512(plaintext).hexdigest() != checksum_plaintext:
+            raise RestoreIntegrityFailed()
+        return plaintext
+
+    async def _load_stored_payload(self, metadata: Any) -> bytes:
+        if self._settings is None or self._storage is None:
+            raise RestoreExecutionUnavailable()
         storage_path = self._require_restore_field(metadata, 'storage_path')
         key_version = self._require_restore_field(metadata, 'key_version')
+        manifest = self._dedup_manifest(metadata)
+        if manifest is not None:
+            chunks = await self._fetch_dedup_chunks(metadata, manifest, storage_path, key_version)
+            return b''.join(chunks)
         nonce_hex = self._require_restore_field(metadata, 'nonce')
-        checksum_plaintext = self._require_restore_field(metadata, 'checksum_plaintext')
 
         try:
-            ciphertext_blob = await self._storage.get_object(
-                self._settings.minio_bucket,
-                storage_path,
-            )
+            with trace_span('storage.download'):
+                ciphertext_blob = await self._storage.get_object(
+                    self._settings.minio_bucket,
+                    storage_path,
+                )
+                if ciphertext_blob is not None:
+                    annotate_span(size=len(ciphertext_blob))
         except ObjectStorageError as exc:
             raise RestoreExecutionUnavailable() from exc
         except Exception as exc:
             raise RestoreExecutionUnavailable() from exc
-        if ciphertext_blob is None or len(ciphertext_blob) < 28:
+        chunk_size = getattr(metadata, 'chunk_size', None)
+        # A chunked blob is at least one tag; a single frame also carries nonce and tag.
+        minimum_size = GCM_TAG_SIZE if chunk_size else 28
+        if ciphertext_blob is None or len(ciphertext_blob) < minimum_size:
             raise RestoreIntegrityFailed()
 
         checksum_ciphertext = getattr(metadata, 'checksum_ciphertext', None)
@@ -180,6 +343,58 @@ class RestoreService:
             if sha512(ciphertext_blob).hexdigest() != checksum_ciphertext:
                 raise RestoreIntegrityFailed()
 
+        with trace_span('key.fetch'):
+            key_bytes = self._resolve_key_bytes(key_version)
+        with trace_span('crypto.decrypt', size=len(ciphertext_blob), chunked=bool(chunk_size)):
+            if chunk_size:
+                plaintext = self._decrypt_chunked(metadata, ciphertext_blob, key_bytes, nonce_hex)
+            else:
+                plaintext = self._decrypt_single(ciphertext_blob, key_bytes, nonce_hex)
+                # A delta backup stores the encoded delta, not the reconstructed payload.
+                stored_size = (
+                    getattr(metadata, 'delta_size', None)
+                    if getattr(metadata, 'base_backup_id', None)
+                    else getattr(metadata, 'original_size', None)
+                )
+                decompress = self._decompressor(metadata, stored_size)
+                if decompress is not None:
+                    try:
+                        plaintext = decompress(plaintext)
+                    except CompressionError as exc:
+                        raise RestoreIntegrityFailed() from exc
+        return plaintext
+
+    def _resolve_key_bytes(self, key_version: str) -> bytes:
+        key_store = self._key_store
+        if key_store is None:
+            raise RestoreExecutionUnavailable()
+        try:
+            if hasattr(key_store, 'get_key'):
+                key_material = key_store.get_key(key_version)
+            else:
+                key_material = key_store.get_active_key()  # type: ignore[attr-defined]
+        except Exception as exc:
+            raise RestoreExecutionUnavailable() from exc
+        key_bytes: bytes = key_material.key_bytes
+        return key_bytes
+
+    def _decompressor(
+        self,
+        metadata: Any,
+        max_size: int | None,
+    ) -> Callable[[bytes], bytes] | None:
+        try:
+            decompress = get_decompressor(getattr(metadata, 'compression', None))
+        except ValueError as exc:
+            raise RestoreExecutionUnavailable() from exc
+        if decompress is None:
+            return None
+        if not isinstance(max_size, int):
+            raise RestoreExecutionUnavailable()
+        # Bounding the output keeps a tampered-but-authentic frame from inflating unchecked.
+        return lambda data: decompress(data, max_size)
+
+    def _decrypt_single(self, ciphertext_blob: bytes, key_bytes: bytes, nonce_hex: str) -> bytes:
         nonce = ciphertext_blob[:12]
         tag = ciphertext_blob[12:28]
         ciphertext = ciphertext_blob[28:]
@@ -189,22 +404,101 @@ class RestoreService:
             raise RestoreIntegrityFailed() from exc
         if nonce != nonce_from_metadata:
             raise RestoreIntegrityFailed()
-
         try:
-            if hasattr(self._key_store, 'get_key'):
-                key_material = self._key_store.get_key(key_version)
-            else:
-                key_material = self._key_store.get_active_key()  # type: ignore[attr-defined]
+            return decrypt(ciphertext, key_bytes, nonce, tag)
         except Exception as exc:
-            raise RestoreExecutionUnavailable() from exc
+            raise RestoreIntegrityFailed() from exc
 
+    def _chunk_offsets(self, metadata: Any) -> list[int]:
+        offsets = getattr(metadata, 'chunk_offsets', None)
+        if not isinstance(offsets, list) or len(offsets) < 2:
+            raise RestoreIntegrityFailed()
+        return offsets
+
+    def _decrypt_chunked(
+        self,
+        metadata: Any,
+        ciphertext_blob: bytes,
+        key_bytes: bytes,
+        nonce_hex: str,
+    ) -> bytes:
+        offsets = self._chunk_offsets(metadata)
+        if len(ciphertext_blob) != offsets[-1]:
+            raise RestoreIntegrityFailed()
+        decompress = self._decompressor(metadata, getattr(metadata, 'chunk_size', None))
         try:
-            plaintext = decrypt(ciphertext, key_material.key_bytes, nonce, tag)
+            return decrypt_chunks(
+                ciphertext_blob,
+                key_bytes,
+                bytes.fromhex(nonce_hex),
+                offsets,
+                decompress=decompress,
+            )
         except Exception as exc:
             raise RestoreIntegrityFailed() from exc
-        if sha512(plaintext).hexdigest() != checksum_plaintext:
+
+    def _dedup_manifest(self, metadata: Any) -> list[tuple[str, int]] | None:
+        manifest = getattr(metadata, 'dedup_manifest', None)
+        if manifest is None:
+            return None
+        try:
+            entries = [(str(identifier), int(size)) for identifier, size in manifest]
+        except (TypeError, ValueError) as exc:
+            raise RestoreIntegrityFailed() from exc
+        if not entries:
             raise RestoreIntegrityFailed()
-        return plaintext
+        return entries
+
+    async def _fetch_dedup_chunks(
+        self,
+        metadata: Any,
+        entries: list[tuple[str, int]],
+        storage_path: str,
+        key_version: str,
+    ) -> list[bytes]:
+        if self._settings is None or self._storage is None:
+            raise RestoreExecutionUnavailable()
+        settings = self._settings
+        storage = self._storage
+        keys = derive_convergent_keys(
+            self._resolve_key_bytes(key_version),
+            dedup_scope(metadata.source_system, getattr(metadata, 'compression', None) or 'none'),
+        )
+        max_size = max(size for _, size in entries)
+        decompress = self._decompressor(metadata, max_size)
+        semaphore = asyncio.Semaphore(_DEDUP_FETCH_CONCURRENCY)
+
+        async def _fetch(identifier: str) -> bytes | None:
+            object_name = f'{storage_path}/{identifier}'
+            async with semaphore:
+                return await storage.get_object(settings.minio_bucket, object_name)
+
+        # Repeated chunks are fetched once; fetches overlap, decryption stays in order.
+        unique_ids = list(dict.fromkeys(identifier for identifier, _ in entries))
+        try:
+            with trace_span('storage.download', chunks=len(unique_ids)):
+                sealed = await asyncio.gather(*(_fetch(identifier) for identifier in unique_ids))
+        except Exception as exc:
+            raise RestoreExecutionUnavailable() from exc
+        opened: dict[str, bytes] = {}
+        with trace_span('crypto.decrypt', chunks=len(unique_ids), deduplicated=True):
+            for identifier, frame in zip(unique_ids, sealed, strict=True):
+                if frame is None:
+                    raise RestoreIntegrityFailed()
+                try:
+                    chunk = open_chunk(keys, identifier, frame)
+                    if decompress is not None:
+                        chunk = decompress(chunk)
+                except Exception as exc:
+                    raise RestoreIntegrityFailed() from exc
+                # The id is a keyed hash of the plaintext, so it verifies the chunk content too.
+                if not hmac.compare_digest(chunk_id(keys, chunk), identifier):
+                    raise RestoreIntegrityFailed()
+                opened[identifier] = chunk
+        chunks = [opened[identifier] for identifier, _ in entries]
+        if any(len(chunk) != size for chunk, (_, size) in zip(chunks, entries, strict=True)):
+            raise RestoreIntegrityFailed()
+        return chunks
 
     async def load_restore_metadata(
         self,
@@ -219,21 +513,7 @@ class RestoreService:
         if metadata is None:
             raise RestoreMetadataNotFound(request.backup_id)
         if getattr(metadata, 'status', None) == 'IRREVERSIBLE':
-            await self._audit_service.record_restore_event(
-                action='restore_restricted_blocked',
-                backup_id=metadata.backup_id,
-                actor_key_id=principal.key_id if principal else None,
-                actor_role=principal.role if principal else None,
-                status='BLOCKED',
-                reason='irreversible',
-            )
-            if self._monitoring_service is not None:
-                await self._monitoring_service.process_security_event(
-                    source_event='restore_restricted_blocked',
-                    actor=principal,
-                    backup_id=metadata.backup_id,
-                    metadata={'restriction_reason': 'irreversible'},
-                )
+            await self._record_restore_blocked(metadata, principal, 'irreversible')
             raise RestoreIrreversible(
                 'Restore blocked: backup is irreversible after crypto-shredding',
                 'irreversible',
@@ -248,7 +528,21 @@ class RestoreService:
                 'invalid_metadata_classification',
             )
             raise RestoreExecutionUnavailable('Restore metadata is invalid') from exc
-        decision = self._policy_service.evaluate_restore(principal, classification)
+        incident_error: Exception | None = None
+        try:
+            incident_level = await self._resolve_incident_level()
+        except Exception as exc:
+            # Evaluate as the strictest level; the restore is blocked below regardless.
+            incident_error = exc
+            incident_level = IncidentLevel.LOCKDOWN
+        with trace_span('policy.evaluate'):
+            # validate_mfa_token raised above unless the caller's MFA token checked out.
+            decision = self._policy_service.evaluate_restore(
+                principal,
+                classification,
+                incident_level=incident_level,
+                mfa_verified=True,
+            )
         await self._audit_service.record_policy_decision(
             key_id=principal.key_id if principal else None,
             operation='restore_authorize',
@@ -270,9 +564,7 @@ class RestoreService:
             created_at=getattr(metadata, 'created_at', None),
         )
 
-        try:
-            incident_level = await self._resolve_incident_level()
-        except Exception as exc:
+        if incident_error is not None:
             await self._audit_service.record_restore_event(
                 action='restore_restricted_blocked',
                 backup_id=metadata.backup_id,
@@ -291,7 +583,7 @@ class RestoreService:
             raise RestoreIncidentRestricted(
                 'Restore blocked due to incident state unavailable',
                 'incident_state_unavailable',
-            ) from exc
+            ) from incident_error
         if incident_level == IncidentLevel.QUARANTINE:
             await self._audit_service.record_restore_event(
                 action='restore_restricted_pending_manual_review',
@@ -315,21 +607,7 @@ class RestoreService:
                 'next_step': 'manual_review',
             }
         if incident_level == IncidentLevel.LOCKDOWN:
-            await self._audit_service.record_restore_event(
-                action='restore_restricted_blocked',
-                backup_id=metadata.backup_id,
-                actor_key_id=principal.key_id if principal else None,
-                actor_role=principal.role if principal else None,
-                status='BLOCKED',
-                reason='incident_lockdown',
-            )
-            if self._monitoring_service is not None:
-                await self._monitoring_service.process_security_event(
-                    source_event='restore_restricted_blocked',
-                    actor=principal,
-                    backup_id=metadata.backup_id,
-                    metadata={'restriction_reason': 'incident_lockdown'},
-                )
+            await self._record_restore_blocked(metadata, principal, 'incident_lockdown')
             raise RestoreIncidentRestricted(
                 'Restore blocked by active incident level',
                 'incident_lockdown',
@@ -346,6 +624,9 @@ class RestoreService:
 
         try:
             plaintext = await self._restore_and_verify(metadata)
+        except RestoreIrreversible as exc:
+            await self._record_restore_blocked(metadata, principal, exc.reason_category)
+            raise
         except RestoreIntegrityFailed:
             await self._record_restore_failure(metadata, principal, 'integrity_failed')
             raise
@@ -369,7 +650,7 @@ class RestoreService:
             'next_step': 'restore_access_token',
         }
         if self._restore_access_token_service is not None and self._settings is not None:
-            token_record = self._restore_access_token_service.issue_token(
+            token_record = await self._restore_access_token_service.issue_token(
                 backup_id=metadata.backup_id,
                 actor_key_id=principal.key_id if principal else None,
                 ttl_seconds=self._settings.restore_access_token_ttl_seconds,
@@ -379,4 +660,271 @@ class RestoreService:
             response['restore_token_ttl_seconds'] = (
                 self._settings.restore_access_token_ttl_seconds
             )
+            if self._restore_spool is not None:
+                try:
+                    await self._restore_spool.put(
+                        token_record.token,
+                        metadata.backup_id,
+                        plaintext,
+                        token_record.expires_at,
+                    )
+                except Exception:
+                    # The content endpoint verifies again on a spool miss.
+                    logger.warning('Failed to spool restored plaintext', exc_info=True)
         return response
+
+    async def restore_backup_plaintext(self, metadata: Any) -> bytes:
+        """Rebuild and verify a backup's plaintext without policy checks or auditing.
+
+        Used by the backup service to diff a new incremental backup against its base.
+        """
+        return await self._restore_and_verify(metadata)
+
+    async def _load_servable_metadata(self, backup_id: str) -> Any:
+        metadata = await self._backups_repository.get_by_backup_id(backup_id)
+        if metadata is None:
+            raise RestoreMetadataNotFound(backup_id)
+        if getattr(metadata, 'status', None) == 'IRREVERSIBLE':
+            raise RestoreIrreversible(
+                'Restore blocked: backup is irreversible after crypto-shredding',
+                'irreversible',
+            )
+        return metadata
+
+    async def open_restored_content(
+        self,
+        token_record: Any,
+        principal: ApiKeyPrincipal | None,
+    ) -> Any:
+        """Return the token's spool entry, already acquired; the caller releases it."""
+        if self._restore_spool is None:
+            raise RestoreExecutionUnavailable('Restore content spool is not configured')
+        metadata = await self._load_servable_metadata(token_record.backup_id)
+        entry = await self._restore_spool.get(token_record.token)
+        if entry is None:
+            # Issued by another worker, or spooling failed: verify once more and keep it.
+            try:
+                plaintext = await self._restore_and_verify(metadata)
+            except RestoreIrreversible as exc:
+                await self._record_restore_blocked(metadata, principal, exc.reason_category)
+                raise
+            except RestoreIntegrityFailed:
+                await self._record_restore_failure(metadata, principal, 'integrity_failed')
+                raise
+            except RestoreExecutionUnavailable:
+                await self._record_restore_failure(metadata, principal, 'restore_unavailable')
+                raise
+            entry = await self._restore_spool.put(
+                token_record.token,
+                metadata.backup_id,
+                plaintext,
+                token_record.expires_at,
+            )
+        # Acquire before the next await so an expiry purge cannot wipe the entry while
+        # the audit write waits on the chain lock.
+        self._restore_spool.acquire(entry)
+        try:
+            await self._audit_service.record_restore_event(
+                action='restore_content_served',
+                backup_id=metadata.backup_id,
+                actor_key_id=principal.key_id if principal else None,
+                actor_role=principal.role if principal else None,
+                status='SERVED',
+                reason=None,
+            )
+        except BaseException:
+            await self._restore_spool.release(entry)
+            raise
+        return entry
+
+    async def _read_chunked_range(
+        self,
+        metadata: Any,
+        storage_path: str,
+        key_version: str,
+        first_byte: int,
+        last_byte: int,
+    ) -> bytes:
+        if self._settings is None or self._storage is None:
+            raise RestoreExecutionUnavailable()
+        chunk_size: int = metadata.chunk_size
+        nonce_hex = self._require_restore_field(metadata, 'nonce')
+        offsets = self._chunk_offsets(metadata)
+        first_chunk, last_chunk = chunk_span(first_byte, last_byte, chunk_size)
+        if last_chunk + 1 >= len(offsets):
+            raise RestoreIntegrityFailed()
+        try:
+            frames = await self._storage.get_object_range(
+                self._settings.minio_bucket,
+                storage_path,
+                offsets[first_chunk],
+                offsets[last_chunk + 1] - 1,
+            )
+        except Exception as exc:
+            raise RestoreExecutionUnavailable() from exc
+        if frames is None or len(frames) != offsets[last_chunk + 1] - offsets[first_chunk]:
+            raise RestoreIntegrityFailed()
+        key_bytes = self._resolve_key_bytes(key_version)
+        decompress = self._decompressor(metadata, chunk_size)
+        try:
+            plaintext = decrypt_chunks(
+                frames,
+                key_bytes,
+                bytes.fromhex(nonce_hex),
+                offsets,
+                first_index=first_chunk,
+                decompress=decompress,
+            )
+        except Exception as exc:
+            raise RestoreIntegrityFailed() from exc
+        skip = first_byte - first_chunk * chunk_size
+        return plaintext[skip : skip + last_byte - first_byte + 1]
+
+    async def _read_dedup_range(
+        self,
+        metadata: Any,
+        entries: list[tuple[str, int]],
+        storage_path: str,
+        key_version: str,
+        first_byte: int,
+        last_byte: int,
+    ) -> bytes:
+        starts = [0, *accumulate(size for _, size in entries)]
+        first_chunk = bisect_right(starts, first_byte) - 1
+        last_chunk = bisect_right(starts, last_byte) - 1
+        if last_chunk >= len(entries):
+            raise RestoreIntegrityFailed()
+        chunks = await self._fetch_dedup_chunks(
+            metadata,
+            entries[first_chunk : last_chunk + 1],
+            storage_path,
+            key_version,
+        )
+        skip = first_byte - starts[first_chunk]
+        return b''.join(chunks)[skip : skip + last_byte - first_byte + 1]
+
+    async def read_restored_range(
+        self,
+        token_record: Any,
+        principal: ApiKeyPrincipal | None,
+        first_byte: int | None,
+        last_byte: int | None,
+    ) -> RestoredRange | None:
+        """Serve one byte range of restored content.
+
+        Reads from the restore spool when the token's plaintext is already there;
+        otherwise decrypts only the chunks covering the range. `first_byte=None` is a
+        suffix range of the last `last_byte` bytes. Returns None on a spool miss for
+        single-frame and delta backups, which can only be served whole.
+        """
+        metadata = await self._load_servable_metadata(token_record.backup_id)
+        if self._restore_spool is not None:
+            entry = await self._restore_spool.get(token_record.token)
+            if entry is not None:
+                return await self._read_spooled_range(
+                    self._restore_spool,
+                    metadata,
+                    principal,
+                    entry,
+                    first_byte,
+                    last_byte,
+                )
+        if getattr(metadata, 'base_backup_id', None):
+            return None
+        manifest = self._dedup_manifest(metadata)
+        if manifest is None and not getattr(metadata, 'chunk_size', None):
+            return None
+        if self._settings is None or self._key_store is None or self._storage is None:
+            raise RestoreExecutionUnavailable()
+        storage_path = self._require_restore_field(metadata, 'storage_path')
+        key_version = self._require_restore_field(metadata, 'key_version')
+        total_size = getattr(metadata, 'original_size', None)
+        if not isinstance(total_size, int):
+            raise RestoreExecutionUnavailable()
+        first_byte, last_byte = _resolve_range(total_size, first_byte, last_byte)
+
+        try:
+            if manifest is not None:
+                content = await self._read_dedup_range(
+                    metadata,
+                    manifest,
+                    storage_path,
+                    key_version,
+                    first_byte,
+                    last_byte,
+                )
+            else:
+                content = await self._read_chunked_range(
+                    metadata,
+                    storage_path,
+                    key_version,
+                    first_byte,
+                    last_byte,
+                )
+        except RestoreIntegrityFailed:
+            await self._record_restore_failure(metadata, principal, 'integrity_failed')
+            raise
+        except RestoreExecutionUnavailable:
+            await self._record_restore_failure(metadata, principal, 'restore_unavailable')
+            raise
+
+        return await self._served_range(
+            metadata,
+            principal,
+            first_byte,
+            last_byte,
+            total_size,
+            content,
+        )
+
+    async def _read_spooled_range(
+        self,
+        spool: RestoreSpoolLike,
+        metadata: Any,
+        principal: ApiKeyPrincipal | None,
+        entry: Any,
+        first_byte: int | None,
+        last_byte: int | None,
+    ) -> RestoredRange:
+        first_byte, last_byte = _resolve_range(entry.size, first_byte, last_byte)
+        spool.acquire(entry)
+        try:
+            content = await spool.read_range(entry, first_byte, last_byte)
+        except RestoreSpoolError as exc:
+            await self._record_restore_failure(metadata, principal, 'integrity_failed')
+            raise RestoreIntegrityFailed() from exc
+        finally:
+            await spool.release(entry)
+        return await self._served_range(
+            metadata,
+            principal,
+            first_byte,
+            last_byte,
+            entry.size,
+            content,
+        )
+
+    async def _served_range(
+        self,
+        metadata: Any,
+        principal: ApiKeyPrincipal | None,
+        first_byte: int,
+        last_byte: int,
+        total_size: int,
+        content: bytes,
+    ) -> RestoredRange:
+        await self._audit_service.record_restore_event(
+            action='restore_content_served',
+            backup_id=metadata.backup_id,
+            actor_key_id=principal.key_id if principal else None,
+            actor_role=principal.role if principal else None,
+            status='SERVED',
+            reason=f'bytes={first_byte}-{last_byte}',
+        )
+        return RestoredRange(
+            backup_id=metadata.backup_id,
+            first_byte=first_byte,
+            last_byte=last_byte,
+            total_size=total_size,
+            content=content,
+        )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from app.services.audit_aggregation import AuthSuccessAggregator
+from app.services.audit_service import AuditService
+
+
+class _SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingAuditRepository:
+    def __init__(self) -> None:
+        self.writes = 0
+        self._cursor: tuple[int, str] | None = None
+
+    async def get_latest_chain_cursor(self) -> tuple[int, str] | None:
+        return self._cursor
+
+    async def create_entry(self, record: Any) -> Any:
+        self.writes += 1
+        self._cursor = (record.chain_index, record.entry_hash)
+        return record
+
+
+async def _measure(
+    mode: str,
+    rate: int,
+    seconds: int,
+    keys: int,
+    window_seconds: float,
+) -> dict[str, float]:
+    clock = _SimulatedClock()
+    repository = _CountingAuditRepository()
+    aggregator = (
+        AuthSuccessAggregator(window_seconds=window_seconds, clock=clock)
+        if mode == 'aggregate'
+        else None
+    )
+    service = AuditService(repository, auth_success_aggregator=aggregator)  # type: ignore[arg-type]
+    total = rate * seconds
+    started = time.perf_counter()
+    for request_index in range(total):
+        clock.now = request_index / rate
+        key_index = request_index % keys
+        await service.record_auth_success(f'key-{key_index}', f'10.0.0.{key_index}')
+    await service.flush_auth_summaries(force=True)
+    elapsed = time.perf_counter() - started
+    return {
+        'requests': total,
+        'audit_writes': repository.writes,
+        'writes_per_request': round(repository.writes / total, 5),
+        'cpu_seconds': round(elapsed, 4),
+    }
+
+
+async def _run(rate: int, seconds: int, keys: int, window_seconds: float) -> int:
+    results = {
+        mode: await _measure(mode, rate, seconds, keys, window_seconds)
+        for mode in ('full', 'aggregate')
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare audit writes for authenticated traffic in full and aggregate modes.',
+    )
+    parser.add_argument('--rate', type=int, default=1000, help='Simulated requests per second.')
+    parser.add_argument('--seconds', type=int, default=120)
+    parser.add_argument('--keys', type=int, default=10)
+    parser.add_argument('--window-seconds', type=float, default=60.0)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run(args.rate, args.seconds, args.keys, args.window_seconds)))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+
+from app.api.dependencies import get_audit_service, get_auth_service
+from app.core.config import get_settings
+from app.main import create_app
+from app.schemas.auth import ApiKeyPrincipal
+from app.services.auth_service import AuthFailure
+
+
+class _RejectingAuthService:
+    async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+        raise AuthFailure('AUTH_INVALID_KEY', 'Invalid API key')
+
+
+class _NullAuditService:
+    async def record_auth_failure(
+        self,
+        key_prefix: str,
+        reason: str,
+        client_ip: str | None,
+    ) -> None:
+        return None
+
+
+def _middleware_app() -> FastAPI:
+    # A single benchmark client would otherwise trip the per-IP limit.
+    os.environ['RATE_LIMIT_ENABLED'] = 'false'
+    get_settings.cache_clear()
+    app = create_app()
+    app.dependency_overrides[get_auth_service] = _RejectingAuthService
+    app.dependency_overrides[get_audit_service] = _NullAuditService
+    return app
+
+
+def _dependency_app() -> FastAPI:
+    """Reference app that rejects through a router-level FastAPI dependency."""
+
+    def auth_service() -> _RejectingAuthService:
+        return _RejectingAuthService()
+
+    async def require_key(
+        request: Request,
+        service: _RejectingAuthService = Depends(auth_service),
+    ) -> ApiKeyPrincipal:
+        try:
+            return await service.authenticate(request.headers.get('x-api-key', ''), None)
+        except AuthFailure as exc:
+            raise HTTPException(status_code=401, detail=exc.message) from exc
+
+    router = APIRouter()
+
+    @router.post('')
+    async def create_backup(request: Request) -> dict[str, str]:
+        return {}
+
+    app = FastAPI()
+    app.include_router(router, prefix='/api/v1/backups', dependencies=[Depends(require_key)])
+    return app
+
+
+async def _measure(app: FastAPI, requests: int, concurrency: int) -> dict[str, float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        per_worker = requests // concurrency
+
+        async def worker() -> None:
+            for _ in range(per_worker):
+                response = await client.post(
+                    '/api/v1/backups',
+                    headers={'X-API-Key': 'invalid-key'},
+                    json={},
+                )
+                if response.status_code != 401:
+                    raise RuntimeError(f'Unexpected status {response.status_code}')
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    total = per_worker * concurrency
+    return {
+        'requests': total,
+        'seconds': round(elapsed, 4),
+        'requests_per_second': round(total / elapsed, 1),
+        'microseconds_per_request': round(elapsed / total * 1_000_000, 1),
+    }
+
+
+async def _run(requests: int, concurrency: int) -> int:
+    results = {
+        'middleware': await _measure(_middleware_app(), requests, concurrency),
+        'dependency_reference': await _measure(_dependency_app(), requests, concurrency),
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure rejected-request throughput.')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run(args.requests, args.concurrency)))
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import secrets
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from hashlib import sha512
+
+from app.infrastructure.crypto import aes_gcm
+from app.infrastructure.crypto.hashing import AUDIT_HASH_V1, AUDIT_HASH_V2
+from app.services.audit_service import AuditService
+
+_UNITS = {'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
+_KEY = secrets.token_bytes(32)
+
+
+def _parse_size(value: str) -> int:
+    unit = value[-2:].upper()
+    if unit in _UNITS:
+        return int(value[:-2]) * _UNITS[unit]
+    return int(value)
+
+
+def _label(size: int) -> str:
+    for unit in ('GB', 'MB', 'KB'):
+        if size >= _UNITS[unit] and size % _UNITS[unit] == 0:
+            return f'{size // _UNITS[unit]}{unit}'
+    return f'{size}B'
+
+
+def _peak_bytes(operation: Callable[[], object]) -> int:
+    # Traced separately from timing; tracemalloc slows every allocation down.
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(
+    operation: Callable[[], object],
+    size: int,
+    repeat: int,
+    target_bytes: int,
+) -> dict[str, float]:
+    number = max(1, min(target_bytes // max(size, 1), 100_000))
+    seconds = min(timeit.repeat(operation, number=number, repeat=repeat)) / number
+    peak = _peak_bytes(operation)
+    return {
+        'microseconds_per_op': round(seconds * 1_000_000, 3),
+        'mb_per_second': round(size / seconds / _UNITS['MB'], 1),
+        'peak_bytes_per_op': peak,
+        # How many payload-sized buffers one call holds at its peak.
+        'payload_copies': round(peak / size, 2) if size else 0.0,
+    }
+
+
+def _payload_paths(size: int, chunk_size: int) -> dict[str, Callable[[], object]]:
+    plaintext = secrets.token_bytes(size)
+    one_shot = aes_gcm.encrypt(plaintext, _KEY)
+    chunked = aes_gcm.encrypt_chunked(plaintext, _KEY, chunk_size)
+    return {
+        'aes_gcm_encrypt': lambda: aes_gcm.encrypt(plaintext, _KEY),
+        'aes_gcm_decrypt': lambda: aes_gcm.decrypt(
+            one_shot.ciphertext,
+            _KEY,
+            one_shot.nonce,
+            one_shot.tag,
+        ),
+        'aes_gcm_encrypt_chunked': lambda: aes_gcm.encrypt_chunked(plaintext, _KEY, chunk_size),
+        'aes_gcm_decrypt_chunked': lambda: aes_gcm.decrypt_chunks(
+            chunked.blob,
+            _KEY,
+            chunked.nonce_prefix,
+            chunked.offsets,
+        ),
+        # BackupService/RestoreService checksum the plaintext and ciphertext blob.
+        'sha512_checksum': lambda: sha512(plaintext).hexdigest(),
+    }
+
+
+def _small_paths() -> dict[str, tuple[int, Callable[[], object]]]:
+    raw_key = secrets.token_urlsafe(32)
+    created_at = datetime(2026, 10, 1, tzinfo=UTC)
+
+    def audit_hash(hash_version: int) -> Callable[[], object]:
+        return lambda: AuditService._build_entry_hash(
+            chain_index=1_000_000,
+            prev_hash='f' * 128,
+            created_at=created_at,
+            event_id=secrets.token_hex(16),
+            action='backup_processing_succeeded',
+            resource='backup',
+            resource_id='b' * 32,
+            actor_key_id='admin-key',
+            actor_role='admin',
+            status='ACTIVE',
+            reason=None,
+            hash_version=hash_version,
+        )
+
+    return {
+        # Same digest AuthService.authenticate computes on every request.
+        'api_key_hash': (len(raw_key), lambda: sha512(raw_key.encode()).hexdigest()),
+        'audit_entry_hash_v1': (0, audit_hash(AUDIT_HASH_V1)),
+        'audit_entry_hash_v2': (0, audit_hash(AUDIT_HASH_V2)),
+    }
+
+
+def _thread_scaling(size: int, chunk_size: int, threads: list[int]) -> dict[str, dict[str, float]]:
+    """Aggregate chunked-encryption throughput with one payload per thread."""
+    payloads = [secrets.token_bytes(size) for _ in range(max(threads))]
+    results: dict[str, dict[str, float]] = {}
+    for count in threads:
+        with ThreadPoolExecutor(max_workers=count) as executor:
+
+            def run(count: int = count, executor: ThreadPoolExecutor = executor) -> None:
+                list(
+                    executor.map(
+                        lambda payload: aes_gcm.encrypt_chunked(payload, _KEY, chunk_size),
+                        payloads[:count],
+                    ),
+                )
+
+            run()
+            seconds = min(timeit.repeat(run, number=1, repeat=3))
+        results[str(count)] = {
+            'mb_per_second': round(size * count / seconds / _UNITS['MB'], 1),
+        }
+    return results
+
+
+def _run(args: argparse.Namespace) -> int:
+    sizes = [_parse_size(value) for value in args.sizes]
+    payload_results: dict[str, dict[str, dict[str, float]]] = {}
+    for size in sizes:
+        for name, operation in _payload_paths(size, args.chunk_size).items():
+            payload_results.setdefault(name, {})[_label(size)] = _measure(
+                operation,
+                size,
+                args.repeat,
+                args.target_bytes,
+            )
+    small_results = {
+        name: _measure(operation, size, args.repeat, args.target_bytes)
+        for name, (size, operation) in _small_paths().items()
+    }
+    for result in small_results.values():
+        # Fixed-size inputs; per-call latency is the number that matters.
+        result.pop('mb_per_second')
+        result.pop('payload_copies')
+    print(
+        json.dumps(
+            {
+                'cpu_count': os.cpu_count(),
+                'chunk_size': args.chunk_size,
+                'payload_paths': payload_results,
+                'small_paths': small_results,
+                'thread_scaling': {
+                    'payload': _label(_parse_size(args.scaling_size)),
+                    'threads': _thread_scaling(
+                        _parse_size(args.scaling_size),
+                        args.chunk_size,
+                        args.threads,
+                    ),
+                },
+            },
+            indent=2,
+        ),
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure crypto and hashing throughput and peak allocation per operation.',
+    )
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        default=['1KB', '64KB', '1MB', '16MB', '256MB'],
+        help='Payload sizes, e.g. 1KB 1MB 1GB.',
+    )
+    parser.add_argument('--chunk-size', type=int, default=65536)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--target-bytes',
+        type=int,
+        default=64 * _UNITS['MB'],
+        help='Bytes processed per timing sample; small payloads loop to reach it.',
+    )
+    parser.add_argument('--scaling-size', default='16MB')
+    parser.add_argument(
+        '--threads',
+        type=int,
+        nargs='+',
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+    raise SystemExit(_run(args))
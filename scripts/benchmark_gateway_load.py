@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.dependencies import get_storage_client
+from app.core.config import get_settings
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage
+from app.main import create_app
+
+_SCENARIOS = ('backup_submit', 'restore', 'auth_rejection', 'audit_list', 'chain_validate')
+# Chain validation walks the whole chain; keep it from dominating the run.
+_DEFAULT_CONCURRENCY = {'chain_validate': 1}
+_DEFAULT_REQUESTS = {'chain_validate': 5}
+
+
+@dataclass
+class _Context:
+    api_key: str
+    key_id: str
+    mfa_header: str
+    payload_bytes: int
+    backup_ids: list[str]
+
+    def headers(self) -> dict[str, str]:
+        return {'X-API-Key': self.api_key}
+
+    def backup_body(self, index: int) -> dict[str, object]:
+        filler = 'x' * max(self.payload_bytes - 16, 0)
+        return {
+            'classification': 'INTERNAL',
+            'source_system': 'load-benchmark',
+            'payload': f'{index:016d}{filler}',
+        }
+
+
+_Call = Callable[[httpx.AsyncClient, _Context, int], Awaitable[httpx.Response]]
+
+
+async def _backup_submit(client: httpx.AsyncClient, ctx: _Context, index: int) -> httpx.Response:
+    return await client.post('/api/v1/backups', headers=ctx.headers(), json=ctx.backup_body(index))
+
+
+async def _restore(client: httpx.AsyncClient, ctx: _Context, index: int) -> httpx.Response:
+    return await client.post(
+        '/api/v1/restores',
+        headers={**ctx.headers(), ctx.mfa_header: f'mfa:{ctx.key_id}'},
+        json={'backup_id': ctx.backup_ids[index % len(ctx.backup_ids)]},
+    )
+
+
+async def _auth_rejection(client: httpx.AsyncClient, ctx: _Context, index: int) -> httpx.Response:
+    return await client.post(
+        '/api/v1/backups',
+        headers={'X-API-Key': f'invalid-{index}'},
+        json={},
+    )
+
+
+async def _audit_list(client: httpx.AsyncClient, ctx: _Context, index: int) -> httpx.Response:
+    return await client.get('/api/v1/audit/entries', headers=ctx.headers(), params={'limit': 50})
+
+
+async def _chain_validate(client: httpx.AsyncClient, ctx: _Context, index: int) -> httpx.Response:
+    return await client.get('/api/v1/audit/chain/validate', headers=ctx.headers())
+
+
+_CALLS: dict[str, tuple[_Call, int]] = {
+    'backup_submit': (_backup_submit, 200),
+    'restore': (_restore, 200),
+    'auth_rejection': (_auth_rejection, 401),
+    'audit_list': (_audit_list, 200),
+    'chain_validate': (_chain_validate, 200),
+}
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    # Nearest-rank, so the value reported is a latency that was actually observed.
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def _measure(
+    client: httpx.AsyncClient,
+    ctx: _Context,
+    scenario: str,
+    requests: int,
+    concurrency: int,
+) -> dict[str, object]:
+    call, expected_status = _CALLS[scenario]
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await call(client, ctx, index)
+                outcome = str(response.status_code)
+            except httpx.HTTPError as exc:
+                outcome = type(exc).__name__
+            latencies.append(time.perf_counter() - started)
+            if outcome != str(expected_status):
+                errors[outcome] = errors.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 4),
+        'requests_per_second': round(requests / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(_percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(_percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(_percentile(latencies, 0.99) * 1000, 3),
+        'errors': errors,
+    }
+
+
+async def _prepare_backups(client: httpx.AsyncClient, ctx: _Context, count: int) -> None:
+    for index in range(count):
+        response = await _backup_submit(client, ctx, -index - 1)
+        if response.status_code != 200:
+            raise RuntimeError(f'Could not create restore fixture: {response.status_code}')
+        ctx.backup_ids.append(response.json()['data']['backup_id'])
+
+
+def _in_process_app() -> FastAPI:
+    # A single benchmark client would otherwise trip the per-IP limit.
+    os.environ['RATE_LIMIT_ENABLED'] = 'false'
+    # Per-request access logs would be measured along with the gateway itself.
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    get_settings.cache_clear()
+    app = create_app()
+    # Restores must read what earlier requests stored, so every request shares one store.
+    storage = InMemoryObjectStorage()
+    app.dependency_overrides[get_storage_client] = lambda: storage
+    return app
+
+
+@contextlib.asynccontextmanager
+async def _client(base_url: str | None, timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+    if base_url is not None:
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+            yield client
+        return
+    app = _in_process_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url='http://bench',
+            timeout=timeout,
+        ) as client:
+            yield client
+
+
+def _regressions(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[dict[str, object]]:
+    found: list[dict[str, object]] = []
+    for scenario, current in results.items():
+        previous = baseline.get(scenario)
+        if previous is None:
+            continue
+        throughput_floor = previous['requests_per_second'] * (1 - tolerance)
+        checks = (
+            ('requests_per_second', current['requests_per_second'] < throughput_floor),
+            ('p95_ms', current['p95_ms'] > previous['p95_ms'] * (1 + tolerance)),
+            ('p99_ms', current['p99_ms'] > previous['p99_ms'] * (1 + tolerance)),
+        )
+        for metric, regressed in checks:
+            if regressed:
+                found.append(
+                    {
+                        'scenario': scenario,
+                        'metric': metric,
+                        'baseline': previous[metric],
+                        'current': current[metric],
+                    },
+                )
+    return found
+
+
+async def _run(args: argparse.Namespace) -> int:
+    settings = get_settings()
+    ctx = _Context(
+        api_key=args.api_key,
+        key_id=args.key_id,
+        mfa_header=settings.mfa_header,
+        payload_bytes=args.payload_bytes,
+        backup_ids=[],
+    )
+    results: dict[str, dict[str, Any]] = {}
+    async with _client(args.base_url, args.timeout) as client:
+        if 'restore' in args.scenarios:
+            await _prepare_backups(client, ctx, args.restore_fixtures)
+        for scenario in args.scenarios:
+            results[scenario] = await _measure(
+                client,
+                ctx,
+                scenario,
+                args.requests or _DEFAULT_REQUESTS.get(scenario, 1000),
+                args.concurrency or _DEFAULT_CONCURRENCY.get(scenario, 16),
+            )
+
+    report: dict[str, object] = {
+        'target': args.base_url or 'asgi',
+        'recorded_at': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'results': results,
+    }
+    exit_code = 0
+    if args.baseline is not None and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = _regressions(results, baseline.get('results', {}), args.tolerance)
+        report['regressions'] = regressions
+        exit_code = 1 if regressions else 0
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+    print(json.dumps(report, indent=2))
+    return exit_code
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Load-test gateway hot paths and compare against a stored baseline.',
+    )
+    parser.add_argument(
+        '--base-url',
+        default=None,
+        help='Live server, e.g. http://127.0.0.1:8000. Defaults to in-process ASGI.',
+    )
+    parser.add_argument('--api-key', default=os.environ.get('SSBG_BENCH_API_KEY', ''))
+    parser.add_argument('--key-id', default=os.environ.get('SSBG_BENCH_KEY_ID', ''))
+    parser.add_argument('--scenarios', nargs='+', choices=_SCENARIOS, default=list(_SCENARIOS))
+    parser.add_argument('--requests', type=int, default=None, help='Per scenario.')
+    parser.add_argument('--concurrency', type=int, default=None)
+    parser.add_argument('--payload-bytes', type=int, default=16 * 1024)
+    parser.add_argument('--restore-fixtures', type=int, default=20)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--output', type=Path, default=None, help='Write the JSON report here.')
+    parser.add_argument('--baseline', type=Path, default=None, help='Report to compare against.')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.15,
+        help='Allowed relative slowdown before a metric counts as a regression.',
+    )
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run(args)))
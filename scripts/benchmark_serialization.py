@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.api.responses import success_response
+from app.schemas.admin import AlertResponse
+from app.schemas.audit import AuditEntrySummary
+
+_REQUEST_ID = 'bench-request'
+
+
+def _audit_entries(count: int) -> list[AuditEntrySummary]:
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        AuditEntrySummary(
+            chain_index=index + 1,
+            event_id=f'{index:032x}',
+            action='backup_submitted',
+            resource='backup',
+            resource_id=f'backup-{index}',
+            actor_key_id='key-benchmark',
+            actor_role='operator',
+            status='SUCCESS',
+            reason=None,
+            created_at=started + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _alerts(count: int) -> list[AlertResponse]:
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        AlertResponse(
+            alert_id=f'alert-{index}',
+            rule_id='restore_burst',
+            severity='HIGH',
+            status='OPEN',
+            source_event='restore_requested',
+            actor_key_id='key-benchmark',
+            related_backup_id=f'backup-{index}',
+            reason='Restore volume above threshold',
+            metadata_json='{"window_seconds": 60, "count": 25}',
+            created_at=started + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _previous(models: list[BaseModel], key: str) -> Callable[[], bytes]:
+    # What the routes did before: dump every model, then let FastAPI walk the result
+    # with jsonable_encoder and json.dumps it.
+    def render() -> bytes:
+        payload = {
+            'data': {key: [model.model_dump(mode='json') for model in models]},
+            'meta': {'request_id': _REQUEST_ID},
+        }
+        return JSONResponse(jsonable_encoder(payload)).body
+
+    return render
+
+
+def _envelope(models: list[BaseModel], key: str) -> Callable[[], bytes]:
+    def render() -> bytes:
+        return success_response(data={key: models}, request_id=_REQUEST_ID).body
+
+    return render
+
+
+def _time(render: Callable[[], bytes], repeat: int, number: int) -> dict[str, float]:
+    best = min(timeit.repeat(render, repeat=repeat, number=number)) / number
+    return {'ms_per_response': round(best * 1000, 3), 'bytes': len(render())}
+
+
+def main(args: argparse.Namespace) -> dict[str, object]:
+    payloads: dict[str, tuple[list[BaseModel], str]] = {
+        'audit_entries': (list(_audit_entries(args.entries)), 'entries'),
+        'alerts': (list(_alerts(args.entries)), 'alerts'),
+    }
+    results: dict[str, object] = {}
+    for name, (models, key) in payloads.items():
+        previous = _time(_previous(models, key), args.repeat, args.number)
+        envelope = _time(_envelope(models, key), args.repeat, args.number)
+        results[name] = {
+            'entries': len(models),
+            'identical_body': _previous(models, key)() == _envelope(models, key)(),
+            'previous': previous,
+            'envelope': envelope,
+            'speedup': round(previous['ms_per_response'] / envelope['ms_per_response'], 2),
+        }
+    return {
+        'recorded_at': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'results': results,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare response serialization cost for large audit and alert pages.',
+    )
+    parser.add_argument('--entries', type=int, default=500, help='Models per response.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20, help='Renders per timing run.')
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[1]
+_PHASES = (
+    'import_ms',
+    'create_app_ms',
+    'lifespan_ms',
+    'first_request_ms',
+    'openapi_ms',
+    'total_ms',
+)
+
+# Runs in a fresh interpreter per sample, so every phase is measured cold, the way an
+# autoscaled replica starts.
+_PROBE = """
+import asyncio, json, os, time
+
+started = time.perf_counter()
+from app.main import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+
+
+async def serve():
+    import httpx
+
+    timings = {}
+    entered = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            response = await client.get('/api/v1/health/live')
+            answered = time.perf_counter()
+            if response.status_code != 200:
+                raise SystemExit(f'health check returned {response.status_code}')
+            await client.get('/openapi.json')
+            documented = time.perf_counter()
+    timings['lifespan_ms'] = (ready - entered) * 1000
+    timings['first_request_ms'] = (answered - ready) * 1000
+    timings['openapi_ms'] = (documented - answered) * 1000
+    return timings
+
+
+timings = {'import_ms': (imported - started) * 1000, 'create_app_ms': (created - imported) * 1000}
+if os.environ.get('SSBG_BENCH_SERVE') == '1':
+    timings.update(asyncio.run(serve()))
+# Garbage collection passes land in whichever phase crosses the threshold, so compare
+# the total as well as the individual phases.
+timings['total_ms'] = sum(timings.values())
+print(json.dumps(timings))
+"""
+
+
+def _environment(serve: bool) -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault('LOG_LEVEL', 'WARNING')
+    env['SSBG_BENCH_SERVE'] = '1' if serve else '0'
+    return env
+
+
+def _sample(serve: bool) -> dict[str, float]:
+    completed = subprocess.run(
+        [sys.executable, '-c', _PROBE],
+        cwd=_ROOT,
+        env=_environment(serve),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, float] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return timings
+
+
+def _import_profile(top: int) -> list[dict[str, object]]:
+    # `-X importtime` writes one "self | cumulative | module" line per import to stderr.
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app.main'],
+        cwd=_ROOT,
+        env=_environment(False),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: list[dict[str, object]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        modules.append(
+            {
+                'module': name.strip(),
+                'self_ms': round(int(self_us) / 1000, 2),
+                'cumulative_ms': round(int(cumulative_us) / 1000, 2),
+            },
+        )
+    modules.sort(key=lambda item: float(str(item['cumulative_ms'])), reverse=True)
+    return modules[:top]
+
+
+def _summarise(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    summary: dict[str, dict[str, float]] = {}
+    for phase in _PHASES:
+        values = [sample[phase] for sample in samples if phase in sample]
+        if not values:
+            continue
+        summary[phase] = {
+            'median': round(statistics.median(values), 2),
+            'min': round(min(values), 2),
+            'max': round(max(values), 2),
+        }
+    return summary
+
+
+def _regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[dict[str, object]]:
+    found: list[dict[str, object]] = []
+    for phase, current in results.items():
+        previous = baseline.get(phase)
+        if previous is not None and current['median'] > previous['median'] * (1 + tolerance):
+            found.append(
+                {
+                    'phase': phase,
+                    'baseline': previous['median'],
+                    'current': current['median'],
+                },
+            )
+    return found
+
+
+def _run(args: argparse.Namespace) -> int:
+    samples = [_sample(not args.skip_serve) for _ in range(args.samples)]
+    results = _summarise(samples)
+    report: dict[str, Any] = {
+        'recorded_at': datetime.now(UTC).isoformat(),
+        'python': platform.python_version(),
+        'samples': args.samples,
+        'results': results,
+    }
+    if args.import_profile:
+        report['slowest_imports'] = _import_profile(args.import_profile)
+    exit_code = 0
+    if args.baseline is not None and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = _regressions(results, baseline.get('results', {}), args.tolerance)
+        report['regressions'] = regressions
+        exit_code = 1 if regressions else 0
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+    print(json.dumps(report, indent=2))
+    return exit_code
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure cold-start time of the gateway, one fresh interpreter per sample.',
+    )
+    parser.add_argument('--samples', type=int, default=10)
+    parser.add_argument(
+        '--skip-serve',
+        action='store_true',
+        help='Stop after create_app(); skip lifespan, the first request and /openapi.json.',
+    )
+    parser.add_argument(
+        '--import-profile',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Also report the N imports with the largest cumulative time.',
+    )
+    parser.add_argument('--output', type=Path, default=None, help='Write the JSON report here.')
+    parser.add_argument('--baseline', type=Path, default=None, help='Report to compare against.')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.15,
+        help='Allowed relative slowdown of a median before it counts as a regression.',
+    )
+    args = parser.parse_args()
+    raise SystemExit(_run(args))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from app.api.dependencies import get_storage_client
+from app.core.config import get_settings
+from app.infrastructure.db.session import get_session_factory
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage
+from app.repositories.audit_partitions_repository import AuditPartitionsRepository
+from app.repositories.audit_repository import AuditRepository
+from app.services.audit_archive_service import AuditArchiveService
+from app.services.audit_service import AuditService
+
+
+async def _run(archive: bool, drop: bool, verify: bool) -> int:
+    settings = get_settings()
+    storage = get_storage_client()
+    if drop and isinstance(storage, InMemoryObjectStorage):
+        # Archives written to process memory vanish on exit; dropping would lose history.
+        print(json.dumps({'error': 'refusing to drop partitions without durable storage'}))
+        return 2
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        service = AuditArchiveService(
+            AuditPartitionsRepository(session),
+            storage,
+            settings.minio_bucket,
+            audit_service=AuditService(AuditRepository(session)),
+            archive_prefix=settings.audit_archive_prefix,
+        )
+        report: dict[str, object] = {
+            'created_partitions': await service.ensure_partitions(
+                settings.audit_partition_months_ahead,
+            ),
+        }
+        if archive:
+            manifests = await service.archive_sealed_partitions(
+                settings.audit_archive_retain_months,
+                drop=drop,
+            )
+            report['archived_partitions'] = [manifest.partition_name for manifest in manifests]
+        valid = True
+        if verify:
+            result = await service.verify_archives()
+            report['archive_validation'] = result.model_dump(mode='json')
+            valid = result.valid
+    print(json.dumps(report, indent=2))
+    return 0 if valid else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Maintain monthly audit partitions.')
+    parser.add_argument('--archive', action='store_true', help='archive sealed partitions')
+    parser.add_argument(
+        '--drop',
+        action='store_true',
+        help='drop archived partitions once their archive reads back intact (needs --archive)',
+    )
+    parser.add_argument('--verify', action='store_true', help='verify archived partitions')
+    args = parser.parse_args()
+    if args.drop and not args.archive:
+        parser.error('--drop requires --archive')
+    raise SystemExit(asyncio.run(_run(args.archive, args.drop, args.verify)))
@@ -1 +1,486 @@
-"""Seed demo data script placeholder."""
+"""Bulk-load production-scale demo data into PostgreSQL with COPY.
+
+Rows are generated deterministically from --seed in worker processes. Audit entries
+extend the existing hash chain, after its head in both index and time, while holding the
+chain lock, so `verify_audit_chain.py` passes afterwards. Seeded key versions are inserted
+inactive because the key store holds no material for them.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import UTC, datetime, timedelta
+from hashlib import blake2b, sha512
+from typing import Any
+
+from sqlalchemy import text
+
+from app.core.enums import AlertSeverity, AlertStatus, BackupStatus, ClassificationLevel
+from app.infrastructure.crypto.hashing import CURRENT_AUDIT_HASH_VERSION, audit_entry_hasher
+from app.infrastructure.db.session import get_engine, get_session_factory
+from app.repositories.audit_partitions_repository import (
+    AuditPartition,
+    AuditPartitionsRepository,
+    month_start,
+    next_month,
+)
+from app.repositories.audit_repository import AUDIT_CHAIN_LOCK_KEY
+
+Row = tuple[Any, ...]
+
+_API_KEY_COLUMNS = (
+    'key_id', 'key_hash', 'key_prefix', 'role', 'department', 'description',
+    'created_at', 'expires_at', 'is_active', 'last_used_at',
+)
+_KEY_VERSION_COLUMNS = (
+    'version_id', 'is_active', 'is_destroyed', 'rotated_from_version', 'created_by_key_id',
+    'rotation_reason', 'created_at', 'activated_at', 'destroyed_at',
+)
+_BACKUP_COLUMNS = (
+    'backup_id', 'key_version', 'classification', 'source_system', 'description', 'status',
+    'storage_path', 'checksum_plaintext', 'checksum_ciphertext', 'nonce', 'original_size',
+    'encrypted_size', 'chunk_size', 'chunk_offsets', 'compression', 'delta_depth',
+    'irreversible_reason', 'shredded_at', 'created_by', 'created_at',
+)
+_ALERT_COLUMNS = (
+    'alert_id', 'rule_id', 'severity', 'status', 'source_event', 'actor_key_id',
+    'related_backup_id', 'reason', 'metadata_json', 'dedupe_key', 'created_at',
+)
+_AUDIT_COLUMNS = (
+    'chain_index', 'prev_hash', 'entry_hash', 'hash_version', 'event_id', 'action',
+    'resource', 'resource_id', 'actor_key_id', 'actor_role', 'status', 'reason', 'created_at',
+)
+
+_ROLES = ('operator', 'operator', 'operator', 'admin', 'super_admin')
+_DEPARTMENTS = ('IT', 'Finance', 'HR', 'Legal', 'Operations')
+_SOURCE_SYSTEMS = tuple(f'system-{index:03d}' for index in range(60))
+_CLASSIFICATIONS = tuple(ClassificationLevel)
+_ALERT_RULES = (
+    ('RESTORE_RESTRICTED_SPIKE', 'restore_restricted_blocked'),
+    ('AUTH_FAILURE_BURST', 'auth_failed'),
+    ('RESTORE_FAILURE_SPIKE', 'restore_failed'),
+    ('BACKUP_DENIED_SPIKE', 'backup_processing_denied'),
+)
+_AUDIT_EVENTS = (
+    ('policy_decision', 'policy', 'ALLOWED'),
+    ('backup_processing_started', 'backup', BackupStatus.PROCESSING.value),
+    ('backup_processing_succeeded', 'backup', BackupStatus.ACTIVE.value),
+    ('restore_completed', 'restore', 'COMPLETED'),
+    ('auth_success_summary', 'auth', 'SUCCESS'),
+    ('auth_failed', 'auth', 'FAILED'),
+)
+
+
+class _Plan:
+    """Shared shape of the generated data; every worker derives rows from it alone."""
+
+    def __init__(self, seed: int, days: int, api_keys: int, key_versions: int, backups: int):
+        self.seed = seed
+        self.end = datetime.now(UTC).replace(microsecond=0)
+        self.start = self.end - timedelta(days=days)
+        self.api_keys = api_keys
+        self.key_versions = key_versions
+        self.backups = backups
+        # Moved past the chain head once it is read, so seeded entries follow it in time.
+        self.audit_start = self.start
+
+    def rng(self, table: str, chunk: int) -> random.Random:
+        return random.Random(f'{self.seed}:{table}:{chunk}')
+
+    def at(self, index: int, count: int) -> datetime:
+        # Evenly spread, strictly increasing timestamps over the seeded window.
+        span = (self.end - self.start) / max(count, 1)
+        return self.start + span * index
+
+    def audit_at(self, index: int, count: int) -> datetime:
+        span = max(self.end - self.audit_start, timedelta(0)) / max(count, 1)
+        return self.audit_start + span * index
+
+    def backup_id(self, index: int) -> str:
+        return blake2b(f'{self.seed}:backup:{index}'.encode(), digest_size=16).hexdigest()
+
+    def api_key_id(self, index: int) -> str:
+        return f'seed-key-{index:05d}'
+
+    def key_version_index(self, created_at: datetime) -> int:
+        elapsed = (created_at - self.start) / (self.end - self.start)
+        return min(int(elapsed * self.key_versions), self.key_versions - 1)
+
+    def key_version_created_at(self, index: int) -> datetime:
+        return self.at(index, self.key_versions)
+
+    def key_version_destroyed_at(self, index: int) -> datetime:
+        # Destroyed a day after its successor took over, once no new backups used it.
+        return self.key_version_created_at(index + 1) + timedelta(days=1)
+
+
+def _api_key_rows(plan: _Plan) -> list[Row]:
+    rng = plan.rng('api_keys', 0)
+    rows = []
+    for index in range(plan.api_keys):
+        created_at = plan.at(index, plan.api_keys * 4)
+        key_hash = sha512(f'ssbg-seed-{plan.seed}-{index}'.encode()).hexdigest()
+        rows.append(
+            (
+                plan.api_key_id(index),
+                key_hash,
+                key_hash[:8],
+                rng.choice(_ROLES),
+                rng.choice(_DEPARTMENTS),
+                'seeded load-test key',
+                created_at,
+                None,
+                rng.random() > 0.05,
+                plan.end - timedelta(minutes=rng.randrange(60 * 24 * 30)),
+            ),
+        )
+    return rows
+
+
+def _key_version_rows(plan: _Plan, destroyed: int) -> list[Row]:
+    rows = []
+    for index in range(plan.key_versions):
+        created_at = plan.key_version_created_at(index)
+        is_destroyed = index < destroyed
+        rows.append(
+            (
+                f'K-{index:04d}',
+                # The key store holds no material for seeded versions; none may be active.
+                False,
+                is_destroyed,
+                f'K-{index - 1:04d}' if index else None,
+                plan.api_key_id(0),
+                'scheduled rotation' if index else None,
+                created_at,
+                created_at,
+                plan.key_version_destroyed_at(index) if is_destroyed else None,
+            ),
+        )
+    return rows
+
+
+def _backup_rows(plan: _Plan, destroyed: int, first: int, count: int) -> list[Row]:
+    rng = plan.rng('backup_metadata', first)
+    rows = []
+    for index in range(first, first + count):
+        created_at = plan.at(index, plan.backups)
+        version = plan.key_version_index(created_at)
+        backup_id = plan.backup_id(index)
+        original_size = int(rng.lognormvariate(13, 1.5)) + 1
+        chunks = -(-original_size // 65536)
+        offsets = [chunk * (65536 + 16) for chunk in range(chunks)]
+        encrypted_size = original_size + chunks * 16
+        offsets.append(encrypted_size)
+        roll = rng.random()
+        if version < destroyed:
+            status = BackupStatus.IRREVERSIBLE.value
+        elif roll < 0.03:
+            status = BackupStatus.FAILED.value
+        elif roll < 0.035:
+            status = BackupStatus.PROCESSING.value
+        else:
+            status = BackupStatus.ACTIVE.value
+        irreversible = status == BackupStatus.IRREVERSIBLE.value
+        rows.append(
+            (
+                backup_id,
+                f'K-{version:04d}',
+                rng.choice(_CLASSIFICATIONS).value,
+                _SOURCE_SYSTEMS[min(int(rng.paretovariate(1.2)) - 1, len(_SOURCE_SYSTEMS) - 1)],
+                None,
+                status,
+                f'{backup_id}.bin',
+                rng.randbytes(64).hex(),
+                rng.randbytes(64).hex(),
+                rng.randbytes(8).hex(),
+                original_size,
+                encrypted_size,
+                65536,
+                json.dumps(offsets),
+                'none',
+                0,
+                'key_version_destroyed' if irreversible else None,
+                plan.key_version_destroyed_at(version) if irreversible else None,
+                plan.api_key_id(rng.randrange(plan.api_keys)),
+                created_at,
+            ),
+        )
+    return rows
+
+
+def _alert_rows(plan: _Plan, first: int, count: int, total: int) -> list[Row]:
+    rng = plan.rng('alerts', first)
+    rows = []
+    for index in range(first, first + count):
+        rule_id, source_event = rng.choice(_ALERT_RULES)
+        rows.append(
+            (
+                f'seed-alert-{index:08d}',
+                rule_id,
+                rng.choice(tuple(AlertSeverity)).value,
+                rng.choice(tuple(AlertStatus)).value,
+                source_event,
+                plan.api_key_id(rng.randrange(plan.api_keys)),
+                plan.backup_id(rng.randrange(max(plan.backups, 1))),
+                'Seeded alert for load testing',
+                '{}',
+                f'seed:{plan.seed}:{index}',
+                plan.at(index, total),
+            ),
+        )
+    return rows
+
+
+def _audit_field_rows(plan: _Plan, first: int, count: int, total: int) -> list[Row]:
+    # Everything except prev_hash/entry_hash, which depend on the previous entry.
+    rng = plan.rng('audit_log_entries', first)
+    rows = []
+    for index in range(first, first + count):
+        action, resource, status = rng.choice(_AUDIT_EVENTS)
+        key_index = rng.randrange(plan.api_keys)
+        rows.append(
+            (
+                rng.randbytes(16).hex(),
+                action,
+                resource,
+                plan.backup_id(rng.randrange(max(plan.backups, 1))),
+                plan.api_key_id(key_index),
+                _ROLES[key_index % len(_ROLES)],
+                status,
+                None,
+                plan.audit_at(index, total),
+            ),
+        )
+    return rows
+
+
+def _chain(
+    fields: list[Row],
+    cursor: tuple[int, str | None],
+) -> tuple[list[Row], tuple[int, str | None]]:
+    """Hash one batch in chain order; only this pass is sequential."""
+    hasher = audit_entry_hasher(CURRENT_AUDIT_HASH_VERSION)
+    chain_index, prev_hash = cursor
+    rows = []
+    for event_id, action, resource, resource_id, actor, role, status, reason, at in fields:
+        chain_index += 1
+        entry_hash = hasher(
+            chain_index, prev_hash, at, event_id, action, resource, resource_id, actor, role,
+            status, reason,
+        )
+        rows.append(
+            (
+                chain_index, prev_hash, entry_hash, CURRENT_AUDIT_HASH_VERSION, event_id,
+                action, resource, resource_id, actor, role, status, reason, at,
+            ),
+        )
+        prev_hash = entry_hash
+    return rows, (chain_index, prev_hash)
+
+
+def _batches(total: int, batch_size: int) -> Iterator[tuple[int, int]]:
+    for first in range(0, total, batch_size):
+        yield first, min(batch_size, total - first)
+
+
+async def _in_order(
+    executor: Executor,
+    build: Callable[[int, int], list[Row]],
+    total: int,
+    batch_size: int,
+    window: int,
+) -> AsyncIterator[list[Row]]:
+    # Keep a bounded number of batches in flight so memory stays flat at any volume.
+    pending: list[Future[list[Row]]] = []
+    batches = _batches(total, batch_size)
+    for first, count in batches:
+        pending.append(executor.submit(build, first, count))
+        if len(pending) >= window:
+            break
+    while pending:
+        rows = await asyncio.wrap_future(pending.pop(0))
+        next_batch = next(batches, None)
+        if next_batch is not None:
+            pending.append(executor.submit(build, *next_batch))
+        yield rows
+
+
+class _Builder:
+    """Picklable batch builders bound to one plan, for ProcessPoolExecutor."""
+
+    def __init__(self, plan: _Plan, destroyed: int, alerts: int, audit_entries: int) -> None:
+        self.plan = plan
+        self.destroyed = destroyed
+        self.alerts = alerts
+        self.audit_entries = audit_entries
+
+    def backups(self, first: int, count: int) -> list[Row]:
+        return _backup_rows(self.plan, self.destroyed, first, count)
+
+    def alerts_batch(self, first: int, count: int) -> list[Row]:
+        return _alert_rows(self.plan, first, count, self.alerts)
+
+    def audit_batch(self, first: int, count: int) -> list[Row]:
+        return _audit_field_rows(self.plan, first, count, self.audit_entries)
+
+
+async def _copy(connection: Any, table: str, columns: tuple[str, ...], rows: list[Row]) -> None:
+    await connection.copy_records_to_table(table, records=rows, columns=list(columns))
+
+
+async def _ensure_audit_partitions(start: datetime, end: datetime) -> None:
+    async with get_session_factory()() as session:
+        repository = AuditPartitionsRepository(session)
+        existing = {partition.name for partition in await repository.list_partitions()}
+        month = month_start(start)
+        while month <= end:
+            partition = AuditPartition.for_month(month)
+            if partition.name not in existing:
+                await repository.create_partition(partition)
+            month = next_month(month)
+
+
+async def _chain_head(connection: Any) -> tuple[tuple[int, str | None], datetime | None]:
+    """Chain cursor plus the earliest timestamp a following entry may carry."""
+    latest = await connection.fetchrow(
+        'SELECT chain_index, entry_hash, created_at FROM audit_log_entries '
+        'ORDER BY chain_index DESC LIMIT 1',
+    )
+    if latest is not None:
+        after = latest['created_at'] + timedelta(microseconds=1)
+        return (latest['chain_index'], latest['entry_hash']), after
+    anchor = await connection.fetchrow(
+        'SELECT last_chain_index, last_entry_hash, range_end FROM audit_archive_manifests '
+        'WHERE last_chain_index IS NOT NULL ORDER BY last_chain_index DESC LIMIT 1',
+    )
+    if anchor is not None:
+        return (anchor['last_chain_index'], anchor['last_entry_hash']), anchor['range_end']
+    return (0, None), None
+
+
+async def _run(args: argparse.Namespace) -> int:
+    plan = _Plan(args.seed, args.days, args.api_keys, args.key_versions, args.backups)
+    builder = _Builder(plan, args.destroyed_key_versions, args.alerts, args.audit_entries)
+    report: dict[str, dict[str, float]] = {}
+    started = time.perf_counter()
+    await _ensure_audit_partitions(plan.start, plan.end)
+    cursor: tuple[int, str | None] = (0, None)
+    engine = get_engine()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        async with engine.connect() as sa_connection:
+            raw = await sa_connection.get_raw_connection()
+            connection: Any = raw.driver_connection
+
+            async def _load(
+                table: str,
+                columns: tuple[str, ...],
+                batches: AsyncIterator[list[Row]],
+                prepare: Callable[[], Awaitable[None]] | None = None,
+            ) -> None:
+                table_started = time.perf_counter()
+                loaded = 0
+                async with connection.transaction():
+                    if prepare is not None:
+                        await prepare()
+                    async for rows in batches:
+                        await _copy(connection, table, columns, rows)
+                        loaded += len(rows)
+                elapsed = time.perf_counter() - table_started
+                report[table] = {
+                    'rows': loaded,
+                    'seconds': round(elapsed, 2),
+                    'rows_per_second': round(loaded / elapsed) if elapsed else 0,
+                }
+
+            async def _single(rows: list[Row]) -> AsyncIterator[list[Row]]:
+                yield rows
+
+            async def _lock_chain() -> None:
+                # Held until the audit COPY commits, so no gateway append can interleave.
+                nonlocal cursor
+                await connection.execute('SELECT pg_advisory_xact_lock($1)', AUDIT_CHAIN_LOCK_KEY)
+                cursor, after = await _chain_head(connection)
+                if after is not None:
+                    plan.audit_start = max(plan.start, after)
+
+            async def _chained(batches: AsyncIterator[list[Row]]) -> AsyncIterator[list[Row]]:
+                nonlocal cursor
+                async for fields in batches:
+                    rows, cursor = _chain(fields, cursor)
+                    yield rows
+
+            window = args.workers * 2
+            await _load('api_keys', _API_KEY_COLUMNS, _single(_api_key_rows(plan)))
+            await _load(
+                'key_versions',
+                _KEY_VERSION_COLUMNS,
+                _single(_key_version_rows(plan, args.destroyed_key_versions)),
+            )
+            await _load(
+                'backup_metadata',
+                _BACKUP_COLUMNS,
+                _in_order(executor, builder.backups, args.backups, args.batch_size, window),
+            )
+            await _load(
+                'alerts',
+                _ALERT_COLUMNS,
+                _in_order(executor, builder.alerts_batch, args.alerts, args.batch_size, window),
+            )
+            # Chain order matters, so batches are hashed in sequence as they arrive.
+            await _load(
+                'audit_log_entries',
+                _AUDIT_COLUMNS,
+                _chained(
+                    _in_order(
+                        executor,
+                        builder.audit_batch,
+                        args.audit_entries,
+                        args.batch_size,
+                        window,
+                    ),
+                ),
+                prepare=_lock_chain,
+            )
+        async with engine.begin() as sa_connection:
+            # Fresh statistics so query plans match what production would choose.
+            for table in report:
+                await sa_connection.execute(text(f'ANALYZE {table}'))
+    print(
+        json.dumps(
+            {
+                'seed': args.seed,
+                'window': {
+                    'start': plan.start.isoformat(),
+                    'audit_start': plan.audit_start.isoformat(),
+                    'end': plan.end.isoformat(),
+                },
+                'tables': report,
+                'audit_chain_head': cursor[0],
+                'total_seconds': round(time.perf_counter() - started, 2),
+            },
+            indent=2,
+        ),
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk-load demo data with COPY.')
+    parser.add_argument('--backups', type=int, default=1_000_000)
+    parser.add_argument('--audit-entries', type=int, default=3_000_000)
+    parser.add_argument('--alerts', type=int, default=20_000)
+    parser.add_argument('--api-keys', type=int, default=500)
+    parser.add_argument('--key-versions', type=int, default=12)
+    parser.add_argument('--destroyed-key-versions', type=int, default=1)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--seed', type=int, default=20261019)
+    parser.add_argument('--batch-size', type=int, default=50_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_run(args)))
@@ -127,7 +127,7 @@ def test_operator_denied_crypto_shred_by_rbac() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies and audit.denies[0]['permission'] == 'admin'
 
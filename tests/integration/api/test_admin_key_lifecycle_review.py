@@ -194,6 +194,6 @@ def test_operator_denied_review_endpoints_by_rbac() -> None:
     assert list_response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': list_response.headers['X-Request-ID']},
     }
     assert len(audit.denies) == 3
@@ -130,6 +130,6 @@ def test_operator_denied_key_rotation() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies and audit.denies[0]['permission'] == 'admin'
@@ -137,7 +137,7 @@ def test_operator_denied_admin_key_create() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies
     assert audit.denies[0]['permission'] == 'admin'
@@ -5,9 +5,15 @@ from typing import Any
 
 from fastapi.testclient import TestClient
 
-from app.api.dependencies import get_audit_service, get_auth_service, get_policies_repository
+from app.api.dependencies import (
+    get_audit_service,
+    get_auth_service,
+    get_policies_repository,
+    get_policy_service,
+)
 from app.main import create_app
 from app.schemas.auth import ApiKeyPrincipal
+from app.services.policy_service import PolicyService
 
 
 class FakeAuditService:
@@ -67,6 +73,9 @@ class FakePoliciesRepository:
     async def list_policies(self) -> list[Any]:
         return list(self.records)
 
+    async def get_watermark(self) -> tuple[int, datetime | None]:
+        return len(self.records), max((r.updated_at for r in self.records), default=None)
+
     async def update_policy(
         self,
         policy_id: str,
@@ -151,7 +160,7 @@ def test_operator_denied_admin_policy_create() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies
     assert audit.denies[0]['permission'] == 'admin'
@@ -178,3 +187,61 @@ def test_operator_denied_admin_policy_list_and_update() -> None:
     assert list_response.status_code == 403
     assert update_response.status_code == 403
     assert len(audit.denies) == 2
+
+
+def test_policy_update_swaps_authorization_table() -> None:
+    class FakeAuthService:
+        async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+            if raw_key == 'operator':
+                return ApiKeyPrincipal(key_id='op-key', role='operator', department='IT')
+            return ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+    app = create_app()
+    audit = FakeAuditService()
+    repo = FakePoliciesRepository()
+    policy_service = PolicyService()
+    app.dependency_overrides[get_auth_service] = lambda: FakeAuthService()
+    app.dependency_overrides[get_policies_repository] = lambda: repo
+    app.dependency_overrides[get_audit_service] = lambda: audit
+    app.dependency_overrides[get_policy_service] = lambda: policy_service
+    client = TestClient(app)
+
+    response = client.post(
+        '/api/v1/admin/policies',
+        json={
+            'name': 'operator-admin',
+            'rule_json': {
+                'type': 'role_permissions',
+                'role': 'operator',
+                'permissions': ['backups', 'admin'],
+            },
+        },
+        headers={'X-API-Key': 'admin'},
+    )
+
+    assert response.status_code == 200
+    response = client.get('/api/v1/admin/policies', headers={'X-API-Key': 'operator'})
+    assert response.status_code == 200
+
+
+def test_invalid_policy_rule_rejected() -> None:
+    class FakeAuthService:
+        async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+            return ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+    app = create_app()
+    repo = FakePoliciesRepository()
+    app.dependency_overrides[get_auth_service] = lambda: FakeAuthService()
+    app.dependency_overrides[get_policies_repository] = lambda: repo
+    app.dependency_overrides[get_audit_service] = lambda: FakeAuditService()
+    client = TestClient(app)
+
+    response = client.post(
+        '/api/v1/admin/policies',
+        json={'name': 'broken', 'rule_json': {'type': 'restore_roles', 'roles': 'admin'}},
+        headers={'X-API-Key': 'valid'},
+    )
+
+    assert response.status_code == 422
+    assert response.json()['error']['code'] == 'POLICY_INVALID'
+    assert repo.records == []
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import (
+    get_audit_service,
+    get_auth_service,
+    get_stack_sampler,
+    get_trace_store,
+)
+from app.core.profiling import StackSampler
+from app.core.tracing import TraceStore
+from app.main import create_app
+from app.schemas.auth import ApiKeyPrincipal
+
+ROLES = {'admin-key': 'admin', 'operator-key': 'operator'}
+
+
+class FakeAuthService:
+    async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+        _ = client_ip
+        return ApiKeyPrincipal(key_id=raw_key, role=ROLES[raw_key], department='IT')
+
+
+class FakeAuditService:
+    def __init__(self) -> None:
+        self.actions: list[str] = []
+
+    async def record_admin_action(
+        self,
+        actor_key_id: str | None,
+        action: str,
+        resource: str,
+        resource_id: str | None,
+        client_ip: str | None,
+    ) -> None:
+        self.actions.append(action)
+
+    async def record_authorization_denied(self, **kwargs: Any) -> None:
+        return None
+
+
+def _client(store: TraceStore, sampler: StackSampler | None = None) -> tuple[TestClient, Any]:
+    app = create_app()
+    audit = FakeAuditService()
+    app.dependency_overrides[get_auth_service] = lambda: FakeAuthService()
+    app.dependency_overrides[get_audit_service] = lambda: audit
+    app.dependency_overrides[get_trace_store] = lambda: store
+    app.dependency_overrides[get_stack_sampler] = lambda: sampler or StackSampler()
+    return TestClient(app), audit
+
+
+def test_admin_trace_header_records_request_spans_viewable_in_each_format() -> None:
+    store = TraceStore()
+    client, audit = _client(store)
+
+    response = client.get(
+        '/api/v1/admin/profiling/traces',
+        headers={'X-API-Key': 'admin-key', 'X-SSBG-Trace': '1'},
+    )
+    assert response.status_code == 200
+    request_id = response.headers['X-Request-ID']
+    trace = store.get(request_id)
+    assert trace is not None
+    assert trace.status_code == 200
+    assert trace.trigger == 'header'
+    assert [span.name for span in trace.spans][0] == 'auth.authenticate'
+
+    listing = client.get('/api/v1/admin/profiling/traces', headers={'X-API-Key': 'admin-key'})
+    assert [item['request_id'] for item in listing.json()['data']['traces']] == [request_id]
+
+    detail = client.get(
+        f'/api/v1/admin/profiling/traces/{request_id}',
+        headers={'X-API-Key': 'admin-key'},
+    )
+    assert detail.status_code == 200
+    assert detail.json()['data']['spans'][0]['name'] == 'auth.authenticate'
+
+    speedscope = client.get(
+        f'/api/v1/admin/profiling/traces/{request_id}',
+        params={'format': 'speedscope'},
+        headers={'X-API-Key': 'admin-key'},
+    )
+    assert speedscope.json()['profiles'][0]['unit'] == 'microseconds'
+
+    collapsed = client.get(
+        f'/api/v1/admin/profiling/traces/{request_id}',
+        params={'format': 'collapsed'},
+        headers={'X-API-Key': 'admin-key'},
+    )
+    assert collapsed.headers['content-type'].startswith('text/plain')
+    assert collapsed.text.startswith('request')
+    assert 'profiling_trace_viewed' in audit.actions
+
+
+def test_trace_header_from_non_admin_is_not_kept() -> None:
+    store = TraceStore()
+    client, _ = _client(store)
+
+    response = client.get(
+        '/api/v1/health/live',
+        headers={'X-API-Key': 'operator-key', 'X-SSBG-Trace': '1'},
+    )
+    denied = client.get(
+        '/api/v1/admin/profiling/traces',
+        headers={'X-API-Key': 'operator-key'},
+    )
+
+    assert response.status_code == 200
+    assert store.recent(10) == []
+    assert denied.status_code == 403
+
+
+def test_unknown_trace_and_stopped_sampler_return_error_envelopes() -> None:
+    client, _ = _client(TraceStore())
+
+    missing = client.get(
+        '/api/v1/admin/profiling/traces/unknown',
+        headers={'X-API-Key': 'admin-key'},
+    )
+    sampler = client.get('/api/v1/admin/profiling/sampler', headers={'X-API-Key': 'admin-key'})
+
+    assert missing.status_code == 404
+    assert missing.json()['error']['code'] == 'TRACE_NOT_FOUND'
+    assert sampler.status_code == 409
+    assert sampler.json()['error']['code'] == 'PROFILING_DISABLED'
+
+
+def test_running_sampler_exports_collapsed_stacks() -> None:
+    sampler = StackSampler(interval_seconds=0.001)
+    sampler.start()
+    try:
+        sampler.sample_once()
+        client, _ = _client(TraceStore(), sampler)
+        summary = client.get(
+            '/api/v1/admin/profiling/sampler',
+            headers={'X-API-Key': 'admin-key'},
+        )
+        collapsed = client.get(
+            '/api/v1/admin/profiling/sampler',
+            params={'format': 'collapsed', 'reset': 'true'},
+            headers={'X-API-Key': 'admin-key'},
+        )
+    finally:
+        sampler.stop()
+
+    assert summary.status_code == 200
+    assert summary.json()['data']['samples'] >= 1
+    assert collapsed.status_code == 200
+    assert 'test_running_sampler_exports_collapsed_stacks' in collapsed.text
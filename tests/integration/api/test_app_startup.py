@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.routing import APIRoute
+
+import app.main as main_module
+from app.core.config import get_settings
+from app.main import create_app
+from app.services.policy_service import PolicyService
+
+_UPDATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_module_app_is_built_on_first_access_and_reused() -> None:
+    vars(main_module).pop('app', None)
+
+    first = main_module.app
+    second = main_module.app
+
+    assert first is second
+
+
+def test_every_router_is_mounted_once_under_the_api_prefix() -> None:
+    prefix = get_settings().api_v1_prefix
+    app = create_app()
+    endpoints = [
+        (route.path, method)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    ]
+
+    assert len(endpoints) == len(set(endpoints))
+    assert f'{prefix}/health/live' in {path for path, _ in endpoints}
+    assert f'{prefix}/admin/profiling/traces' in {path for path, _ in endpoints}
+
+
+async def test_policy_table_reloads_only_when_records_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = PolicyService()
+    watermarks = [(1, _UPDATED_AT), (1, _UPDATED_AT), (2, _UPDATED_AT)]
+    listed: list[int] = []
+
+    class FakeSession:
+        async def __aenter__(self) -> FakeSession:
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+    class FakeRepository:
+        def __init__(self, session: object) -> None:
+            pass
+
+        async def get_watermark(self) -> tuple[int, datetime]:
+            return watermarks.pop(0)
+
+        async def list_policies(self) -> list[object]:
+            listed.append(1)
+            return []
+
+    monkeypatch.setattr('app.api.dependencies.get_policy_service', lambda: service)
+    monkeypatch.setattr(
+        'app.infrastructure.db.session.get_session_factory',
+        lambda: FakeSession,
+    )
+    monkeypatch.setattr('app.repositories.policies_repository.PoliciesRepository', FakeRepository)
+
+    for _ in range(3):
+        await main_module._load_policy_table()
+
+    assert len(listed) == 2
+    assert service.watermark == (2, _UPDATED_AT)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 from fastapi import FastAPI
@@ -30,6 +34,9 @@ class InMemoryAuditRepository:
         self._entries.append(record)
         return record
 
+    async def get_archive_anchor(self) -> tuple[int, str] | None:
+        return None
+
     async def list_entries(
         self,
         offset: int = 0,
@@ -37,6 +44,7 @@ class InMemoryAuditRepository:
         action: str | None = None,
         resource: str | None = None,
         status: str | None = None,
+        after_chain_index: int | None = None,
     ) -> list[Any]:
         items = self.entries
         if action:
@@ -45,8 +53,47 @@ class InMemoryAuditRepository:
             items = [item for item in items if item.resource == resource]
         if status:
             items = [item for item in items if item.status == status]
+        if after_chain_index is not None:
+            items = [item for item in items if item.chain_index > after_chain_index]
         return items[offset : offset + limit]
 
+    async def list_chain_rows(self, after_chain_index: int, limit: int = 1000) -> list[Any]:
+        return [
+            (
+                item.chain_index,
+                item.prev_hash,
+                item.created_at,
+                item.event_id,
+                item.action,
+                item.resource,
+                item.resource_id,
+                item.actor_key_id,
+                item.actor_role,
+                item.status,
+                item.reason,
+                item.hash_version,
+                item.entry_hash,
+            )
+            for item in self.entries
+            if item.chain_index > after_chain_index
+        ][:limit]
+
+    async def stream_entries(
+        self,
+        action: str | None = None,
+        resource: str | None = None,
+        status: str | None = None,
+        after_chain_index: int | None = None,
+    ) -> AsyncIterator[Any]:
+        for item in await self.list_entries(
+            limit=len(self._entries),
+            action=action,
+            resource=resource,
+            status=status,
+            after_chain_index=after_chain_index,
+        ):
+            yield item
+
 
 class FakeDenyAuditService:
     def __init__(self) -> None:
@@ -131,6 +178,23 @@ def test_authorized_admin_can_review_audit_entries_and_summary() -> None:
     assert 'audit_validation_reviewed' in actions
 
 
+def test_audit_entries_record_the_request_id_that_wrote_them() -> None:
+    app = create_app()
+    _override_auth(app, role='admin')
+    repository = InMemoryAuditRepository()
+    audit_service = AuditService(cast(Any, repository))
+    app.dependency_overrides[get_audit_service] = lambda: audit_service
+    client = TestClient(app)
+
+    client.get('/api/v1/audit/entries', headers={'X-API-Key': 'valid', 'X-Request-ID': 'req-1'})
+    response = client.get('/api/v1/audit/entries', headers={'X-API-Key': 'valid'})
+
+    entries = response.json()['data']['entries']
+    assert [entry['action'] for entry in entries] == ['audit_review_accessed']
+    assert entries[0]['request_id'] == 'req-1'
+    assert repository.entries[-1].request_id == response.headers['X-Request-ID']
+
+
 def test_unauthorized_caller_is_denied_for_audit_review_endpoints() -> None:
     app = create_app()
     _override_auth(app, role='operator')
@@ -144,7 +208,69 @@ def test_unauthorized_caller_is_denied_for_audit_review_endpoints() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert deny_audit.denies
     assert deny_audit.denies[0]['permission'] == 'audit'
+
+
+def test_audit_entries_cursor_pagination_walks_chain() -> None:
+    app = create_app()
+    _override_auth(app, role='admin')
+    repository = InMemoryAuditRepository()
+    audit_service = AuditService(cast(Any, repository))
+    asyncio.run(_seed_events(audit_service))
+    asyncio.run(_seed_events(audit_service))
+    app.dependency_overrides[get_audit_service] = lambda: audit_service
+    client = TestClient(app)
+
+    first = client.get(
+        '/api/v1/audit/entries?limit=1&resource=backup',
+        headers={'X-API-Key': 'valid'},
+    ).json()['data']
+    second = client.get(
+        f'/api/v1/audit/entries?limit=1&resource=backup&cursor={first["next_cursor"]}',
+        headers={'X-API-Key': 'valid'},
+    ).json()['data']
+
+    assert first['next_cursor'] == first['entries'][0]['chain_index']
+    assert second['entries'][0]['chain_index'] > first['next_cursor']
+    assert second['paging'] == {'offset': None, 'limit': 1}
+    last = client.get(
+        f'/api/v1/audit/entries?limit=1&resource=backup&cursor={second["next_cursor"]}',
+        headers={'X-API-Key': 'valid'},
+    ).json()['data']
+    assert last['entries'] == []
+    assert last['next_cursor'] is None
+
+
+def test_audit_export_streams_ndjson_and_csv_with_hashes() -> None:
+    app = create_app()
+    _override_auth(app, role='admin')
+    repository = InMemoryAuditRepository()
+    audit_service = AuditService(cast(Any, repository))
+    asyncio.run(_seed_events(audit_service))
+    app.dependency_overrides[get_audit_service] = lambda: audit_service
+    client = TestClient(app)
+
+    ndjson_response = client.get(
+        '/api/v1/audit/export?resource=backup',
+        headers={'X-API-Key': 'valid'},
+    )
+    csv_response = client.get(
+        '/api/v1/audit/export?format=csv&resource=restore',
+        headers={'X-API-Key': 'valid'},
+    )
+
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert [row['resource'] for row in rows] == ['backup']
+    assert rows[0]['entry_hash'] == repository.entries[0].entry_hash
+    assert rows[0]['prev_hash'] is None
+
+    assert csv_response.status_code == 200
+    csv_rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert [row['action'] for row in csv_rows] == ['restore_completed']
+    assert csv_rows[0]['prev_hash'] == repository.entries[0].entry_hash
+    assert 'audit_export_accessed' in [entry.action for entry in repository.entries]
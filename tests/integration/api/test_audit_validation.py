@@ -6,6 +6,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.dependencies import get_audit_service, get_auth_service
+from app.infrastructure.crypto.hashing import AUDIT_HASH_V1, CURRENT_AUDIT_HASH_VERSION
 from app.main import create_app
 from app.schemas.auth import ApiKeyPrincipal
 from app.services.audit_service import AuditService
@@ -29,8 +30,40 @@ class InMemoryAuditRepository:
         self._entries.append(record)
         return record
 
-    async def list_entries(self, offset: int = 0, limit: int = 100) -> list[Any]:
-        return self.entries[offset : offset + limit]
+    async def get_archive_anchor(self) -> tuple[int, str] | None:
+        return None
+
+    async def list_entries(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        after_chain_index: int | None = None,
+    ) -> list[Any]:
+        items = self.entries
+        if after_chain_index is not None:
+            items = [item for item in items if item.chain_index > after_chain_index]
+        return items[offset : offset + limit]
+
+    async def list_chain_rows(self, after_chain_index: int, limit: int = 1000) -> list[Any]:
+        return [
+            (
+                item.chain_index,
+                item.prev_hash,
+                item.created_at,
+                item.event_id,
+                item.action,
+                item.resource,
+                item.resource_id,
+                item.actor_key_id,
+                item.actor_role,
+                item.status,
+                item.reason,
+                item.hash_version,
+                item.entry_hash,
+            )
+            for item in self.entries
+            if item.chain_index > after_chain_index
+        ][:limit]
 
 
 def _override_admin_auth(app: FastAPI) -> None:
@@ -79,7 +112,7 @@ def test_validate_audit_chain_reports_valid_machine_readable_result() -> None:
     assert payload['data']['valid'] is True
     assert payload['data']['checked_entries'] == 2
     assert payload['data']['failure'] is None
-    assert payload['meta']['request_id'] == 'generated-placeholder-id'
+    assert payload['meta']['request_id'] == response.headers['X-Request-ID']
 
 
 def test_validate_audit_chain_reports_tamper_with_failure_pointer() -> None:
@@ -180,3 +213,57 @@ def test_validate_audit_chain_scans_entire_chain_not_fixed_window() -> None:
     payload = response.json()
     assert payload['data']['valid'] is True
     assert payload['data']['checked_entries'] == 1205
+
+
+def test_validate_audit_chain_verifies_legacy_v1_entries_alongside_v2() -> None:
+    app = create_app()
+    _override_admin_auth(app)
+    repository = InMemoryAuditRepository()
+    audit_service = AuditService(cast(Any, repository))
+    import asyncio
+
+    asyncio.run(_seed_chain(audit_service))
+    legacy = repository.entries[0]
+    assert legacy.hash_version == CURRENT_AUDIT_HASH_VERSION
+    # Rows written before hash versioning were hashed with v1 and default to it.
+    legacy.hash_version = AUDIT_HASH_V1
+    legacy.entry_hash = AuditService._build_entry_hash(
+        chain_index=legacy.chain_index,
+        prev_hash=legacy.prev_hash,
+        created_at=legacy.created_at,
+        event_id=legacy.event_id,
+        action=legacy.action,
+        resource=legacy.resource,
+        resource_id=legacy.resource_id,
+        actor_key_id=legacy.actor_key_id,
+        actor_role=legacy.actor_role,
+        status=legacy.status,
+        reason=legacy.reason,
+    )
+    repository.entries[1].prev_hash = legacy.entry_hash
+    repository.entries[1].entry_hash = AuditService._build_entry_hash(
+        chain_index=2,
+        prev_hash=legacy.entry_hash,
+        created_at=repository.entries[1].created_at,
+        event_id=repository.entries[1].event_id,
+        action=repository.entries[1].action,
+        resource=repository.entries[1].resource,
+        resource_id=repository.entries[1].resource_id,
+        actor_key_id=repository.entries[1].actor_key_id,
+        actor_role=repository.entries[1].actor_role,
+        status=repository.entries[1].status,
+        reason=repository.entries[1].reason,
+        hash_version=CURRENT_AUDIT_HASH_VERSION,
+    )
+    app.dependency_overrides[get_audit_service] = lambda: audit_service
+    client = TestClient(app)
+
+    response = client.get('/api/v1/audit/chain/validate', headers={'X-API-Key': 'valid'})
+    assert response.json()['data']['valid'] is True
+
+    legacy.hash_version = CURRENT_AUDIT_HASH_VERSION
+    response = client.get('/api/v1/audit/chain/validate', headers={'X-API-Key': 'valid'})
+    payload = response.json()
+    assert payload['data']['valid'] is False
+    assert payload['data']['failure']['reason'] == 'entry_hash_mismatch'
+    assert payload['data']['failure']['chain_index'] == 1
@@ -21,7 +21,7 @@ def test_missing_api_key_returns_auth_error() -> None:
     assert response.json() == {
         'error': {'code': 'AUTH_INVALID_KEY', 'message': 'Missing API key'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -44,7 +44,7 @@ def test_invalid_api_key_returns_auth_error() -> None:
     assert response.json() == {
         'error': {'code': 'AUTH_INVALID_KEY', 'message': 'Invalid API key'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -59,6 +59,7 @@ def test_valid_api_key_allows_request() -> None:
             request: object,
             principal: ApiKeyPrincipal | None,
             client_ip: str | None,
+            mfa_token: str | None = None,
         ) -> dict[str, object]:
             return {
                 'status': 'accepted',
@@ -86,7 +87,7 @@ def test_valid_api_key_allows_request() -> None:
             'classification': 'PUBLIC',
             'source_system': 'system-a',
         },
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -109,5 +110,5 @@ def test_auth_dependency_failure_denies_request_fail_secure() -> None:
     assert response.json() == {
         'error': {'code': 'AUTH_UNAVAILABLE', 'message': 'Authentication service unavailable'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
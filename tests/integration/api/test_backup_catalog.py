@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_audit_service, get_auth_service, get_backups_repository
+from app.main import create_app
+from app.repositories.backups_repository import BackupCatalogFilters
+from app.schemas.auth import ApiKeyPrincipal
+
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class FakeAuditService:
+    def __init__(self) -> None:
+        self.actions: list[str] = []
+
+    async def record_admin_action(
+        self,
+        actor_key_id: str | None,
+        action: str,
+        resource: str,
+        resource_id: str | None,
+        client_ip: str | None,
+    ) -> None:
+        self.actions.append(action)
+
+
+class FakeAuthService:
+    async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+        _ = (raw_key, client_ip)
+        return ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+
+class FakeBackupsRepository:
+    def __init__(self) -> None:
+        # Two backups share a timestamp so paging must fall back to the id tiebreaker.
+        self.records = [
+            SimpleNamespace(
+                id=index + 1,
+                backup_id=f'backup-{index:04d}',
+                classification='SECRET' if index % 2 else 'PUBLIC',
+                source_system='erp' if index < 4 else 'crm',
+                description=None,
+                status='ACTIVE',
+                key_version='P-001',
+                original_size=100,
+                encrypted_size=140,
+                compression='none',
+                base_backup_id=None,
+                delta_depth=0,
+                created_by='admin-key',
+                created_at=START + timedelta(hours=min(index, 3)),
+            )
+            for index in range(6)
+        ]
+        self.filters: list[BackupCatalogFilters] = []
+        self.estimates = 0
+
+    def _matching(self, filters: BackupCatalogFilters) -> list[Any]:
+        self.filters.append(filters)
+        return [
+            record
+            for record in self.records
+            if (filters.source_system is None or record.source_system == filters.source_system)
+            and (filters.classification is None or record.classification == filters.classification)
+            and (filters.created_from is None or record.created_at >= filters.created_from)
+        ]
+
+    async def list_catalog(
+        self,
+        filters: BackupCatalogFilters,
+        limit: int = 50,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[Any]:
+        ordered = sorted(
+            self._matching(filters),
+            key=lambda record: (record.created_at, record.id),
+            reverse=True,
+        )
+        if after is not None:
+            ordered = [record for record in ordered if (record.created_at, record.id) < after]
+        return ordered[:limit]
+
+    async def count_catalog(self, filters: BackupCatalogFilters) -> int:
+        return len(self._matching(filters))
+
+    async def estimate_catalog_count(self, filters: BackupCatalogFilters) -> int:
+        self.estimates += 1
+        return len(self._matching(filters)) + 7
+
+
+def _client() -> tuple[TestClient, FakeBackupsRepository, FakeAuditService]:
+    app = create_app()
+    repository = FakeBackupsRepository()
+    audit = FakeAuditService()
+    app.dependency_overrides[get_auth_service] = lambda: FakeAuthService()
+    app.dependency_overrides[get_audit_service] = lambda: audit
+    app.dependency_overrides[get_backups_repository] = lambda: repository
+    return TestClient(app), repository, audit
+
+
+def test_catalog_pages_by_keyset_cursor_without_gaps() -> None:
+    client, _, audit = _client()
+    seen: list[str] = []
+    cursor: str | None = None
+    for _ in range(4):
+        params: dict[str, object] = {'limit': 2}
+        if cursor is not None:
+            params['cursor'] = cursor
+        response = client.get('/api/v1/backups', params=params, headers={'X-API-Key': 'valid'})
+        assert response.status_code == 200
+        data = response.json()['data']
+        seen.extend(entry['backup_id'] for entry in data['backups'])
+        cursor = data['next_cursor']
+        if cursor is None:
+            break
+
+    assert seen == [f'backup-{index:04d}' for index in (5, 4, 3, 2, 1, 0)]
+    assert audit.actions[0] == 'backup_catalog_accessed'
+
+
+def test_catalog_filters_and_count_modes() -> None:
+    client, repository, _ = _client()
+
+    exact = client.get(
+        '/api/v1/backups',
+        params={'source_system': 'erp', 'classification': 'SECRET', 'count': 'exact'},
+        headers={'X-API-Key': 'valid'},
+    ).json()['data']
+    estimated = client.get(
+        '/api/v1/backups',
+        params={'source_system': 'erp', 'count': 'estimate'},
+        headers={'X-API-Key': 'valid'},
+    ).json()['data']
+
+    assert [entry['backup_id'] for entry in exact['backups']] == ['backup-0003', 'backup-0001']
+    assert exact['paging'] == {'limit': 50, 'count_mode': 'exact', 'total': 2}
+    assert estimated['paging']['total'] == 11
+    assert repository.estimates == 1
+    assert repository.filters[0] == BackupCatalogFilters(
+        source_system='erp',
+        classification='SECRET',
+    )
+
+
+def test_catalog_rejects_invalid_cursor_and_filters() -> None:
+    client, _, _ = _client()
+
+    bad_cursor = client.get(
+        '/api/v1/backups',
+        params={'cursor': 'not-a-cursor'},
+        headers={'X-API-Key': 'valid'},
+    )
+    bad_status = client.get(
+        '/api/v1/backups',
+        params={'status': 'DELETED'},
+        headers={'X-API-Key': 'valid'},
+    )
+
+    assert bad_cursor.status_code == 400
+    assert bad_cursor.json()['error']['code'] == 'BACKUP_CURSOR_INVALID'
+    assert bad_status.status_code == 422
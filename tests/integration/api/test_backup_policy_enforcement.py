@@ -5,10 +5,11 @@ from typing import Any
 from fastapi.testclient import TestClient
 
 from app.api.dependencies import get_auth_service, get_backup_service
-from app.core.enums import ClassificationLevel
+from app.core.enums import ClassificationLevel, IncidentLevel
 from app.infrastructure.crypto.key_store_fs import KeyMaterial
 from app.main import create_app
 from app.schemas.auth import ApiKeyPrincipal
+from app.services.auth_service import MfaFailure
 from app.services.backup_service import BackupService
 from app.services.policy_service import BackupPolicyDecision
 
@@ -37,11 +38,17 @@ class FakeBackupsRepository:
 
 
 class FakePolicyService:
+    def __init__(self) -> None:
+        self.calls: list[tuple[object, bool]] = []
+
     def evaluate_backup(
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
     ) -> BackupPolicyDecision:
+        self.calls.append((incident_level, mfa_verified))
         return BackupPolicyDecision(
             allowed=False,
             reason='Policy denies backup',
@@ -99,6 +106,27 @@ class FakeStorage:
         return None
 
 
+class FakeIncidentService:
+    def __init__(self, level: IncidentLevel | None) -> None:
+        self._level = level
+
+    async def get_current_level(self) -> IncidentLevel:
+        if self._level is None:
+            raise RuntimeError('incident state unavailable')
+        return self._level
+
+
+class FakeMfaValidator:
+    async def validate_mfa_token(
+        self,
+        principal: ApiKeyPrincipal | None,
+        mfa_token: str | None,
+        client_ip: str | None,
+    ) -> None:
+        if mfa_token != 'mfa:key-1':
+            raise MfaFailure('MFA_INVALID', 'Invalid MFA token')
+
+
 class FakeSettings:
     classification_required = True
     default_classification = 'PUBLIC'
@@ -137,3 +165,53 @@ def test_backup_policy_denial_blocks_persistence_and_returns_error() -> None:
     assert payload['data']['details'][0]['reason_category'] == 'policy_rule'
     assert repository.records == []
     assert audit_service.decisions[0]['allowed'] is False
+
+
+def test_backup_policy_sees_incident_level_and_verified_mfa() -> None:
+    class FakeAuthService:
+        async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+            return ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+
+    def _service(policy: FakePolicyService, level: IncidentLevel | None) -> BackupService:
+        return BackupService(
+            FakeBackupsRepository(),
+            FakeSettings(),
+            policy,
+            FakeAuditService(),
+            FakeKeyStore(),
+            FakeStorage(),
+            incident_service=FakeIncidentService(level),
+            mfa_validator=FakeMfaValidator(),
+        )
+
+    app = create_app()
+    app.dependency_overrides[get_auth_service] = lambda: FakeAuthService()
+    client = TestClient(app)
+    body = {'classification': 'PUBLIC', 'source_system': 'system-a'}
+    policy = FakePolicyService()
+
+    app.dependency_overrides[get_backup_service] = lambda: _service(
+        policy,
+        IncidentLevel.QUARANTINE,
+    )
+    client.post('/api/v1/backups', json=body, headers={'X-API-Key': 'valid'})
+    client.post(
+        '/api/v1/backups',
+        json=body,
+        headers={'X-API-Key': 'valid', 'X-MFA-Token': 'mfa:key-1'},
+    )
+    invalid_mfa = client.post(
+        '/api/v1/backups',
+        json=body,
+        headers={'X-API-Key': 'valid', 'X-MFA-Token': 'wrong'},
+    )
+    app.dependency_overrides[get_backup_service] = lambda: _service(policy, None)
+    client.post('/api/v1/backups', json=body, headers={'X-API-Key': 'valid'})
+
+    assert invalid_mfa.status_code == 401
+    assert invalid_mfa.json()['error']['code'] == 'MFA_INVALID'
+    assert policy.calls == [
+        (IncidentLevel.QUARANTINE, False),
+        (IncidentLevel.QUARANTINE, True),
+        (IncidentLevel.LOCKDOWN, False),
+    ]
@@ -42,6 +42,8 @@ class FakePolicyService:
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
     ) -> BackupPolicyDecision:
         return BackupPolicyDecision(
             allowed=True,
@@ -118,7 +120,7 @@ def test_backup_validation_rejects_malformed_request() -> None:
 
     assert response.status_code == 422
     assert response.json()['error']['code'] == 'VALIDATION_ERROR'
-    assert response.json()['meta']['request_id'] == 'generated-placeholder-id'
+    assert response.json()['meta']['request_id'] == response.headers['X-Request-ID']
     assert response.json()['data']['details']
     assert repository.records == []
 
@@ -152,7 +154,7 @@ def test_backup_request_structure_validation_uses_contract() -> None:
     assert response.status_code == 422
     payload = response.json()
     assert payload['error']['code'] == 'VALIDATION_ERROR'
-    assert payload['meta']['request_id'] == 'generated-placeholder-id'
+    assert payload['meta']['request_id'] == response.headers['X-Request-ID']
     assert payload['data']['details']
     assert repository.records == []
 
@@ -189,5 +191,5 @@ def test_backup_validation_allows_well_formed_request() -> None:
     assert payload['data']['classification'] == 'PUBLIC'
     assert payload['data']['source_system'] == 'system-a'
     assert payload['data']['backup_id']
-    assert payload['meta'] == {'request_id': 'generated-placeholder-id'}
+    assert payload['meta'] == {'request_id': response.headers['X-Request-ID']}
     assert len(repository.records) == 1
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.responses import EnvelopeResponse, success_response
+from app.schemas.audit import AuditEntrySummary
+
+
+def _entry() -> AuditEntrySummary:
+    return AuditEntrySummary(
+        chain_index=7,
+        event_id='evt-7',
+        action='backup_submitted',
+        resource='backup',
+        reason='Übertragung geprüft',
+        created_at=datetime(2026, 2, 26, 12, 5, tzinfo=UTC),
+    )
+
+
+def test_models_serialize_as_their_json_dump_inside_the_envelope() -> None:
+    response = success_response(data={'entries': [_entry()]}, request_id='req-1')
+
+    assert isinstance(response, EnvelopeResponse)
+    assert response.media_type == 'application/json'
+    assert response.body == (
+        b'{"data":{"entries":[' + _entry().model_dump_json().encode() + b']},'
+        b'"meta":{"request_id":"req-1"}}'
+    )
+
+
+def test_route_returning_envelope_keeps_status_and_payload() -> None:
+    app = FastAPI()
+
+    @app.post('/entries')
+    async def create_entry() -> EnvelopeResponse:
+        return success_response(data=_entry(), request_id='req-2', status_code=201)
+
+    response = TestClient(app).post('/entries')
+
+    assert response.status_code == 201
+    assert response.json() == {
+        'data': _entry().model_dump(mode='json'),
+        'meta': {'request_id': 'req-2'},
+    }
+    assert response.json()['data']['reason'] == 'Übertragung geprüft'
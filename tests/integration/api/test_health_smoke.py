@@ -23,7 +23,7 @@ def test_health_liveness_endpoint_returns_ok(client: TestClient) -> None:
     assert response.status_code == 200
     assert response.json() == {
         'data': {'status': 'ok'},
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -51,7 +51,7 @@ def test_health_readiness_reports_ready(
                 'minio': {'status': 'ok'},
             },
         },
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -79,7 +79,7 @@ def test_health_readiness_reports_not_ready(
                 'minio': {'status': 'ok'},
             },
         },
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -107,7 +107,7 @@ def test_health_readiness_reports_minio_not_ready(
                 'minio': {'status': 'unavailable'},
             },
         },
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
 
 
@@ -131,3 +131,29 @@ def test_health_unexpected_error_uses_shared_error_envelope(
         'meta': None,
     }
     get_settings.cache_clear()
+
+
+def test_request_id_generated_and_echoed(client: TestClient) -> None:
+    first = client.get('/api/v1/health/live')
+    second = client.get('/api/v1/health/live')
+
+    first_id = first.headers['X-Request-ID']
+    second_id = second.headers['X-Request-ID']
+    assert first.json()['meta'] == {'request_id': first_id}
+    assert len(first_id) == 26
+    assert first_id != second_id
+    assert first_id[:12] <= second_id[:12]
+
+
+def test_request_id_propagates_client_value(client: TestClient) -> None:
+    response = client.get('/api/v1/health/live', headers={'X-Request-ID': 'client-req-42'})
+
+    assert response.headers['X-Request-ID'] == 'client-req-42'
+    assert response.json()['meta'] == {'request_id': 'client-req-42'}
+
+
+def test_request_id_rejects_unsafe_client_value(client: TestClient) -> None:
+    response = client.get('/api/v1/health/live', headers={'X-Request-ID': 'bad id\tinjected'})
+
+    assert response.headers['X-Request-ID'] != 'bad id\tinjected'
+    assert response.json()['meta'] == {'request_id': response.headers['X-Request-ID']}
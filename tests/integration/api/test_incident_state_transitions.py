@@ -155,6 +155,6 @@ def test_unauthorized_incident_transition_is_denied() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies and audit.denies[0]['permission'] == 'admin'
@@ -49,7 +49,7 @@ def test_operator_denied_on_restore() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies
     assert audit.denies[0]['permission'] == 'restores'
@@ -87,7 +87,7 @@ def test_operator_denied_on_admin_endpoint() -> None:
     assert response.json() == {
         'error': {'code': 'POLICY_DENIED', 'message': 'Not authorized for this operation'},
         'data': None,
-        'meta': {'request_id': 'generated-placeholder-id'},
+        'meta': {'request_id': response.headers['X-Request-ID']},
     }
     assert audit.denies
     assert audit.denies[0]['permission'] == 'admin'
@@ -77,7 +77,13 @@ class FakeAuditService:
 
 
 class FakePolicyService:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         _ = classification
         return SimpleNamespace(
             allowed=True,
@@ -108,7 +108,13 @@ class FakeRestoreAuthService:
 
 
 class FakePolicyServiceAllow:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         return SimpleNamespace(
             allowed=True,
             reason='Restore allowed',
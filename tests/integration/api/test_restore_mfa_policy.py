@@ -123,7 +123,13 @@ class FakeAuthService:
 
 
 class FakePolicyServiceAllow:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         return SimpleNamespace(
             allowed=True,
             reason='Restore allowed',
@@ -134,7 +140,13 @@ class FakePolicyServiceAllow:
 
 
 class FakePolicyServiceDeny:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         return SimpleNamespace(
             allowed=False,
             reason='Restore policy denied',
@@ -362,3 +374,37 @@ def test_restore_irreversible_backup_returns_documented_error() -> None:
     payload = response.json()
     assert payload['error']['code'] == 'RESTORE_IRREVERSIBLE'
     assert payload['data']['details'][0]['reason_category'] == 'irreversible'
+
+
+def test_restore_policy_sees_incident_level_and_verified_mfa() -> None:
+    class RecordingPolicyService(FakePolicyServiceAllow):
+        def __init__(self) -> None:
+            self.calls: list[tuple[object, bool]] = []
+
+        def evaluate_restore(
+            self,
+            principal: ApiKeyPrincipal | None,
+            classification: object,
+            incident_level: object = None,
+            mfa_verified: bool = False,
+        ) -> Any:
+            self.calls.append((incident_level, mfa_verified))
+            return super().evaluate_restore(principal, classification)
+
+    app = create_app()
+    _override_restore_auth(app)
+    policy_service = RecordingPolicyService()
+    app.dependency_overrides[get_restore_service] = lambda: _build_restore_service(
+        policy_service,
+        FakeAuditService(),
+        FakeIncidentService(IncidentLevel.QUARANTINE),
+    )
+    client = TestClient(app)
+
+    client.post(
+        '/api/v1/restores',
+        json={'backup_id': 'backup-0001'},
+        headers={'X-API-Key': 'valid', 'X-MFA-Token': 'mfa:admin-key'},
+    )
+
+    assert policy_service.calls == [(IncidentLevel.QUARANTINE, True)]
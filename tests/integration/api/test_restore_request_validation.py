@@ -98,7 +98,7 @@ def test_restore_invalid_request_returns_validation_contract() -> None:
     assert response.status_code == 422
     payload = response.json()
     assert payload['error']['code'] == 'VALIDATION_ERROR'
-    assert payload['meta']['request_id'] == 'generated-placeholder-id'
+    assert payload['meta']['request_id'] == response.headers['X-Request-ID']
     assert payload['data']['details']
 
 
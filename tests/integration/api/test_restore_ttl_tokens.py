@@ -3,9 +3,11 @@ from __future__ import annotations
 import asyncio
 from datetime import UTC, datetime, timedelta
 from hashlib import sha512
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -13,10 +15,12 @@ from app.api.dependencies import (
     get_auth_service,
     get_restore_access_token_service,
     get_restore_service,
+    get_restore_spool,
 )
 from app.core.enums import IncidentLevel
-from app.infrastructure.crypto.aes_gcm import encrypt
+from app.infrastructure.crypto.aes_gcm import encrypt, encrypt_chunked
 from app.infrastructure.crypto.key_store_fs import KeyMaterial
+from app.infrastructure.storage.restore_spool import RestoreSpool
 from app.main import create_app
 from app.schemas.auth import ApiKeyPrincipal
 from app.schemas.restores import RestoreRequest
@@ -59,7 +63,13 @@ class FakeRequestAuthServiceAttacker:
 
 
 class FakePolicyService:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         _ = classification
         return SimpleNamespace(
             allowed=True,
@@ -94,6 +104,29 @@ class FakeAuditService:
         return None
 
 
+class PurgingAuditService(FakeAuditService):
+    """Lets the token expire and a purge run while the audit write is in flight."""
+
+    def __init__(self, clock: MutableClock, spool: RestoreSpool, fail: bool = False) -> None:
+        self._clock = clock
+        self._spool = spool
+        self._fail = fail
+
+    async def record_restore_event(
+        self,
+        action: str,
+        backup_id: str,
+        actor_key_id: str | None,
+        actor_role: str | None,
+        status: str,
+        reason: str | None,
+    ) -> None:
+        self._clock.now = self._clock.now + timedelta(seconds=301)
+        await self._spool.purge_expired()
+        if self._fail:
+            raise RuntimeError('audit write failed')
+
+
 class FakeIncidentService:
     def get_current_level(self) -> IncidentLevel:
         return IncidentLevel.NORMAL
@@ -112,11 +145,24 @@ class FakeKeyStore:
 class FakeStorage:
     def __init__(self, blob: bytes) -> None:
         self._blob = blob
+        self.fetches = 0
 
     async def get_object(self, bucket: str, object_name: str) -> bytes | None:
         _ = bucket
+        self.fetches += 1
         return self._blob if object_name == 'backup-0001.bin' else None
 
+    async def get_object_range(
+        self,
+        bucket: str,
+        object_name: str,
+        first_byte: int,
+        last_byte: int,
+    ) -> bytes | None:
+        _ = bucket
+        self.fetches += 1
+        return self._blob[first_byte : last_byte + 1] if object_name == 'backup-0001.bin' else None
+
 
 class MutableClock:
     def __init__(self, now: datetime) -> None:
@@ -156,18 +202,26 @@ def _metadata_and_crypto() -> tuple[SimpleNamespace, bytes, KeyMaterial]:
 def _build_restore_service(
     ttl_seconds: int,
     token_service: RestoreAccessTokenService,
+    restore_spool: RestoreSpool | None = None,
+    crypto: tuple[SimpleNamespace, FakeStorage, KeyMaterial] | None = None,
+    audit_service: FakeAuditService | None = None,
 ) -> RestoreService:
-    metadata, ciphertext_blob, key_material = _metadata_and_crypto()
+    if crypto is None:
+        metadata, ciphertext_blob, key_material = _metadata_and_crypto()
+        crypto = (metadata, FakeStorage(ciphertext_blob), key_material)
+    metadata, storage, key_material = crypto
     return RestoreService(  # type: ignore[arg-type]
         FakeBackupsRepository(metadata),
         FakeRestoreAuthService(),  # type: ignore[arg-type]
         FakePolicyService(),  # type: ignore[arg-type]
-        FakeAuditService(),  # type: ignore[arg-type]
+        audit_service or FakeAuditService(),  # type: ignore[arg-type]
         FakeIncidentService(),  # type: ignore[arg-type]
         cast(Any, FakeSettings(ttl_seconds)),
         FakeKeyStore(key_material),  # type: ignore[arg-type]
-        FakeStorage(ciphertext_blob),  # type: ignore[arg-type]
+        storage,  # type: ignore[arg-type]
         token_service,  # type: ignore[arg-type]
+        None,
+        restore_spool,
     )
 
 
@@ -212,7 +266,7 @@ def test_successful_restore_includes_token_expiration_and_token_can_be_used() ->
 def test_expired_restore_access_token_is_denied() -> None:
     clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
     token_service = RestoreAccessTokenService(now_provider=clock)
-    record = token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=60)
+    record = asyncio.run(token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=60))
     app = create_app()
     _override_restore_request_auth(app)
     app.dependency_overrides[get_restore_access_token_service] = lambda: token_service
@@ -232,7 +286,9 @@ def test_expired_restore_access_token_is_denied() -> None:
 def test_restore_access_token_cannot_be_used_by_different_principal() -> None:
     clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
     token_service = RestoreAccessTokenService(now_provider=clock)
-    record = token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=300)
+    record = asyncio.run(
+        token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=300),
+    )
     app = create_app()
     app.dependency_overrides[get_auth_service] = lambda: FakeRequestAuthServiceAttacker()
     app.dependency_overrides[get_restore_access_token_service] = lambda: token_service
@@ -251,12 +307,12 @@ def test_restore_access_token_cannot_be_used_by_different_principal() -> None:
 def test_expired_records_are_purged_on_new_token_issue() -> None:
     clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
     token_service = RestoreAccessTokenService(now_provider=clock)
-    token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=1)
+    asyncio.run(token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=1))
 
     clock.now = clock.now + timedelta(seconds=2)
-    token_service.issue_token('backup-0002', 'admin-key', ttl_seconds=60)
+    asyncio.run(token_service.issue_token('backup-0002', 'admin-key', ttl_seconds=60))
 
-    assert token_service.active_record_count() == 1
+    assert asyncio.run(token_service.active_record_count()) == 1
 
 
 def test_ttl_configuration_change_affects_newly_issued_restore_tokens() -> None:
@@ -295,3 +351,178 @@ def test_ttl_configuration_change_affects_newly_issued_restore_tokens() -> None:
     assert issued_short['restore_token_expires_at'] == '2026-02-26T13:01:00+00:00'
     assert issued_long['restore_token_ttl_seconds'] == 600
     assert issued_long['restore_token_expires_at'] == '2026-02-26T13:20:00+00:00'
+
+
+def test_restored_content_is_served_from_spool_without_refetching_backup(
+    tmp_path: Path,
+) -> None:
+    clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
+    token_service = RestoreAccessTokenService(now_provider=clock)
+    spool = RestoreSpool(tmp_path, now_provider=clock)
+    metadata, ciphertext_blob, key_material = _metadata_and_crypto()
+    storage = FakeStorage(ciphertext_blob)
+    restore_service = _build_restore_service(
+        ttl_seconds=300,
+        token_service=token_service,
+        restore_spool=spool,
+        crypto=(metadata, storage, key_material),
+    )
+    app = create_app()
+    _override_restore_request_auth(app)
+    app.dependency_overrides[get_restore_service] = lambda: restore_service
+    app.dependency_overrides[get_restore_access_token_service] = lambda: token_service
+    app.dependency_overrides[get_restore_spool] = lambda: spool
+    client = TestClient(app)
+
+    restore_response = client.post(
+        '/api/v1/restores',
+        json={'backup_id': 'backup-0001'},
+        headers={'X-API-Key': 'valid', 'X-MFA-Token': 'mfa:admin-key'},
+    )
+    token = restore_response.json()['data']['restore_token']
+    for _ in range(3):
+        response = client.get(
+            f'/api/v1/restores/access/{token}/content',
+            headers={'X-API-Key': 'valid'},
+        )
+        assert response.status_code == 200
+        assert response.content == b'restore-payload'
+        assert response.headers['content-length'] == str(len(b'restore-payload'))
+        assert response.headers['accept-ranges'] == 'bytes'
+        assert 'backup-0001.bin' in response.headers['content-disposition']
+    partial = client.get(
+        f'/api/v1/restores/access/{token}/content',
+        headers={'X-API-Key': 'valid', 'Range': 'bytes=8-'},
+    )
+    assert partial.status_code == 206
+    assert partial.content == b'payload'
+    assert partial.headers['content-range'] == 'bytes 8-14/15'
+
+    assert storage.fetches == 1
+    clock.now = clock.now + timedelta(seconds=301)
+    expired = client.get(
+        f'/api/v1/restores/access/{token}/content',
+        headers={'X-API-Key': 'valid'},
+    )
+    assert expired.status_code == 401
+    assert asyncio.run(spool.purge_expired()) == 1
+    assert spool.entry_count() == 0
+
+
+def test_restored_content_is_verified_again_on_spool_miss(tmp_path: Path) -> None:
+    clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
+    token_service = RestoreAccessTokenService(now_provider=clock)
+    spool = RestoreSpool(tmp_path, encrypt=False, now_provider=clock)
+    metadata, ciphertext_blob, key_material = _metadata_and_crypto()
+    storage = FakeStorage(ciphertext_blob)
+    restore_service = _build_restore_service(
+        ttl_seconds=300,
+        token_service=token_service,
+        restore_spool=spool,
+        crypto=(metadata, storage, key_material),
+    )
+    record = asyncio.run(token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=300))
+    app = create_app()
+    _override_restore_request_auth(app)
+    app.dependency_overrides[get_restore_service] = lambda: restore_service
+    app.dependency_overrides[get_restore_access_token_service] = lambda: token_service
+    app.dependency_overrides[get_restore_spool] = lambda: spool
+    client = TestClient(app)
+
+    response = client.get(
+        f'/api/v1/restores/access/{record.token}/content',
+        headers={'X-API-Key': 'valid'},
+    )
+
+    assert response.status_code == 200
+    assert response.content == b'restore-payload'
+    assert storage.fetches == 1
+    assert spool.entry_count() == 1
+
+
+def test_spool_entry_survives_expiry_during_the_audit_write(tmp_path: Path) -> None:
+    clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
+    token_service = RestoreAccessTokenService(now_provider=clock)
+    spool = RestoreSpool(tmp_path, now_provider=clock)
+    restore_service = _build_restore_service(
+        ttl_seconds=300,
+        token_service=token_service,
+        restore_spool=spool,
+        audit_service=PurgingAuditService(clock, spool),
+    )
+    record = asyncio.run(token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=300))
+    principal = ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+    async def download() -> bytes:
+        entry = await restore_service.open_restored_content(record, principal)
+        try:
+            return b''.join([chunk async for chunk in spool.iter_plaintext(entry)])
+        finally:
+            await spool.release(entry)
+
+    assert asyncio.run(download()) == b'restore-payload'
+    assert spool.entry_count() == 0
+
+
+def test_spool_entry_is_released_when_the_audit_write_fails(tmp_path: Path) -> None:
+    clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
+    token_service = RestoreAccessTokenService(now_provider=clock)
+    spool = RestoreSpool(tmp_path, now_provider=clock)
+    restore_service = _build_restore_service(
+        ttl_seconds=300,
+        token_service=token_service,
+        restore_spool=spool,
+        audit_service=PurgingAuditService(clock, spool, fail=True),
+    )
+    record = asyncio.run(token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=300))
+    principal = ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(restore_service.open_restored_content(record, principal))
+
+    assert spool.entry_count() == 0
+
+
+def test_range_request_returns_partial_content_from_chunked_backup(tmp_path: Path) -> None:
+    clock = MutableClock(datetime(2026, 2, 26, 12, 0, 0, tzinfo=UTC))
+    token_service = RestoreAccessTokenService(now_provider=clock)
+    plaintext = bytes(range(256)) * 16
+    metadata, _, key_material = _metadata_and_crypto()
+    chunked = encrypt_chunked(plaintext, key_material.key_bytes, 1024)
+    metadata.nonce = chunked.nonce_prefix.hex()
+    metadata.checksum_plaintext = sha512(plaintext).hexdigest()
+    metadata.checksum_ciphertext = sha512(chunked.blob).hexdigest()
+    metadata.chunk_size = chunked.chunk_size
+    metadata.chunk_offsets = chunked.offsets
+    metadata.original_size = len(plaintext)
+    storage = FakeStorage(chunked.blob)
+    restore_service = _build_restore_service(
+        ttl_seconds=300,
+        token_service=token_service,
+        restore_spool=RestoreSpool(tmp_path, now_provider=clock),
+        crypto=(metadata, storage, key_material),
+    )
+    record = asyncio.run(token_service.issue_token('backup-0001', 'admin-key', ttl_seconds=300))
+    app = create_app()
+    _override_restore_request_auth(app)
+    app.dependency_overrides[get_restore_service] = lambda: restore_service
+    app.dependency_overrides[get_restore_access_token_service] = lambda: token_service
+    client = TestClient(app)
+
+    partial = client.get(
+        f'/api/v1/restores/access/{record.token}/content',
+        headers={'X-API-Key': 'valid', 'Range': 'bytes=1000-1099'},
+    )
+    unsatisfiable = client.get(
+        f'/api/v1/restores/access/{record.token}/content',
+        headers={'X-API-Key': 'valid', 'Range': 'bytes=5000-'},
+    )
+
+    assert partial.status_code == 206
+    assert partial.content == plaintext[1000:1100]
+    assert partial.headers['content-range'] == 'bytes 1000-1099/4096'
+    assert partial.headers['accept-ranges'] == 'bytes'
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers['content-range'] == 'bytes */4096'
+    assert unsatisfiable.json()['error']['code'] == 'RESTORE_RANGE_NOT_SATISFIABLE'
+    assert storage.fetches == 1
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+import random
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from app.core.config import Settings
+from app.core.enums import ClassificationLevel, IncidentLevel
+from app.infrastructure.crypto.key_store_fs import KeyMaterial
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage
+from app.repositories.backups_repository import BackupsRepository
+from app.schemas.auth import ApiKeyPrincipal
+from app.schemas.backups import BackupRequest
+from app.schemas.restores import RestoreRequest
+from app.services.audit_service import AuditService
+from app.services.backup_service import BackupService
+from app.services.policy_service import BackupPolicyDecision, PolicyService
+from app.services.restore_service import RestoreIntegrityFailed, RestoreService
+
+
+class FakeBackupsRepository:
+    def __init__(self) -> None:
+        self.records: list[Any] = []
+
+    async def create_metadata(self, record: object) -> object:
+        self.records.append(record)
+        return record
+
+    async def get_by_backup_id(self, backup_id: str) -> Any | None:
+        for record in self.records:
+            if getattr(record, 'backup_id', None) == backup_id:
+                return record
+        return None
+
+    async def update_metadata(self, backup_id: str, **fields: object) -> Any | None:
+        record = await self.get_by_backup_id(backup_id)
+        if record is None:
+            return None
+        for key, value in fields.items():
+            setattr(record, key, value)
+        return record
+
+
+class FakePolicyService:
+    def evaluate_backup(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> BackupPolicyDecision:
+        return BackupPolicyDecision(
+            allowed=True,
+            reason='Backup allowed',
+            reason_category='allowed',
+            role=principal.role if principal else 'unknown',
+            classification=classification,
+        )
+
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
+        _ = classification
+        return SimpleNamespace(
+            allowed=True,
+            reason='Restore allowed',
+            reason_category='allowed',
+            role=principal.role if principal else 'unknown',
+        )
+
+
+class FakeAuditService:
+    def __init__(self) -> None:
+        self.restore_events: list[dict[str, object]] = []
+
+    async def record_policy_decision(
+        self,
+        key_id: str | None,
+        operation: str,
+        allowed: bool,
+        reason: str,
+        reason_category: str,
+        classification: str | None,
+        client_ip: str | None,
+    ) -> None:
+        return None
+
+    async def record_backup_event(
+        self,
+        action: str,
+        backup_id: str,
+        actor_key_id: str | None,
+        actor_role: str | None,
+        status: str,
+        reason: str | None,
+    ) -> None:
+        return None
+
+    async def record_restore_event(
+        self,
+        action: str,
+        backup_id: str,
+        actor_key_id: str | None,
+        actor_role: str | None,
+        status: str,
+        reason: str | None,
+    ) -> None:
+        self.restore_events.append({'action': action, 'reason': reason})
+
+
+class FakeAuthService:
+    async def validate_mfa_token(
+        self,
+        principal: ApiKeyPrincipal | None,
+        mfa_token: str | None,
+        client_ip: str | None,
+    ) -> None:
+        return None
+
+
+class FakeIncidentService:
+    def get_current_level(self) -> IncidentLevel:
+        return IncidentLevel.NORMAL
+
+
+class FakeKeyStore:
+    def __init__(self) -> None:
+        self.key_material = KeyMaterial(version_id='P-001', key_bytes=b'dedup-key-material')
+
+    def get_active_key(self) -> KeyMaterial:
+        return self.key_material
+
+    def get_key(self, version_id: str) -> KeyMaterial:
+        return self.key_material
+
+
+class CountingStorage(InMemoryObjectStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.uploaded_bytes = 0
+
+    async def put_object(self, bucket: str, object_name: str, data: bytes) -> None:
+        self.uploaded_bytes += len(data)
+        await super().put_object(bucket, object_name, data)
+
+
+PRINCIPAL = ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+
+def _nightly_dump(night: int) -> str:
+    rng = random.Random(42)
+    rows = [
+        json.dumps({'id': index, 'owner': rng.randbytes(12).hex(), 'balance': rng.random()})
+        for index in range(6000)
+    ]
+    # Each night touches a handful of rows and appends a few more.
+    for index in range(night):
+        rows[index * 997 % len(rows)] = json.dumps({'id': index, 'night': night})
+    rows.extend(json.dumps({'id': 10_000 + n, 'night': n}) for n in range(night))
+    return '\n'.join(rows)
+
+
+def _services(
+    settings: Settings,
+) -> tuple[BackupService, RestoreService, FakeBackupsRepository, CountingStorage, FakeAuditService]:
+    repository = FakeBackupsRepository()
+    storage = CountingStorage()
+    key_store = FakeKeyStore()
+    audit = FakeAuditService()
+    backup_service = BackupService(
+        cast(BackupsRepository, repository),
+        settings,
+        cast(PolicyService, FakePolicyService()),
+        cast(AuditService, audit),
+        key_store,
+        storage,
+    )
+    restore_service = RestoreService(  # type: ignore[arg-type]
+        repository,
+        FakeAuthService(),  # type: ignore[arg-type]
+        FakePolicyService(),  # type: ignore[arg-type]
+        audit,  # type: ignore[arg-type]
+        FakeIncidentService(),  # type: ignore[arg-type]
+        settings,
+        key_store,  # type: ignore[arg-type]
+        storage,
+    )
+    return backup_service, restore_service, repository, storage, audit
+
+
+async def _submit(service: BackupService, payload: str) -> str:
+    result = await service.submit_backup(
+        BackupRequest(
+            classification=ClassificationLevel.PUBLIC,
+            source_system='system-a',
+            payload=payload,
+        ),
+        PRINCIPAL,
+        None,
+    )
+    return str(result['backup_id'])
+
+
+@pytest.mark.parametrize('compression', ['none', 'zlib'])
+async def test_near_identical_backups_upload_only_changed_chunks(compression: str) -> None:
+    settings = Settings(BACKUP_DEDUP_ENABLED=True, BACKUP_COMPRESSION=compression)
+    backup_service, restore_service, repository, storage, _ = _services(settings)
+
+    first_id = await _submit(backup_service, _nightly_dump(0))
+    first_upload = storage.uploaded_bytes
+    second_id = await _submit(backup_service, _nightly_dump(5))
+    second_upload = storage.uploaded_bytes - first_upload
+
+    assert second_upload < first_upload * 0.2
+    record = await repository.get_by_backup_id(second_id)
+    assert record.storage_path == 'dedup/P-001'
+    assert record.compression == compression
+    for backup_id, payload in ((first_id, _nightly_dump(0)), (second_id, _nightly_dump(5))):
+        restored = await restore_service.load_restore_metadata(
+            RestoreRequest(backup_id=backup_id),
+            PRINCIPAL,
+            '127.0.0.1',
+            'mfa',
+        )
+        assert restored['restored_size'] == len(payload)
+
+    token_record = SimpleNamespace(backup_id=second_id, token='token')
+    payload = _nightly_dump(5).encode()
+    restored_range = await restore_service.read_restored_range(
+        token_record,
+        PRINCIPAL,
+        100_000,
+        140_000,
+    )
+    assert restored_range is not None
+    assert restored_range.content == payload[100_000:140_001]
+
+
+async def test_dedup_restore_detects_swapped_chunk() -> None:
+    settings = Settings(BACKUP_DEDUP_ENABLED=True)
+    backup_service, restore_service, repository, storage, audit = _services(settings)
+    backup_id = await _submit(backup_service, _nightly_dump(0))
+    record = await repository.get_by_backup_id(backup_id)
+    first_id, second_id = record.dedup_manifest[0][0], record.dedup_manifest[1][0]
+    bucket = settings.minio_bucket
+    swapped = await storage.get_object(bucket, f'dedup/P-001/{second_id}')
+    await storage.put_object(bucket, f'dedup/P-001/{first_id}', swapped or b'')
+
+    with pytest.raises(RestoreIntegrityFailed):
+        await restore_service.load_restore_metadata(
+            RestoreRequest(backup_id=backup_id),
+            PRINCIPAL,
+            '127.0.0.1',
+            'mfa',
+        )
+    assert audit.restore_events[-1]['reason'] == 'integrity_failed'
@@ -43,6 +43,8 @@ class FakePolicyService:
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
     ) -> BackupPolicyDecision:
         return BackupPolicyDecision(
             allowed=True,
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from sqlalchemy import Update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.core.enums import ClassificationLevel
+from app.infrastructure.crypto.key_store_fs import KeyMaterial
+from app.infrastructure.db.models.audit_log_entry import AuditLogEntryModel
+from app.infrastructure.db.models.backup_metadata import BackupMetadataModel
+from app.infrastructure.db.unit_of_work import UnitOfWork
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage, ObjectStorageError
+from app.repositories.audit_repository import AuditRepository
+from app.repositories.backups_repository import BackupsRepository
+from app.schemas.auth import ApiKeyPrincipal
+from app.schemas.backups import BackupRequest
+from app.services.audit_service import AuditService
+from app.services.backup_service import BackupPolicyDenied, BackupProcessingError, BackupService
+from app.services.policy_service import BackupPolicyDecision, PolicyService
+
+
+class _Savepoint:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class CountingSession:
+    """Just enough of AsyncSession for the backup and audit repositories."""
+
+    def __init__(self) -> None:
+        self.info: dict[str, object] = {}
+        self.added: list[Any] = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.savepoints = 0
+
+    def add(self, record: Any) -> None:
+        self.added.append(record)
+
+    async def flush(self) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    async def refresh(self, record: Any) -> None:
+        return None
+
+    def begin_nested(self) -> _Savepoint:
+        self.savepoints += 1
+        return _Savepoint()
+
+    def get_bind(self) -> Any:
+        return SimpleNamespace(dialect=SimpleNamespace(name='sqlite'))
+
+    def _backups(self) -> list[BackupMetadataModel]:
+        return [record for record in self.added if isinstance(record, BackupMetadataModel)]
+
+    async def execute(self, statement: Any, params: object = None) -> Any:
+        if isinstance(statement, Update):
+            values = dict(statement.compile().params)
+            backup_id = values.pop('backup_id_1')
+            record = next(item for item in self._backups() if item.backup_id == backup_id)
+            for key, value in values.items():
+                setattr(record, key, value)
+            return SimpleNamespace(scalar_one_or_none=lambda: record)
+        entries = [record for record in self.added if isinstance(record, AuditLogEntryModel)]
+        latest = (entries[-1].chain_index, entries[-1].entry_hash) if entries else None
+        return SimpleNamespace(first=lambda: latest)
+
+
+class FakePolicyService:
+    def __init__(self, allowed: bool = True) -> None:
+        self.allowed = allowed
+
+    def evaluate_backup(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> BackupPolicyDecision:
+        return BackupPolicyDecision(
+            allowed=self.allowed,
+            reason='Backup allowed' if self.allowed else 'Backup denied',
+            reason_category='allowed' if self.allowed else 'role_denied',
+            role=principal.role if principal else 'unknown',
+            classification=classification,
+        )
+
+
+class FakeKeyStore:
+    def get_active_key(self) -> KeyMaterial:
+        return KeyMaterial(version_id='P-001', key_bytes=b'uow-key-material')
+
+
+class FailingStorage(InMemoryObjectStorage):
+    async def put_object(self, bucket: str, object_name: str, data: bytes) -> None:
+        raise ObjectStorageError('Storage unavailable')
+
+
+PRINCIPAL = ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+
+def _service(
+    session: CountingSession,
+    unit_of_work: bool = True,
+    allowed: bool = True,
+    storage: InMemoryObjectStorage | None = None,
+) -> BackupService:
+    db = cast(AsyncSession, session)
+    return BackupService(
+        BackupsRepository(db),
+        Settings(),
+        cast(PolicyService, FakePolicyService(allowed)),
+        AuditService(AuditRepository(db)),
+        FakeKeyStore(),
+        storage or InMemoryObjectStorage(),
+        unit_of_work=UnitOfWork(db) if unit_of_work else None,
+    )
+
+
+def _request() -> BackupRequest:
+    return BackupRequest(
+        classification=ClassificationLevel.PUBLIC,
+        source_system='system-a',
+        payload='payload',
+    )
+
+
+def _audit_actions(session: CountingSession) -> list[str]:
+    return [record.action for record in session.added if isinstance(record, AuditLogEntryModel)]
+
+
+async def test_successful_backup_commits_once_before_and_once_after_upload() -> None:
+    session = CountingSession()
+
+    await _service(session).submit_backup(_request(), PRINCIPAL, '127.0.0.1')
+
+    assert session.commits == 2
+    assert session.savepoints == 3
+    assert _audit_actions(session) == [
+        'policy_decision',
+        'backup_processing_started',
+        'backup_processing_succeeded',
+    ]
+    assert session._backups()[0].status == 'ACTIVE'
+
+
+async def test_without_unit_of_work_every_write_commits() -> None:
+    session = CountingSession()
+
+    await _service(session, unit_of_work=False).submit_backup(_request(), PRINCIPAL, None)
+
+    assert session.commits == 5
+
+
+async def test_failed_upload_commits_processing_row_then_failure() -> None:
+    session = CountingSession()
+
+    with pytest.raises(BackupProcessingError):
+        await _service(session, storage=FailingStorage()).submit_backup(
+            _request(),
+            PRINCIPAL,
+            None,
+        )
+
+    assert session.commits == 2
+    assert session.rollbacks == 0
+    assert session._backups()[0].status == 'FAILED'
+    assert _audit_actions(session)[-1] == 'backup_processing_failed'
+
+
+async def test_denied_backup_commits_decision_and_denial_together() -> None:
+    session = CountingSession()
+
+    with pytest.raises(BackupPolicyDenied):
+        await _service(session, allowed=False).submit_backup(_request(), PRINCIPAL, None)
+
+    assert session.commits == 1
+    assert _audit_actions(session) == ['policy_decision', 'backup_processing_denied']
+    assert session._backups() == []
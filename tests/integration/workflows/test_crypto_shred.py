@@ -196,7 +196,13 @@ class FakeIncidentService:
 
 
 class FakePolicyService:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         _ = (principal, classification)
         return SimpleNamespace(allowed=True, reason='allowed', reason_category='allowed')
 
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import json
+import random
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from app.core.config import Settings
+from app.core.enums import ClassificationLevel, IncidentLevel
+from app.infrastructure.crypto.key_store_fs import KeyMaterial
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage
+from app.repositories.backups_repository import BackupsRepository
+from app.schemas.auth import ApiKeyPrincipal
+from app.schemas.backups import BackupRequest
+from app.schemas.restores import RestoreRequest
+from app.services.audit_service import AuditService
+from app.services.backup_service import BackupService, BackupValidationError
+from app.services.policy_service import BackupPolicyDecision, PolicyService
+from app.services.restore_service import RestoreIrreversible, RestoreService
+
+
+class FakeBackupsRepository:
+    def __init__(self) -> None:
+        self.records: list[Any] = []
+
+    async def create_metadata(self, record: object) -> object:
+        self.records.append(record)
+        return record
+
+    async def get_by_backup_id(self, backup_id: str) -> Any | None:
+        for record in self.records:
+            if getattr(record, 'backup_id', None) == backup_id:
+                return record
+        return None
+
+    async def update_metadata(self, backup_id: str, **fields: object) -> Any | None:
+        record = await self.get_by_backup_id(backup_id)
+        if record is None:
+            return None
+        for key, value in fields.items():
+            setattr(record, key, value)
+        return record
+
+
+class FakePolicyService:
+    def __init__(self, may_restore: bool = True) -> None:
+        self.may_restore = may_restore
+
+    def authorize(self, principal: ApiKeyPrincipal | None, permission: str) -> Any:
+        return SimpleNamespace(allowed=True)
+
+    def evaluate_backup(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> BackupPolicyDecision:
+        return BackupPolicyDecision(
+            allowed=True,
+            reason='Backup allowed',
+            reason_category='allowed',
+            role=principal.role if principal else 'unknown',
+            classification=classification,
+        )
+
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
+        _ = classification
+        return SimpleNamespace(
+            allowed=self.may_restore,
+            reason='Restore allowed',
+            reason_category='allowed',
+            role=principal.role if principal else 'unknown',
+        )
+
+
+class FakeAuditService:
+    def __init__(self) -> None:
+        self.restore_events: list[dict[str, object]] = []
+
+    async def record_policy_decision(
+        self,
+        key_id: str | None,
+        operation: str,
+        allowed: bool,
+        reason: str,
+        reason_category: str,
+        classification: str | None,
+        client_ip: str | None,
+    ) -> None:
+        return None
+
+    async def record_backup_event(
+        self,
+        action: str,
+        backup_id: str,
+        actor_key_id: str | None,
+        actor_role: str | None,
+        status: str,
+        reason: str | None,
+    ) -> None:
+        return None
+
+    async def record_restore_event(
+        self,
+        action: str,
+        backup_id: str,
+        actor_key_id: str | None,
+        actor_role: str | None,
+        status: str,
+        reason: str | None,
+    ) -> None:
+        self.restore_events.append({'action': action, 'reason': reason})
+
+
+class FakeAuthService:
+    async def validate_mfa_token(
+        self,
+        principal: ApiKeyPrincipal | None,
+        mfa_token: str | None,
+        client_ip: str | None,
+    ) -> None:
+        return None
+
+
+class FakeIncidentService:
+    def get_current_level(self) -> IncidentLevel:
+        return IncidentLevel.NORMAL
+
+
+class FakeKeyStore:
+    def __init__(self) -> None:
+        self.key_material = KeyMaterial(version_id='P-001', key_bytes=b'delta-key-material')
+
+    def get_active_key(self) -> KeyMaterial:
+        return self.key_material
+
+    def get_key(self, version_id: str) -> KeyMaterial:
+        return self.key_material
+
+
+class CountingStorage(InMemoryObjectStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.uploaded_bytes = 0
+
+    async def put_object(self, bucket: str, object_name: str, data: bytes) -> None:
+        self.uploaded_bytes += len(data)
+        await super().put_object(bucket, object_name, data)
+
+
+PRINCIPAL = ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+
+def _nightly_dump(night: int) -> str:
+    rng = random.Random(7)
+    rows = [
+        json.dumps({'id': index, 'owner': rng.randbytes(12).hex(), 'balance': rng.random()})
+        for index in range(6000)
+    ]
+    for index in range(night):
+        rows[index * 997 % len(rows)] = json.dumps({'id': index, 'night': night})
+    rows.extend(json.dumps({'id': 10_000 + n, 'night': n}) for n in range(night))
+    return '\n'.join(rows)
+
+
+def _services(
+    settings: Settings,
+    may_restore: bool = True,
+    audit: FakeAuditService | None = None,
+) -> tuple[BackupService, RestoreService, FakeBackupsRepository, CountingStorage]:
+    repository = FakeBackupsRepository()
+    storage = CountingStorage()
+    key_store = FakeKeyStore()
+    audit = audit or FakeAuditService()
+    restore_service = RestoreService(  # type: ignore[arg-type]
+        repository,
+        FakeAuthService(),  # type: ignore[arg-type]
+        FakePolicyService(),  # type: ignore[arg-type]
+        audit,  # type: ignore[arg-type]
+        FakeIncidentService(),  # type: ignore[arg-type]
+        settings,
+        key_store,  # type: ignore[arg-type]
+        storage,
+    )
+    backup_service = BackupService(
+        cast(BackupsRepository, repository),
+        settings,
+        cast(PolicyService, FakePolicyService(may_restore)),
+        cast(AuditService, audit),
+        key_store,
+        storage,
+        base_reader=restore_service,
+    )
+    return backup_service, restore_service, repository, storage
+
+
+async def _submit(
+    service: BackupService,
+    payload: str,
+    base_backup_id: str | None = None,
+    source_system: str = 'system-a',
+    classification: ClassificationLevel = ClassificationLevel.PUBLIC,
+) -> dict[str, object]:
+    return await service.submit_backup(
+        BackupRequest(
+            classification=classification,
+            source_system=source_system,
+            payload=payload,
+            base_backup_id=base_backup_id,
+        ),
+        PRINCIPAL,
+        None,
+    )
+
+
+async def _restored_size(restore_service: RestoreService, backup_id: str) -> object:
+    restored = await restore_service.load_restore_metadata(
+        RestoreRequest(backup_id=backup_id),
+        PRINCIPAL,
+        '127.0.0.1',
+        'mfa',
+    )
+    return restored['restored_size']
+
+
+@pytest.mark.parametrize(
+    ('compression', 'dedup', 'chunk_size'),
+    [('none', False, 65536), ('zlib', False, 0), ('zlib', True, 65536)],
+)
+async def test_incremental_chain_stores_deltas_and_restores_every_level(
+    compression: str,
+    dedup: bool,
+    chunk_size: int,
+) -> None:
+    settings = Settings(
+        BACKUP_COMPRESSION=compression,
+        BACKUP_DEDUP_ENABLED=dedup,
+        BACKUP_CHUNK_SIZE=chunk_size,
+    )
+    backup_service, restore_service, repository, storage = _services(settings)
+
+    full = await _submit(backup_service, _nightly_dump(0))
+    full_upload = storage.uploaded_bytes
+    backup_ids = [str(full['backup_id'])]
+    for night in range(1, 4):
+        result = await _submit(backup_service, _nightly_dump(night), backup_ids[-1])
+        assert result['base_backup_id'] == backup_ids[-1]
+        assert result['delta_depth'] == night
+        backup_ids.append(str(result['backup_id']))
+
+    assert storage.uploaded_bytes - full_upload < full_upload * 0.2
+    latest = await repository.get_by_backup_id(backup_ids[-1])
+    assert latest.original_size == len(_nightly_dump(3).encode())
+    for night, backup_id in enumerate(backup_ids):
+        assert await _restored_size(restore_service, backup_id) == len(_nightly_dump(night))
+    plaintext = await restore_service.restore_backup_plaintext(latest)
+    assert plaintext == _nightly_dump(3).encode()
+    token_record = SimpleNamespace(backup_id=backup_ids[-1], token='token')
+    assert await restore_service.read_restored_range(token_record, PRINCIPAL, 0, 99) is None
+
+
+async def test_chain_is_compacted_into_synthetic_full_at_max_depth() -> None:
+    settings = Settings(BACKUP_MAX_DELTA_DEPTH=2)
+    backup_service, restore_service, repository, _ = _services(settings)
+
+    previous = str((await _submit(backup_service, _nightly_dump(0)))['backup_id'])
+    depths = []
+    for night in range(1, 5):
+        result = await _submit(backup_service, _nightly_dump(night), previous)
+        depths.append(result['delta_depth'])
+        previous = str(result['backup_id'])
+
+    assert depths == [1, 2, 0, 1]
+    compacted = repository.records[3]
+    assert compacted.base_backup_id is None
+    assert compacted.delta_size is None
+    assert await _restored_size(restore_service, previous) == len(_nightly_dump(4))
+
+
+async def test_unrelated_payload_is_stored_in_full() -> None:
+    backup_service, _, repository, _ = _services(Settings())
+    base_id = str((await _submit(backup_service, _nightly_dump(0)))['backup_id'])
+
+    result = await _submit(backup_service, random.Random(3).randbytes(40_000).hex(), base_id)
+
+    assert result['base_backup_id'] is None
+    assert repository.records[-1].base_backup_id is None
+
+
+@pytest.mark.parametrize(
+    ('classification', 'may_restore'),
+    [(ClassificationLevel.INTERNAL, True), (ClassificationLevel.PUBLIC, False)],
+)
+async def test_base_the_caller_may_not_restore_as_is_falls_back_to_full(
+    classification: ClassificationLevel,
+    may_restore: bool,
+) -> None:
+    backup_service, _, repository, _ = _services(Settings(), may_restore=may_restore)
+    base_id = str((await _submit(backup_service, _nightly_dump(0)))['backup_id'])
+
+    result = await _submit(
+        backup_service,
+        _nightly_dump(1),
+        base_id,
+        classification=classification,
+    )
+
+    assert result['base_backup_id'] is None
+    assert repository.records[-1].base_backup_id is None
+    assert result['delta_depth'] == 0
+
+
+@pytest.mark.parametrize(
+    ('base_backup_id', 'source_system', 'status', 'message'),
+    [
+        ('missing', 'system-a', 'ACTIVE', 'Base backup not found'),
+        (None, 'system-b', 'ACTIVE', 'Base backup belongs to a different source system'),
+        (None, 'system-a', 'FAILED', 'Base backup is not active'),
+    ],
+)
+async def test_invalid_base_is_rejected(
+    base_backup_id: str | None,
+    source_system: str,
+    status: str,
+    message: str,
+) -> None:
+    backup_service, _, repository, _ = _services(Settings())
+    base_id = str((await _submit(backup_service, _nightly_dump(0)))['backup_id'])
+    repository.records[0].status = status
+    records_before = len(repository.records)
+
+    with pytest.raises(BackupValidationError) as exc_info:
+        await _submit(backup_service, _nightly_dump(1), base_backup_id or base_id, source_system)
+
+    assert exc_info.value.details[0]['loc'] == ['body', 'base_backup_id']
+    assert exc_info.value.details[0]['msg'] == message
+    assert len(repository.records) == records_before
+
+
+async def test_shredded_base_makes_delta_irreversible() -> None:
+    audit = FakeAuditService()
+    backup_service, restore_service, repository, _ = _services(Settings(), audit=audit)
+    base_id = str((await _submit(backup_service, _nightly_dump(0)))['backup_id'])
+    delta_id = str((await _submit(backup_service, _nightly_dump(1), base_id))['backup_id'])
+    repository.records[0].status = 'IRREVERSIBLE'
+
+    with pytest.raises(RestoreIrreversible) as exc_info:
+        await _restored_size(restore_service, delta_id)
+
+    assert exc_info.value.reason_category == 'base_irreversible'
+    assert audit.restore_events[-1] == {
+        'action': 'restore_restricted_blocked',
+        'reason': 'base_irreversible',
+    }
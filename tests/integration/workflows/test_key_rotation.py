@@ -153,6 +153,8 @@ class FakePolicyService:
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
     ) -> Any:
         _ = (principal, classification)
         return SimpleNamespace(
@@ -161,7 +163,13 @@ class FakePolicyService:
             reason_category='allowed',
         )
 
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         _ = (principal, classification)
         return SimpleNamespace(
             allowed=True,
@@ -7,14 +7,16 @@ from typing import Any, cast
 import pytest
 
 from app.core.enums import IncidentLevel
-from app.infrastructure.crypto.aes_gcm import encrypt
+from app.infrastructure.crypto.aes_gcm import encrypt, encrypt_chunked
 from app.infrastructure.crypto.key_store_fs import KeyMaterial
-from app.infrastructure.storage.minio_client import ObjectStorageError
+from app.infrastructure.storage.compression import get_compressor
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage, ObjectStorageError
 from app.schemas.auth import ApiKeyPrincipal
 from app.schemas.restores import RestoreRequest
 from app.services.restore_service import (
     RestoreExecutionUnavailable,
     RestoreIntegrityFailed,
+    RestoreRangeNotSatisfiable,
     RestoreService,
 )
 
@@ -42,7 +44,13 @@ class FakeAuthService:
 
 
 class FakePolicyService:
-    def evaluate_restore(self, principal: ApiKeyPrincipal | None, classification: object) -> Any:
+    def evaluate_restore(
+        self,
+        principal: ApiKeyPrincipal | None,
+        classification: object,
+        incident_level: object = None,
+        mfa_verified: bool = False,
+    ) -> Any:
         _ = classification
         return SimpleNamespace(
             allowed=True,
@@ -130,6 +138,27 @@ class FailingStorage:
         raise ObjectStorageError('Storage unavailable')
 
 
+class RecordingStorage(InMemoryObjectStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.full_reads = 0
+        self.ranges: list[tuple[int, int]] = []
+
+    async def get_object(self, bucket: str, object_name: str) -> bytes | None:
+        self.full_reads += 1
+        return await super().get_object(bucket, object_name)
+
+    async def get_object_range(
+        self,
+        bucket: str,
+        object_name: str,
+        first_byte: int,
+        last_byte: int,
+    ) -> bytes | None:
+        self.ranges.append((first_byte, last_byte))
+        return await super().get_object_range(bucket, object_name, first_byte, last_byte)
+
+
 class FakeSettings:
     minio_bucket = 'unit-test'
 
@@ -281,3 +310,156 @@ async def test_restore_invalid_metadata_classification_is_fail_secure() -> None:
 
     assert audit.restore_events[-1]['action'] == 'restore_failed'
     assert audit.restore_events[-1]['reason'] == 'invalid_metadata_classification'
+
+
+async def _chunked_backup(
+    plaintext: bytes,
+    key_material: KeyMaterial,
+    compression: str = 'none',
+) -> tuple[SimpleNamespace, RecordingStorage]:
+    chunked = encrypt_chunked(
+        plaintext,
+        key_material.key_bytes,
+        1024,
+        compress=get_compressor(compression, 6),
+    )
+    storage = RecordingStorage()
+    await storage.put_object('unit-test', 'backup-0001.bin', chunked.blob)
+    metadata = _build_metadata(chunked.blob, plaintext)
+    metadata.nonce = chunked.nonce_prefix.hex()
+    metadata.chunk_size = chunked.chunk_size
+    metadata.chunk_offsets = chunked.offsets
+    metadata.original_size = len(plaintext)
+    metadata.compression = compression
+    return metadata, storage
+
+
+@pytest.mark.asyncio
+async def test_chunked_backup_restores_and_verifies_integrity() -> None:
+    plaintext = bytes(range(256)) * 20
+    key_material = KeyMaterial(version_id='P-001', key_bytes=b'restore-key-material')
+    metadata, storage = await _chunked_backup(plaintext, key_material)
+    audit = FakeAuditService()
+    service = _build_service(metadata, storage, FakeKeyStore(key_material), audit)
+
+    result = await service.load_restore_metadata(
+        RestoreRequest(backup_id='backup-0001'),
+        ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT'),
+        '127.0.0.1',
+        'mfa:admin-key',
+    )
+
+    assert result['status'] == 'restore_completed'
+    assert result['restored_size'] == len(plaintext)
+
+
+@pytest.mark.asyncio
+async def test_range_read_fetches_and_decrypts_only_covering_chunks() -> None:
+    plaintext = bytes(range(256)) * 20
+    key_material = KeyMaterial(version_id='P-001', key_bytes=b'restore-key-material')
+    metadata, storage = await _chunked_backup(plaintext, key_material)
+    audit = FakeAuditService()
+    service = _build_service(metadata, storage, FakeKeyStore(key_material), audit)
+    token_record = SimpleNamespace(backup_id='backup-0001', token='token')
+    principal = ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT')
+
+    middle = await service.read_restored_range(token_record, principal, 1500, 2100)
+    suffix = await service.read_restored_range(token_record, principal, None, 100)
+    open_ended = await service.read_restored_range(token_record, principal, 5000, None)
+
+    assert middle is not None and middle.content == plaintext[1500:2101]
+    assert (middle.first_byte, middle.last_byte, middle.total_size) == (1500, 2100, 5120)
+    assert suffix is not None and suffix.content == plaintext[-100:]
+    assert open_ended is not None and open_ended.content == plaintext[5000:]
+    offsets = metadata.chunk_offsets
+    assert storage.ranges[0] == (offsets[1], offsets[3] - 1)
+    assert storage.full_reads == 0
+    assert audit.restore_events[0]['reason'] == 'bytes=1500-2100'
+    with pytest.raises(RestoreRangeNotSatisfiable):
+        await service.read_restored_range(token_record, principal, 5120, None)
+
+
+@pytest.mark.asyncio
+async def test_range_read_detects_tampered_chunk() -> None:
+    plaintext = bytes(range(256)) * 20
+    key_material = KeyMaterial(version_id='P-001', key_bytes=b'restore-key-material')
+    metadata, storage = await _chunked_backup(plaintext, key_material)
+    blob = bytearray(await storage.get_object('unit-test', 'backup-0001.bin') or b'')
+    blob[metadata.chunk_offsets[2] + 3] ^= 0x01
+    await storage.put_object('unit-test', 'backup-0001.bin', bytes(blob))
+    audit = FakeAuditService()
+    service = _build_service(metadata, storage, FakeKeyStore(key_material), audit)
+    token_record = SimpleNamespace(backup_id='backup-0001', token='token')
+
+    assert await service.read_restored_range(token_record, None, 0, 1023) is not None
+    with pytest.raises(RestoreIntegrityFailed):
+        await service.read_restored_range(token_record, None, 2048, 2048)
+    assert audit.restore_events[-1]['reason'] == 'integrity_failed'
+
+
+@pytest.mark.asyncio
+async def test_range_read_is_not_offered_for_single_frame_backups() -> None:
+    plaintext = b'secret restore payload'
+    key_material = KeyMaterial(version_id='P-001', key_bytes=b'restore-key-material')
+    encrypted = encrypt(plaintext, key_material.key_bytes)
+    ciphertext_blob = encrypted.nonce + encrypted.tag + encrypted.ciphertext
+    service = _build_service(
+        _build_metadata(ciphertext_blob, plaintext),
+        FakeStorage(ciphertext_blob),
+        FakeKeyStore(key_material),
+        FakeAuditService(),
+    )
+    token_record = SimpleNamespace(backup_id='backup-0001', token='token')
+
+    assert await service.read_restored_range(token_record, None, 0, 3) is None
+
+
+@pytest.mark.asyncio
+async def test_compressed_chunked_backup_restores_whole_and_by_range() -> None:
+    plaintext = b'INSERT INTO backups VALUES (1, "system-a");\n' * 200
+    key_material = KeyMaterial(version_id='P-001', key_bytes=b'restore-key-material')
+    metadata, storage = await _chunked_backup(plaintext, key_material, compression='zlib')
+    service = _build_service(metadata, storage, FakeKeyStore(key_material), FakeAuditService())
+    token_record = SimpleNamespace(backup_id='backup-0001', token='token')
+
+    result = await service.load_restore_metadata(
+        RestoreRequest(backup_id='backup-0001'),
+        ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT'),
+        '127.0.0.1',
+        'mfa:admin-key',
+    )
+    restored_range = await service.read_restored_range(token_record, None, 3000, 6000)
+
+    assert metadata.chunk_offsets[-1] * 5 < len(plaintext)
+    assert result['restored_size'] == len(plaintext)
+    assert restored_range is not None
+    assert restored_range.content == plaintext[3000:6001]
+
+
+@pytest.mark.asyncio
+async def test_compressed_single_frame_backup_restores() -> None:
+    plaintext = b'{"setting": "value"}\n' * 200
+    key_material = KeyMaterial(version_id='P-001', key_bytes=b'restore-key-material')
+    compress = get_compressor('zlib', 6)
+    assert compress is not None
+    encrypted = encrypt(compress(plaintext), key_material.key_bytes)
+    ciphertext_blob = encrypted.nonce + encrypted.tag + encrypted.ciphertext
+    metadata = _build_metadata(ciphertext_blob, plaintext)
+    metadata.compression = 'zlib'
+    metadata.original_size = len(plaintext)
+    service = _build_service(
+        metadata,
+        FakeStorage(ciphertext_blob),
+        FakeKeyStore(key_material),
+        FakeAuditService(),
+    )
+
+    result = await service.load_restore_metadata(
+        RestoreRequest(backup_id='backup-0001'),
+        ApiKeyPrincipal(key_id='admin-key', role='admin', department='IT'),
+        '127.0.0.1',
+        'mfa:admin-key',
+    )
+
+    assert result['status'] == 'restore_completed'
+    assert result['restored_size'] == len(plaintext)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+
+from app.core.logging import DroppingQueueHandler, JsonFormatter
+from app.core.request_context import key_id_var, request_id_var
+
+
+def _record(message: str, *args: object, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord('app.test', logging.INFO, __file__, 1, message, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_emits_request_fields_and_extras() -> None:
+    record = _record(
+        'Request completed',
+        request_id='req-1',
+        key_id='key-1',
+        route='/api/v1/backups',
+        latency_ms=1.5,
+    )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload['message'] == 'Request completed'
+    assert payload['level'] == 'INFO'
+    assert payload['request_id'] == 'req-1'
+    assert payload['key_id'] == 'key-1'
+    assert payload['route'] == '/api/v1/backups'
+    assert payload['latency_ms'] == 1.5
+
+
+def test_queue_handler_captures_context_and_defers_formatting() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=10)
+    handler = DroppingQueueHandler(log_queue)
+    request_token = request_id_var.set('req-2')
+    key_token = key_id_var.set('key-2')
+    try:
+        handler.handle(_record('Auth failure for %s', 'abcd1234'))
+    finally:
+        request_id_var.reset(request_token)
+        key_id_var.reset(key_token)
+
+    queued = log_queue.get_nowait()
+    assert queued.msg == 'Auth failure for abcd1234'
+    assert queued.args is None
+    assert queued.request_id == 'req-2'  # type: ignore[attr-defined]
+    assert queued.key_id == 'key-2'  # type: ignore[attr-defined]
+
+
+def test_queue_handler_drops_and_counts_when_full() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+
+    for index in range(5):
+        handler.handle(_record('event %s', index))
+
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 3
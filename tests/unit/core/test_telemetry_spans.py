@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.telemetry import configure_telemetry
+from app.core.tracing import (
+    RequestTrace,
+    annotate_span,
+    set_span_backend,
+    start_trace,
+    trace_span,
+    traced,
+)
+from app.main import create_app
+
+
+class FakeSpanBackend:
+    def __init__(self) -> None:
+        self.started: list[tuple[str, dict[str, object], Mapping[str, str] | None]] = []
+        self.annotations: list[dict[str, object]] = []
+        self.open: list[str] = []
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, object],
+        carrier: Mapping[str, str] | None = None,
+    ) -> AbstractContextManager[object]:
+        self.started.append((name, dict(attributes), carrier))
+
+        @contextmanager
+        def span() -> Iterator[None]:
+            self.open.append(name)
+            try:
+                yield
+            finally:
+                self.open.remove(name)
+
+        return span()
+
+    def annotate(self, attributes: Mapping[str, object]) -> None:
+        self.annotations.append(dict(attributes))
+
+
+@pytest.fixture
+def backend() -> Iterator[FakeSpanBackend]:
+    fake = FakeSpanBackend()
+    set_span_backend(fake)
+    try:
+        yield fake
+    finally:
+        set_span_backend(None)
+
+
+@traced('audit.append')
+async def _append_with_retries() -> None:
+    for attempt in range(2):
+        annotate_span(attempts=attempt + 1)
+
+
+async def test_spans_and_attempts_reach_backend_without_request_trace(
+    backend: FakeSpanBackend,
+) -> None:
+    with trace_span('storage.upload', size=3):
+        assert backend.open == ['storage.upload']
+    await _append_with_retries()
+
+    assert [name for name, _, _ in backend.started] == ['storage.upload', 'audit.append']
+    assert backend.started[0][1] == {'size': 3}
+    assert backend.annotations == [{'attempts': 1}, {'attempts': 2}]
+    assert backend.open == []
+
+
+async def test_annotations_also_land_on_request_trace(backend: FakeSpanBackend) -> None:
+    trace = RequestTrace('req-1', 'POST', '/api/v1/backups', 'header')
+    with start_trace(trace):
+        await _append_with_retries()
+
+    assert trace.spans[0].name == 'audit.append'
+    assert trace.spans[0].attributes == {'attempts': 2}
+    assert len(backend.started) == 1
+
+
+def test_request_gets_server_span_with_carrier_and_status(backend: FakeSpanBackend) -> None:
+    client = TestClient(create_app())
+    traceparent = '00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01'
+
+    response = client.get('/api/v1/health/live', headers={'traceparent': traceparent})
+
+    assert response.status_code == 200
+    name, attributes, carrier = backend.started[0]
+    assert name == 'GET /api/v1/health/live'
+    assert attributes['ssbg.request_id'] == response.headers['X-Request-ID']
+    assert carrier is not None
+    assert carrier['traceparent'] == traceparent
+    assert {'http.response.status_code': 200} in backend.annotations
+
+
+def test_disabled_telemetry_installs_nothing() -> None:
+    assert configure_telemetry(Settings(TELEMETRY_ENABLED=False)) is False
+
+
+def test_unknown_exporter_is_rejected() -> None:
+    settings = Settings(TELEMETRY_ENABLED=True, TELEMETRY_EXPORTER='zipkin')
+
+    with pytest.raises(ValueError, match='zipkin'):
+        configure_telemetry(settings)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from app.core.profiling import StackSampler
+from app.core.tracing import (
+    RequestTrace,
+    TraceStore,
+    collapsed_stacks,
+    speedscope_profile,
+    start_trace,
+    trace_span,
+    traced_methods,
+)
+
+
+@traced_methods('repository.fake')
+class FakeRepository:
+    async def get(self, key: str) -> str:
+        with trace_span('db.query', key=key):
+            await asyncio.sleep(0)
+        return key
+
+    async def _private(self) -> None:
+        return None
+
+
+def _trace() -> RequestTrace:
+    return RequestTrace(request_id='req-1', method='POST', path='/api/v1/backups', trigger='header')
+
+
+async def test_spans_nest_under_their_parent_even_when_gathered() -> None:
+    trace = _trace()
+    repository = FakeRepository()
+    with start_trace(trace):
+        with trace_span('backup.submit'):
+            await asyncio.gather(repository.get('a'), repository.get('b'))
+    trace.finish(200)
+
+    names = [(span.name, span.parent) for span in trace.spans]
+    assert names[0] == ('backup.submit', None)
+    repository_spans = [
+        index for index, span in enumerate(trace.spans) if span.name == 'repository.fake.get'
+    ]
+    assert len(repository_spans) == 2
+    assert all(trace.spans[index].parent == 0 for index in repository_spans)
+    queries = [span for span in trace.spans if span.name == 'db.query']
+    assert sorted(span.parent for span in queries) == repository_spans
+    assert {span.attributes['key'] for span in queries} == {'a', 'b'}
+    assert all(span.end_ns is not None for span in trace.spans)
+
+
+async def test_untraced_calls_record_nothing() -> None:
+    repository = FakeRepository()
+    assert await repository.get('a') == 'a'
+    with trace_span('ignored'):
+        pass
+    assert hasattr(FakeRepository.get, '__wrapped__')
+    assert not hasattr(FakeRepository._private, '__wrapped__')
+
+
+def test_self_times_feed_collapsed_and_speedscope_exports() -> None:
+    trace = _trace()
+    with start_trace(trace):
+        with trace_span('crypto.encrypt'):
+            time.sleep(0.002)
+            with trace_span('storage.upload'):
+                time.sleep(0.002)
+    trace.finish(200)
+
+    stacks = trace.self_times()
+    assert stacks[('request', 'crypto.encrypt', 'storage.upload')] >= 2000
+    assert stacks[('request', 'crypto.encrypt')] >= 2000
+    assert sum(stacks.values()) <= trace.duration_ns // 1000
+
+    folded = collapsed_stacks(stacks)
+    assert 'request;crypto.encrypt;storage.upload ' in folded
+
+    profile = speedscope_profile('trace', stacks, 'microseconds')
+    frames = [frame['name'] for frame in profile['shared']['frames']]  # type: ignore[index]
+    sampled = profile['profiles'][0]  # type: ignore[index]
+    assert frames[:3] == ['request', 'crypto.encrypt', 'storage.upload']
+    assert len(sampled['samples']) == len(sampled['weights'])
+    assert sampled['endValue'] == sum(sampled['weights'])
+
+
+def test_trace_store_keeps_most_recent_traces() -> None:
+    store = TraceStore(capacity=2)
+    for index in range(3):
+        store.add(RequestTrace(f'req-{index}', 'GET', '/', 'sampled'))
+
+    assert store.get('req-0') is None
+    assert [trace.request_id for trace in store.recent(10)] == ['req-2', 'req-1']
+
+
+def test_stack_sampler_counts_target_thread_stacks() -> None:
+    ready = threading.Event()
+    done = threading.Event()
+
+    def busy_worker() -> None:
+        ready.set()
+        done.wait(5)
+
+    worker = threading.Thread(target=busy_worker)
+    worker.start()
+    ready.wait(5)
+    sampler = StackSampler()
+    sampler.start(target_thread_id=worker.ident)
+    sampler.stop()
+    for _ in range(3):
+        sampler.sample_once()
+    done.set()
+    worker.join()
+
+    stacks = sampler.snapshot(reset=True)
+    assert sampler.samples == 0
+    assert sum(stacks.values()) >= 3
+    assert any('busy_worker' in frame for stack in stacks for frame in stack)
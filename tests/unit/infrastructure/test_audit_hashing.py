@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from app.infrastructure.crypto.hashing import (
+    AUDIT_HASH_V1,
+    AUDIT_HASH_V2,
+    audit_entry_hash_v2,
+    audit_entry_hasher,
+)
+
+_FIELDS: dict[str, Any] = {
+    'chain_index': 7,
+    'prev_hash': 'ab' * 64,
+    'created_at': datetime(2026, 10, 19, 12, 0, 0, 123456, tzinfo=UTC),
+    'event_id': 'event-7',
+    'action': 'backup_processing_started',
+    'resource': 'backup',
+    'resource_id': 'backup-7',
+    'actor_key_id': 'admin-key',
+    'actor_role': 'admin',
+    'status': 'PROCESSING',
+    'reason': None,
+}
+
+
+def test_v2_hash_is_stable_and_differs_from_v1() -> None:
+    v2 = audit_entry_hash_v2(**_FIELDS)
+
+    assert v2 == audit_entry_hasher(AUDIT_HASH_V2)(**_FIELDS)
+    assert len(v2) == 128
+    assert v2 != audit_entry_hasher(AUDIT_HASH_V1)(**_FIELDS)
+
+
+@pytest.mark.parametrize(
+    'changes',
+    [
+        {'action': 'backup', 'resource': 'backup_processing_started'},
+        {'resource': 'backupbackup', 'resource_id': '-7'},
+        {'reason': ''},
+        {'status': None},
+        {'created_at': None},
+        {'created_at': datetime(2026, 10, 19, 12, 0, 0, 123457, tzinfo=UTC)},
+        {'chain_index': 8},
+    ],
+)
+def test_v2_encoding_separates_field_boundaries_and_nulls(changes: dict[str, Any]) -> None:
+    assert audit_entry_hash_v2(**{**_FIELDS, **changes}) != audit_entry_hash_v2(**_FIELDS)
+
+
+def test_v2_hash_is_independent_of_timezone_representation() -> None:
+    local = _FIELDS['created_at'].astimezone(datetime.now().astimezone().tzinfo)
+
+    assert audit_entry_hash_v2(**{**_FIELDS, 'created_at': local}) == audit_entry_hash_v2(
+        **_FIELDS,
+    )
+
+
+def test_v2_hash_treats_naive_timestamps_as_utc() -> None:
+    naive = _FIELDS['created_at'].replace(tzinfo=None)
+
+    assert audit_entry_hash_v2(**{**_FIELDS, 'created_at': naive}) == audit_entry_hash_v2(
+        **_FIELDS,
+    )
+
+
+def test_unknown_hash_version_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        audit_entry_hasher(99)
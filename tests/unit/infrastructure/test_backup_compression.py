@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from app.infrastructure.storage.compression import (
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    COMPRESSION_ZSTD,
+    CompressionError,
+    get_compressor,
+    get_decompressor,
+    worth_compressing,
+)
+
+PAYLOAD = b'INSERT INTO backups VALUES (1, "system-a", "ACTIVE");\n' * 500
+
+
+def test_none_has_no_codec() -> None:
+    assert get_compressor(COMPRESSION_NONE, 6) is None
+    assert get_decompressor(COMPRESSION_NONE) is None
+    assert get_decompressor(None) is None
+
+
+def test_zlib_round_trip_is_bounded_by_the_expected_size() -> None:
+    compress = get_compressor(COMPRESSION_ZLIB, 6)
+    decompress = get_decompressor(COMPRESSION_ZLIB)
+    assert compress is not None and decompress is not None
+
+    compressed = compress(PAYLOAD)
+
+    assert len(compressed) * 5 < len(PAYLOAD)
+    assert decompress(compressed, len(PAYLOAD)) == PAYLOAD
+    with pytest.raises(CompressionError):
+        decompress(compressed, len(PAYLOAD) - 1)
+    with pytest.raises(CompressionError):
+        decompress(compressed[:-4], len(PAYLOAD))
+
+
+def test_zstd_round_trip() -> None:
+    pytest.importorskip('zstandard')
+    compress = get_compressor(COMPRESSION_ZSTD, 3)
+    decompress = get_decompressor(COMPRESSION_ZSTD)
+    assert compress is not None and decompress is not None
+
+    assert decompress(compress(PAYLOAD), len(PAYLOAD)) == PAYLOAD
+
+
+def test_adaptive_sampling_skips_incompressible_data() -> None:
+    compress = get_compressor(COMPRESSION_ZLIB, 6)
+    assert compress is not None
+
+    assert worth_compressing(PAYLOAD, compress)
+    assert not worth_compressing(os.urandom(64 * 1024), compress)
+    assert not worth_compressing(b'', compress)
+
+
+def test_unknown_algorithm_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_compressor('lz77', 6)
+    with pytest.raises(ValueError):
+        get_decompressor('lz77')
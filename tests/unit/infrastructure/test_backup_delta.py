@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.infrastructure.storage.delta import DELTA_MAGIC, DeltaError, apply_delta, compute_delta
+from app.infrastructure.storage.offload import run_cpu_bound, shutdown_process_pool
+
+
+def _data(size: int, seed: int = 11) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def test_delta_of_edited_payload_is_small_and_round_trips() -> None:
+    base = _data(400_000)
+    target = base[:50_000] + b'inserted row' * 20 + base[50_000:300_000] + base[310_000:]
+
+    delta = compute_delta(base, target, 1024, 4096, 32768)
+
+    assert len(delta) < len(target) // 10
+    assert apply_delta(base, delta, len(target)) == target
+
+
+async def test_large_delta_is_computed_in_a_worker_process() -> None:
+    base = _data(400_000)
+    target = base[:200_000] + b'appended' + base[200_000:]
+
+    try:
+        delta = await run_cpu_bound(
+            len(base) + len(target),
+            compute_delta,
+            base,
+            target,
+            1024,
+            4096,
+            32768,
+        )
+    finally:
+        shutdown_process_pool()
+
+    assert delta == compute_delta(base, target, 1024, 4096, 32768)
+
+
+def test_delta_against_unrelated_base_is_all_literal() -> None:
+    base = _data(50_000, seed=1)
+    target = _data(50_000, seed=2)
+
+    delta = compute_delta(base, target, 1024, 4096, 32768)
+
+    assert len(target) < len(delta) < len(target) + 64
+    assert apply_delta(base, delta, len(target)) == target
+
+
+def test_empty_target_round_trips() -> None:
+    delta = compute_delta(_data(10_000), b'', 1024, 4096, 32768)
+
+    assert delta == DELTA_MAGIC
+    assert apply_delta(b'', delta, 0) == b''
+
+
+@pytest.mark.parametrize(
+    'mutate',
+    [
+        lambda delta: b'XXXXXX' + delta[6:],
+        lambda delta: delta[:-1],
+        lambda delta: delta + b'\x09',
+    ],
+)
+def test_malformed_delta_is_rejected(mutate: object) -> None:
+    base = _data(40_000)
+    target = base[:20_000] + b'changed' + base[20_000:]
+    delta = compute_delta(base, target, 1024, 4096, 32768)
+
+    with pytest.raises(DeltaError):
+        apply_delta(base, mutate(delta), len(target))  # type: ignore[operator]
+
+
+def test_copy_outside_base_and_oversized_output_are_rejected() -> None:
+    base = _data(40_000)
+    delta = compute_delta(base, base, 1024, 4096, 32768)
+
+    with pytest.raises(DeltaError):
+        apply_delta(base[:1000], delta, len(base))
+    with pytest.raises(DeltaError):
+        apply_delta(base, delta, len(base) - 1)
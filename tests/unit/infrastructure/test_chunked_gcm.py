@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from app.infrastructure.crypto.aes_gcm import (
+    GCM_TAG_SIZE,
+    chunk_span,
+    decrypt_chunk,
+    decrypt_chunks,
+    encrypt_chunked,
+)
+
+KEY = b'chunked-key-material'
+
+
+@pytest.mark.parametrize('size', [0, 1, 4095, 4096, 4097, 3 * 4096 + 5])
+def test_chunked_round_trip_and_offset_index(size: int) -> None:
+    plaintext = os.urandom(size)
+
+    result = encrypt_chunked(plaintext, KEY, 4096)
+
+    chunks = max(1, -(-size // 4096))
+    assert len(result.offsets) == chunks + 1
+    assert result.offsets[-1] == len(result.blob) == size + chunks * GCM_TAG_SIZE
+    assert decrypt_chunks(result.blob, KEY, result.nonce_prefix, result.offsets) == plaintext
+
+
+def test_single_chunk_decrypts_from_its_offsets() -> None:
+    plaintext = os.urandom(3 * 4096)
+    result = encrypt_chunked(plaintext, KEY, 4096)
+    offsets = result.offsets
+
+    frame = result.blob[offsets[1] : offsets[2]]
+
+    assert decrypt_chunk(frame, KEY, result.nonce_prefix, 1, False) == plaintext[4096:8192]
+    assert (
+        decrypt_chunks(result.blob[offsets[1] :], KEY, result.nonce_prefix, offsets, 1)
+        == plaintext[4096:]
+    )
+
+
+def test_reordered_or_truncated_chunks_are_rejected() -> None:
+    result = encrypt_chunked(os.urandom(2 * 4096), KEY, 4096)
+    offsets = result.offsets
+    first = result.blob[offsets[0] : offsets[1]]
+    second = result.blob[offsets[1] : offsets[2]]
+
+    with pytest.raises(InvalidTag):
+        decrypt_chunk(second, KEY, result.nonce_prefix, 0, False)
+    with pytest.raises(InvalidTag):
+        # A blob cut after the first chunk must not pass as complete.
+        decrypt_chunk(first, KEY, result.nonce_prefix, 0, True)
+
+
+def test_chunk_span_maps_inclusive_byte_range_to_chunks() -> None:
+    assert chunk_span(0, 0, 4096) == (0, 0)
+    assert chunk_span(4095, 4096, 4096) == (0, 1)
+    assert chunk_span(10_000, 20_000, 4096) == (2, 4)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from app.infrastructure.crypto.convergent import (
+    chunk_id,
+    derive_convergent_keys,
+    open_chunk,
+    seal_chunk,
+)
+from app.infrastructure.storage.chunking import cdc_boundaries, slice_chunks, split_chunks
+from app.infrastructure.storage.offload import (
+    PROCESS_OFFLOAD_MIN_SIZE,
+    run_cpu_bound,
+    shutdown_process_pool,
+)
+
+
+def _data(size: int, seed: int = 7) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def test_boundaries_cover_data_within_size_limits() -> None:
+    data = _data(300_000)
+
+    boundaries = cdc_boundaries(data, 1024, 4096, 16384)
+
+    assert boundaries[-1] == len(data)
+    sizes = [end - start for start, end in zip([0, *boundaries], boundaries, strict=False)]
+    assert all(1024 < size <= 16384 for size in sizes[:-1])
+    assert 2048 < sum(sizes) / len(sizes) < 8192
+
+
+def test_insert_only_changes_chunks_around_the_edit() -> None:
+    data = _data(300_000)
+    edited = data[:150_000] + b'inserted bytes' + data[150_000:]
+
+    original = split_chunks(data, 1024, 4096, 16384)
+    changed = split_chunks(edited, 1024, 4096, 16384)
+
+    assert b''.join(changed) == edited
+    assert len(set(original) & set(changed)) >= len(original) - 2
+
+
+def test_small_and_empty_inputs() -> None:
+    assert cdc_boundaries(b'', 1024, 4096, 16384) == []
+    assert split_chunks(b'abc', 1024, 4096, 16384) == [b'abc']
+    with pytest.raises(ValueError):
+        cdc_boundaries(b'abc', 4096, 1024, 16384)
+
+
+def test_convergent_sealing_is_deterministic_per_key_and_scope() -> None:
+    keys = derive_convergent_keys(b'data-key', 'system-a\x00none')
+    other_scope = derive_convergent_keys(b'data-key', 'system-b\x00none')
+    chunk = b'nightly dump chunk'
+
+    identifier = chunk_id(keys, chunk)
+
+    assert seal_chunk(keys, identifier, chunk) == seal_chunk(keys, identifier, chunk)
+    assert chunk_id(other_scope, chunk) != identifier
+    assert open_chunk(keys, identifier, seal_chunk(keys, identifier, chunk)) == chunk
+    with pytest.raises(InvalidTag):
+        open_chunk(other_scope, identifier, seal_chunk(keys, identifier, chunk))
+
+
+async def test_large_inputs_are_chunked_in_a_worker_process() -> None:
+    data = _data(PROCESS_OFFLOAD_MIN_SIZE + 1)
+
+    try:
+        boundaries = await run_cpu_bound(len(data), cdc_boundaries, data, 1024, 4096, 16384)
+    finally:
+        shutdown_process_pool()
+
+    assert boundaries == cdc_boundaries(data, 1024, 4096, 16384)
+    assert b''.join(slice_chunks(data, boundaries)) == data
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.tracing import RequestTrace, start_trace
+from app.infrastructure.db.instrumentation import instrument_engine
+
+
+def _trace() -> RequestTrace:
+    return RequestTrace('req-1', 'GET', '/api/v1/audit', 'header')
+
+
+def test_each_statement_gets_a_span_while_traced() -> None:
+    engine = create_engine('sqlite://')
+    instrument_engine(engine)
+    trace = _trace()
+
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+        with start_trace(trace):
+            connection.execute(text('select 2'))
+
+    assert [span.name for span in trace.spans] == ['db.statement']
+    span = trace.spans[0]
+    assert span.attributes['db.operation'] == 'SELECT'
+    assert span.attributes['db.statement'] == 'select 2'
+    assert span.end_ns is not None
+
+
+def test_failed_statement_closes_its_span() -> None:
+    engine = create_engine('sqlite://')
+    instrument_engine(engine)
+    trace = _trace()
+
+    with engine.connect() as connection, start_trace(trace):
+        with pytest.raises(OperationalError):
+            connection.execute(text('SELECT * FROM missing_table'))
+        connection.rollback()
+        connection.execute(text('SELECT 1'))
+
+    assert len(trace.spans) == 2
+    assert all(span.end_ns is not None for span in trace.spans)
+    assert trace.spans[1].parent is None
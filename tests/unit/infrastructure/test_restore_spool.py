@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.storage.restore_spool import (
+    SPOOL_FRAME_SIZE,
+    RestoreSpool,
+    RestoreSpoolError,
+)
+
+
+class MutableClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 10, 19, 12, 0, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _read_all(spool: RestoreSpool, token: str) -> bytes:
+    entry = await spool.get(token)
+    assert entry is not None
+    return b''.join([chunk async for chunk in spool.iter_plaintext(entry)])
+
+
+async def test_encrypted_entry_round_trips_and_is_not_plaintext_on_disk(tmp_path: Path) -> None:
+    clock = MutableClock()
+    spool = RestoreSpool(tmp_path, now_provider=clock)
+    plaintext = os.urandom(SPOOL_FRAME_SIZE * 2 + 17)
+
+    entry = await spool.put('token-1', 'backup-0001', plaintext, clock.now + timedelta(seconds=60))
+
+    assert entry.encrypted
+    assert entry.path.stat().st_mode & 0o777 == 0o600
+    assert plaintext[:64] not in entry.path.read_bytes()
+    assert await _read_all(spool, 'token-1') == plaintext
+
+
+async def test_plaintext_entry_is_stored_as_is(tmp_path: Path) -> None:
+    clock = MutableClock()
+    spool = RestoreSpool(tmp_path, encrypt=False, now_provider=clock)
+
+    entry = await spool.put('token-1', 'backup-0001', b'payload', clock.now + timedelta(seconds=60))
+
+    assert not entry.encrypted
+    assert entry.path.read_bytes() == b'payload'
+    again = await spool.put('token-1', 'backup-0001', b'other', clock.now + timedelta(seconds=60))
+    assert again is entry
+
+
+@pytest.mark.parametrize('encrypt', [True, False])
+async def test_ranges_are_read_without_the_rest_of_the_entry(tmp_path: Path, encrypt: bool) -> None:
+    clock = MutableClock()
+    spool = RestoreSpool(tmp_path, encrypt=encrypt, now_provider=clock)
+    plaintext = os.urandom(SPOOL_FRAME_SIZE * 2 + 17)
+    entry = await spool.put('token-1', 'backup-0001', plaintext, clock.now + timedelta(seconds=60))
+
+    for first_byte, last_byte in [
+        (0, 9),
+        (SPOOL_FRAME_SIZE - 5, SPOOL_FRAME_SIZE + 4),
+        (SPOOL_FRAME_SIZE * 2, SPOOL_FRAME_SIZE * 2 + 16),
+    ]:
+        content = await spool.read_range(entry, first_byte, last_byte)
+        assert content == plaintext[first_byte : last_byte + 1]
+
+
+async def test_tampered_frame_is_rejected(tmp_path: Path) -> None:
+    clock = MutableClock()
+    spool = RestoreSpool(tmp_path, now_provider=clock)
+    entry = await spool.put('token-1', 'backup-0001', b'payload', clock.now + timedelta(seconds=60))
+    data = bytearray(entry.path.read_bytes())
+    data[-1] ^= 0x01
+    entry.path.write_bytes(bytes(data))
+
+    with pytest.raises(RestoreSpoolError):
+        await _read_all(spool, 'token-1')
+    with pytest.raises(RestoreSpoolError):
+        await spool.read_range(entry, 0, 3)
+
+
+async def test_expired_entries_are_wiped_unless_still_being_read(tmp_path: Path) -> None:
+    clock = MutableClock()
+    spool = RestoreSpool(tmp_path, now_provider=clock)
+    short = await spool.put('token-1', 'backup-0001', b'a', clock.now + timedelta(seconds=10))
+    busy = await spool.put('token-2', 'backup-0002', b'b', clock.now + timedelta(seconds=10))
+    await spool.put('token-3', 'backup-0003', b'c', clock.now + timedelta(seconds=60))
+    spool.acquire(busy)
+
+    clock.now += timedelta(seconds=10)
+    assert await spool.purge_expired() == 1
+    assert not short.path.exists()
+    assert busy.path.exists()
+    assert await spool.get('token-1') is None
+
+    await spool.release(busy)
+    assert not busy.path.exists()
+    assert spool.entry_count() == 1
+
+    await spool.wipe_all()
+    assert spool.entry_count() == 0
+    assert not any(tmp_path.rglob('*.spool'))
+
+
+async def test_leftovers_from_dead_processes_are_wiped(tmp_path: Path) -> None:
+    stale_dir = tmp_path / 'pid-999999999'
+    stale_dir.mkdir()
+    (stale_dir / 'leftover.spool').write_bytes(b'secret')
+
+    RestoreSpool(tmp_path)
+
+    assert not stale_dir.exists()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_audit_service, get_auth_service
+from app.main import create_app
+from app.schemas.auth import ApiKeyPrincipal
+from app.services.auth_service import AuthFailure
+
+
+class RejectingAuthService:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+        self.calls += 1
+        raise AuthFailure('AUTH_INVALID_KEY', 'Invalid API key')
+
+
+class BrokenAuthService:
+    async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+        raise RuntimeError('database unavailable')
+
+
+class RecordingAuditService:
+    def __init__(self) -> None:
+        self.failures: list[dict[str, Any]] = []
+
+    async def record_auth_failure(
+        self,
+        key_prefix: str,
+        reason: str,
+        client_ip: str | None,
+    ) -> None:
+        self.failures.append({'key_prefix': key_prefix, 'reason': reason})
+
+
+@pytest.fixture
+def no_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail() -> None:
+        raise AssertionError('session factory must not be used')
+
+    monkeypatch.setattr('app.infrastructure.db.session.get_session_factory', _fail)
+
+
+def test_rejected_request_short_circuits_before_router(no_database: None) -> None:
+    app = create_app()
+    auth = RejectingAuthService()
+    app.dependency_overrides[get_auth_service] = lambda: auth
+    client = TestClient(app)
+
+    # The body is invalid too: a 401 proves the router never validated the request.
+    response = client.post('/api/v1/backups', headers={'X-API-Key': 'bad'}, json={})
+
+    assert response.status_code == 401
+    assert response.json() == {
+        'error': {'code': 'AUTH_INVALID_KEY', 'message': 'Invalid API key'},
+        'data': None,
+        'meta': {'request_id': response.headers['X-Request-ID']},
+    }
+    assert auth.calls == 1
+
+
+def test_unprotected_routes_skip_authentication(no_database: None) -> None:
+    app = create_app()
+    auth = RejectingAuthService()
+    app.dependency_overrides[get_auth_service] = lambda: auth
+    client = TestClient(app)
+
+    assert client.get('/api/v1/health/live').status_code == 200
+    assert client.get('/api/v1/backupsx').status_code == 404
+    assert auth.calls == 0
+
+
+def test_auth_service_error_is_audited_and_reported_unavailable(no_database: None) -> None:
+    app = create_app()
+    audit = RecordingAuditService()
+    app.dependency_overrides[get_auth_service] = lambda: BrokenAuthService()
+    app.dependency_overrides[get_audit_service] = lambda: audit
+    client = TestClient(app)
+
+    response = client.get('/api/v1/audit', headers={'X-API-Key': 'abcdefghijk'})
+
+    assert response.status_code == 401
+    assert response.json()['error']['code'] == 'AUTH_UNAVAILABLE'
+    assert audit.failures == [{'key_prefix': 'abcdefgh', 'reason': 'auth_dependency_failure'}]
+
+
+def test_api_paths_without_a_router_entry_are_refused(no_database: None) -> None:
+    app = create_app()
+    auth = RejectingAuthService()
+    app.dependency_overrides[get_auth_service] = lambda: auth
+    reached: list[bool] = []
+
+    # Mounted on the app directly, so it has no entry (and no permission) in ROUTERS.
+    @app.get('/api/v1/debug/state')
+    async def debug_state() -> dict[str, str]:
+        reached.append(True)
+        return {'state': 'open'}
+
+    response = TestClient(app).get('/api/v1/debug/state')
+
+    assert response.status_code == 404
+    assert response.json()['error']['code'] == 'NOT_FOUND'
+    assert reached == []
+    assert auth.calls == 0
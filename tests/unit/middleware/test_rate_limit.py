@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_auth_service
+from app.api.middleware.rate_limit import (
+    InMemoryRateLimiter,
+    RateLimit,
+    RateLimitConfigError,
+)
+from app.core.config import get_settings
+from app.main import create_app
+from app.schemas.auth import ApiKeyPrincipal
+from app.services.auth_service import AuthFailure
+
+
+@pytest.fixture
+def fresh_settings() -> Iterator[None]:
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingAuthService:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def authenticate(self, raw_key: str, client_ip: str | None) -> ApiKeyPrincipal:
+        self.calls += 1
+        if not raw_key.startswith('ssbg_'):
+            raise AuthFailure('AUTH_INVALID_KEY', 'Invalid API key')
+        return ApiKeyPrincipal(key_id=f'key-{raw_key}', role='admin', department='IT')
+
+
+def test_rate_limit_parse_rejects_invalid_specs() -> None:
+    assert RateLimit.parse('10/3600') == RateLimit(capacity=10, period_seconds=3600.0)
+    with pytest.raises(RateLimitConfigError):
+        RateLimit.parse('ten/minute')
+    with pytest.raises(RateLimitConfigError):
+        RateLimit.parse('0/60')
+
+
+def test_token_bucket_refills_over_time() -> None:
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(shard_count=4, clock=clock)
+    limit = RateLimit(capacity=2, period_seconds=10)
+
+    assert limiter.acquire('key:a', limit) == 0.0
+    assert limiter.acquire('key:a', limit) == 0.0
+    retry_after = limiter.acquire('key:a', limit)
+    assert retry_after == pytest.approx(5.0)
+
+    clock.now += 5.0
+    assert limiter.acquire('key:a', limit) == 0.0
+    assert limiter.acquire('key:b', limit) == 0.0
+
+
+def test_limiter_evicts_idle_buckets_when_shard_is_full() -> None:
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(shard_count=1, max_buckets_per_shard=2, clock=clock)
+    limit = RateLimit(capacity=1, period_seconds=1)
+
+    limiter.acquire('a', limit)
+    limiter.acquire('b', limit)
+    clock.now += 2.0
+    limiter.acquire('c', limit)
+
+    assert limiter.bucket_count() == 1
+
+
+def test_limiter_rejects_non_power_of_two_shards() -> None:
+    with pytest.raises(RateLimitConfigError):
+        InMemoryRateLimiter(shard_count=3)
+
+
+def test_key_quota_charged_after_authentication(
+    monkeypatch: pytest.MonkeyPatch,
+    fresh_settings: None,
+) -> None:
+    monkeypatch.setenv('RATE_LIMIT_PER_KEY', '{"default": "2/60"}')
+    app = create_app()
+    auth = CountingAuthService()
+    app.dependency_overrides[get_auth_service] = lambda: auth
+    client = TestClient(app)
+
+    statuses = [
+        client.post('/api/v1/backups', headers={'X-API-Key': 'ssbg_key'}, json={}).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses == [422, 422, 429]
+    assert auth.calls == 3
+    response = client.post(
+        '/api/v1/backups',
+        headers={'X-API-Key': 'ssbg_key', 'X-Request-ID': 'req-1'},
+        json={},
+    )
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert response.json() == {
+        'error': {'code': 'RATE_LIMITED', 'message': 'Rate limit exceeded'},
+        'data': None,
+        'meta': {'request_id': 'req-1'},
+    }
+    other_key = client.post('/api/v1/backups', headers={'X-API-Key': 'ssbg_other'}, json={})
+    assert other_key.status_code == 422
+
+
+def test_restore_submission_uses_system_wide_limit(
+    monkeypatch: pytest.MonkeyPatch,
+    fresh_settings: None,
+) -> None:
+    monkeypatch.setenv('RATE_LIMIT_GLOBAL', '{"restore_submit": "1/3600"}')
+    app = create_app()
+    app.dependency_overrides[get_auth_service] = lambda: CountingAuthService()
+    client = TestClient(app)
+
+    first = client.post('/api/v1/restores', headers={'X-API-Key': 'ssbg_a'}, json={})
+    second = client.post('/api/v1/restores', headers={'X-API-Key': 'ssbg_b'}, json={})
+    health = client.get('/api/v1/health/live')
+
+    assert first.status_code == 422
+    assert second.status_code == 429
+    assert health.status_code == 200
+
+
+def test_unauthenticated_requests_do_not_spend_restore_quotas(
+    monkeypatch: pytest.MonkeyPatch,
+    fresh_settings: None,
+) -> None:
+    monkeypatch.setenv('RATE_LIMIT_PER_KEY', '{"restore_submit": "1/3600"}')
+    monkeypatch.setenv('RATE_LIMIT_GLOBAL', '{"restore_submit": "1/3600"}')
+    app = create_app()
+    app.dependency_overrides[get_auth_service] = lambda: CountingAuthService()
+    client = TestClient(app)
+
+    rejected = [
+        client.post('/api/v1/restores', headers={'X-API-Key': 'forged'}, json={}).status_code
+        for _ in range(3)
+    ]
+    legitimate = client.post('/api/v1/restores', headers={'X-API-Key': 'ssbg_a'}, json={})
+
+    assert rejected == [401, 401, 401]
+    assert legitimate.status_code == 422
+
+
+def test_per_ip_limit_applies_before_authentication(
+    monkeypatch: pytest.MonkeyPatch,
+    fresh_settings: None,
+) -> None:
+    monkeypatch.setenv('RATE_LIMIT_PER_IP', '2/60')
+    app = create_app()
+    auth = CountingAuthService()
+    app.dependency_overrides[get_auth_service] = lambda: auth
+    client = TestClient(app)
+
+    statuses = [
+        client.get('/api/v1/audit', headers={'X-API-Key': 'forged'}).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses == [401, 401, 429]
+    assert auth.calls == 2
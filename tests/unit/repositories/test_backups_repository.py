@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.backups_repository import BackupCatalogFilters, BackupsRepository
+
+
+class RecordingSession:
+    def __init__(self, returned: object | None) -> None:
+        self.returned = returned
+        self.statements: list[Any] = []
+        self.commits = 0
+        self.info: dict[str, object] = {}
+
+    async def execute(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        return SimpleNamespace(
+            scalar_one_or_none=lambda: self.returned,
+            scalars=lambda: iter([]),
+        )
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def refresh(self, record: object) -> None:
+        raise AssertionError('update_metadata must not refresh')
+
+
+async def test_update_metadata_is_a_single_update_returning() -> None:
+    record = SimpleNamespace(backup_id='backup-0001', status='ACTIVE')
+    session = RecordingSession(record)
+    repository = BackupsRepository(cast(AsyncSession, session))
+
+    updated = await repository.update_metadata('backup-0001', status='ACTIVE', key_version='P-1')
+
+    assert updated is record
+    assert session.commits == 1
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith('UPDATE backup_metadata SET')
+    assert 'WHERE backup_metadata.backup_id = ' in sql
+    assert 'RETURNING' in sql
+
+
+async def test_update_metadata_returns_none_for_unknown_backup() -> None:
+    session = RecordingSession(None)
+    repository = BackupsRepository(cast(AsyncSession, session))
+
+    assert await repository.update_metadata('missing', status='FAILED') is None
+
+
+async def test_catalog_query_leaves_out_chunk_json_columns() -> None:
+    session = RecordingSession(None)
+    repository = BackupsRepository(cast(AsyncSession, session))
+
+    await repository.list_catalog(BackupCatalogFilters(status='ACTIVE'), limit=10)
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert 'backup_metadata.source_system' in sql
+    assert 'chunk_offsets' not in sql
+    assert 'dedup_manifest' not in sql
+
+
+class LineageSession:
+    """Answers the key-version query, then each base_backup_id lookup, in order."""
+
+    def __init__(self, batches: list[list[object]]) -> None:
+        self.batches = batches
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        batch = self.batches.pop(0) if self.batches else []
+        return SimpleNamespace(scalars=lambda: iter(batch))
+
+    async def flush(self) -> None:
+        return None
+
+
+async def test_shredding_a_base_marks_its_delta_lineage_irreversible() -> None:
+    base = SimpleNamespace(backup_id='backup-base', status='ACTIVE')
+    delta = SimpleNamespace(backup_id='backup-delta', status='ACTIVE')
+    grandchild = SimpleNamespace(backup_id='backup-grandchild', status='ACTIVE')
+    already = SimpleNamespace(
+        backup_id='backup-other',
+        status='IRREVERSIBLE',
+        irreversible_reason='crypto_shredded',
+    )
+    session = LineageSession([[base], [delta, already], [grandchild]])
+    repository = BackupsRepository(cast(AsyncSession, session))
+
+    affected = await repository.mark_irreversible_by_key_version(
+        'P-1',
+        'crypto_shredded',
+        commit=False,
+    )
+
+    assert affected == 3
+    assert base.irreversible_reason == 'crypto_shredded'
+    assert delta.status == grandchild.status == 'IRREVERSIBLE'
+    assert delta.irreversible_reason == grandchild.irreversible_reason == 'base_irreversible'
+    assert already.irreversible_reason == 'crypto_shredded'
+    sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+    assert 'backup_metadata.base_backup_id IN' in sql
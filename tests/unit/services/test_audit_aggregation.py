@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.services.audit_aggregation import AuthSuccessAggregator
+from app.services.audit_service import AuditService
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_020.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingAuditRepository:
+    def __init__(self) -> None:
+        self.entries: list[Any] = []
+
+    async def get_latest_chain_cursor(self) -> tuple[int, str] | None:
+        if not self.entries:
+            return None
+        latest = self.entries[-1]
+        return latest.chain_index, latest.entry_hash
+
+    async def create_entry(self, record: Any) -> Any:
+        self.entries.append(record)
+        return record
+
+
+def _service(clock: FakeClock) -> tuple[AuditService, RecordingAuditRepository]:
+    repository = RecordingAuditRepository()
+    aggregator = AuthSuccessAggregator(window_seconds=60, clock=clock)
+    return AuditService(repository, auth_success_aggregator=aggregator), repository  # type: ignore[arg-type]
+
+
+def test_aggregator_rejects_non_positive_window() -> None:
+    with pytest.raises(ValueError):
+        AuthSuccessAggregator(window_seconds=0)
+
+
+def test_drain_only_returns_closed_windows() -> None:
+    clock = FakeClock()
+    aggregator = AuthSuccessAggregator(window_seconds=60, clock=clock)
+    aggregator.add('auth_success', 'api_key', 'key-1', '10.0.0.1')
+    aggregator.add('auth_success', 'api_key', 'key-1', '10.0.0.1')
+    aggregator.add('auth_success', 'api_key', 'key-2', '10.0.0.2')
+
+    assert aggregator.drain() == []
+    assert aggregator.pending_count() == 3
+
+    clock.now += 60
+    summaries = aggregator.drain()
+
+    assert {(summary.key_id, summary.count) for summary in summaries} == {
+        ('key-1', 2),
+        ('key-2', 1),
+    }
+    assert aggregator.pending_count() == 0
+    assert summaries[0].reason.startswith('count=')
+    assert summaries[0].reason.endswith('/60s')
+
+
+async def test_auth_successes_collapse_into_one_summary_per_window() -> None:
+    clock = FakeClock()
+    service, repository = _service(clock)
+
+    for _ in range(50):
+        await service.record_auth_success('key-1', '10.0.0.1')
+    assert repository.entries == []
+
+    clock.now += 60
+    await service.record_auth_success('key-1', '10.0.0.1')
+
+    assert len(repository.entries) == 1
+    [summary] = repository.entries
+    assert summary.action == 'auth_success_summary'
+    assert summary.actor_key_id == 'key-1'
+    assert summary.status == 'success'
+    assert summary.reason.startswith('count=50;ip=10.0.0.1;')
+
+
+async def test_failures_and_denials_are_still_recorded_individually() -> None:
+    clock = FakeClock()
+    service, repository = _service(clock)
+
+    await service.record_auth_failure('abcd', 'invalid key', '10.0.0.1')
+    await service.record_mfa_outcome('key-1', 'denied', 'missing token', '10.0.0.1')
+    await service.record_mfa_outcome('key-1', 'allowed', None, '10.0.0.1')
+
+    assert [entry.action for entry in repository.entries] == ['auth_failure', 'mfa_outcome']
+
+
+async def test_forced_flush_persists_open_window() -> None:
+    clock = FakeClock()
+    service, repository = _service(clock)
+    await service.record_auth_success('key-1', None)
+    await service.record_mfa_outcome('key-1', 'allowed', None, None)
+
+    assert await service.flush_auth_summaries() == 0
+    assert await service.flush_auth_summaries(force=True) == 2
+
+    assert sorted(entry.action for entry in repository.entries) == [
+        'auth_success_summary',
+        'mfa_outcome_summary',
+    ]
+    assert [entry.chain_index for entry in repository.entries] == [1, 2]
+
+
+class FlakyAuditRepository(RecordingAuditRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fail = True
+
+    async def create_entry(self, record: Any) -> Any:
+        if self.fail:
+            raise RuntimeError('database unavailable')
+        return await super().create_entry(record)
+
+
+async def test_failed_summary_write_keeps_counts_for_the_next_flush() -> None:
+    clock = FakeClock()
+    repository = FlakyAuditRepository()
+    aggregator = AuthSuccessAggregator(window_seconds=60, clock=clock)
+    service = AuditService(repository, auth_success_aggregator=aggregator)  # type: ignore[arg-type]
+    for _ in range(3):
+        await service.record_auth_success('key-1', '10.0.0.1')
+    clock.now += 60
+
+    assert await service.flush_auth_summaries() == 0
+    assert aggregator.pending_count() == 3
+
+    await service.record_auth_success('key-1', '10.0.0.1')
+    repository.fail = False
+    assert await service.flush_auth_summaries() == 1
+
+    [summary] = repository.entries
+    assert summary.reason.startswith('count=3;')
+    assert aggregator.pending_count() == 1
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from app.infrastructure.crypto.hashing import CURRENT_AUDIT_HASH_VERSION
+from app.infrastructure.db.models.audit_archive_manifest import AuditArchiveManifestModel
+from app.infrastructure.db.models.audit_log_entry import AuditLogEntryModel
+from app.infrastructure.storage.minio_client import InMemoryObjectStorage
+from app.repositories.audit_partitions_repository import AuditPartition
+from app.services.audit_archive_service import AuditArchiveError, AuditArchiveService
+from app.services.audit_service import AuditService
+
+
+def _make_chain(timestamps: list[datetime]) -> list[AuditLogEntryModel]:
+    entries: list[AuditLogEntryModel] = []
+    prev_hash: str | None = None
+    for chain_index, created_at in enumerate(timestamps, start=1):
+        fields: dict[str, Any] = {
+            'chain_index': chain_index,
+            'prev_hash': prev_hash,
+            'created_at': created_at,
+            'event_id': f'event-{chain_index}',
+            'action': 'backup_processing_started',
+            'resource': 'backup',
+            'resource_id': f'backup-{chain_index}',
+            'actor_key_id': 'admin-key',
+            'actor_role': 'admin',
+            'status': 'PROCESSING',
+            'reason': None,
+            'hash_version': CURRENT_AUDIT_HASH_VERSION,
+        }
+        entry_hash = AuditService._build_entry_hash(**fields)
+        entries.append(AuditLogEntryModel(entry_hash=entry_hash, **fields))
+        prev_hash = entry_hash
+    return entries
+
+
+class FakePartitionsRepository:
+    def __init__(self, entries: list[AuditLogEntryModel]) -> None:
+        self.entries = entries
+        self.partitions = {
+            partition.name: partition
+            for partition in (AuditPartition.for_month(entry.created_at) for entry in entries)
+        }
+        self.manifests: list[AuditArchiveManifestModel] = []
+        self.dropped: list[str] = []
+
+    async def list_partitions(self) -> list[AuditPartition]:
+        return sorted(self.partitions.values(), key=lambda partition: partition.range_start)
+
+    async def create_partition(self, partition: AuditPartition) -> None:
+        self.partitions[partition.name] = partition
+
+    async def stream_partition_entries(self, partition: AuditPartition) -> AsyncIterator[Any]:
+        for entry in self.entries:
+            if partition.range_start <= entry.created_at < partition.range_end:
+                yield entry
+
+    async def drop_partition(self, partition: AuditPartition) -> None:
+        self.partitions.pop(partition.name)
+        self.dropped.append(partition.name)
+
+    async def list_manifests(self) -> list[AuditArchiveManifestModel]:
+        return list(self.manifests)
+
+    async def create_manifest(
+        self,
+        manifest: AuditArchiveManifestModel,
+    ) -> AuditArchiveManifestModel:
+        self.manifests.append(manifest)
+        return manifest
+
+
+def _service(repository: FakePartitionsRepository, storage: InMemoryObjectStorage) -> Any:
+    return AuditArchiveService(
+        repository,
+        storage,
+        'ssbg-backups',
+        now_provider=lambda: datetime(2026, 6, 15, tzinfo=UTC),
+    )
+
+
+async def test_ensure_partitions_creates_current_and_future_months() -> None:
+    repository = FakePartitionsRepository([])
+    service = _service(repository, InMemoryObjectStorage())
+
+    created = await service.ensure_partitions(months_ahead=2)
+
+    assert created == [
+        'audit_log_entries_y2026m06',
+        'audit_log_entries_y2026m07',
+        'audit_log_entries_y2026m08',
+    ]
+    assert await service.ensure_partitions(months_ahead=2) == []
+
+
+async def test_archive_sealed_partitions_links_manifests_and_verifies() -> None:
+    entries = _make_chain(
+        [
+            datetime(2026, 1, 10, tzinfo=UTC),
+            datetime(2026, 1, 20, tzinfo=UTC),
+            datetime(2026, 2, 5, tzinfo=UTC),
+            datetime(2026, 5, 1, tzinfo=UTC),
+        ],
+    )
+    repository = FakePartitionsRepository(entries)
+    storage = InMemoryObjectStorage()
+    service = _service(repository, storage)
+
+    manifests = await service.archive_sealed_partitions(retain_months=3, drop=True)
+
+    assert [manifest.partition_name for manifest in manifests] == [
+        'audit_log_entries_y2026m01',
+        'audit_log_entries_y2026m02',
+    ]
+    assert repository.dropped == ['audit_log_entries_y2026m01', 'audit_log_entries_y2026m02']
+    assert manifests[1].prev_manifest_hash == manifests[0].manifest_hash
+    assert manifests[1].first_prev_hash == manifests[0].last_entry_hash
+    assert manifests[1].last_entry_hash == entries[2].entry_hash
+    # The live chain continues from the archived anchor.
+    assert entries[3].prev_hash == manifests[1].last_entry_hash
+
+    result = await service.verify_archives()
+    assert result.valid is True
+    assert result.checked_entries == 3
+
+
+async def test_verify_archives_detects_tampered_archive() -> None:
+    entries = _make_chain([datetime(2026, 1, 10, tzinfo=UTC)])
+    repository = FakePartitionsRepository(entries)
+    storage = InMemoryObjectStorage()
+    service = _service(repository, storage)
+    [manifest] = await service.archive_sealed_partitions(retain_months=3)
+    assert manifest.object_name is not None
+
+    await storage.put_object('ssbg-backups', manifest.object_name, b'tampered')
+
+    result = await service.verify_archives()
+    assert result.valid is False
+    assert result.failure is not None
+    assert result.failure.reason == 'archive_digest_mismatch'
+
+
+async def test_archive_refuses_broken_chain() -> None:
+    entries = _make_chain([datetime(2026, 1, 10, tzinfo=UTC), datetime(2026, 1, 11, tzinfo=UTC)])
+    entries[1].reason = 'tampered'
+    repository = FakePartitionsRepository(entries)
+    service = _service(repository, InMemoryObjectStorage())
+
+    with pytest.raises(AuditArchiveError):
+        await service.archive_sealed_partitions(retain_months=3, drop=True)
+    assert repository.dropped == []
+    assert repository.manifests == []
+
+
+class LossyStorage(InMemoryObjectStorage):
+    async def put_object(self, bucket: str, object_name: str, data: bytes) -> None:
+        return None
+
+
+async def test_partitions_are_kept_unless_archive_reads_back_and_drop_is_requested() -> None:
+    entries = _make_chain([datetime(2026, 1, 10, tzinfo=UTC)])
+    repository = FakePartitionsRepository(entries)
+    lossy = _service(repository, LossyStorage())
+
+    [manifest] = await lossy.archive_sealed_partitions(retain_months=3)
+    assert repository.dropped == []
+
+    with pytest.raises(AuditArchiveError):
+        await lossy.archive_sealed_partitions(retain_months=3, drop=True)
+    assert repository.dropped == []
+
+    # An object that exists but does not match the manifest digest is refused as well.
+    storage = InMemoryObjectStorage()
+    assert manifest.object_name is not None
+    await storage.put_object('ssbg-backups', manifest.object_name, b'')
+    with pytest.raises(AuditArchiveError):
+        await _service(repository, storage).archive_sealed_partitions(retain_months=3, drop=True)
+    assert repository.dropped == []
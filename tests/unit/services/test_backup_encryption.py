@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, cast
 
 import pytest
@@ -19,6 +20,7 @@ from app.services.policy_service import BackupPolicyDecision, PolicyService
 class FakeBackupsRepository:
     def __init__(self) -> None:
         self.records: list[Any] = []
+        self.updates: list[dict[str, object]] = []
 
     async def create_metadata(self, record: object) -> object:
         self.records.append(record)
@@ -31,6 +33,7 @@ class FakeBackupsRepository:
         return None
 
     async def update_metadata(self, backup_id: str, **fields: object) -> Any | None:
+        self.updates.append(fields)
         record = await self.get_by_backup_id(backup_id)
         if record is None:
             return None
@@ -44,6 +47,8 @@ class FakePolicyService:
         self,
         principal: ApiKeyPrincipal | None,
         classification: ClassificationLevel,
+        incident_level: object = None,
+        mfa_verified: bool = False,
     ) -> BackupPolicyDecision:
         return BackupPolicyDecision(
             allowed=True,
@@ -130,6 +135,12 @@ async def test_encrypts_payload_before_storage_and_tracks_key_version() -> None:
     record = repository.records[0]
     assert record.key_version == 'P-001'
     assert record.status == BackupStatus.ACTIVE.value
+    assert record.chunk_size == Settings().backup_chunk_size
+    assert record.chunk_offsets == [0, len(stored_data)]
+    # One INSERT while processing, one UPDATE to the final state.
+    assert len(repository.records) == 1
+    assert len(repository.updates) == 1
+    assert repository.updates[0]['status'] == BackupStatus.ACTIVE.value
 
 
 @pytest.mark.asyncio
@@ -180,3 +191,130 @@ async def test_storage_failure_aborts_metadata_creation() -> None:
 
     assert len(repository.records) == 1
     assert repository.records[0].status == BackupStatus.FAILED.value
+
+
+@pytest.mark.asyncio
+async def test_compression_is_recorded_and_shrinks_stored_object() -> None:
+    repository = FakeBackupsRepository()
+    storage = FakeStorage()
+    settings = Settings(BACKUP_COMPRESSION='zlib', BACKUP_COMPRESSION_LEVEL=9)
+    service = BackupService(
+        cast(BackupsRepository, repository),
+        settings,
+        cast(PolicyService, FakePolicyService()),
+        cast(AuditService, FakeAuditService()),
+        FakeKeyStore(),
+        storage,
+    )
+    principal = ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+    payload = '{"setting": "value", "enabled": true}\n' * 2000
+    request = BackupRequest(
+        classification=ClassificationLevel.PUBLIC,
+        source_system='system-a',
+        payload=payload,
+    )
+
+    await service.submit_backup(request, principal, None)
+
+    record = repository.records[0]
+    assert record.compression == 'zlib'
+    assert record.compression_level == 9
+    assert record.original_size == len(payload)
+    assert len(storage.objects[0][2]) * 5 < len(payload)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_compression_skips_payloads_that_do_not_shrink() -> None:
+    repository = FakeBackupsRepository()
+    settings = Settings(BACKUP_COMPRESSION='zlib', BACKUP_COMPRESSION_ADAPTIVE=True)
+    service = BackupService(
+        cast(BackupsRepository, repository),
+        settings,
+        cast(PolicyService, FakePolicyService()),
+        cast(AuditService, FakeAuditService()),
+        FakeKeyStore(),
+        FakeStorage(),
+    )
+    principal = ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+    request = BackupRequest(
+        classification=ClassificationLevel.PUBLIC,
+        source_system='system-a',
+        payload='secret-payload',
+    )
+
+    await service.submit_backup(request, principal, None)
+
+    record = repository.records[0]
+    assert record.compression == 'none'
+    assert record.compression_level is None
+
+
+@pytest.mark.asyncio
+async def test_large_payload_is_encrypted_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    offloaded: list[str] = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func: Any, *args: Any) -> Any:
+        offloaded.append(func.__name__)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr('app.services.backup_service.asyncio.to_thread', recording_to_thread)
+    repository = FakeBackupsRepository()
+    service = BackupService(
+        cast(BackupsRepository, repository),
+        Settings(),
+        cast(PolicyService, FakePolicyService()),
+        cast(AuditService, FakeAuditService()),
+        FakeKeyStore(),
+        FakeStorage(),
+    )
+    principal = ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+    for payload in ('secret-payload', 'x' * 256 * 1024):
+        request = BackupRequest(
+            classification=ClassificationLevel.PUBLIC,
+            source_system='system-a',
+            payload=payload,
+        )
+        await service.submit_backup(request, principal, None)
+
+    assert offloaded == ['encrypt_chunked']
+    assert repository.records[-1].status == BackupStatus.ACTIVE.value
+
+
+@pytest.mark.asyncio
+async def test_large_single_frame_payload_is_compressed_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    offloaded: list[str] = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func: Any, *args: Any) -> Any:
+        offloaded.append(func.__name__)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr('app.services.backup_service.asyncio.to_thread', recording_to_thread)
+    repository = FakeBackupsRepository()
+    storage = FakeStorage()
+    service = BackupService(
+        cast(BackupsRepository, repository),
+        Settings(BACKUP_CHUNK_SIZE=0, BACKUP_COMPRESSION='zlib'),
+        cast(PolicyService, FakePolicyService()),
+        cast(AuditService, FakeAuditService()),
+        FakeKeyStore(),
+        storage,
+    )
+    principal = ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+    payload = '{"setting": "value", "enabled": true}\n' * 8000
+    request = BackupRequest(
+        classification=ClassificationLevel.PUBLIC,
+        source_system='system-a',
+        payload=payload,
+    )
+
+    await service.submit_backup(request, principal, None)
+
+    assert offloaded == ['_compress_and_encrypt']
+    assert repository.records[0].compression == 'zlib'
+    assert len(storage.objects[0][2]) * 5 < len(payload)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.enums import ClassificationLevel, IncidentLevel
+from app.schemas.auth import ApiKeyPrincipal
+from app.services.policy_compiler import PolicyCompileError, validate_rule
+from app.services.policy_service import PolicyService
+
+_BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class FakePolicyRecord:
+    policy_id: str
+    rule_json: dict[str, object]
+    is_active: bool = True
+    created_at: datetime = field(default=_BASE_TIME)
+
+
+def test_decisions_are_preallocated_and_shared() -> None:
+    service = PolicyService()
+    principal = ApiKeyPrincipal(key_id='key-1', role='admin', department='IT')
+    other = ApiKeyPrincipal(key_id='key-2', role='admin', department='Finance')
+
+    assert service.authorize(principal, 'audit') is service.authorize(other, 'audit')
+    assert service.evaluate_backup(principal, ClassificationLevel.SECRET) is (
+        service.evaluate_backup(principal, ClassificationLevel.SECRET, IncidentLevel.LOCKDOWN)
+    )
+    assert service.authorize(None, 'admin') is service.authorize(None, 'admin')
+
+
+def test_reload_applies_active_records_oldest_first() -> None:
+    service = PolicyService()
+    operator = ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+    previous = service.table
+
+    table = service.reload(
+        [
+            FakePolicyRecord(
+                policy_id='late',
+                rule_json={'type': 'role_permissions', 'role': 'operator', 'permissions': []},
+                created_at=_BASE_TIME + timedelta(minutes=1),
+            ),
+            FakePolicyRecord(
+                policy_id='early',
+                rule_json={
+                    'type': 'role_permissions',
+                    'role': 'operator',
+                    'permissions': ['backups', 'audit'],
+                },
+            ),
+            FakePolicyRecord(
+                policy_id='inactive',
+                rule_json={'type': 'restore_roles', 'roles': ['operator']},
+                is_active=False,
+            ),
+            FakePolicyRecord(policy_id='legacy', rule_json={'limit': 'daily'}),
+        ],
+    )
+
+    assert table is service.table
+    assert table is not previous
+    assert table.version == previous.version + 1
+    assert service.authorize(operator, 'backups').allowed is False
+    assert service.evaluate_restore(operator, ClassificationLevel.PUBLIC).allowed is False
+
+
+def test_incident_restriction_requires_mfa() -> None:
+    service = PolicyService()
+    service.reload(
+        [
+            FakePolicyRecord(
+                policy_id='lockdown-mfa',
+                rule_json={
+                    'type': 'incident_restriction',
+                    'operation': 'backup',
+                    'incident_level': 'LOCKDOWN',
+                    'require_mfa': True,
+                },
+            ),
+        ],
+    )
+    principal = ApiKeyPrincipal(key_id='key-1', role='operator', department='IT')
+
+    denied = service.evaluate_backup(
+        principal,
+        ClassificationLevel.INTERNAL,
+        incident_level=IncidentLevel.LOCKDOWN,
+    )
+    allowed = service.evaluate_backup(
+        principal,
+        ClassificationLevel.INTERNAL,
+        incident_level=IncidentLevel.LOCKDOWN,
+        mfa_verified=True,
+    )
+
+    assert denied.allowed is False
+    assert denied.reason_category == 'mfa_required'
+    assert allowed.allowed is True
+
+
+def test_unknown_role_is_denied() -> None:
+    service = PolicyService()
+    principal = ApiKeyPrincipal(key_id='key-1', role='guest', department='IT')
+
+    assert service.authorize(principal, 'backups').reason == 'permission_denied'
+    assert service.evaluate_backup(principal, ClassificationLevel.PUBLIC).allowed is False
+
+
+def test_validate_rule_rejects_malformed_typed_rules() -> None:
+    validate_rule({'limit': 'daily'})
+    with pytest.raises(PolicyCompileError):
+        validate_rule({'type': 'backup_classification', 'roles': 'admin'})
+    with pytest.raises(PolicyCompileError):
+        validate_rule({'type': 'incident_restriction', 'operation': 'delete'})
+    with pytest.raises(PolicyCompileError):
+        validate_rule({'type': 'unknown'})
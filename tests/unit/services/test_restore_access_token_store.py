@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.restore_access_token_service import (
+    RestoreAccessTokenExpired,
+    RestoreAccessTokenForbidden,
+    RestoreAccessTokenInvalid,
+    RestoreAccessTokenService,
+)
+from app.services.restore_access_token_store import (
+    InMemoryRestoreAccessTokenStore,
+    SignedRestoreAccessTokenStore,
+)
+
+
+class MutableClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 10, 19, 12, 0, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def test_in_memory_store_purges_only_expired_tokens_from_heap() -> None:
+    clock = MutableClock()
+    store = InMemoryRestoreAccessTokenStore()
+    service = RestoreAccessTokenService(now_provider=clock, store=store)
+    for ttl_seconds in (30, 10, 20):
+        await service.issue_token('backup-0001', 'admin-key', ttl_seconds=ttl_seconds)
+    long_lived = await service.issue_token('backup-0002', 'admin-key', ttl_seconds=300)
+
+    clock.now += timedelta(seconds=20)
+    assert await service.active_record_count() == 2
+
+    clock.now += timedelta(seconds=10)
+    assert await service.active_record_count() == 1
+    assert (await service.validate_token(long_lived.token, 'admin-key')) == long_lived
+
+
+async def test_in_memory_store_discards_expired_token_on_validation() -> None:
+    clock = MutableClock()
+    service = RestoreAccessTokenService(now_provider=clock)
+    record = await service.issue_token('backup-0001', 'admin-key', ttl_seconds=5)
+
+    clock.now += timedelta(seconds=5)
+    with pytest.raises(RestoreAccessTokenExpired):
+        await service.validate_token(record.token, 'admin-key')
+    with pytest.raises(RestoreAccessTokenInvalid):
+        await service.validate_token(record.token, 'admin-key')
+
+
+async def test_signed_tokens_validate_on_any_instance_with_the_same_key() -> None:
+    clock = MutableClock()
+    issuer = RestoreAccessTokenService(
+        now_provider=clock,
+        store=SignedRestoreAccessTokenStore(b'shared-signing-key'),
+    )
+    verifier = RestoreAccessTokenService(
+        now_provider=clock,
+        store=SignedRestoreAccessTokenStore(b'shared-signing-key'),
+    )
+    record = await issuer.issue_token('backup-0001', 'admin-key', ttl_seconds=60)
+
+    assert await verifier.validate_token(record.token, 'admin-key') == record
+    with pytest.raises(RestoreAccessTokenForbidden):
+        await verifier.validate_token(record.token, 'other-key')
+
+    clock.now += timedelta(seconds=60)
+    with pytest.raises(RestoreAccessTokenExpired):
+        await verifier.validate_token(record.token, 'admin-key')
+
+
+def _flip_last(value: str) -> str:
+    return value[:-1] + ('B' if value[-1] == 'A' else 'A')
+
+
+@pytest.mark.parametrize('tamper', ['payload', 'signature', 'key', 'garbage'])
+async def test_signed_tokens_reject_tampering(tamper: str) -> None:
+    clock = MutableClock()
+    store = SignedRestoreAccessTokenStore(b'shared-signing-key')
+    service = RestoreAccessTokenService(now_provider=clock, store=store)
+    record = await service.issue_token('backup-0001', 'admin-key', ttl_seconds=60)
+    payload, signature = record.token.split('.')
+    token = {
+        'payload': f'{_flip_last(payload)}.{signature}',
+        'signature': f'{payload}.{_flip_last(signature)}',
+        'key': record.token,
+        'garbage': 'not-a-token',
+    }[tamper]
+    if tamper == 'key':
+        service = RestoreAccessTokenService(
+            now_provider=clock,
+            store=SignedRestoreAccessTokenStore(b'another-key'),
+        )
+
+    with pytest.raises(RestoreAccessTokenInvalid):
+        await service.validate_token(token, 'admin-key')
+
+
+def test_signed_store_requires_a_signing_key() -> None:
+    with pytest.raises(ValueError):
+        SignedRestoreAccessTokenStore(b'')